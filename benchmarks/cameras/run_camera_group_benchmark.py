@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare reading cameras one after the other with reading them together in a `CameraGroup`.
+
+Each synthetic camera behaves like `OpenCVCamera`: a background thread publishes a frame every `1 / fps` seconds,
+with a random phase per camera, and `async_read` waits for a frame that was not read yet. The frame is published
+`--latency-ms` after its capture, as a USB camera delivers it after exposure and transfer, and each `async_read`
+then takes `--read-ms`, as a network camera fetching or decoding the frame on read does.
+
+Every gather waits for a frame of each camera captured after the gather started, and gathers are spaced by a
+random delay. The benchmark reports the time spent gathering and the spread of the capture times of the frames
+gathered together, for:
+- `sequential`: `async_read` on each camera in turn, until it returns a new frame,
+- `group.read`: the next frame of every camera, waited for together,
+- `group.read_nearest`: the frames captured the closest to the start of the gather.
+
+Reading the cameras in turn takes the sum of their read times, while reading them together takes their maximum.
+With `--read-ms 0`, waiting for a camera lets the frames of the others arrive, so both take about the same time,
+and the group only brings the capture times of the frames closer with `read_nearest`.
+
+Example:
+
+```bash
+python benchmarks/cameras/run_camera_group_benchmark.py --n-cameras 1 2 4 --fps 30
+```
+"""
+
+import argparse
+import time
+from threading import Condition, Event, Thread
+
+import numpy as np
+
+from lerobot.cameras import Camera, CameraGroup
+
+
+class SyntheticCamera(Camera):
+    """Stand-in for a camera publishing frames at a fixed rate from a background thread."""
+
+    def __init__(self, fps: int, latency_ms: float, read_ms: float, width: int, height: int, phase_s: float):
+        self.fps, self.width, self.height = fps, width, height
+        self.latency_s = latency_ms / 1000
+        self.read_s = read_ms / 1000
+        self.phase_s = phase_s
+        self._frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._condition = Condition()
+        self._latest: tuple[np.ndarray, float] | None = None
+        self._is_new = False
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._thread is not None
+
+    @staticmethod
+    def find_cameras():
+        return []
+
+    def connect(self, warmup: bool = True) -> None:
+        self._stop_event.clear()
+        self._thread = Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def _read_loop(self) -> None:
+        start = time.perf_counter() + self.phase_s
+        index = 0
+        while not self._stop_event.is_set():
+            capture_t = start + index / self.fps
+            index += 1
+            publish_t = capture_t + self.latency_s
+            remaining = publish_t - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            with self._condition:
+                self._latest = (self._frame, capture_t)
+                self._is_new = True
+                self._condition.notify_all()
+
+    def read(self, color_mode=None) -> np.ndarray:
+        return self.async_read()
+
+    def async_read_with_timestamp(self, timeout_ms: float = 200) -> tuple[np.ndarray, float]:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._is_new, timeout=timeout_ms / 1000):
+                raise TimeoutError(f"Timed out waiting for frame from {self}.")
+            self._is_new = False
+            latest = self._latest
+        time.sleep(self.read_s)
+        return latest
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        return self.async_read_with_timestamp(timeout_ms)[0]
+
+    def disconnect(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+
+def read_sequential(cameras: dict[str, SyntheticCamera]) -> list[float]:
+    start = time.perf_counter()
+    timestamps = []
+    for cam in cameras.values():
+        while (timestamp := cam.async_read_with_timestamp()[1]) < start:
+            pass
+        timestamps.append(timestamp)
+    return timestamps
+
+
+def run_gathers(
+    mode: str, cameras: dict[str, SyntheticCamera], n_gathers: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Returns the gather time and the spread of the capture times of the frames, per gather."""
+    group = CameraGroup(cameras, history=4)
+    if mode != "sequential":
+        group.start()
+    period_s = 1 / next(iter(cameras.values())).fps
+    results = []
+    for _ in range(n_gathers):
+        # Starts the gathers at random times relatively to the frames.
+        time.sleep(rng.uniform(0, period_s))
+        start = time.perf_counter()
+        if mode == "sequential":
+            timestamps = read_sequential(cameras)
+        elif mode == "group.read":
+            timestamps = [frame.timestamp for frame in group.read().values()]
+        else:
+            timestamps = [frame.timestamp for frame in group.read_nearest(start).values()]
+        results.append((time.perf_counter() - start, np.ptp(timestamps)))
+    group.stop()
+    return np.array(results)
+
+
+def main(
+    n_cameras: list[int],
+    fps: int,
+    latency_ms: float,
+    read_ms: float,
+    width: int,
+    height: int,
+    n_gathers: int,
+    seed: int,
+):
+    rng = np.random.default_rng(seed)
+    print(
+        f"{'cameras':>7} {'mode':>18} {'gather mean (ms)':>16} {'gather p99 (ms)':>15} "
+        f"{'spread mean (ms)':>16} {'spread max (ms)':>15}"
+    )
+    for n in n_cameras:
+        for mode in ("sequential", "group.read", "group.read_nearest"):
+            cameras = {
+                f"cam{i}": SyntheticCamera(
+                    fps, latency_ms, read_ms, width, height, phase_s=rng.uniform(0, 1 / fps)
+                )
+                for i in range(n)
+            }
+            for cam in cameras.values():
+                cam.connect()
+            results = run_gathers(mode, cameras, n_gathers, rng) * 1e3
+            for cam in cameras.values():
+                cam.disconnect()
+            print(
+                f"{n:>7} {mode:>18} {results[:, 0].mean():>16.2f} {np.percentile(results[:, 0], 99):>15.2f} "
+                f"{results[:, 1].mean():>16.2f} {results[:, 1].max():>15.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--n-cameras", type=int, nargs="+", default=[1, 2, 4], help="Numbers of cameras.")
+    parser.add_argument("--fps", type=int, default=30, help="Frame rate of the cameras.")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=5.0,
+        help="Delay between the capture and the publication of a frame.",
+    )
+    parser.add_argument("--read-ms", type=float, default=10.0, help="Time taken by each `async_read`.")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--n-gathers", type=int, default=100, help="Number of gathers per mode.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the phases of the cameras.")
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the throughput of `aggregate_datasets`.
+
+First, the benchmark compares the remapping of the indices of `--num-frames` synthetic data frames with a
+row-wise pandas `apply`, as previously done for every frame, and with `update_data_table`.
+
+Then, if datasets are given, it aggregates them into a temporary directory with each number of processes of
+`--num-workers`, and reports the wall time and the throughput in frames and MB of source files per second.
+
+Example:
+
+```bash
+python benchmarks/datasets/run_aggregate_benchmark.py \
+    --repo-ids user/xarm_day_1 user/xarm_day_2 \
+    --roots path/to/xarm_day_1 path/to/xarm_day_2 \
+    --num-workers 0 4 8
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from lerobot.datasets.aggregate import aggregate_datasets, update_data_table
+from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+
+
+def run_remap(num_frames: int, num_tasks: int = 10):
+    rng = np.random.default_rng(0)
+    table = pa.table(
+        {
+            "index": np.arange(num_frames, dtype=np.int64),
+            "episode_index": np.arange(num_frames, dtype=np.int64) // 500,
+            "task_index": rng.integers(0, num_tasks, num_frames),
+            "timestamp": (np.arange(num_frames) % 500 / 30).astype(np.float32),
+        }
+    )
+    task_lookup = rng.permutation(num_tasks)
+    src_tasks = pd.DataFrame({"task_index": range(num_tasks)}, index=[f"task {i}" for i in range(num_tasks)])
+    dst_tasks = src_tasks.iloc[np.argsort(task_lookup)].assign(task_index=range(num_tasks))
+
+    def _update(row):
+        row["episode_index"] = row["episode_index"] + 100
+        row["index"] = row["index"] + 50_000
+        # The rows of mixed dtypes are upcast to float.
+        task = src_tasks.iloc[int(row["task_index"])].name
+        row["task_index"] = dst_tasks.loc[task].task_index.item()
+        return row
+
+    df = table.to_pandas()
+    start = time.perf_counter()
+    expected = df.apply(_update, axis=1)
+    apply_s = time.perf_counter() - start
+
+    update_data_table(table.slice(0, 10), 100, 50_000, task_lookup)
+    start = time.perf_counter()
+    updated = update_data_table(table, 100, 50_000, task_lookup)
+    arrow_s = time.perf_counter() - start
+
+    np.testing.assert_array_equal(updated["task_index"].to_numpy(), expected["task_index"].to_numpy())
+    print(f"{'remap':>12} {'time (ms)':>10} {'frames/s':>12}")
+    for name, elapsed_s in (("pandas apply", apply_s), ("arrow", arrow_s)):
+        print(f"{name:>12} {elapsed_s * 1e3:>10.1f} {num_frames / elapsed_s:>12.0f}")
+
+
+def run_aggregate(repo_ids: list[str], roots: list[Path] | None, num_workers: list[int]):
+    all_metadata = [
+        LeRobotDatasetMetadata(repo_id, root=root)
+        for repo_id, root in zip(repo_ids, roots or [None] * len(repo_ids), strict=True)
+    ]
+    num_frames = sum(meta.total_frames for meta in all_metadata)
+    size_mb = sum(
+        path.stat().st_size
+        for meta in all_metadata
+        for pattern in ("data/*/*.parquet", "videos/*/*/*.mp4")
+        for path in meta.root.glob(pattern)
+    ) / (1024**2)
+    print(f"{len(repo_ids)} datasets, {num_frames} frames, {size_mb:.1f} MB of data and videos")
+    print(f"{'num workers':>11} {'time (s)':>9} {'frames/s':>10} {'MB/s':>8}")
+    for workers in num_workers:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            aggregate_datasets(
+                repo_ids,
+                "benchmark/aggregated",
+                roots=roots,
+                aggr_root=Path(tmp_dir) / "aggregated",
+                num_workers=workers,
+            )
+            elapsed_s = time.perf_counter() - start
+        print(f"{workers:>11} {elapsed_s:>9.1f} {num_frames / elapsed_s:>10.0f} {size_mb / elapsed_s:>8.1f}")
+
+
+def main(num_frames: int, repo_ids: list[str] | None, roots: list[Path] | None, num_workers: list[int]):
+    run_remap(num_frames)
+    if repo_ids:
+        print()
+        run_aggregate(repo_ids, roots, num_workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-frames", type=int, default=20_000, help="Number of synthetic frames to remap.")
+    parser.add_argument("--repo-ids", type=str, nargs="+", default=None, help="Datasets to aggregate.")
+    parser.add_argument(
+        "--roots", type=Path, nargs="+", default=None, help="Local roots of the datasets, if any."
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        nargs="+",
+        default=[0, 4],
+        help="Numbers of processes writing the data and video files to compare.",
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure how `eval_policy_all` scales with the number of tasks evaluated in parallel.
+
+The suite mimics LIBERO: each task is a vectorized environment with two camera images and the robot state as
+observations, and episodes of random lengths. The simulator step is emulated by sleeping for `--sim-step-ms`,
+which releases the GIL as MuJoCo does. A small ACT policy, predicting one action per forward pass, is evaluated on
+every task for each value of `max_parallel_tasks`, and the per-task metrics are checked to match the sequential
+evaluation.
+
+Example:
+
+```bash
+python benchmarks/eval/run_multitask_eval_benchmark.py --n-tasks 10 --max-parallel-tasks 1 2 5 10
+```
+"""
+
+import argparse
+import time
+
+import gymnasium as gym
+import numpy as np
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.scripts.lerobot_eval import eval_policy_all
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+
+class LiberoLikeEnv(gym.Env):
+    """Environment with LIBERO's observation format and an emulated simulator step time."""
+
+    metadata = {"render_fps": 10}
+
+    def __init__(self, task_id: int, image_size: int, max_episode_steps: int, sim_step_ms: float):
+        self.observation_space = gym.spaces.Dict(
+            {
+                "pixels": gym.spaces.Dict(
+                    {
+                        key: gym.spaces.Box(0, 255, (image_size, image_size, 3), dtype=np.uint8)
+                        for key in ("image", "image2")
+                    }
+                ),
+                "agent_pos": gym.spaces.Box(-np.inf, np.inf, (8,), dtype=np.float64),
+            }
+        )
+        self.action_space = gym.spaces.Box(-1, 1, (7,), dtype=np.float32)
+        self.task = f"task {task_id}"
+        self.task_description = f"do task {task_id}"
+        self._max_episode_steps = max_episode_steps
+        self.sim_step_s = sim_step_ms / 1000
+
+    def _observation(self):
+        return {
+            "pixels": {
+                key: self.np_random.integers(
+                    0, 256, self.observation_space["pixels"][key].shape, dtype=np.uint8
+                )
+                for key in ("image", "image2")
+            },
+            "agent_pos": self.np_random.standard_normal(8),
+        }
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.episode_length = int(
+            self.np_random.integers(self._max_episode_steps // 2, self._max_episode_steps)
+        )
+        self.step_ix = 0
+        return self._observation(), {}
+
+    def step(self, action):
+        time.sleep(self.sim_step_s)
+        self.step_ix += 1
+        terminated = self.step_ix >= self.episode_length
+        success = terminated and bool(self.np_random.random() < 0.5)
+        return self._observation(), float(success), terminated, False, {"is_success": success}
+
+
+def make_suite(n_tasks: int, n_envs: int, image_size: int, max_episode_steps: int, sim_step_ms: float):
+    return {
+        "libero_like": {
+            task_id: gym.vector.SyncVectorEnv(
+                [
+                    lambda task_id=task_id: LiberoLikeEnv(task_id, image_size, max_episode_steps, sim_step_ms)
+                    for _ in range(n_envs)
+                ]
+            )
+            for task_id in range(n_tasks)
+        }
+    }
+
+
+def main(
+    n_tasks: int,
+    max_parallel_tasks: list[int],
+    n_envs: int,
+    n_episodes: int,
+    image_size: int,
+    max_episode_steps: int,
+    sim_step_ms: float,
+    num_threads: int | None,
+):
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+
+    config = ACTConfig(
+        input_features={
+            f"{OBS_IMAGES}.image": PolicyFeature(type=FeatureType.VISUAL, shape=(3, image_size, image_size)),
+            f"{OBS_IMAGES}.image2": PolicyFeature(type=FeatureType.VISUAL, shape=(3, image_size, image_size)),
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(8,)),
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(7,))},
+        chunk_size=10,
+        n_action_steps=1,
+        pretrained_backbone_weights=None,
+        use_vae=False,
+        dim_model=128,
+        n_heads=4,
+        dim_feedforward=512,
+        n_encoder_layers=2,
+        device="cpu",
+    )
+    policy = ACTPolicy(config).eval()
+
+    def identity(x):
+        return x
+
+    print(f"{'parallel':>8} {'eval (s)':>9} {'episodes/s':>11} {'speedup':>8} {'identical':>10}")
+    reference_time = reference_metrics = None
+    for n_parallel in max_parallel_tasks:
+        envs = make_suite(n_tasks, n_envs, image_size, max_episode_steps, sim_step_ms)
+        start = time.perf_counter()
+        with torch.no_grad():
+            info = eval_policy_all(
+                envs, policy, identity, identity, n_episodes, start_seed=0, max_parallel_tasks=n_parallel
+            )
+        eval_s = time.perf_counter() - start
+        metrics = sorted((task["task_id"], task["metrics"]["successes"]) for task in info["per_task"])
+        if reference_time is None:
+            reference_time, reference_metrics = eval_s, metrics
+        print(
+            f"{n_parallel:>8} {eval_s:>9.2f} {n_tasks * n_episodes / eval_s:>11.2f} "
+            f"{reference_time / eval_s:>7.2f}x {str(metrics == reference_metrics):>10}"
+        )
+        for group in envs.values():
+            for env in group.values():
+                env.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-tasks", type=int, default=10, help="Number of tasks of the suite.")
+    parser.add_argument(
+        "--max-parallel-tasks",
+        type=int,
+        nargs="*",
+        default=[1, 2, 5, 10],
+        help="Numbers of tasks evaluated in parallel to be tested. The first one is the reference.",
+    )
+    parser.add_argument("--n-envs", type=int, default=2, help="Number of environments per task.")
+    parser.add_argument("--n-episodes", type=int, default=2, help="Number of episodes per task.")
+    parser.add_argument("--image-size", type=int, default=128)
+    parser.add_argument("--max-episode-steps", type=int, default=60)
+    parser.add_argument(
+        "--sim-step-ms", type=float, default=5.0, help="Emulated simulator step time (releases the GIL)."
+    )
+    parser.add_argument(
+        "--num-threads",
+        type=int,
+        default=None,
+        help="Number of threads used by torch on cpu. Defaults to torch's default.",
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the per-step latency of ACT's temporal ensembling across chunk sizes.
+
+`ACTTemporalEnsembler`, which keeps the online averages in a circular buffer, is compared to a reference
+concatenating the new action to the online averages (and slicing off the consumed one) at every step. Both are
+fed the same action chunks, and their outputs are checked to be identical.
+
+Example:
+
+```bash
+python benchmarks/policies/run_act_temporal_ensemble_benchmark.py --chunk-sizes 50 100 200
+```
+"""
+
+import argparse
+import time
+
+import torch
+from torch import Tensor
+
+from lerobot.policies.act.modeling_act import ACTTemporalEnsembler
+
+
+class ConcatTemporalEnsembler:
+    """Reference temporal ensembler, growing and slicing its online averages at every step."""
+
+    def __init__(self, temporal_ensemble_coeff: float, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.ensemble_weights = torch.exp(-temporal_ensemble_coeff * torch.arange(chunk_size))
+        self.ensemble_weights_cumsum = torch.cumsum(self.ensemble_weights, dim=0)
+        self.reset()
+
+    def reset(self):
+        self.ensembled_actions = None
+        self.ensembled_actions_count = None
+
+    def update(self, actions: Tensor) -> Tensor:
+        if self.ensembled_actions is None:
+            self.ensembled_actions = actions.clone()
+            self.ensembled_actions_count = torch.ones((self.chunk_size, 1), dtype=torch.long)
+        else:
+            self.ensembled_actions *= self.ensemble_weights_cumsum[self.ensembled_actions_count - 1]
+            self.ensembled_actions += actions[:, :-1] * self.ensemble_weights[self.ensembled_actions_count]
+            self.ensembled_actions /= self.ensemble_weights_cumsum[self.ensembled_actions_count]
+            self.ensembled_actions_count = torch.clamp(self.ensembled_actions_count + 1, max=self.chunk_size)
+            self.ensembled_actions = torch.cat([self.ensembled_actions, actions[:, -1:]], dim=1)
+            self.ensembled_actions_count = torch.cat(
+                [self.ensembled_actions_count, torch.ones_like(self.ensembled_actions_count[-1:])]
+            )
+        action, self.ensembled_actions, self.ensembled_actions_count = (
+            self.ensembled_actions[:, 0],
+            self.ensembled_actions[:, 1:],
+            self.ensembled_actions_count[1:],
+        )
+        return action
+
+
+def run_episode(ensembler, chunks: Tensor) -> tuple[Tensor, float]:
+    """Returns the actions of the episode and the median update latency in microseconds."""
+    ensembler.reset()
+    actions = []
+    latencies = []
+    for chunk in chunks:
+        start = time.perf_counter()
+        actions.append(ensembler.update(chunk))
+        latencies.append(time.perf_counter() - start)
+    return torch.stack(actions), torch.tensor(latencies).median().item() * 1e6
+
+
+def main(
+    chunk_sizes: list[int],
+    batch_size: int,
+    action_dim: int,
+    episode_length: int,
+    temporal_ensemble_coeff: float,
+    num_threads: int | None,
+):
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+
+    print(f"{'chunk':>5} {'concat (us)':>12} {'ring (us)':>10} {'speedup':>8} {'identical':>10}")
+    for chunk_size in chunk_sizes:
+        chunks = torch.randn(episode_length, batch_size, chunk_size, action_dim)
+        # The first episode is a warmup.
+        for _ in range(2):
+            reference, concat_us = run_episode(
+                ConcatTemporalEnsembler(temporal_ensemble_coeff, chunk_size), chunks
+            )
+            actions, ring_us = run_episode(ACTTemporalEnsembler(temporal_ensemble_coeff, chunk_size), chunks)
+        print(
+            f"{chunk_size:>5} {concat_us:>12.1f} {ring_us:>10.1f} {concat_us / ring_us:>7.2f}x "
+            f"{str(torch.equal(actions, reference)):>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="*", default=[50, 100, 150, 200], help="Chunk sizes to be tested."
+    )
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--action-dim", type=int, default=14)
+    parser.add_argument("--episode-length", type=int, default=500, help="Number of control steps.")
+    parser.add_argument("--temporal-ensemble-coeff", type=float, default=0.01)
+    parser.add_argument(
+        "--num-threads",
+        type=int,
+        default=None,
+        help="Number of threads used by torch on cpu. Defaults to torch's default.",
+    )
+    args = parser.parse_args()
+    main(**vars(args))
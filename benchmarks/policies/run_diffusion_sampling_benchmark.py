@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the speed and accuracy of the diffusion policy noise schedulers across step budgets.
+
+For each (scheduler, number of inference steps) pair, actions are generated from the same observations and
+initial noise, and compared to the actions produced with the full training schedule (the training scheduler
+with `num_train_timesteps` steps). Actions are compared in the normalized space the policy operates in.
+
+Example (with a trained policy):
+
+```bash
+python benchmarks/policies/run_diffusion_sampling_benchmark.py \
+    --policy-path lerobot/diffusion_pusht \
+    --schedulers DDPM DDIM DPMSolver++ UniPC \
+    --num-inference-steps 100 50 20 10 5
+```
+
+Without `--policy-path`, a randomly initialized policy with PushT-like features is used, which is only useful
+to measure latency.
+"""
+
+import argparse
+import time
+
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import DiffusionPolicy
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+
+
+def make_policy(policy_path: str | None, device: str) -> DiffusionPolicy:
+    if policy_path is not None:
+        policy = DiffusionPolicy.from_pretrained(policy_path)
+    else:
+        config = DiffusionConfig(
+            input_features={
+                OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+                f"{OBS_IMAGES}.top": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 96, 96)),
+            },
+            output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        )
+        policy = DiffusionPolicy(config)
+    return policy.to(device).eval()
+
+
+def make_batches(policy: DiffusionPolicy, num_chunks: int, device: str) -> list[dict[str, torch.Tensor]]:
+    """Random (already normalized) observations in the format expected by `DiffusionModel.generate_actions`."""
+    config = policy.config
+    batches = []
+    for _ in range(num_chunks):
+        batch = {OBS_STATE: torch.randn(1, config.n_obs_steps, *config.robot_state_feature.shape)}
+        if config.image_features:
+            batch[OBS_IMAGES] = torch.stack(
+                [
+                    torch.rand(1, config.n_obs_steps, *feature.shape)
+                    for feature in config.image_features.values()
+                ],
+                dim=2,
+            )
+        if config.env_state_feature:
+            batch["observation.environment_state"] = torch.randn(
+                1, config.n_obs_steps, *config.env_state_feature.shape
+            )
+        batches.append({k: v.to(device) for k, v in batch.items()})
+    return batches
+
+
+@torch.no_grad()
+def generate(
+    policy: DiffusionPolicy, batches: list[dict[str, torch.Tensor]], seed: int, device: str
+) -> tuple[torch.Tensor, float]:
+    """Returns the actions generated for all batches and the median latency per chunk in milliseconds."""
+    actions = []
+    latencies = []
+    for i, batch in enumerate(batches):
+        torch.manual_seed(seed + i)
+        start = time.perf_counter()
+        actions.append(policy.diffusion.generate_actions(batch))
+        if device == "cuda":
+            torch.cuda.synchronize()
+        latencies.append(time.perf_counter() - start)
+    return torch.cat(actions), torch.tensor(latencies).median().item() * 1e3
+
+
+def main(
+    policy_path: str | None,
+    schedulers: list[str],
+    num_inference_steps: list[int],
+    num_chunks: int,
+    num_threads: int | None,
+    device: str,
+    seed: int,
+):
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+
+    policy = make_policy(policy_path, device)
+    batches = make_batches(policy, num_chunks, device)
+    config = policy.config
+
+    # Warmup
+    policy.diffusion.set_inference_schedule(num_inference_steps=2)
+    generate(policy, batches[:1], seed, device)
+
+    policy.diffusion.set_inference_schedule(config.noise_scheduler_type, config.num_train_timesteps)
+    reference, reference_latency = generate(policy, batches, seed, device)
+
+    print(
+        f"Reference: {config.noise_scheduler_type} with {config.num_train_timesteps} steps, "
+        f"{reference_latency:.1f} ms/chunk"
+    )
+    print(f"{'scheduler':<12} {'steps':>6} {'latency (ms)':>13} {'speedup':>8} {'action MSE':>11}")
+    for scheduler in schedulers:
+        for steps in num_inference_steps:
+            policy.diffusion.set_inference_schedule(scheduler, steps)
+            actions, latency = generate(policy, batches, seed, device)
+            mse = torch.mean((actions - reference) ** 2).item()
+            print(
+                f"{scheduler:<12} {steps:>6} {latency:>13.1f} {reference_latency / latency:>7.1f}x {mse:>11.2e}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--policy-path",
+        type=str,
+        default=None,
+        help="Hub repo id or local path of a trained diffusion policy. Defaults to a randomly initialized one.",
+    )
+    parser.add_argument(
+        "--schedulers",
+        type=str,
+        nargs="*",
+        default=["DDPM", "DDIM", "DPMSolver++", "UniPC"],
+        help="Noise schedulers to be tested.",
+    )
+    parser.add_argument(
+        "--num-inference-steps",
+        type=int,
+        nargs="*",
+        default=[100, 50, 20, 10, 5],
+        help="Step budgets to be tested.",
+    )
+    parser.add_argument(
+        "--num-chunks",
+        type=int,
+        default=20,
+        help="Number of action chunks generated for each scheduler x step budget.",
+    )
+    parser.add_argument(
+        "--num-threads",
+        type=int,
+        default=None,
+        help="Number of threads used by torch on cpu. Defaults to torch's default.",
+    )
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--seed", type=int, default=1000)
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the duration of a SAC learner optimization step with the stacked critic ensemble.
+
+A learner step is made of `utd_ratio` critic updates (with target network updates) followed by an actor and a
+temperature update, as in `lerobot.rl.learner.add_actor_information_and_train`. The stacked critic ensemble
+is compared to a reference evaluating the critic heads one by one in a Python loop (the previous
+`nn.ModuleList` implementation), starting from the same weights.
+
+Example:
+
+```bash
+python benchmarks/policies/run_sac_learner_benchmark.py --num-critics 2 10 --utd-ratio 2 --device cuda
+```
+"""
+
+import argparse
+import time
+from dataclasses import asdict
+
+import torch
+from torch import nn
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.sac.configuration_sac import SACConfig
+from lerobot.policies.sac.modeling_sac import CriticEnsemble, CriticHead, SACPolicy
+from lerobot.policies.utils import get_device_from_parameters, unstack_ensemble_state_dict
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+
+class LoopCriticEnsemble(nn.Module):
+    """Reference critic ensemble evaluating each head in turn."""
+
+    def __init__(self, stacked: CriticEnsemble, input_dim: int, config: SACConfig):
+        super().__init__()
+        self.encoder = stacked.encoder
+        self.critics = nn.ModuleList(
+            [
+                CriticHead(input_dim=input_dim, **asdict(config.critic_network_kwargs))
+                for _ in range(stacked.num_critics)
+            ]
+        )
+        self.critics.load_state_dict(unstack_ensemble_state_dict(stacked.critics.state_dict()))
+        self.to(get_device_from_parameters(stacked))
+
+    def forward(self, observations, actions, observation_features=None):
+        obs_enc = self.encoder(observations, cache=observation_features)
+        inputs = torch.cat([obs_enc, actions], dim=-1)
+        return torch.stack([critic(inputs).squeeze(-1) for critic in self.critics], dim=0)
+
+
+def make_policy(num_critics: int, state_dim: int, action_dim: int, compile: bool, device: str) -> SACPolicy:
+    config = SACConfig(
+        input_features={OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(state_dim,))},
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(action_dim,))},
+        dataset_stats={
+            OBS_STATE: {"min": [0.0] * state_dim, "max": [1.0] * state_dim},
+            ACTION: {"min": [0.0] * action_dim, "max": [1.0] * action_dim},
+        },
+        num_critics=num_critics,
+        use_torch_compile=compile,
+        device=device,
+    )
+    return SACPolicy(config).to(device).train()
+
+
+def use_loop_critics(policy: SACPolicy):
+    input_dim = policy.encoder_critic.output_dim + policy.config.output_features[ACTION].shape[0]
+    policy.critic_ensemble = LoopCriticEnsemble(policy.critic_ensemble, input_dim, policy.config)
+    policy.critic_target = LoopCriticEnsemble(policy.critic_target, input_dim, policy.config)
+
+
+def make_batch(batch_size: int, state_dim: int, action_dim: int, device: str) -> dict:
+    return {
+        ACTION: torch.rand(batch_size, action_dim, device=device),
+        "reward": torch.randn(batch_size, device=device),
+        "state": {OBS_STATE: torch.rand(batch_size, state_dim, device=device)},
+        "next_state": {OBS_STATE: torch.rand(batch_size, state_dim, device=device)},
+        "done": torch.zeros(batch_size, device=device),
+        "observation_feature": None,
+        "next_observation_feature": None,
+    }
+
+
+def learner_step(policy: SACPolicy, optimizers: dict, batch: dict, utd_ratio: int, clip_grad_norm: float):
+    for _ in range(utd_ratio):
+        loss_critic = policy.forward(batch, model="critic")["loss_critic"]
+        optimizers["critic"].zero_grad()
+        loss_critic.backward()
+        torch.nn.utils.clip_grad_norm_(policy.critic_ensemble.parameters(), max_norm=clip_grad_norm)
+        optimizers["critic"].step()
+        policy.update_target_networks()
+
+    loss_actor = policy.forward(batch, model="actor")["loss_actor"]
+    optimizers["actor"].zero_grad()
+    loss_actor.backward()
+    torch.nn.utils.clip_grad_norm_(policy.actor.parameters(), max_norm=clip_grad_norm)
+    optimizers["actor"].step()
+
+    loss_temperature = policy.forward(batch, model="temperature")["loss_temperature"]
+    optimizers["temperature"].zero_grad()
+    loss_temperature.backward()
+    optimizers["temperature"].step()
+    policy.update_temperature()
+
+
+def benchmark(policy: SACPolicy, batch: dict, utd_ratio: int, num_steps: int, num_warmup_steps: int, device):
+    lr = policy.config.critic_lr
+    optimizers = {
+        "critic": torch.optim.Adam(policy.critic_ensemble.parameters(), lr=lr),
+        "actor": torch.optim.Adam(
+            [p for n, p in policy.actor.named_parameters() if not n.startswith("encoder")], lr=lr
+        ),
+        "temperature": torch.optim.Adam([policy.log_alpha], lr=lr),
+    }
+    durations = []
+    for step in range(num_warmup_steps + num_steps):
+        start = time.perf_counter()
+        learner_step(policy, optimizers, batch, utd_ratio, policy.config.grad_clip_norm)
+        if device == "cuda":
+            torch.cuda.synchronize()
+        if step >= num_warmup_steps:
+            durations.append(time.perf_counter() - start)
+    return torch.tensor(durations).median().item() * 1e3
+
+
+def main(
+    num_critics: list[int],
+    utd_ratio: int,
+    batch_size: int,
+    state_dim: int,
+    action_dim: int,
+    num_steps: int,
+    num_warmup_steps: int,
+    compile: bool,
+    device: str,
+):
+    batch = make_batch(batch_size, state_dim, action_dim, device)
+    print(f"{'critics':>7} {'loop (ms)':>10} {'stacked (ms)':>13} {'speedup':>8}")
+    for n in num_critics:
+        torch.manual_seed(0)
+        stacked_policy = make_policy(n, state_dim, action_dim, compile, device)
+        torch.manual_seed(0)
+        loop_policy = make_policy(n, state_dim, action_dim, compile=False, device=device)
+        use_loop_critics(loop_policy)
+        if compile:
+            loop_policy.critic_ensemble = torch.compile(loop_policy.critic_ensemble)
+            loop_policy.critic_target = torch.compile(loop_policy.critic_target)
+
+        loop_ms = benchmark(loop_policy, batch, utd_ratio, num_steps, num_warmup_steps, device)
+        stacked_ms = benchmark(stacked_policy, batch, utd_ratio, num_steps, num_warmup_steps, device)
+        print(f"{n:>7} {loop_ms:>10.2f} {stacked_ms:>13.2f} {loop_ms / stacked_ms:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-critics", type=int, nargs="*", default=[2, 10], help="Critic ensemble sizes to be tested."
+    )
+    parser.add_argument("--utd-ratio", type=int, default=2, help="Number of critic updates per learner step.")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--state-dim", type=int, default=18)
+    parser.add_argument("--action-dim", type=int, default=6)
+    parser.add_argument("--num-steps", type=int, default=50, help="Number of timed learner steps.")
+    parser.add_argument("--num-warmup-steps", type=int, default=5)
+    parser.add_argument(
+        "--compile", action="store_true", help="Compile the critics with `torch.compile` (slow warmup)."
+    )
+    parser.add_argument("--device", type=str, default="cpu")
+    args = parser.parse_args()
+    main(**vars(args))
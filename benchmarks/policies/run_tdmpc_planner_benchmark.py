@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the latency of TD-MPC's MPC planner (`TDMPCPolicy.plan`).
+
+The reference planner, which allocates its sampled trajectories at every step and evaluates them step by step,
+is compared to the static planner (`use_static_planner=True`), which works in place on buffers allocated in
+`reset()`, optionally compiled with `torch.compile` (`compile_planner=True`). All planners start from the same
+weights. The latency percentiles are compared to the control period at `--fps`.
+
+Example:
+
+```bash
+python benchmarks/policies/run_tdmpc_planner_benchmark.py --planners reference static compiled --device cuda
+```
+"""
+
+import argparse
+import time
+
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.tdmpc.configuration_tdmpc import TDMPCConfig
+from lerobot.policies.tdmpc.modeling_tdmpc import TDMPCPolicy
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+PLANNER_KWARGS = {
+    "reference": {},
+    "static": {"use_static_planner": True},
+    "compiled": {"use_static_planner": True, "compile_planner": True},
+}
+
+
+def make_policy(
+    planner: str, state_dim: int, action_dim: int, config_kwargs: dict, device: str
+) -> TDMPCPolicy:
+    config = TDMPCConfig(
+        input_features={OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(state_dim,))},
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(action_dim,))},
+        device=device,
+        **config_kwargs,
+        **PLANNER_KWARGS[planner],
+    )
+    torch.manual_seed(0)
+    return TDMPCPolicy(config).to(device).eval()
+
+
+def benchmark(policy: TDMPCPolicy, z: torch.Tensor, num_steps: int, num_warmup_steps: int, device: str):
+    """Returns the plan latencies in milliseconds and the warmup duration in seconds."""
+    policy.reset()
+    start = time.perf_counter()
+    for _ in range(num_warmup_steps):
+        policy.plan(z)
+    if device == "cuda":
+        torch.cuda.synchronize()
+    warmup_duration = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(num_steps):
+        start = time.perf_counter()
+        policy.plan(z)
+        if device == "cuda":
+            torch.cuda.synchronize()
+        latencies.append(time.perf_counter() - start)
+    return torch.tensor(latencies) * 1e3, warmup_duration
+
+
+def main(
+    planners: list[str],
+    batch_size: int,
+    state_dim: int,
+    action_dim: int,
+    horizon: int,
+    n_gaussian_samples: int,
+    n_pi_samples: int,
+    cem_iterations: int,
+    num_steps: int,
+    num_warmup_steps: int,
+    fps: float,
+    device: str,
+):
+    config_kwargs = {
+        "horizon": horizon,
+        "n_gaussian_samples": n_gaussian_samples,
+        "n_pi_samples": n_pi_samples,
+        "cem_iterations": cem_iterations,
+    }
+    budget_ms = 1e3 / fps
+    print(f"Control period at {fps:g} fps: {budget_ms:.1f} ms")
+    print(
+        f"{'planner':<10} {'warmup (s)':>10} {'p50 (ms)':>9} {'p95 (ms)':>9} {'speedup':>8} {'in budget':>10}"
+    )
+    reference_p50 = None
+    for planner in planners:
+        policy = make_policy(planner, state_dim, action_dim, config_kwargs, device)
+        z = torch.randn(batch_size, policy.config.latent_dim, device=device)
+        latencies, warmup_duration = benchmark(policy, z, num_steps, num_warmup_steps, device)
+        p50, p95 = torch.quantile(latencies, torch.tensor([0.5, 0.95], dtype=latencies.dtype)).tolist()
+        if reference_p50 is None:
+            reference_p50 = p50
+        print(
+            f"{planner:<10} {warmup_duration:>10.1f} {p50:>9.2f} {p95:>9.2f} {reference_p50 / p50:>7.2f}x "
+            f"{str(p95 <= budget_ms):>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--planners",
+        type=str,
+        nargs="*",
+        choices=list(PLANNER_KWARGS),
+        default=["reference", "static"],
+        help="Planners to be tested. Speedups are relative to the first one.",
+    )
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--state-dim", type=int, default=4)
+    parser.add_argument("--action-dim", type=int, default=4)
+    parser.add_argument("--horizon", type=int, default=5)
+    parser.add_argument("--n-gaussian-samples", type=int, default=512)
+    parser.add_argument("--n-pi-samples", type=int, default=51)
+    parser.add_argument("--cem-iterations", type=int, default=6)
+    parser.add_argument("--num-steps", type=int, default=50, help="Number of timed planning steps.")
+    parser.add_argument(
+        "--num-warmup-steps",
+        type=int,
+        default=3,
+        help="Number of untimed planning steps (compilation happens during the first ones).",
+    )
+    parser.add_argument(
+        "--fps", type=float, default=30, help="Control frequency the planner has to keep up with."
+    )
+    parser.add_argument("--device", type=str, default="cpu")
+    args = parser.parse_args()
+    main(**vars(args))
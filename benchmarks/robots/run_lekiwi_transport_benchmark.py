@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the formats of the observations sent by the LeKiwi host to the client, over loopback.
+
+A `LeKiwiHost` runs in a separate process and sends synthetic observations, with the state and the two
+cameras of LeKiwi, at `--fps`. A `LeKiwiClient` reads each of them as it arrives with `get_observation`. For
+each format, the benchmark reports the size of an observation, the latency from its encoding on the host to
+its decoding by the client, and the CPU time per observation of the host and of the client processes. The
+latency is the `observation_clock_delta_s` logged by the client, which is only a latency here as the host and
+the client share the clock of the machine. The formats are:
+- `json`: JSON with base64-encoded JPEG images, the previous format,
+- `multipart-jpeg`: binary header and JPEG images as separate frames,
+- `multipart-raw`: binary header and raw images as separate frames, sent and received without copy.
+
+Example:
+
+```bash
+python benchmarks/robots/run_lekiwi_transport_benchmark.py --formats json multipart-jpeg --fps 30
+```
+"""
+
+import argparse
+import multiprocessing
+import socket
+import time
+
+import numpy as np
+import zmq
+
+from lerobot.robots.lekiwi import LeKiwiClient, LeKiwiClientConfig
+from lerobot.robots.lekiwi.config_lekiwi import LeKiwiHostConfig, lekiwi_cameras_config
+from lerobot.robots.lekiwi.lekiwi_host import LeKiwiHost
+from lerobot.robots.lekiwi.observation_protocol import encode_observation, encode_observation_json
+
+STATE_KEYS = (
+    "arm_shoulder_pan.pos",
+    "arm_shoulder_lift.pos",
+    "arm_elbow_flex.pos",
+    "arm_wrist_flex.pos",
+    "arm_wrist_roll.pos",
+    "arm_gripper.pos",
+    "x.vel",
+    "y.vel",
+    "theta.vel",
+)
+
+
+def make_observation(rng: np.random.Generator) -> dict:
+    """Observation with the cameras of LeKiwi, with gradients and noise as images to compress like photos."""
+    observation = {
+        key: float(value) for key, value in zip(STATE_KEYS, rng.uniform(-1, 1, len(STATE_KEYS)), strict=True)
+    }
+    for name, cfg in lekiwi_cameras_config().items():
+        gradient = (
+            np.linspace(0, 200, cfg.width)[None, :, None] + np.linspace(0, 40, cfg.height)[:, None, None]
+        )
+        noise = rng.normal(0, 6, (cfg.height, cfg.width, 3))
+        observation[name] = np.clip(gradient + noise, 0, 255).astype(np.uint8)
+    return observation
+
+
+def message_size(observation: dict, observation_format: str, image_encoding: str) -> int:
+    image_keys = list(lekiwi_cameras_config())
+    if observation_format == "json":
+        return len(encode_observation_json(observation, image_keys))
+    frames = encode_observation(observation, image_keys, 0, image_encoding)
+    return sum(memoryview(frame).nbytes for frame in frames)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_host(host_config: LeKiwiHostConfig, fps: int, duration_s: float, results: multiprocessing.Queue):
+    host = LeKiwiHost(host_config)
+    observation = make_observation(np.random.default_rng(0))
+    image_keys = list(lekiwi_cameras_config())
+    num_sent = 0
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    tick = 0
+    while (now := time.perf_counter()) - start < duration_s:
+        try:
+            # The cameras return new arrays at every observation.
+            host.send_observation(dict(observation), image_keys)
+            num_sent += 1
+        except zmq.Again:
+            pass
+        tick += 1
+        time.sleep(max(start + tick / fps - now, 0))
+    results.put((time.process_time() - start_cpu, num_sent))
+    host.disconnect()
+
+
+def run_format(name: str, fps: int, duration_s: float) -> dict:
+    observation_format, _, image_encoding = name.partition("-")
+    host_config = LeKiwiHostConfig(
+        port_zmq_cmd=free_port(),
+        port_zmq_observations=free_port(),
+        observation_format=observation_format,
+        image_encoding=image_encoding or "jpeg",
+    )
+    results = multiprocessing.Queue()
+    host_process = multiprocessing.Process(target=run_host, args=(host_config, fps, duration_s + 2, results))
+    host_process.start()
+
+    client = LeKiwiClient(
+        LeKiwiClientConfig(
+            remote_ip="127.0.0.1",
+            port_zmq_cmd=host_config.port_zmq_cmd,
+            port_zmq_observations=host_config.port_zmq_observations,
+        )
+    )
+    client.connect()
+    latencies = []
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration_s:
+        # Waits for the next observation, up to the polling timeout of the client.
+        client.get_observation()
+        if (latency := client.logs.pop("observation_clock_delta_s", None)) is not None:
+            latencies.append(latency)
+    client_cpu_s = time.process_time() - start_cpu
+    client.disconnect()
+
+    host_cpu_s, num_sent = results.get()
+    host_process.join()
+    latencies = np.array(latencies) * 1e3
+    size = message_size(make_observation(np.random.default_rng(0)), observation_format, image_encoding)
+    return {
+        "size_kb": size / 1e3,
+        "latency_mean_ms": latencies.mean(),
+        "latency_p99_ms": np.percentile(latencies, 99),
+        "host_cpu_ms": host_cpu_s / num_sent * 1e3,
+        "client_cpu_ms": client_cpu_s / len(latencies) * 1e3,
+        "received": len(latencies),
+    }
+
+
+def main(formats: list[str], fps: int, duration_s: float):
+    print(
+        f"{'format':>15} {'size (kB)':>9} {'latency mean (ms)':>17} {'latency p99 (ms)':>16} "
+        f"{'host cpu/obs (ms)':>17} {'client cpu/obs (ms)':>19} {'received':>8}"
+    )
+    for name in formats:
+        r = run_format(name, fps, duration_s)
+        print(
+            f"{name:>15} {r['size_kb']:>9.1f} {r['latency_mean_ms']:>17.2f} {r['latency_p99_ms']:>16.2f} "
+            f"{r['host_cpu_ms']:>17.2f} {r['client_cpu_ms']:>19.2f} {r['received']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--formats",
+        type=str,
+        nargs="+",
+        default=["json", "multipart-jpeg", "multipart-raw"],
+        choices=["json", "multipart-jpeg", "multipart-raw"],
+        help="Observation formats to compare.",
+    )
+    parser.add_argument("--fps", type=int, default=30, help="Rate at which the host sends observations.")
+    parser.add_argument(
+        "--duration-s", type=float, default=5.0, help="Duration of the measurement per format."
+    )
+    args = parser.parse_args()
+    main(**vars(args))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the latency and the detections of the CPU inference paths of the RT-DETR detector of the OAK-D.
+
+The detector runs on the crops of stored frames, in batches of `--batch-size` frames as for that many cameras,
+with each path given as `backend:processing` (see `RTDetrDetector`). The first path is the reference, the fp32
+model with the Hugging Face image processor by default.
+
+For each path, the benchmark reports the wall time and the CPU time of the process per batch, and how much its
+detections drift from the ones of the reference: the mAP of the detections taking the reference detections as
+ground truth, at an IoU of 0.5 and averaged over IoUs from 0.5 to 0.95 as in COCO. The reference scores 1.
+
+Example:
+
+```bash
+python benchmarks/teleoperators/run_rtdetr_benchmark.py \
+    --model-path path/to/model_5_rtdetr \
+    --frames-dir path/to/frames \
+    --paths fp32:hf fp32:numpy int8:numpy onnx:numpy onnx_int8:numpy
+```
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from lerobot.teleoperators.pearlywhite_keyboard.rtdetr import RTDetrDetector
+
+COCO_IOU_THRESHOLDS = np.linspace(0.5, 0.95, 10)
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """IoUs of every pair of (x_min, y_min, x_max, y_max) boxes, of shape (len(boxes_a), len(boxes_b))."""
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=-1)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=-1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=-1)
+    return intersection / np.maximum(area_a[:, None] + area_b[None, :] - intersection, 1e-9)
+
+
+def average_precision(references: list[dict], detections: list[dict], iou_threshold: float) -> float:
+    """101-point interpolated AP as in COCO, averaged over the classes of the reference detections."""
+    classes = np.unique(np.concatenate([reference["labels"] for reference in references]))
+    aps = []
+    for label in classes:
+        num_targets = 0
+        scores, true_positives = [], []
+        for reference, detection in zip(references, detections, strict=True):
+            targets = reference["boxes"][reference["labels"] == label]
+            num_targets += len(targets)
+            mask = detection["labels"] == label
+            order = np.argsort(-detection["scores"][mask], kind="stable")
+            boxes, box_scores = detection["boxes"][mask][order], detection["scores"][mask][order]
+            ious = box_iou(boxes, targets)
+            matched = np.zeros(len(targets), dtype=bool)
+            for box_ious, score in zip(ious, box_scores, strict=True):
+                box_ious = np.where(matched, -1.0, box_ious)
+                best = int(np.argmax(box_ious)) if len(targets) else -1
+                is_match = best >= 0 and box_ious[best] >= iou_threshold
+                if is_match:
+                    matched[best] = True
+                scores.append(score)
+                true_positives.append(is_match)
+
+        order = np.argsort(-np.array(scores), kind="stable")
+        cumulative = np.cumsum(np.array(true_positives, dtype=np.float64)[order])
+        precision = cumulative / np.arange(1, len(cumulative) + 1)
+        recall = cumulative / num_targets
+        # Precision envelope, sampled at 101 recall levels.
+        precision = np.maximum.accumulate(precision[::-1])[::-1]
+        indices = np.searchsorted(recall, np.linspace(0, 1, 101), side="left")
+        aps.append(
+            np.where(indices < len(precision), precision[np.minimum(indices, len(precision) - 1)], 0).mean()
+        )
+    return float(np.mean(aps)) if aps else float("nan")
+
+
+def load_frames(frames_dir: Path, crop: list[int], max_frames: int) -> list[np.ndarray]:
+    x_min, y_min, x_max, y_max = crop
+    paths = sorted(p for p in frames_dir.iterdir() if p.suffix in (".png", ".jpg", ".jpeg"))[:max_frames]
+    return [cv2.imread(str(p))[y_min:y_max, x_min:x_max] for p in paths]
+
+
+def run_path(detector: RTDetrDetector, frames: list[np.ndarray], batch_size: int, n_warmup: int):
+    """Returns the detections of every frame, and the wall and CPU times of each batch."""
+    batches = [frames[i : i + batch_size] for i in range(0, len(frames), batch_size)]
+    for batch in batches[:n_warmup]:
+        detector(batch)
+    detections, wall_times, cpu_times = [], [], []
+    for batch in batches:
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        detections.extend(detector(batch))
+        wall_times.append(time.perf_counter() - start_wall)
+        cpu_times.append(time.process_time() - start_cpu)
+    return detections, np.array(wall_times), np.array(cpu_times)
+
+
+def main(
+    model_path: str,
+    frames_dir: Path,
+    paths: list[str],
+    crop: list[int],
+    batch_size: int,
+    threshold: float,
+    max_frames: int,
+    n_warmup: int,
+    num_threads: int | None,
+):
+    frames = load_frames(frames_dir, crop, max_frames)
+    print(f"{len(frames)} frames of {frames[0].shape[1]}x{frames[0].shape[0]}, batches of {batch_size}")
+    print(
+        f"{'path':>16} {'wall mean (ms)':>14} {'wall p99 (ms)':>13} {'cpu mean (ms)':>13} "
+        f"{'detections':>10} {'mAP@0.5':>8} {'mAP@[.5:.95]':>12}"
+    )
+    references = None
+    for path in paths:
+        backend, processing = path.split(":")
+        detector = RTDetrDetector(
+            model_path,
+            threshold=threshold,
+            backend=backend,
+            processing=processing,
+            max_batch_size=batch_size,
+            num_threads=num_threads,
+        )
+        detections, wall_times, cpu_times = run_path(detector, frames, batch_size, n_warmup)
+        if references is None:
+            references = detections
+        map_50 = average_precision(references, detections, 0.5)
+        map_coco = np.mean([average_precision(references, detections, iou) for iou in COCO_IOU_THRESHOLDS])
+        num_detections = sum(len(detection["scores"]) for detection in detections)
+        print(
+            f"{path:>16} {wall_times.mean() * 1e3:>14.1f} {np.percentile(wall_times, 99) * 1e3:>13.1f} "
+            f"{cpu_times.mean() * 1e3:>13.1f} {num_detections:>10} {map_50:>8.3f} {map_coco:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--model-path", type=str, required=True, help="Directory of the pretrained model.")
+    parser.add_argument("--frames-dir", type=Path, required=True, help="Directory of stored color frames.")
+    parser.add_argument(
+        "--paths",
+        type=str,
+        nargs="+",
+        default=["fp32:hf", "fp32:numpy", "int8:numpy"],
+        help="Inference paths as `backend:processing`, the first one being the reference.",
+    )
+    parser.add_argument(
+        "--crop",
+        type=int,
+        nargs=4,
+        default=[357, 330, 1839, 1094],
+        help="x_min y_min x_max y_max of the region of the frames to detect objects in.",
+    )
+    parser.add_argument("--batch-size", type=int, default=1, help="Number of frames per batch, as cameras.")
+    parser.add_argument("--threshold", type=float, default=0.35, help="Minimum score of the detections.")
+    parser.add_argument("--max-frames", type=int, default=50, help="Maximum number of frames to load.")
+    parser.add_argument("--n-warmup", type=int, default=2, help="Number of batches run before timing.")
+    parser.add_argument("--num-threads", type=int, default=None, help="Number of threads of ONNX Runtime.")
+    args = parser.parse_args()
+    main(**vars(args))
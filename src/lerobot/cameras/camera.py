@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import abc
+import time
 from typing import Any
 
 import numpy as np
@@ -114,6 +115,21 @@ class Camera(abc.ABC):
         """
         pass
 
+    def async_read_with_timestamp(self, timeout_ms: float = 200) -> tuple[np.ndarray, float]:
+        """Asynchronously capture a single frame and return it with its capture time.
+
+        Cameras which know when their frames were captured override this method. By default, the
+        capture time is approximated by the time at which `async_read` returned.
+
+        Args:
+            timeout_ms: Maximum time to wait for a frame in milliseconds.
+
+        Returns:
+            tuple[np.ndarray, float]: Captured frame and its `time.perf_counter()` capture time.
+        """
+        frame = self.async_read(timeout_ms)
+        return frame, time.perf_counter()
+
     @abc.abstractmethod
     def disconnect(self) -> None:
         """Disconnect from the camera and release resources."""
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Event, Thread
+
+import numpy as np
+
+from lerobot.utils.errors import DeviceNotConnectedError
+
+from .camera import Camera
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimestampedFrame:
+    """A frame and the `time.perf_counter()` time at which it was captured."""
+
+    frame: np.ndarray
+    timestamp: float
+
+
+class CameraGroup:
+    """Reads several cameras together, with the capture time of their frames.
+
+    Reading cameras one after the other with `async_read` waits for each of them in turn, so gathering N
+    cameras takes the sum of their latencies and their frames are captured at unrelated times. A camera group
+    runs one collector thread per camera, which keeps the last `history` frames of the camera with their
+    capture times. Reads then wait on all the cameras at once, so they take the maximum of the latencies, and
+    frames can be chosen by their capture time.
+
+    The group owns the `async_read` of its cameras: they must be connected before the group is started, and
+    must not be read by anything else while it runs.
+
+    Example:
+        ```python
+        cameras = make_cameras_from_configs(config.cameras)
+        for cam in cameras.values():
+            cam.connect()
+        group = CameraGroup(cameras)
+
+        # Next frame of every camera
+        frames = group.read()
+        # Frames captured the closest to a trigger time, e.g. when the robot state was read
+        frames = group.read_nearest(state_timestamp)
+
+        group.stop()
+        ```
+    """
+
+    def __init__(self, cameras: dict[str, Camera], history: int = 4, timeout_ms: float = 200):
+        """
+        Args:
+            cameras: The cameras of the group, by name.
+            history: Number of frames kept per camera to choose from in `read_nearest`.
+            timeout_ms: Default maximum time to wait for frames, in milliseconds.
+        """
+        self.cameras = cameras
+        self.history = history
+        self.timeout_ms = timeout_ms
+
+        self._frames: dict[str, deque[TimestampedFrame]] = {name: deque(maxlen=history) for name in cameras}
+        self._condition = Condition()
+        self._threads: list[Thread] = []
+        self._stop_event = Event()
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """Starts the collector threads."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        for frames in self._frames.values():
+            frames.clear()
+        self._threads = [
+            Thread(target=self._collect, args=(name, cam), name=f"{cam}_collector", daemon=True)
+            for name, cam in self.cameras.items()
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stops the collector threads, before the cameras are disconnected."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        self._threads = []
+
+    def _collect(self, name: str, cam: Camera) -> None:
+        while not self._stop_event.is_set():
+            try:
+                frame, timestamp = cam.async_read_with_timestamp(timeout_ms=self.timeout_ms)
+            except TimeoutError:
+                continue
+            except DeviceNotConnectedError:
+                break
+            except Exception as e:
+                logger.warning(f"Error reading frame in collector thread for {cam}: {e}")
+                continue
+
+            with self._condition:
+                self._frames[name].append(TimestampedFrame(frame, timestamp))
+                self._condition.notify_all()
+
+    def _wait_for(self, min_timestamp: float, timeout_ms: float | None) -> None:
+        """Waits until every camera has a frame captured at or after `min_timestamp`, or the timeout."""
+        if not self.is_running:
+            self.start()
+        timeout_s = (self.timeout_ms if timeout_ms is None else timeout_ms) / 1000.0
+        self._condition.wait_for(
+            lambda: all(frames and frames[-1].timestamp >= min_timestamp for frames in self._frames.values()),
+            timeout=timeout_s,
+        )
+
+    def read(self, timeout_ms: float | None = None) -> dict[str, TimestampedFrame]:
+        """Waits for the next frame of every camera.
+
+        Raises:
+            TimeoutError: If a camera did not capture a new frame within the timeout.
+        """
+        start = time.perf_counter()
+        with self._condition:
+            self._wait_for(start, timeout_ms)
+            late = [
+                name for name, frames in self._frames.items() if not frames or frames[-1].timestamp < start
+            ]
+            if late:
+                raise TimeoutError(f"Timed out waiting for a new frame from cameras {late}.")
+            return {name: frames[-1] for name, frames in self._frames.items()}
+
+    def read_nearest(self, trigger_t: float, timeout_ms: float | None = None) -> dict[str, TimestampedFrame]:
+        """Returns the frame of every camera captured the closest to `trigger_t`.
+
+        Waits until every camera has a frame captured at or after `trigger_t`, so that the frames on both sides
+        of the trigger are compared. After the timeout, the closest frame received so far is returned.
+
+        Raises:
+            TimeoutError: If a camera has not captured any frame within the timeout.
+        """
+        with self._condition:
+            self._wait_for(trigger_t, timeout_ms)
+            missing = [name for name, frames in self._frames.items() if not frames]
+            if missing:
+                raise TimeoutError(f"Timed out waiting for a frame from cameras {missing}.")
+            return {
+                name: min(frames, key=lambda frame: abs(frame.timestamp - trigger_t))
+                for name, frames in self._frames.items()
+            }
+
+    def latest(self) -> dict[str, TimestampedFrame]:
+        """Returns the latest frame received from each camera, without waiting."""
+        with self._condition:
+            return {name: frames[-1] for name, frames in self._frames.items() if frames}
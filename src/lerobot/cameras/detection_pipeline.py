@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Frame capture and object detection running in background threads, decoupled from each other.
+
+Capture threads read every stream of a `FrameSource` and keep only its latest frame, so a slow consumer never
+delays the acquisition. A `DetectionWorker` runs the detector on the most recent frames of one or several
+streams, batched together, and publishes timestamped detections which are read without blocking.
+"""
+
+import abc
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any
+
+import cv2
+import numpy as np
+
+from .camera_group import TimestampedFrame
+
+logger = logging.getLogger(__name__)
+
+# ((x_min, y_min), (x_max, y_max)) region of a frame, in pixels.
+Crop = tuple[tuple[int, int], tuple[int, int]]
+
+
+class LatestFrame:
+    """Thread-safe holder of the latest frame of a stream and of its sequence number."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._frame: TimestampedFrame | None = None
+        # Sequence number of the latest frame, 0 before the first one.
+        self.sequence = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Registers a callback called, from the writer thread, after each new frame."""
+        self._listeners.append(callback)
+
+    def put(self, frame: np.ndarray, timestamp: float) -> int:
+        with self._lock:
+            self._frame = TimestampedFrame(frame, timestamp)
+            self.sequence += 1
+            sequence = self.sequence
+        for callback in self._listeners:
+            callback()
+        return sequence
+
+    def get(self) -> tuple[TimestampedFrame | None, int]:
+        """Returns the latest frame, or None before the first one, and its sequence number."""
+        with self._lock:
+            return self._frame, self.sequence
+
+
+class FrameSource(abc.ABC):
+    """Source of the frames of several streams, e.g. the color, depth and disparity outputs of a device."""
+
+    @property
+    @abc.abstractmethod
+    def streams(self) -> Sequence[str]:
+        pass
+
+    @abc.abstractmethod
+    def read(self, stream: str, timeout_s: float) -> np.ndarray | None:
+        """Waits for the next frame of `stream`, and returns None if none arrived within `timeout_s`."""
+        pass
+
+
+class RecordedFrameSource(FrameSource):
+    """Replays recorded frames at a fixed rate, in place of a device.
+
+    Args:
+        frames: The frames of each stream, in order.
+        fps: Rate at which the frames of each stream are returned.
+        loop: Whether to start over after the last frame. Otherwise, `read` returns None once the frames are
+            exhausted.
+    """
+
+    def __init__(self, frames: dict[str, Sequence[np.ndarray]], fps: float = 30.0, loop: bool = True):
+        self.frames = frames
+        self.period_s = 1.0 / fps
+        self.loop = loop
+        self._indices = dict.fromkeys(frames, 0)
+        self._next_t = dict.fromkeys(frames, 0.0)
+
+    @classmethod
+    def from_directory(cls, root: str | Path, **kwargs) -> "RecordedFrameSource":
+        """Loads the images of each subdirectory of `root` as a stream named after it, sorted by file name."""
+        frames = {}
+        for stream_dir in sorted(Path(root).iterdir()):
+            if stream_dir.is_dir():
+                paths = sorted(p for p in stream_dir.iterdir() if p.suffix in (".png", ".jpg", ".jpeg"))
+                frames[stream_dir.name] = [cv2.imread(str(p), cv2.IMREAD_UNCHANGED) for p in paths]
+        return cls(frames, **kwargs)
+
+    @property
+    def streams(self) -> Sequence[str]:
+        return list(self.frames)
+
+    def read(self, stream: str, timeout_s: float) -> np.ndarray | None:
+        frames = self.frames[stream]
+        index = self._indices[stream]
+        if index >= len(frames):
+            if not self.loop:
+                time.sleep(timeout_s)
+                return None
+            index = 0
+
+        remaining = self._next_t[stream] - time.perf_counter()
+        if remaining > timeout_s:
+            time.sleep(timeout_s)
+            return None
+        if remaining > 0:
+            time.sleep(remaining)
+        self._next_t[stream] = max(self._next_t[stream] + self.period_s, time.perf_counter())
+        self._indices[stream] = index + 1
+        return frames[index]
+
+
+@dataclass(frozen=True)
+class Detections:
+    """Detections of a frame, with the time at which the frame was received and its sequence number."""
+
+    results: Any
+    timestamp: float
+    sequence: int
+    # Time from the reception of the frame to the publication of the detections.
+    latency_s: float
+
+
+class DetectionWorker:
+    """Runs a detector in a background thread on the most recent frames of one or several streams.
+
+    Whenever new frames are available, the worker takes the latest frame of every input with a new frame,
+    crops them and runs the detector once on the batch. Frames received while the detector runs are only kept
+    if they are the latest of their stream, so the detections lag the frames by at most one inference, and the
+    frames dropped this way are counted in `skipped_frames`.
+
+    Args:
+        detector: Called with a list of frames, returns one result per frame.
+        inputs: The latest frames of the streams to run the detector on, by name.
+        crops: Optional region of the frames of each input to run the detector on.
+    """
+
+    def __init__(
+        self,
+        detector: Callable[[list[np.ndarray]], Sequence[Any]],
+        inputs: dict[str, LatestFrame],
+        crops: dict[str, Crop] | None = None,
+    ):
+        self.detector = detector
+        self.inputs = inputs
+        self.crops = crops or {}
+
+        self._new_frame = Event()
+        for latest in inputs.values():
+            latest.add_listener(self._new_frame.set)
+        self._processed = dict.fromkeys(inputs, 0)
+        self._lock = Lock()
+        self._detections: dict[str, Detections] = {}
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+
+        self.num_batches = 0
+        self.skipped_frames = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="detection_worker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._new_frame.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def latest(self, name: str | None = None) -> Detections | None:
+        """Returns the latest detections of input `name`, or of the only input, without waiting."""
+        if name is None:
+            (name,) = self.inputs
+        with self._lock:
+            return self._detections.get(name)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._new_frame.wait()
+            self._new_frame.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.detect_batch()
+            except Exception as e:
+                logger.warning(f"Error running the detector in {self}: {e}")
+
+    def detect_batch(self) -> int:
+        """Runs the detector on the new frames of the inputs, if any, and returns the size of the batch."""
+        names, frames, batch = [], [], []
+        for name, latest in self.inputs.items():
+            frame, sequence = latest.get()
+            if frame is None or sequence == self._processed[name]:
+                continue
+            self.skipped_frames += sequence - self._processed[name] - 1
+            self._processed[name] = sequence
+            names.append((name, sequence))
+            frames.append(frame)
+            batch.append(self._crop(name, frame.frame))
+        if not batch:
+            return 0
+
+        results = self.detector(batch)
+        now = time.perf_counter()
+        with self._lock:
+            for (name, sequence), frame, result in zip(names, frames, results, strict=True):
+                self._detections[name] = Detections(result, frame.timestamp, sequence, now - frame.timestamp)
+        self.num_batches += 1
+        return len(batch)
+
+    def _crop(self, name: str, frame: np.ndarray) -> np.ndarray:
+        if name not in self.crops:
+            return frame
+        (x_min, y_min), (x_max, y_max) = self.crops[name]
+        return frame[y_min:y_max, x_min:x_max]
+
+
+class FramePipeline:
+    """Captures every stream of a frame source in a background thread, keeping only their latest frame.
+
+    When a detector is given, a `DetectionWorker` runs it on the frames of `detection_stream`. To batch the
+    detections of several devices together, create the pipelines without a detector and a single worker on
+    their `frames[stream]` instead.
+
+    Example:
+        ```python
+        pipeline = FramePipeline(
+            RecordedFrameSource.from_directory("frames/"), detector, crop=((0, 0), (640, 360))
+        )
+        pipeline.start()
+        rgb = pipeline.latest("rgb")
+        detections = pipeline.latest_detections()
+        pipeline.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        source: FrameSource,
+        detector: Callable[[list[np.ndarray]], Sequence[Any]] | None = None,
+        detection_stream: str = "rgb",
+        crop: Crop | None = None,
+        timeout_s: float = 0.1,
+    ):
+        self.source = source
+        self.timeout_s = timeout_s
+        self.frames = {stream: LatestFrame() for stream in source.streams}
+        self.detection_worker = None
+        if detector is not None:
+            self.detection_worker = DetectionWorker(
+                detector,
+                {detection_stream: self.frames[detection_stream]},
+                crops=None if crop is None else {detection_stream: crop},
+            )
+        self._stop_event = Event()
+        self._threads: list[Thread] = []
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._threads = [
+            Thread(target=self._capture, args=(stream,), name=f"{stream}_capture", daemon=True)
+            for stream in self.frames
+        ]
+        for thread in self._threads:
+            thread.start()
+        if self.detection_worker is not None:
+            self.detection_worker.start()
+
+    def stop(self) -> None:
+        if self.detection_worker is not None:
+            self.detection_worker.stop()
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        self._threads = []
+
+    def _capture(self, stream: str) -> None:
+        latest = self.frames[stream]
+        while not self._stop_event.is_set():
+            try:
+                frame = self.source.read(stream, self.timeout_s)
+            except Exception as e:
+                logger.warning(f"Error reading stream '{stream}' of {self.source}: {e}")
+                time.sleep(self.timeout_s)
+                continue
+            if frame is not None:
+                latest.put(frame, time.perf_counter())
+
+    def latest(self, stream: str) -> TimestampedFrame | None:
+        """Returns the latest frame of `stream`, or None before the first one, without waiting."""
+        return self.frames[stream].get()[0]
+
+    def latest_detections(self) -> Detections | None:
+        """Returns the latest detections, or None before the first ones, without waiting."""
+        if self.detection_worker is None:
+            return None
+        return self.detection_worker.latest()
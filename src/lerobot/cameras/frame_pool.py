@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Lock
+
+import numpy as np
+
+
+class FramePool:
+    """Preallocated frame buffers, reused in turn by a single writer and published with a sequence number.
+
+    The writer fills the buffer returned by `next_slot` and publishes it with `publish`, so that capturing a
+    frame does not allocate. Frame `k` (starting at 1) is written to slot `(k - 1) % size`, so with the
+    default triple buffering the writer fills one buffer while the latest frame and the previous one stay
+    intact. Readers get read-only views of the buffers: a view of frame `k` stays valid until the writer
+    starts writing frame `k + size`, which `is_valid` checks. Readers keeping frames longer must copy them.
+    """
+
+    def __init__(self, shape: tuple[int, ...], size: int = 3, dtype: np.dtype = np.uint8):
+        if size < 2:
+            raise ValueError(f"`size` must be at least 2, got {size}.")
+        self.size = size
+        self.buffers = [np.empty(shape, dtype=dtype) for _ in range(size)]
+        self._views = []
+        for buffer in self.buffers:
+            view = buffer.view()
+            view.flags.writeable = False
+            self._views.append(view)
+        self._timestamps = [0.0] * size
+        self._lock = Lock()
+        # Sequence number of the latest published frame, 0 before the first one.
+        self.sequence = 0
+
+    def next_slot(self) -> int:
+        """Index of the buffer to write the next frame to."""
+        return self.sequence % self.size
+
+    def publish(self, slot: int, timestamp: float) -> int:
+        """Publishes the frame written to `slot`, and returns its sequence number."""
+        with self._lock:
+            self._timestamps[slot] = timestamp
+            self.sequence += 1
+            return self.sequence
+
+    def latest(self) -> tuple[np.ndarray, float, int]:
+        """Returns a read-only view of the latest frame, its timestamp and its sequence number."""
+        with self._lock:
+            sequence = self.sequence
+            if sequence == 0:
+                raise RuntimeError("No frame was published yet.")
+            slot = (sequence - 1) % self.size
+            return self._views[slot], self._timestamps[slot], sequence
+
+    def is_valid(self, sequence: int) -> bool:
+        """Whether the view of frame `sequence` was not overwritten, nor is being overwritten, by the writer."""
+        # The writer starts writing frame `sequence + size` once frame `sequence + size - 1` is published.
+        return self.sequence - sequence <= self.size - 2
@@ -34,6 +34,7 @@ import numpy as np
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from ..camera import Camera
+from ..frame_pool import FramePool
 from ..utils import get_cv2_backend, get_cv2_rotation
 from .configuration_opencv import ColorMode, OpenCVCameraConfig
 
@@ -121,7 +122,7 @@ class OpenCVCamera(Camera):
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
         self.frame_lock: Lock = Lock()
-        self.latest_frame: np.ndarray | None = None
+        self.frame_pool: FramePool | None = None
         self.new_frame_event: Event = Event()
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
@@ -329,7 +330,9 @@ class OpenCVCamera(Camera):
 
         return processed_frame
 
-    def _postprocess_image(self, image: np.ndarray, color_mode: ColorMode | None = None) -> np.ndarray:
+    def _postprocess_image(
+        self, image: np.ndarray, color_mode: ColorMode | None = None, dst: np.ndarray | None = None
+    ) -> np.ndarray:
         """
         Applies color conversion, dimension validation, and rotation to a raw frame.
 
@@ -337,6 +340,8 @@ class OpenCVCamera(Camera):
             image (np.ndarray): The raw image frame (expected BGR format from OpenCV).
             color_mode (Optional[ColorMode]): The target color mode (RGB or BGR). If None,
                                              uses the instance's default `self.color_mode`.
+            dst (Optional[np.ndarray]): Preallocated buffer to write the processed frame to, without
+                allocating. In that case `image` may be modified in place, and may be `dst` itself.
 
         Returns:
             np.ndarray: The processed image frame.
@@ -365,31 +370,68 @@ class OpenCVCamera(Camera):
 
         processed_image = image
         if requested_color_mode == ColorMode.RGB:
-            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=None if dst is None else image)
 
-        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
-            processed_image = cv2.rotate(processed_image, self.rotation)
+        if self._rotates:
+            processed_image = cv2.rotate(processed_image, self.rotation, dst=dst)
+        elif dst is not None and processed_image is not dst:
+            np.copyto(dst, processed_image)
+            processed_image = dst
 
         return processed_image
 
+    @property
+    def _rotates(self) -> bool:
+        return self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]
+
+    def _capture_to_pool(self) -> None:
+        """
+        Captures a frame into the next buffer of the frame pool and publishes it, without allocating.
+
+        Frames are read straight into the pool, or into a capture buffer when they are rotated, and color
+        converted in place. With `postprocess_in_reader`, the raw frames are published as they are.
+        """
+        slot = self.frame_pool.next_slot()
+        buffer = self.frame_pool.buffers[slot]
+        postprocess = not self.config.postprocess_in_reader
+        capture_buffer = self._capture_buffer if postprocess and self._rotates else buffer
+
+        ret, frame = self.videocapture.read(capture_buffer)
+        timestamp = time.perf_counter()
+
+        if not ret or frame is None:
+            raise RuntimeError(f"{self} read failed (status={ret}).")
+
+        if postprocess:
+            self._postprocess_image(frame, dst=buffer)
+        elif frame is not buffer:
+            # OpenCV allocates a new frame when it does not fit the buffer.
+            h, w = frame.shape[:2]
+            raise RuntimeError(
+                f"{self} frame width={w} or height={h} do not match configured width={self.capture_width} or height={self.capture_height}."
+            )
+
+        with self.frame_lock:
+            self.frame_pool.publish(slot, timestamp)
+            self.new_frame_event.set()
+
     def _read_loop(self):
         """
         Internal loop run by the background thread for asynchronous reading.
 
         On each iteration:
-        1. Reads a color frame
-        2. Stores result in latest_frame (thread-safe)
+        1. Reads a color frame into the next buffer of the frame pool
+        2. Publishes it with its capture time in the frame pool (thread-safe)
         3. Sets new_frame_event to notify listeners
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
         while not self.stop_event.is_set():
             try:
-                color_image = self.read()
+                if not self.is_connected:
+                    raise DeviceNotConnectedError(f"{self} is not connected.")
 
-                with self.frame_lock:
-                    self.latest_frame = color_image
-                self.new_frame_event.set()
+                self._capture_to_pool()
 
             except DeviceNotConnectedError:
                 break
@@ -403,11 +445,23 @@ class OpenCVCamera(Camera):
         if self.stop_event is not None:
             self.stop_event.set()
 
+        if self.frame_pool is None:
+            self._allocate_frame_pool()
+
         self.stop_event = Event()
         self.thread = Thread(target=self._read_loop, args=(), name=f"{self}_read_loop")
         self.thread.daemon = True
         self.thread.start()
 
+    def _allocate_frame_pool(self) -> None:
+        """Allocates the buffers frames are captured into by the background thread."""
+        capture_shape = (self.capture_height, self.capture_width, 3)
+        if self.config.postprocess_in_reader:
+            self.frame_pool = FramePool(capture_shape, self.config.frame_pool_size)
+        else:
+            self.frame_pool = FramePool((self.height, self.width, 3), self.config.frame_pool_size)
+        self._capture_buffer = np.empty(capture_shape, dtype=np.uint8) if self._rotates else None
+
     def _stop_read_thread(self) -> None:
         """Signals the background read thread to stop and waits for it to join."""
         if self.stop_event is not None:
@@ -419,21 +473,23 @@ class OpenCVCamera(Camera):
         self.thread = None
         self.stop_event = None
 
-    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+    def async_read_view(self, timeout_ms: float = 200) -> tuple[np.ndarray, float, int]:
         """
-        Reads the latest available frame asynchronously.
+        Reads the latest available frame asynchronously, without copying it.
 
-        This method retrieves the most recent frame captured by the background
-        read thread. It does not block waiting for the camera hardware directly,
-        but may wait up to timeout_ms for the background thread to provide a frame.
+        The frame is a read-only view of a buffer of the frame pool, which the background thread
+        overwrites `frame_pool_size - 1` frames later. Check `frame_pool.is_valid(sequence)` after
+        using the view, or copy it to keep it longer. With `postprocess_in_reader`, the view is the
+        raw captured frame, before color conversion and rotation.
 
         Args:
             timeout_ms (float): Maximum time in milliseconds to wait for a frame
                 to become available. Defaults to 200ms (0.2 seconds).
 
         Returns:
-            np.ndarray: The latest captured frame as a NumPy array in the format
-                       (height, width, channels), processed according to configuration.
+            np.ndarray: Read-only view of the latest captured frame.
+            float: The `time.perf_counter()` time at which the frame was captured.
+            int: The sequence number of the frame in the frame pool.
 
         Raises:
             DeviceNotConnectedError: If the camera is not connected.
@@ -454,12 +510,56 @@ class OpenCVCamera(Camera):
             )
 
         with self.frame_lock:
-            frame = self.latest_frame
+            if self.frame_pool.sequence == 0:
+                raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
+            frame, timestamp, sequence = self.frame_pool.latest()
             self.new_frame_event.clear()
 
-        if frame is None:
-            raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
+        return frame, timestamp, sequence
+
+    def async_read_with_timestamp(self, timeout_ms: float = 200) -> tuple[np.ndarray, float]:
+        """
+        Reads the latest available frame asynchronously.
 
+        This method retrieves the most recent frame captured by the background
+        read thread. It does not block waiting for the camera hardware directly,
+        but may wait up to timeout_ms for the background thread to provide a frame.
+        The frame is copied out of the frame pool, or color converted and rotated
+        into a new array with `postprocess_in_reader`.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a frame
+                to become available. Defaults to 200ms (0.2 seconds).
+
+        Returns:
+            np.ndarray: The latest captured frame as a NumPy array in the format
+                       (height, width, channels), processed according to configuration.
+            float: The `time.perf_counter()` time at which the frame was captured.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+            RuntimeError: If an unexpected error occurs.
+        """
+        view, timestamp, sequence = self.async_read_view(timeout_ms)
+        while True:
+            if self.config.postprocess_in_reader:
+                frame = self._postprocess_image(view)
+                if frame is view:
+                    frame = view.copy()
+            else:
+                frame = view.copy()
+            if self.frame_pool.is_valid(sequence):
+                return frame, timestamp
+            # The buffer was overwritten while it was copied, the latest frame is taken instead.
+            with self.frame_lock:
+                view, timestamp, sequence = self.frame_pool.latest()
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        """
+        Reads the latest available frame asynchronously, see `async_read_with_timestamp`.
+        """
+        frame, _ = self.async_read_with_timestamp(timeout_ms)
         return frame
 
     def disconnect(self):
@@ -481,5 +581,6 @@ class OpenCVCamera(Camera):
         if self.videocapture is not None:
             self.videocapture.release()
             self.videocapture = None
+        self.frame_pool = None
 
         logger.info(f"{self} disconnected.")
@@ -46,6 +46,9 @@ class OpenCVCameraConfig(CameraConfig):
         color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
+        frame_pool_size: Number of preallocated buffers the background thread captures frames into.
+        postprocess_in_reader: If True, the background thread only captures frames, and the color
+            conversion and rotation are applied by `async_read` in the caller's thread.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
@@ -55,6 +58,8 @@ class OpenCVCameraConfig(CameraConfig):
     color_mode: ColorMode = ColorMode.RGB
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
+    frame_pool_size: int = 3
+    postprocess_in_reader: bool = False
 
     def __post_init__(self):
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -71,3 +76,6 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`rotation` is expected to be in {(Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90, Cv2Rotation.ROTATE_180, Cv2Rotation.ROTATE_270)}, but {self.rotation} is provided."
             )
+
+        if self.frame_pool_size < 2:
+            raise ValueError(f"`frame_pool_size` must be at least 2, but {self.frame_pool_size} is provided.")
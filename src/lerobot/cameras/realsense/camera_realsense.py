@@ -133,6 +133,7 @@ class RealSenseCamera(Camera):
         self.stop_event: Event | None = None
         self.frame_lock: Lock = Lock()
         self.latest_frame: np.ndarray | None = None
+        self.latest_timestamp: float | None = None
         self.new_frame_event: Event = Event()
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
@@ -444,7 +445,7 @@ class RealSenseCamera(Camera):
 
         On each iteration:
         1. Reads a color frame with 500ms timeout
-        2. Stores result in latest_frame (thread-safe)
+        2. Stores result and its capture time in latest_frame and latest_timestamp (thread-safe)
         3. Sets new_frame_event to notify listeners
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
@@ -452,9 +453,11 @@ class RealSenseCamera(Camera):
         while not self.stop_event.is_set():
             try:
                 color_image = self.read(timeout_ms=500)
+                timestamp = time.perf_counter()
 
                 with self.frame_lock:
                     self.latest_frame = color_image
+                    self.latest_timestamp = timestamp
                 self.new_frame_event.set()
 
             except DeviceNotConnectedError:
@@ -486,7 +489,7 @@ class RealSenseCamera(Camera):
         self.stop_event = None
 
     # NOTE(Steven): Missing implementation for depth for now
-    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+    def async_read_with_timestamp(self, timeout_ms: float = 200) -> tuple[np.ndarray, float]:
         """
         Reads the latest available frame data (color) asynchronously.
 
@@ -501,6 +504,7 @@ class RealSenseCamera(Camera):
         Returns:
             np.ndarray:
             The latest captured frame data (color image), processed according to configuration.
+            float: The `time.perf_counter()` time at which the frame was captured.
 
         Raises:
             DeviceNotConnectedError: If the camera is not connected.
@@ -522,11 +526,19 @@ class RealSenseCamera(Camera):
 
         with self.frame_lock:
             frame = self.latest_frame
+            timestamp = self.latest_timestamp
             self.new_frame_event.clear()
 
         if frame is None:
             raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
 
+        return frame, timestamp
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        """
+        Reads the latest available frame asynchronously, see `async_read_with_timestamp`.
+        """
+        frame, _ = self.async_read_with_timestamp(timeout_ms)
         return frame
 
     def disconnect(self):
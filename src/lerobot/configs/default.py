@@ -59,6 +59,10 @@ class EvalConfig:
     batch_size: int = 50
     # `use_async_envs` specifies whether to use asynchronous environments (multiprocessing).
     use_async_envs: bool = False
+    # `continuous_refill` specifies whether to start a new episode in each environment as soon as its current
+    # episode is done, instead of waiting for all the environments of the batch to be done. It requires
+    # synchronous environments and a policy supporting `reset_batch_elements`, and doesn't render videos.
+    continuous_refill: bool = False
 
     def __post_init__(self):
         if self.batch_size > self.n_episodes:
@@ -55,9 +55,23 @@ class TrainPipelineConfig(HubMixin):
     steps: int = 100_000
     eval_freq: int = 20_000
     log_freq: int = 200
+    # Set `log_timing` to true to log a breakdown of the time spent in each phase of a training step (forward,
+    # backward, optimizer). This synchronizes the device after each phase, which slows training down a bit.
+    log_timing: bool = False
     save_checkpoint: bool = True
     # Checkpoint is saved every `save_freq` training iterations and after the last training step.
     save_freq: int = 20_000
+    # Set `async_checkpoint` to true to snapshot the training state to host memory and write checkpoints from a
+    # background thread, instead of stalling training for the whole serialization. At most
+    # `max_checkpoints_in_flight` checkpoints are being written at once (each one holds a copy of the state).
+    async_checkpoint: bool = False
+    max_checkpoints_in_flight: int = 1
+    # Multi-process data-parallel training is enabled by launching this script with `torchrun`, e.g.
+    # `torchrun --nproc_per_node=2 -m lerobot.scripts.lerobot_train ...`. `batch_size` is then per process.
+    # `distributed_backend` defaults to "nccl" on cuda and "gloo" on cpu.
+    distributed_backend: str | None = None
+    # Set to true if some of the policy's trainable parameters don't receive gradients at every step.
+    ddp_find_unused_parameters: bool = False
     use_policy_training_preset: bool = True
     optimizer: OptimizerConfig | None = None
     scheduler: LRSchedulerConfig | None = None
@@ -16,10 +16,17 @@
 # limitations under the License.
 
 import logging
+import os
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import tqdm
 
 from lerobot.datasets.compute_stats import aggregate_stats
@@ -33,13 +40,12 @@ from lerobot.datasets.utils import (
     DEFAULT_VIDEO_PATH,
     get_parquet_file_size_in_mb,
     get_video_size_in_mb,
-    to_parquet_with_hf_images,
     update_chunk_file_indices,
     write_info,
     write_stats,
     write_tasks,
 )
-from lerobot.datasets.video_utils import concatenate_video_files
+from lerobot.datasets.video_utils import concatenate_video_files, get_video_duration_in_s
 
 
 def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
@@ -78,75 +84,302 @@ def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
     return fps, robot_type, features
 
 
-def update_data_df(df, src_meta, dst_meta):
-    """Updates a data DataFrame with new indices and task mappings for aggregation.
+def get_task_lookup(src_meta, dst_meta) -> np.ndarray:
+    """Returns the task index in the destination dataset of each task index of a source dataset.
 
-    Adjusts episode indices, frame indices, and task indices to account for
-    previously aggregated data in the destination dataset.
+    Remapping the task indices of a source dataset is then a single `take` on this lookup array.
 
     Args:
-        df: DataFrame containing the data to be updated.
         src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
+        dst_meta: Destination dataset metadata, with the tasks of all the source datasets.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with adjusted indices.
+        np.ndarray: Array whose i-th element is the destination task index of the source task index i.
     """
+    return dst_meta.tasks.loc[src_meta.tasks.index, "task_index"].to_numpy(dtype=np.int64)
+
+
+def update_data_table(table: pa.Table, episode_offset: int, index_offset: int, task_lookup: np.ndarray):
+    """Updates a table of data frames with new indices and task mappings for aggregation.
 
-    def _update(row):
-        row["episode_index"] = row["episode_index"] + dst_meta.info["total_episodes"]
-        row["index"] = row["index"] + dst_meta.info["total_frames"]
-        task = src_meta.tasks.iloc[row["task_index"]].name
-        row["task_index"] = dst_meta.tasks.loc[task].task_index.item()
-        return row
+    Shifts the episode and frame indices by the episodes and frames aggregated before the source dataset,
+    and remaps the task indices with the lookup array of `get_task_lookup`.
+
+    Args:
+        table: Arrow table of data frames of a source dataset.
+        episode_offset: Number of episodes aggregated before the source dataset.
+        index_offset: Number of frames aggregated before the source dataset.
+        task_lookup: Destination task index of each task index of the source dataset.
 
-    return df.apply(_update, axis=1)
+    Returns:
+        pa.Table: Updated table, with the same schema.
+    """
+    columns = {
+        "episode_index": pc.add(table["episode_index"], episode_offset),
+        "index": pc.add(table["index"], index_offset),
+        "task_index": pc.take(pa.array(task_lookup), table["task_index"]),
+    }
+    return _set_columns(table, columns)
 
 
-def update_meta_data(
-    df,
-    dst_meta,
-    meta_idx,
-    data_idx,
-    videos_idx,
+def update_episodes_table(
+    table: pa.Table,
+    episode_offset: int,
+    index_offset: int,
+    meta_file: tuple[int, int],
+    data_files: dict[tuple[int, int], tuple[int, int]],
+    video_files: dict[str, dict[tuple[int, int], tuple[int, int, float]]],
 ):
-    """Updates metadata DataFrame with new chunk, file, and timestamp indices.
+    """Updates a table of episodes metadata with new chunk, file, and timestamp indices.
+
+    Args:
+        table: Arrow table of episodes metadata of a source dataset.
+        episode_offset: Number of episodes aggregated before the source dataset.
+        index_offset: Number of frames aggregated before the source dataset.
+        meta_file: Destination (chunk index, file index) of the episodes metadata file of the table.
+        data_files: Destination (chunk index, file index) of each data file of the source dataset.
+        video_files: For each video key, the destination (chunk index, file index, timestamp offset) of
+            each video file of the source dataset.
+
+    Returns:
+        pa.Table: Updated table, with the same schema.
+    """
+    columns = {
+        "meta/episodes/chunk_index": np.full(len(table), meta_file[0]),
+        "meta/episodes/file_index": np.full(len(table), meta_file[1]),
+        "dataset_from_index": table["dataset_from_index"].to_numpy() + index_offset,
+        "dataset_to_index": table["dataset_to_index"].to_numpy() + index_offset,
+        "episode_index": table["episode_index"].to_numpy() + episode_offset,
+    }
+    data_dst = _lookup_files(table, "data", data_files)
+    columns["data/chunk_index"], columns["data/file_index"] = data_dst[:, 0], data_dst[:, 1]
+    for key, files in video_files.items():
+        video_dst = _lookup_files(table, f"videos/{key}", files)
+        columns[f"videos/{key}/chunk_index"] = video_dst[:, 0]
+        columns[f"videos/{key}/file_index"] = video_dst[:, 1]
+        for bound in ("from", "to"):
+            column = f"videos/{key}/{bound}_timestamp"
+            columns[column] = table[column].to_numpy() + video_dst[:, 2]
+    return _set_columns(table, columns)
+
+
+def _lookup_files(table: pa.Table, prefix: str, files: dict[tuple, tuple]) -> np.ndarray:
+    # Looks up the destination of the (chunk index, file index) pair of each row, once per unique pair.
+    pairs = np.stack(
+        [table[f"{prefix}/chunk_index"].to_numpy(), table[f"{prefix}/file_index"].to_numpy()], axis=1
+    )
+    unique_pairs, inverse = np.unique(pairs, axis=0, return_inverse=True)
+    lookup = np.array([files[tuple(pair)] for pair in unique_pairs.tolist()], dtype=np.float64)
+    return lookup[inverse.reshape(-1)]
+
+
+def _set_columns(table: pa.Table, columns: dict) -> pa.Table:
+    for name, values in columns.items():
+        i = table.schema.get_field_index(name)
+        field = table.schema.field(i)
+        table = table.set_column(i, field, pa.array(values).cast(field.type))
+    return table
+
+
+def _unique_files(episodes, prefix: str) -> list[tuple[int, int]]:
+    return sorted(set(zip(episodes[f"{prefix}/chunk_index"], episodes[f"{prefix}/file_index"], strict=True)))
 
-    Adjusts all indices and timestamps to account for previously aggregated
-    data and videos in the destination dataset.
+
+def assign_files(sizes_in_mb: list[float], max_mb: float, chunk_size: int) -> list[tuple[int, int]]:
+    """Assigns source files, in order, to destination files based on size constraints.
+
+    A source file is appended to the current destination file, unless this would exceed `max_mb`, in which
+    case it starts a new destination file.
 
     Args:
-        df: DataFrame containing the metadata to be updated.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary containing current metadata chunk and file indices.
-        data_idx: Dictionary containing current data chunk and file indices.
-        videos_idx: Dictionary containing current video indices and timestamps.
+        sizes_in_mb: Size of each source file in MB.
+        max_mb: Maximum allowed file size in MB before rotation.
+        chunk_size: Maximum number of files per chunk before incrementing chunk index.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with adjusted indices and timestamps.
+        list: Destination (chunk index, file index) of each source file.
     """
+    chunk_idx, file_idx = 0, 0
+    dst_size, num_sources = 0.0, 0
+    assignments = []
+    for size in sizes_in_mb:
+        if num_sources > 0 and dst_size + size >= max_mb:
+            chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
+            dst_size, num_sources = 0.0, 0
+        dst_size += size
+        num_sources += 1
+        assignments.append((chunk_idx, file_idx))
+    return assignments
+
+
+def plan_videos(all_metadata, video_keys, video_files_size_in_mb, chunk_size):
+    """Plans the concatenation of the video files of all the source datasets.
 
-    def _update(row):
-        row["meta/episodes/chunk_index"] = row["meta/episodes/chunk_index"] + meta_idx["chunk"]
-        row["meta/episodes/file_index"] = row["meta/episodes/file_index"] + meta_idx["file"]
-        row["data/chunk_index"] = row["data/chunk_index"] + data_idx["chunk"]
-        row["data/file_index"] = row["data/file_index"] + data_idx["file"]
-        for key, video_idx in videos_idx.items():
-            row[f"videos/{key}/chunk_index"] = row[f"videos/{key}/chunk_index"] + video_idx["chunk"]
-            row[f"videos/{key}/file_index"] = row[f"videos/{key}/file_index"] + video_idx["file"]
-            row[f"videos/{key}/from_timestamp"] = (
-                row[f"videos/{key}/from_timestamp"] + video_idx["latest_duration"]
-            )
-            row[f"videos/{key}/to_timestamp"] = (
-                row[f"videos/{key}/to_timestamp"] + video_idx["latest_duration"]
-            )
+    Args:
+        all_metadata: List of all source dataset metadata objects.
+        video_keys: Video keys of the datasets.
+        video_files_size_in_mb: Maximum size for video files in MB.
+        chunk_size: Maximum number of files per chunk.
 
-        row["dataset_from_index"] = row["dataset_from_index"] + dst_meta.info["total_frames"]
-        row["dataset_to_index"] = row["dataset_to_index"] + dst_meta.info["total_frames"]
-        row["episode_index"] = row["episode_index"] + dst_meta.info["total_episodes"]
-        return row
+    Returns:
+        tuple: The source video files of each destination video file, by path relative to the aggregated
+            dataset root, and for each source dataset, the `video_files` of `update_episodes_table`.
+    """
+    dst_files = {}
+    video_files = [{key: {} for key in video_keys} for _ in all_metadata]
+    for key in video_keys:
+        sources = [
+            (i, pair)
+            for i, meta in enumerate(all_metadata)
+            for pair in _unique_files(meta.episodes, f"videos/{key}")
+        ]
+        src_paths = [
+            all_metadata[i].root
+            / DEFAULT_VIDEO_PATH.format(video_key=key, chunk_index=chunk, file_index=file)
+            for i, (chunk, file) in sources
+        ]
+        assignments = assign_files(
+            [get_video_size_in_mb(path) for path in src_paths], video_files_size_in_mb, chunk_size
+        )
+        # Timestamps of each source file are shifted by the duration of the files before it.
+        durations = {}
+        for (i, pair), src_path, (chunk, file) in zip(sources, src_paths, assignments, strict=True):
+            dst_path = DEFAULT_VIDEO_PATH.format(video_key=key, chunk_index=chunk, file_index=file)
+            dst_files.setdefault(dst_path, []).append(src_path)
+            offset = durations.get(dst_path, 0.0)
+            video_files[i][key][pair] = (chunk, file, offset)
+            durations[dst_path] = offset + get_video_duration_in_s(src_path)
+    return dst_files, video_files
 
-    return df.apply(_update, axis=1)
+
+def plan_data(all_metadata, dst_meta, data_files_size_in_mb, chunk_size):
+    """Plans the aggregation of the data files of all the source datasets.
+
+    Args:
+        all_metadata: List of all source dataset metadata objects.
+        dst_meta: Destination dataset metadata, with the tasks of all the source datasets.
+        data_files_size_in_mb: Maximum size for data files in MB.
+        chunk_size: Maximum number of files per chunk.
+
+    Returns:
+        tuple: The sources of each destination data file, as arguments of `update_data_table` along with
+            the source paths, by path relative to the aggregated dataset root, and for each source dataset,
+            the `data_files` of `update_episodes_table`.
+    """
+    episode_offsets = np.cumsum([0] + [meta.total_episodes for meta in all_metadata]).tolist()
+    index_offsets = np.cumsum([0] + [meta.total_frames for meta in all_metadata]).tolist()
+    sources, src_paths = [], []
+    for i, meta in enumerate(all_metadata):
+        task_lookup = get_task_lookup(meta, dst_meta)
+        for chunk, file in _unique_files(meta.episodes, "data"):
+            src_path = meta.root / DEFAULT_DATA_PATH.format(chunk_index=chunk, file_index=file)
+            sources.append((i, (chunk, file), (src_path, episode_offsets[i], index_offsets[i], task_lookup)))
+            src_paths.append(src_path)
+    assignments = assign_files(
+        [get_parquet_file_size_in_mb(path) for path in src_paths], data_files_size_in_mb, chunk_size
+    )
+
+    dst_files = {}
+    data_files = [{} for _ in all_metadata]
+    for (i, pair, source), (chunk, file) in zip(sources, assignments, strict=True):
+        dst_files.setdefault(DEFAULT_DATA_PATH.format(chunk_index=chunk, file_index=file), []).append(source)
+        data_files[i][pair] = (chunk, file)
+    return dst_files, data_files
+
+
+def write_video_file(src_paths: list[Path], dst_path: Path) -> float:
+    """Copies or concatenates source video files into a destination video file.
+
+    Returns:
+        float: Size of the source files in MB.
+    """
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    if len(src_paths) == 1:
+        shutil.copy(str(src_paths[0]), str(dst_path))
+    else:
+        concatenate_video_files(src_paths, dst_path)
+    return sum(get_video_size_in_mb(path) for path in src_paths)
+
+
+def write_data_file(sources: list[tuple], dst_path: Path) -> float:
+    """Streams the row groups of source data files, with updated indices, into a destination data file.
+
+    Source files are read one row group at a time, so that neither the source nor the destination files
+    are loaded in memory. Images embedded in the data files are copied as they are.
+
+    Args:
+        sources: Source data files, as (path, episode offset, index offset, task lookup) tuples.
+        dst_path: Path of the destination data file.
+
+    Returns:
+        float: Size of the source files in MB.
+    """
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    writer = None
+    try:
+        for src_path, episode_offset, index_offset, task_lookup in sources:
+            parquet_file = pq.ParquetFile(src_path)
+            if writer is None:
+                # The schema metadata holds the features of Hugging Face datasets, such as images.
+                writer = pq.ParquetWriter(dst_path, parquet_file.schema_arrow)
+            for row_group in range(parquet_file.num_row_groups):
+                table = parquet_file.read_row_group(row_group)
+                table = update_data_table(table, episode_offset, index_offset, task_lookup)
+                writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    return sum(path.stat().st_size for path, *_ in sources) / (1024**2)
+
+
+def aggregate_metadata(all_metadata, dst_meta, data_files, video_files):
+    """Aggregates the episodes metadata of all the source datasets into the destination dataset.
+
+    Episodes metadata files are streamed into rotating destination files, with all their indices and
+    timestamps updated.
+
+    Args:
+        all_metadata: List of all source dataset metadata objects.
+        dst_meta: Destination dataset metadata.
+        data_files: For each source dataset, the `data_files` of `update_episodes_table`.
+        video_files: For each source dataset, the `video_files` of `update_episodes_table`.
+    """
+    sources = [
+        (i, meta.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk, file_index=file))
+        for i, meta in enumerate(all_metadata)
+        for chunk, file in _unique_files(meta.episodes, "meta/episodes")
+    ]
+    assignments = assign_files(
+        [get_parquet_file_size_in_mb(path) for _, path in sources],
+        DEFAULT_DATA_FILE_SIZE_IN_MB,
+        DEFAULT_CHUNK_SIZE,
+    )
+    episode_offsets = np.cumsum([0] + [meta.total_episodes for meta in all_metadata]).tolist()
+    index_offsets = np.cumsum([0] + [meta.total_frames for meta in all_metadata]).tolist()
+
+    writer, writer_file = None, None
+    try:
+        for (i, src_path), meta_file in zip(sources, assignments, strict=True):
+            table = update_episodes_table(
+                pq.read_table(src_path),
+                episode_offsets[i],
+                index_offsets[i],
+                meta_file,
+                data_files[i],
+                video_files[i],
+            )
+            if meta_file != writer_file:
+                if writer is not None:
+                    writer.close()
+                dst_path = dst_meta.root / DEFAULT_EPISODES_PATH.format(
+                    chunk_index=meta_file[0], file_index=meta_file[1]
+                )
+                dst_path.parent.mkdir(parents=True, exist_ok=True)
+                writer, writer_file = pq.ParquetWriter(dst_path, table.schema), meta_file
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
 
 
 def aggregate_datasets(
@@ -157,14 +390,20 @@ def aggregate_datasets(
     data_files_size_in_mb: float | None = None,
     video_files_size_in_mb: float | None = None,
     chunk_size: int | None = None,
+    num_workers: int | None = None,
 ):
     """Aggregates multiple LeRobot datasets into a single unified dataset.
 
     This is the main function that orchestrates the aggregation process by:
     1. Loading and validating all source dataset metadata
     2. Creating a new destination dataset with unified tasks
-    3. Aggregating videos, data, and metadata from all source datasets
-    4. Finalizing the aggregated dataset with proper statistics
+    3. Planning the destination file of every source data and video file, from their sizes
+    4. Writing the destination data and video files in parallel, and the episodes metadata meanwhile
+    5. Finalizing the aggregated dataset with proper statistics
+
+    Destination files are independent of each other, so they are written by a pool of `num_workers`
+    processes. Since indices are remapped with Arrow compute and lookup arrays, and row groups are streamed
+    to the destination files, aggregating is mostly bound by reading and writing the files.
 
     Args:
         repo_ids: List of repository IDs for the datasets to aggregate.
@@ -174,8 +413,11 @@ def aggregate_datasets(
         data_files_size_in_mb: Maximum size for data files in MB (defaults to DEFAULT_DATA_FILE_SIZE_IN_MB)
         video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
         chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
+        num_workers: Number of processes writing the data and video files (defaults to the number of CPUs).
+            With 0, files are written in the main process.
     """
     logging.info("Start aggregate_datasets")
+    start = time.perf_counter()
 
     if data_files_size_in_mb is None:
         data_files_size_in_mb = DEFAULT_DATA_FILE_SIZE_IN_MB
@@ -183,6 +425,8 @@ def aggregate_datasets(
         video_files_size_in_mb = DEFAULT_VIDEO_FILE_SIZE_IN_MB
     if chunk_size is None:
         chunk_size = DEFAULT_CHUNK_SIZE
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
 
     all_metadata = (
         [LeRobotDatasetMetadata(repo_id) for repo_id in repo_ids]
@@ -206,271 +450,40 @@ def aggregate_datasets(
     unique_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
     dst_meta.tasks = pd.DataFrame({"task_index": range(len(unique_tasks))}, index=unique_tasks)
 
-    meta_idx = {"chunk": 0, "file": 0}
-    data_idx = {"chunk": 0, "file": 0}
-    videos_idx = {
-        key: {"chunk": 0, "file": 0, "latest_duration": 0, "episode_duration": 0} for key in video_keys
-    }
-
-    dst_meta.episodes = {}
-
-    for src_meta in tqdm.tqdm(all_metadata, desc="Copy data and videos"):
-        videos_idx = aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size)
-        data_idx = aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size)
-
-        meta_idx = aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx)
-
-        dst_meta.info["total_episodes"] += src_meta.total_episodes
-        dst_meta.info["total_frames"] += src_meta.total_frames
-
-    finalize_aggregation(dst_meta, all_metadata)
-    logging.info("Aggregation complete.")
-
-
-def aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size):
-    """Aggregates video chunks from a source dataset into the destination dataset.
-
-    Handles video file concatenation and rotation based on file size limits.
-    Creates new video files when size limits are exceeded.
-
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        videos_idx: Dictionary tracking video chunk and file indices.
-        video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
-        chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
-
-    Returns:
-        dict: Updated videos_idx with current chunk and file indices.
-    """
-    for key, video_idx in videos_idx.items():
-        unique_chunk_file_pairs = {
-            (chunk, file)
-            for chunk, file in zip(
-                src_meta.episodes[f"videos/{key}/chunk_index"],
-                src_meta.episodes[f"videos/{key}/file_index"],
-                strict=False,
-            )
-        }
-        unique_chunk_file_pairs = sorted(unique_chunk_file_pairs)
-
-        chunk_idx = video_idx["chunk"]
-        file_idx = video_idx["file"]
-
-        for src_chunk_idx, src_file_idx in unique_chunk_file_pairs:
-            src_path = src_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=src_chunk_idx,
-                file_index=src_file_idx,
-            )
-
-            dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=chunk_idx,
-                file_index=file_idx,
-            )
-
-            # If a new file is created, we don't want to increment the latest_duration
-            update_latest_duration = False
-
-            if not dst_path.exists():
-                # First write to this destination file
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                continue  # not accumulating further, already copied the file in place
-
-            # Check file sizes before appending
-            src_size = get_video_size_in_mb(src_path)
-            dst_size = get_video_size_in_mb(dst_path)
-
-            if dst_size + src_size >= video_files_size_in_mb:
-                # Rotate to a new chunk/file
-                chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
-                dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                    video_key=key,
-                    chunk_index=chunk_idx,
-                    file_index=file_idx,
-                )
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-            else:
-                # Get the timestamps shift for this video
-                timestamps_shift_s = dst_meta.info["total_frames"] / dst_meta.info["fps"]
-
-                # Append to existing video file
-                concatenate_video_files(
-                    [dst_path, src_path],
-                    dst_path,
-                )
-                # Update the latest_duration when appending (shifts timestamps!)
-                update_latest_duration = not update_latest_duration
-
-        # Update the videos_idx with the final chunk and file indices for this key
-        videos_idx[key]["chunk"] = chunk_idx
-        videos_idx[key]["file"] = file_idx
-
-        if update_latest_duration:
-            videos_idx[key]["latest_duration"] += timestamps_shift_s
-
-    return videos_idx
-
-
-def aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size):
-    """Aggregates data chunks from a source dataset into the destination dataset.
-
-    Reads source data files, updates indices to match the aggregated dataset,
-    and writes them to the destination with proper file rotation.
-
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        data_idx: Dictionary tracking data chunk and file indices.
-
-    Returns:
-        dict: Updated data_idx with current chunk and file indices.
-    """
-    unique_chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["data/chunk_index"], src_meta.episodes["data/file_index"], strict=False
-        )
-    }
-
-    unique_chunk_file_ids = sorted(unique_chunk_file_ids)
-
-    for src_chunk_idx, src_file_idx in unique_chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_DATA_PATH.format(
-            chunk_index=src_chunk_idx, file_index=src_file_idx
-        )
-        df = pd.read_parquet(src_path)
-        df = update_data_df(df, src_meta, dst_meta)
-
-        data_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            data_idx,
-            data_files_size_in_mb,
-            chunk_size,
-            DEFAULT_DATA_PATH,
-            contains_images=len(dst_meta.image_keys) > 0,
-            aggr_root=dst_meta.root,
-        )
-
-    return data_idx
-
-
-def aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx):
-    """Aggregates metadata from a source dataset into the destination dataset.
-
-    Reads source metadata files, updates all indices and timestamps,
-    and writes them to the destination with proper file rotation.
-
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary tracking metadata chunk and file indices.
-        data_idx: Dictionary tracking data chunk and file indices.
-        videos_idx: Dictionary tracking video indices and timestamps.
-
-    Returns:
-        dict: Updated meta_idx with current chunk and file indices.
-    """
-    chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["meta/episodes/chunk_index"],
-            src_meta.episodes["meta/episodes/file_index"],
-            strict=False,
-        )
-    }
-
-    chunk_file_ids = sorted(chunk_file_ids)
-    for chunk_idx, file_idx in chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-        df = pd.read_parquet(src_path)
-        df = update_meta_data(
-            df,
-            dst_meta,
-            meta_idx,
-            data_idx,
-            videos_idx,
-        )
-
-        for k in videos_idx:
-            videos_idx[k]["latest_duration"] += videos_idx[k]["episode_duration"]
-
-        meta_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            meta_idx,
-            DEFAULT_DATA_FILE_SIZE_IN_MB,
-            DEFAULT_CHUNK_SIZE,
-            DEFAULT_EPISODES_PATH,
-            contains_images=False,
-            aggr_root=dst_meta.root,
-        )
-
-    return meta_idx
-
-
-def append_or_create_parquet_file(
-    df: pd.DataFrame,
-    src_path: Path,
-    idx: dict[str, int],
-    max_mb: float,
-    chunk_size: int,
-    default_path: str,
-    contains_images: bool = False,
-    aggr_root: Path = None,
-):
-    """Appends data to an existing parquet file or creates a new one based on size constraints.
-
-    Manages file rotation when size limits are exceeded to prevent individual files
-    from becoming too large. Handles both regular parquet files and those containing images.
-
-    Args:
-        df: DataFrame to write to the parquet file.
-        src_path: Path to the source file (used for size estimation).
-        idx: Dictionary containing current 'chunk' and 'file' indices.
-        max_mb: Maximum allowed file size in MB before rotation.
-        chunk_size: Maximum number of files per chunk before incrementing chunk index.
-        default_path: Format string for generating file paths.
-        contains_images: Whether the data contains images requiring special handling.
-        aggr_root: Root path for the aggregated dataset.
-
-    Returns:
-        dict: Updated index dictionary with current chunk and file indices.
-    """
-    dst_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-
-    if not dst_path.exists():
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        if contains_images:
-            to_parquet_with_hf_images(df, dst_path)
-        else:
-            df.to_parquet(dst_path)
-        return idx
-
-    src_size = get_parquet_file_size_in_mb(src_path)
-    dst_size = get_parquet_file_size_in_mb(dst_path)
-
-    if dst_size + src_size >= max_mb:
-        idx["chunk"], idx["file"] = update_chunk_file_indices(idx["chunk"], idx["file"], chunk_size)
-        new_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-        new_path.parent.mkdir(parents=True, exist_ok=True)
-        final_df = df
-        target_path = new_path
+    logging.info("Plan data and video files")
+    dst_video_files, video_files = plan_videos(all_metadata, video_keys, video_files_size_in_mb, chunk_size)
+    dst_data_files, data_files = plan_data(all_metadata, dst_meta, data_files_size_in_mb, chunk_size)
+    jobs = [
+        (write_video_file, src_paths, dst_meta.root / path) for path, src_paths in dst_video_files.items()
+    ]
+    jobs += [(write_data_file, sources, dst_meta.root / path) for path, sources in dst_data_files.items()]
+
+    num_workers = min(num_workers, len(jobs))
+    progress = tqdm.tqdm(total=len(jobs), desc="Copy data and videos")
+    total_mb = 0.0
+    if num_workers == 0:
+        aggregate_metadata(all_metadata, dst_meta, data_files, video_files)
+        for fn, sources, dst_path in jobs:
+            total_mb += fn(sources, dst_path)
+            progress.update()
     else:
-        existing_df = pd.read_parquet(dst_path)
-        final_df = pd.concat([existing_df, df], ignore_index=True)
-        target_path = dst_path
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(fn, sources, dst_path) for fn, sources, dst_path in jobs]
+            aggregate_metadata(all_metadata, dst_meta, data_files, video_files)
+            for future in as_completed(futures):
+                total_mb += future.result()
+                progress.update()
+    progress.close()
 
-    if contains_images:
-        to_parquet_with_hf_images(final_df, target_path)
-    else:
-        final_df.to_parquet(target_path)
+    finalize_aggregation(dst_meta, all_metadata)
 
-    return idx
+    elapsed_s = time.perf_counter() - start
+    total_frames = dst_meta.info["total_frames"]
+    logging.info(
+        f"Aggregation complete: {len(all_metadata)} datasets, {dst_meta.info['total_episodes']} episodes, "
+        f"{total_frames} frames and {total_mb:.1f} MB of data and videos in {elapsed_s:.1f}s "
+        f"({total_frames / elapsed_s:.0f} frames/s, {total_mb / elapsed_s:.1f} MB/s)."
+    )
 
 
 def finalize_aggregation(aggr_meta, all_metadata):
@@ -13,6 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import math
 from collections.abc import Iterator
 
 import torch
@@ -27,9 +28,17 @@ class EpisodeAwareSampler:
         drop_n_first_frames: int = 0,
         drop_n_last_frames: int = 0,
         shuffle: bool = False,
+        num_replicas: int = 1,
+        rank: int = 0,
+        seed: int = 0,
     ):
         """Sampler that optionally incorporates episode boundary information.
 
+        When `num_replicas > 1`, it behaves like `torch.utils.data.DistributedSampler`: each rank only yields its
+        own `1 / num_replicas` shard of the indices, padded so that all ranks yield the same number of samples.
+        Shuffling is then seeded with `seed` and the epoch set with `set_epoch()` so that all ranks agree on the
+        permutation.
+
         Args:
             dataset_from_indices: List of indices containing the start of each episode in the dataset.
             dataset_to_indices: List of indices containing the end of each episode in the dataset.
@@ -38,7 +47,13 @@ class EpisodeAwareSampler:
             drop_n_first_frames: Number of frames to drop from the start of each episode.
             drop_n_last_frames: Number of frames to drop from the end of each episode.
             shuffle: Whether to shuffle the indices.
+            num_replicas: Number of processes participating in distributed training.
+            rank: Rank of the current process within `num_replicas`.
+            seed: Random seed used to shuffle the indices in distributed mode.
         """
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"Invalid rank {rank}, rank should be in the interval [0, {num_replicas - 1}]")
+
         indices = []
         for episode_idx, (start_index, end_index) in enumerate(
             zip(dataset_from_indices, dataset_to_indices, strict=True)
@@ -48,14 +63,41 @@ class EpisodeAwareSampler:
 
         self.indices = indices
         self.shuffle = shuffle
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.seed = seed
+        self.epoch = 0
+        self.num_samples = math.ceil(len(self.indices) / self.num_replicas)
+
+    def set_epoch(self, epoch: int) -> None:
+        """Sets the epoch used to seed the shuffling in distributed mode."""
+        self.epoch = epoch
 
     def __iter__(self) -> Iterator[int]:
+        if self.num_replicas == 1:
+            if self.shuffle:
+                for i in torch.randperm(len(self.indices)):
+                    yield self.indices[i]
+            else:
+                for i in self.indices:
+                    yield i
+            return
+
         if self.shuffle:
-            for i in torch.randperm(len(self.indices)):
-                yield self.indices[i]
+            generator = torch.Generator()
+            generator.manual_seed(self.seed + self.epoch)
+            order = torch.randperm(len(self.indices), generator=generator).tolist()
         else:
-            for i in self.indices:
-                yield i
+            order = list(range(len(self.indices)))
+
+        # Pad so that the indices are evenly divisible across replicas
+        total_size = self.num_samples * self.num_replicas
+        padding_size = total_size - len(order)
+        if padding_size > 0:
+            order += (order * math.ceil(padding_size / len(order)))[:padding_size]
+
+        for i in order[self.rank : total_size : self.num_replicas]:
+            yield self.indices[i]
 
     def __len__(self) -> int:
-        return len(self.indices)
+        return self.num_samples
@@ -905,17 +905,25 @@ def cycle(iterable: Any) -> Iterator[Any]:
     PyTorch DataLoaders with multiple workers.
     See https://github.com/pytorch/pytorch/issues/23900 for details.
 
+    If the iterable is a DataLoader whose sampler implements `set_epoch` (e.g. a distributed sampler), it is
+    called before each new pass so that the shuffling differs from one epoch to the next.
+
     Args:
         iterable: The iterable to cycle over.
 
     Yields:
         Items from the iterable, restarting from the beginning when exhausted.
     """
+    sampler = getattr(iterable, "sampler", None)
+    epoch = 0
     iterator = iter(iterable)
     while True:
         try:
             yield next(iterator)
         except StopIteration:
+            epoch += 1
+            if hasattr(sampler, "set_epoch"):
+                sampler.set_epoch(epoch)
             iterator = iter(iterable)
 
 
@@ -0,0 +1,372 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+# Angle between the upper arm of the xArm6 and the line from joint 2 to joint 3.
+XARM6_T2_OFFSET = np.arctan2(0.2845, 0.0535)
+
+# Modified (Craig) DH parameters of the UFactory xArm6, one row (a, alpha, d, theta_offset) per joint, in meters
+# and radians.
+XARM6_DH_PARAMS = np.array(
+    [
+        [0.0, 0.0, 0.267, 0.0],
+        [0.0, -np.pi / 2, 0.0, -XARM6_T2_OFFSET],
+        [np.hypot(0.0535, 0.2845), 0.0, 0.0, XARM6_T2_OFFSET],
+        [0.0775, -np.pi / 2, 0.3425, 0.0],
+        [0.0, np.pi / 2, 0.0, 0.0],
+        [0.076, -np.pi / 2, 0.097, 0.0],
+    ]
+)
+
+# Joint limits of the xArm6 in degrees, one row (lower, upper) per joint.
+XARM6_JOINT_LIMITS_DEG = np.array(
+    [[-360.0, 360.0], [-118.0, 120.0], [-225.0, 11.0], [-360.0, 360.0], [-97.0, 180.0], [-360.0, 360.0]]
+)
+
+
+def _translation(xyz) -> np.ndarray:
+    transform = np.eye(4)
+    transform[:3, 3] = xyz
+    return transform
+
+
+def _rotation_x(angle: float) -> np.ndarray:
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1]])
+
+
+def _rotation_z(angle: float) -> np.ndarray:
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+
+
+def _rpy_to_transform(xyz, rpy) -> np.ndarray:
+    """Transform of a URDF origin: the rotation is R = Rz(yaw) @ Ry(pitch) @ Rx(roll)."""
+    roll, pitch, yaw = rpy
+    cr, sr, cp, sp, cy, sy = (
+        np.cos(roll),
+        np.sin(roll),
+        np.cos(pitch),
+        np.sin(pitch),
+        np.cos(yaw),
+        np.sin(yaw),
+    )
+    transform = _translation(xyz)
+    transform[:3, :3] = [
+        [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+        [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        [-sp, cp * sr, cp * cr],
+    ]
+    return transform
+
+
+def _skew(v: np.ndarray) -> np.ndarray:
+    """Skew-symmetric matrices of (..., 3) vectors."""
+    x, y, z = v[..., 0], v[..., 1], v[..., 2]
+    zero = np.zeros_like(x)
+    return np.stack([zero, -z, y, z, zero, -x, -y, x, zero], axis=-1).reshape(*v.shape[:-1], 3, 3)
+
+
+def rotation_log(rotation: np.ndarray) -> np.ndarray:
+    """Rotation vectors (axis * angle) of (..., 3, 3) rotation matrices."""
+    cos_angle = np.clip((np.trace(rotation, axis1=-2, axis2=-1) - 1) / 2, -1.0, 1.0)
+    angle = np.arccos(cos_angle)
+    vee = 0.5 * np.stack(
+        [
+            rotation[..., 2, 1] - rotation[..., 1, 2],
+            rotation[..., 0, 2] - rotation[..., 2, 0],
+            rotation[..., 1, 0] - rotation[..., 0, 1],
+        ],
+        axis=-1,
+    )
+    sin_angle = np.sin(angle)
+    # vee = sin(angle) * axis, which is ill-conditioned for angles close to 0 (first order: vee = rotation vector)
+    # and to pi, where the axis is recovered from the symmetric part: (R + R^T) / 2 = cos I + (1 - cos) axis axis^T.
+    scale = np.where(sin_angle > 1e-6, angle / np.maximum(sin_angle, 1e-6), 1.0)
+    log = vee * scale[..., None]
+
+    near_pi = cos_angle < -0.99
+    if np.any(near_pi):
+        cos_near_pi = cos_angle[near_pi][..., None, None]
+        symmetric = (rotation[near_pi] + rotation[near_pi].swapaxes(-1, -2)) / 2
+        symmetric = (symmetric - cos_near_pi * np.eye(3)) / (1 - cos_near_pi)
+        column = np.argmax(np.diagonal(symmetric, axis1=-2, axis2=-1), axis=-1)
+        axis = symmetric[np.arange(len(column)), :, column]
+        axis /= np.linalg.norm(axis, axis=-1, keepdims=True)
+        # Orient the axis consistently with the antisymmetric part.
+        sign = np.where(np.sum(axis * vee[near_pi], axis=-1) < 0, -1.0, 1.0)
+        log[near_pi] = axis * (sign * angle[near_pi])[..., None]
+    return log
+
+
+class ChainKinematics:
+    """Vectorized forward and inverse kinematics of a serial chain of revolute joints, with NumPy only.
+
+    The chain is T = O_1 @ R_1(q_1) @ O_2 @ R_2(q_2) ... O_n @ R_n(q_n) @ T_tip, where O_i is the fixed origin of
+    joint i in the frame of joint i - 1 (or of the base), and R_i(q_i) the rotation of angle q_i around its axis.
+    It can be built from DH parameters (`from_dh`) or from a URDF (`from_urdf`), and follows the interface of
+    `RobotKinematics` (degrees, 4x4 poses, extra trailing joints such as the gripper are passed through), except
+    that every method accepts batches of configurations and poses.
+    """
+
+    def __init__(
+        self,
+        joint_origins: np.ndarray,
+        joint_axes: np.ndarray,
+        tip_transform: np.ndarray | None = None,
+        joint_names: list[str] | None = None,
+        joint_limits_deg: np.ndarray | None = None,
+    ):
+        """
+        Args:
+            joint_origins: (n, 4, 4) fixed transform of each joint frame in the frame of the previous joint.
+            joint_axes: (n, 3) rotation axis of each joint in its own frame.
+            tip_transform: 4x4 transform of the target frame in the frame of the last joint.
+            joint_names: Names of the joints, defaults to "joint1" ... "jointn".
+            joint_limits_deg: (n, 2) lower and upper limits of the joints in degrees, enforced by the inverse
+                kinematics.
+        """
+        self.joint_origins = np.asarray(joint_origins, dtype=np.float64)
+        joint_axes = np.asarray(joint_axes, dtype=np.float64)
+        self.joint_axes = joint_axes / np.linalg.norm(joint_axes, axis=-1, keepdims=True)
+        self.tip_transform = (
+            np.eye(4) if tip_transform is None else np.asarray(tip_transform, dtype=np.float64)
+        )
+        self.num_joints = len(self.joint_origins)
+        self.joint_names = (
+            [f"joint{i + 1}" for i in range(self.num_joints)] if joint_names is None else list(joint_names)
+        )
+        if len(self.joint_names) != self.num_joints or self.joint_axes.shape != (self.num_joints, 3):
+            raise ValueError(
+                "joint_origins, joint_axes and joint_names must describe the same number of joints."
+            )
+        self.joint_limits_rad = None if joint_limits_deg is None else np.deg2rad(joint_limits_deg)
+
+        # Rodrigues' formula, R(q) = I + sin(q) K + (1 - cos(q)) K^2, with K the skew matrix of the axis.
+        self._axes_skew = _skew(self.joint_axes)
+        self._axes_skew_sq = self._axes_skew @ self._axes_skew
+
+    @classmethod
+    def from_dh(
+        cls,
+        dh_params: np.ndarray,
+        modified: bool = True,
+        tool_transform: np.ndarray | None = None,
+        joint_names: list[str] | None = None,
+        joint_limits_deg: np.ndarray | None = None,
+    ) -> "ChainKinematics":
+        """Builds the kinematics of a chain described by DH parameters.
+
+        Args:
+            dh_params: (n, 4) parameters (a, alpha, d, theta_offset) of each joint, in meters and radians.
+            modified: Whether the parameters follow the modified (Craig) convention, where the link transform
+                is RotX(alpha) TransX(a) RotZ(theta) TransZ(d), or the standard one, where it is
+                RotZ(theta) TransZ(d) TransX(a) RotX(alpha).
+            tool_transform: 4x4 transform of the tool frame in the frame of the last joint.
+        """
+        origins = []
+        previous = np.eye(4)
+        for a, alpha, d, theta_offset in np.asarray(dh_params, dtype=np.float64):
+            if modified:
+                # RotZ(q) commutes with TransZ(d), so the joint rotation is applied last.
+                origins.append(
+                    _rotation_x(alpha)
+                    @ _translation([a, 0, 0])
+                    @ _rotation_z(theta_offset)
+                    @ _translation([0, 0, d])
+                )
+            else:
+                origins.append(previous @ _rotation_z(theta_offset))
+                previous = _translation([0, 0, d]) @ _translation([a, 0, 0]) @ _rotation_x(alpha)
+        tip = np.eye(4) if modified else previous
+        if tool_transform is not None:
+            tip = tip @ tool_transform
+        axes = np.tile([0.0, 0.0, 1.0], (len(origins), 1))
+        return cls(np.stack(origins), axes, tip, joint_names, joint_limits_deg)
+
+    @classmethod
+    def from_urdf(
+        cls,
+        urdf_path: str,
+        target_frame_name: str = "gripper_frame_link",
+        joint_names: list[str] | None = None,
+    ) -> "ChainKinematics":
+        """Builds the kinematics of the chain from the root link of a URDF to `target_frame_name`.
+
+        Fixed joints are folded into the origins of the next joints, and the joint limits are read from the URDF.
+
+        Args:
+            urdf_path: Path to the robot URDF file.
+            target_frame_name: Name of the end-effector link in the URDF.
+            joint_names: Order of the joints in the joint positions. Defaults to their order in the chain.
+        """
+        joints_by_child = {}
+        for joint in ET.parse(urdf_path).getroot().iter("joint"):
+            joints_by_child[joint.find("child").get("link")] = joint
+
+        chain = []
+        link = target_frame_name
+        while link in joints_by_child:
+            chain.append(joints_by_child[link])
+            link = joints_by_child[link].find("parent").get("link")
+        if not chain:
+            raise ValueError(f"Link '{target_frame_name}' is not the child of any joint in {urdf_path}.")
+
+        origins, axes, names, limits = [], [], [], []
+        pending = np.eye(4)
+        for joint in reversed(chain):
+            origin = joint.find("origin")
+            xyz = [0.0] * 3 if origin is None else [float(v) for v in origin.get("xyz", "0 0 0").split()]
+            rpy = [0.0] * 3 if origin is None else [float(v) for v in origin.get("rpy", "0 0 0").split()]
+            pending = pending @ _rpy_to_transform(xyz, rpy)
+            joint_type = joint.get("type")
+            if joint_type == "fixed":
+                continue
+            if joint_type not in ("revolute", "continuous"):
+                raise ValueError(f"Joint '{joint.get('name')}' of type '{joint_type}' is not supported.")
+            axis = joint.find("axis")
+            axes.append([1.0, 0.0, 0.0] if axis is None else [float(v) for v in axis.get("xyz").split()])
+            origins.append(pending)
+            names.append(joint.get("name"))
+            limit = joint.find("limit")
+            if joint_type == "revolute" and limit is not None:
+                limits.append([float(limit.get("lower", -np.inf)), float(limit.get("upper", np.inf))])
+            else:
+                limits.append([-np.inf, np.inf])
+            pending = np.eye(4)
+
+        if joint_names is not None:
+            if sorted(joint_names) != sorted(names):
+                raise ValueError(f"joint_names {joint_names} don't match the joints of the chain {names}.")
+            order = [names.index(name) for name in joint_names]
+            # The chain needs its joints in order, so only inputs in another order are supported.
+            if order != sorted(order):
+                raise ValueError(f"joint_names must follow the order of the chain: {names}.")
+        return cls(np.stack(origins), np.array(axes), pending, names, np.rad2deg(np.array(limits)))
+
+    def _joint_frames(self, joint_pos_rad: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the (..., n, 4, 4) frames of the joints (after their rotation) and the (..., 4, 4) tip pose."""
+        s = np.sin(joint_pos_rad)[..., None, None]
+        c = np.cos(joint_pos_rad)[..., None, None]
+        local = np.broadcast_to(self.joint_origins, (*joint_pos_rad.shape, 4, 4)).copy()
+        local[..., :3, :3] = self.joint_origins[:, :3, :3] @ (
+            np.eye(3) + s * self._axes_skew + (1 - c) * self._axes_skew_sq
+        )
+        frames = np.empty_like(local)
+        frames[..., 0, :, :] = local[..., 0, :, :]
+        for i in range(1, self.num_joints):
+            frames[..., i, :, :] = frames[..., i - 1, :, :] @ local[..., i, :, :]
+        return frames, frames[..., -1, :, :] @ self.tip_transform
+
+    def forward_kinematics(self, joint_pos_deg: np.ndarray) -> np.ndarray:
+        """
+        Compute forward kinematics for one or several joint configurations.
+
+        Args:
+            joint_pos_deg: (..., n) joint positions in degrees. Extra trailing joints are ignored.
+
+        Returns:
+            (..., 4, 4) transformation matrices of the end-effector poses
+        """
+        joint_pos_rad = np.deg2rad(np.asarray(joint_pos_deg, dtype=np.float64)[..., : self.num_joints])
+        return self._joint_frames(joint_pos_rad)[1]
+
+    def jacobian(self, joint_pos_deg: np.ndarray) -> np.ndarray:
+        """(..., 6, n) geometric jacobians (linear then angular velocity, in the base frame) of the tip."""
+        joint_pos_rad = np.deg2rad(np.asarray(joint_pos_deg, dtype=np.float64)[..., : self.num_joints])
+        return self._jacobian(*self._joint_frames(joint_pos_rad))
+
+    def _jacobian(self, frames: np.ndarray, tip_pose: np.ndarray) -> np.ndarray:
+        axes = (frames[..., :3, :3] @ self.joint_axes[..., None])[..., 0]
+        lever = tip_pose[..., None, :3, 3] - frames[..., :3, 3]
+        return np.concatenate([np.cross(axes, lever), axes], axis=-1).swapaxes(-1, -2)
+
+    def inverse_kinematics(
+        self,
+        current_joint_pos: np.ndarray,
+        desired_ee_pose: np.ndarray,
+        position_weight: float = 1.0,
+        orientation_weight: float = 0.01,
+        max_iterations: int = 50,
+        damping: float = 1e-4,
+        tolerance: float = 1e-10,
+    ) -> np.ndarray:
+        """
+        Compute inverse kinematics with damped least squares, warm started from the current joint positions.
+
+        Each iteration solves (J^T W J + damping * I) dq = J^T W e, where e stacks the position error and the
+        rotation vector of the orientation error, and W their weights. Joints are clipped to their limits.
+
+        Args:
+            current_joint_pos: (..., n) current joint positions in degrees (used as initial guess)
+            desired_ee_pose: (..., 4, 4) target end-effector poses
+            position_weight: Weight for position constraint in IK
+            orientation_weight: Weight for orientation constraint in IK, set to 0.0 to only constrain position
+            max_iterations: Maximum number of iterations.
+            damping: Damping of the least squares, which regularizes the steps close to singularities.
+            tolerance: Weighted squared error under which a configuration is considered solved.
+
+        Returns:
+            Joint positions in degrees that achieve the desired end-effector poses
+        """
+        current_joint_pos = np.asarray(current_joint_pos, dtype=np.float64)
+        desired_ee_pose = np.asarray(desired_ee_pose, dtype=np.float64)
+        batch_shape = np.broadcast_shapes(current_joint_pos.shape[:-1], desired_ee_pose.shape[:-2])
+        q = np.broadcast_to(
+            np.deg2rad(current_joint_pos[..., : self.num_joints]), (*batch_shape, self.num_joints)
+        )
+        q = q.copy()
+        weights = np.array([position_weight] * 3 + [orientation_weight] * 3)
+        regularization = damping * np.eye(self.num_joints)
+
+        for _ in range(max_iterations):
+            frames, tip_pose = self._joint_frames(q)
+            error = np.concatenate(
+                [
+                    desired_ee_pose[..., :3, 3] - tip_pose[..., :3, 3],
+                    rotation_log(desired_ee_pose[..., :3, :3] @ tip_pose[..., :3, :3].swapaxes(-1, -2)),
+                ],
+                axis=-1,
+            )
+            unsolved = np.sum(weights * error**2, axis=-1) > tolerance
+            if not np.any(unsolved):
+                break
+            jacobian = self._jacobian(frames, tip_pose)
+            weighted_jacobian_t = jacobian.swapaxes(-1, -2) * weights
+            step = np.linalg.solve(
+                weighted_jacobian_t @ jacobian + regularization, (weighted_jacobian_t @ error[..., None])
+            )[..., 0]
+            q += np.where(unsolved[..., None], step, 0.0)
+            if self.joint_limits_rad is not None:
+                q = np.clip(q, self.joint_limits_rad[:, 0], self.joint_limits_rad[:, 1])
+
+        joint_pos_deg = np.rad2deg(q)
+
+        # Preserve gripper position if present in current_joint_pos
+        if current_joint_pos.shape[-1] > self.num_joints:
+            result = np.empty((*batch_shape, current_joint_pos.shape[-1]))
+            result[..., : self.num_joints] = joint_pos_deg
+            result[..., self.num_joints :] = current_joint_pos[..., self.num_joints :]
+            return result
+        return joint_pos_deg
+
+
+def xarm6_kinematics(tool_transform: np.ndarray | None = None) -> ChainKinematics:
+    """Kinematics of the UFactory xArm6, from its DH parameters, with its flange (or tool) as target frame."""
+    return ChainKinematics.from_dh(
+        XARM6_DH_PARAMS, modified=True, tool_transform=tool_transform, joint_limits_deg=XARM6_JOINT_LIMITS_DEG
+    )
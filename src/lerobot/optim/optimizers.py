@@ -174,7 +174,20 @@ def save_optimizer_state(
 
 def _save_single_optimizer_state(optimizer: torch.optim.Optimizer, save_dir: Path) -> None:
     """Save a single optimizer's state to disk."""
-    state = optimizer.state_dict()
+    save_optimizer_state_dict(optimizer.state_dict(), save_dir)
+
+
+def save_optimizer_state_dict(state_dict: dict[str, Any], save_dir: Path) -> None:
+    """Save an already materialized optimizer `state_dict` to disk.
+
+    This is used when the state has been snapshotted ahead of time (e.g. by an asynchronous checkpointer) and
+    the optimizer itself may have moved on since.
+
+    Args:
+        state_dict: The optimizer state dict, as returned by `optimizer.state_dict()`.
+        save_dir: Directory to save the optimizer state.
+    """
+    state = dict(state_dict)
     param_groups = state.pop("param_groups")
     flat_state = flatten_dict(state)
     save_file(flat_state, save_dir / OPTIMIZER_STATE)
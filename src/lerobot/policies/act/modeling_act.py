@@ -95,6 +95,12 @@ class ACTPolicy(PreTrainedPolicy):
         else:
             self._action_queue = deque([], maxlen=self.config.n_action_steps)
 
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        if self.config.temporal_ensemble_coeff is not None:
+            raise NotImplementedError("Temporal ensembling doesn't support resetting part of the batch.")
+        # No history of observations is kept, so elements can restart whenever new actions are generated.
+        return len(self._action_queue) == 0
+
     @torch.no_grad()
     def select_action(self, batch: dict[str, Tensor]) -> Tensor:
         """Select a single action given environment observations.
@@ -207,48 +213,86 @@ class ACTTemporalEnsembler:
         self.chunk_size = chunk_size
         self.ensemble_weights = torch.exp(-temporal_ensemble_coeff * torch.arange(chunk_size))
         self.ensemble_weights_cumsum = torch.cumsum(self.ensemble_weights, dim=0)
+
+        # The online averages of the upcoming time steps are kept in a preallocated buffer of `2 * chunk_size`
+        # time steps: the window of upcoming time steps slides along the buffer (by one step per update, as
+        # actions are consumed), and is moved back to the start of the buffer once it reaches the end. This way,
+        # no memory is allocated during an episode (but for the returned actions), and the window is contiguous.
+        # The number of actions averaged for each time step only depends on the number of updates since the
+        # episode started: at update n, the action at offset j (of the `chunk_size - 1` previous ones) has been
+        # averaged min(n, chunk_size - 1 - j) times. The factors of the online update are thus tabulated, for
+        # update n at index n (the last one is used for all the subsequent updates).
+        counts = torch.minimum(
+            torch.arange(chunk_size)[:, None], torch.arange(chunk_size - 1, 0, -1)[None, :]
+        ).clamp(min=1)  # (chunk_size, chunk_size - 1), the first row is not used.
+        # Note: The last dimension is unsqueezed to make sure we can broadcast properly for tensor operations.
+        self._update_factors = [
+            (
+                self.ensemble_weights_cumsum[update_counts - 1].unsqueeze(-1),
+                self.ensemble_weights[update_counts].unsqueeze(-1),
+                self.ensemble_weights_cumsum[update_counts].unsqueeze(-1),
+            )
+            for update_counts in counts
+        ]
+        self._buffer: Tensor | None = None
         self.reset()
 
     def reset(self):
         """Resets the online computation variables."""
-        self.ensembled_actions = None
-        # (chunk_size,) count of how many actions are in the ensemble for each time step in the sequence.
-        self.ensembled_actions_count = None
+        # Number of updates since the episode started.
+        self._num_updates = 0
+        # Index in the buffer of the next time step.
+        self._head = 0
+
+    def _allocate(self, actions: Tensor):
+        device = actions.device
+        self.ensemble_weights = self.ensemble_weights.to(device=device)
+        self.ensemble_weights_cumsum = self.ensemble_weights_cumsum.to(device=device)
+        self._update_factors = [
+            tuple(factor.to(device=device) for factor in factors) for factors in self._update_factors
+        ]
+        batch_size, _, action_dim = actions.shape
+        # (batch_size, 2 * chunk_size, action_dim) online averages, and scratch space for the weighted actions.
+        self._buffer = actions.new_empty(batch_size, 2 * self.chunk_size, action_dim)
+        self._weighted_actions = torch.empty_like(actions[:, :-1])
 
     def update(self, actions: Tensor) -> Tensor:
         """
         Takes a (batch, chunk_size, action_dim) sequence of actions, update the temporal ensemble for all
         time steps, and pop/return the next batch of actions in the sequence.
         """
-        self.ensemble_weights = self.ensemble_weights.to(device=actions.device)
-        self.ensemble_weights_cumsum = self.ensemble_weights_cumsum.to(device=actions.device)
-        if self.ensembled_actions is None:
-            # Initializes `self._ensembled_action` to the sequence of actions predicted during the first
-            # time step of the episode.
-            self.ensembled_actions = actions.clone()
-            # Note: The last dimension is unsqueeze to make sure we can broadcast properly for tensor
-            # operations later.
-            self.ensembled_actions_count = torch.ones(
-                (self.chunk_size, 1), dtype=torch.long, device=self.ensembled_actions.device
-            )
+        if (
+            self._buffer is None
+            or self._weighted_actions.shape[0] != actions.shape[0]
+            or self._buffer.dtype != actions.dtype
+            or self._buffer.device != actions.device
+        ):
+            self._allocate(actions)
+
+        if self._num_updates == 0:
+            # Initializes the online averages to the sequence of actions predicted during the first time step
+            # of the episode.
+            self._buffer[:, : self.chunk_size] = actions
         else:
-            # self.ensembled_actions will have shape (batch_size, chunk_size - 1, action_dim). Compute
-            # the online update for those entries.
-            self.ensembled_actions *= self.ensemble_weights_cumsum[self.ensembled_actions_count - 1]
-            self.ensembled_actions += actions[:, :-1] * self.ensemble_weights[self.ensembled_actions_count]
-            self.ensembled_actions /= self.ensemble_weights_cumsum[self.ensembled_actions_count]
-            self.ensembled_actions_count = torch.clamp(self.ensembled_actions_count + 1, max=self.chunk_size)
-            # The last action, which has no prior online average, needs to get concatenated onto the end.
-            self.ensembled_actions = torch.cat([self.ensembled_actions, actions[:, -1:]], dim=1)
-            self.ensembled_actions_count = torch.cat(
-                [self.ensembled_actions_count, torch.ones_like(self.ensembled_actions_count[-1:])]
-            )
+            if self._head + self.chunk_size > self._buffer.shape[1]:
+                # Move the window back to the start of the buffer (the two regions don't overlap).
+                self._buffer[:, : self.chunk_size - 1] = self._buffer[:, self._head :]
+                self._head = 0
+            # Compute the online update for the `chunk_size - 1` entries averaged so far.
+            prev_weights_cumsum, weights, weights_cumsum = self._update_factors[
+                min(self._num_updates, self.chunk_size - 1)
+            ]
+            ensembled_actions = self._buffer[:, self._head : self._head + self.chunk_size - 1]
+            ensembled_actions *= prev_weights_cumsum
+            ensembled_actions += torch.mul(actions[:, :-1], weights, out=self._weighted_actions)
+            ensembled_actions /= weights_cumsum
+            # The last action, which has no prior online average, goes at the end of the window.
+            self._buffer[:, self._head + self.chunk_size - 1] = actions[:, -1]
+
         # "Consume" the first action.
-        action, self.ensembled_actions, self.ensembled_actions_count = (
-            self.ensembled_actions[:, 0],
-            self.ensembled_actions[:, 1:],
-            self.ensembled_actions_count[1:],
-        )
+        action = self._buffer[:, self._head].clone()
+        self._head += 1
+        self._num_updates += 1
         return action
 
 
@@ -84,7 +84,8 @@ class DiffusionConfig(PreTrainedConfig):
         use_film_scale_modulation: FiLM (https://huggingface.co/papers/1709.07871) is used for the Unet conditioning.
             Bias modulation is used be default, while this parameter indicates whether to also use scale
             modulation.
-        noise_scheduler_type: Name of the noise scheduler to use. Supported options: ["DDPM", "DDIM"].
+        noise_scheduler_type: Name of the noise scheduler to use. Supported options: ["DDPM", "DDIM",
+            "DPMSolver++", "UniPC"].
         num_train_timesteps: Number of diffusion steps for the forward diffusion schedule.
         beta_schedule: Name of the diffusion beta schedule as per DDPMScheduler from Hugging Face diffusers.
         beta_start: Beta value for the first forward-diffusion step.
@@ -98,6 +99,12 @@ class DiffusionConfig(PreTrainedConfig):
         clip_sample_range: The magnitude of the clipping range as described above.
         num_inference_steps: Number of reverse diffusion steps to use at inference time (steps are evenly
             spaced). If not provided, this defaults to be the same as `num_train_timesteps`.
+        inference_noise_scheduler_type: Name of the noise scheduler to use for sampling at inference time, with
+            the same options as `noise_scheduler_type` (which is used if not provided). All schedulers share the
+            same forward diffusion process, so this can be changed on a trained policy without retraining, e.g.
+            `--policy.inference_noise_scheduler_type=DPMSolver++ --policy.num_inference_steps=10`. The
+            higher-order "DPMSolver++" and "UniPC" solvers need far fewer steps than "DDPM" for similar results.
+            They only support a `clip_sample_range` of 1.
         do_mask_loss_for_padding: Whether to mask the loss when there are copy-padded actions. See
             `LeRobotDataset` and `load_previous_and_future_frames` for more information. Note, this defaults
             to False as the original Diffusion Policy implementation does the same.
@@ -147,6 +154,7 @@ class DiffusionConfig(PreTrainedConfig):
 
     # Inference
     num_inference_steps: int | None = None
+    inference_noise_scheduler_type: str | None = None
 
     # Loss computation
     do_mask_loss_for_padding: bool = False
@@ -173,12 +181,20 @@ class DiffusionConfig(PreTrainedConfig):
             raise ValueError(
                 f"`prediction_type` must be one of {supported_prediction_types}. Got {self.prediction_type}."
             )
-        supported_noise_schedulers = ["DDPM", "DDIM"]
+        supported_noise_schedulers = ["DDPM", "DDIM", "DPMSolver++", "UniPC"]
         if self.noise_scheduler_type not in supported_noise_schedulers:
             raise ValueError(
                 f"`noise_scheduler_type` must be one of {supported_noise_schedulers}. "
                 f"Got {self.noise_scheduler_type}."
             )
+        if (
+            self.inference_noise_scheduler_type is not None
+            and self.inference_noise_scheduler_type not in supported_noise_schedulers
+        ):
+            raise ValueError(
+                f"`inference_noise_scheduler_type` must be one of {supported_noise_schedulers}. "
+                f"Got {self.inference_noise_scheduler_type}."
+            )
 
         # Check that the horizon size and U-Net downsampling is compatible.
         # U-Net downsamples by 2 with each stage.
@@ -20,6 +20,7 @@ TODO(alexander-soare):
   - Remove reliance on diffusers for DDPMScheduler and LR scheduler.
 """
 
+import inspect
 import math
 from collections import deque
 from collections.abc import Callable
@@ -31,6 +32,8 @@ import torch.nn.functional as F  # noqa: N812
 import torchvision
 from diffusers.schedulers.scheduling_ddim import DDIMScheduler
 from diffusers.schedulers.scheduling_ddpm import DDPMScheduler
+from diffusers.schedulers.scheduling_dpmsolver_multistep import DPMSolverMultistepScheduler
+from diffusers.schedulers.scheduling_unipc_multistep import UniPCMultistepScheduler
 from torch import Tensor, nn
 
 from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
@@ -40,9 +43,14 @@ from lerobot.policies.utils import (
     get_dtype_from_parameters,
     get_output_shape,
     populate_queues,
+    restart_queues,
 )
 from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGES, OBS_STATE
 
+# Key under which already encoded image features (B, n_obs_steps, num_cameras * feature_dim) can be passed to
+# `DiffusionModel` in place of the raw images.
+OBS_IMAGE_FEATURES = OBS_IMAGES + ".features"
+
 
 class DiffusionPolicy(PreTrainedPolicy):
     """
@@ -88,12 +96,42 @@ class DiffusionPolicy(PreTrainedPolicy):
             self._queues[OBS_IMAGES] = deque(maxlen=self.config.n_obs_steps)
         if self.config.env_state_feature:
             self._queues[OBS_ENV_STATE] = deque(maxlen=self.config.n_obs_steps)
+        # Batch elements whose observation history restarts at the next step (see `reset_batch_elements`).
+        self._restart_mask: Tensor | None = None
+
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        if len(self._queues[ACTION]) > 0:
+            return False
+        self._restart_mask = mask if self._restart_mask is None else self._restart_mask | mask
+        return True
+
+    def _encode_queued_images(self) -> None:
+        """Replaces the raw frames of the image queue by their features, so that each frame is encoded once.
+
+        Raw frames (B, num_cameras, C, H, W) are appended to the queue at every step, and only encoded here,
+        when a new action chunk is needed, in a single batched call to the image encoder. Frames that are still
+        in the queue from previous chunks are already encoded (B, num_cameras * feature_dim) and are reused.
+        """
+        queue = self._queues[OBS_IMAGES]
+        pending = [i for i, entry in enumerate(queue) if entry.ndim == 5]
+        if not pending:
+            return
+        # When the queue is first filled, the same frame is repeated `n_obs_steps` times.
+        unique_frames = {id(queue[i]): queue[i] for i in pending}
+        features = self.diffusion.encode_images(torch.stack(list(unique_frames.values()), dim=1))
+        features_by_id = {frame_id: features[:, j] for j, frame_id in enumerate(unique_frames)}
+        for i in pending:
+            queue[i] = features_by_id[id(queue[i])]
 
     @torch.no_grad()
     def predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
         """Predict a chunk of actions given environment observations."""
+        if OBS_IMAGES in self._queues:
+            self._encode_queued_images()
         # stack n latest observations from the queue
         batch = {k: torch.stack(list(self._queues[k]), dim=1) for k in batch if k in self._queues}
+        if OBS_IMAGES in batch:
+            batch[OBS_IMAGE_FEATURES] = batch.pop(OBS_IMAGES)
         actions = self.diffusion.generate_actions(batch)
 
         return actions
@@ -119,6 +157,9 @@ class DiffusionPolicy(PreTrainedPolicy):
         Note that this means we require: `n_action_steps <= horizon - n_obs_steps + 1`. Also, note that
         "horizon" may not the best name to describe what the variable actually means, because this period is
         actually measured from the first observation which (if `n_obs_steps` > 1) happened in the past.
+
+        Image frames are encoded lazily when a new chunk is generated, and their features are kept in the
+        observation queue, so that each frame goes through the image encoder only once.
         """
         # NOTE: for offline evaluation, we have action in the batch, so we need to pop it out
         if ACTION in batch:
@@ -129,6 +170,12 @@ class DiffusionPolicy(PreTrainedPolicy):
             batch[OBS_IMAGES] = torch.stack([batch[key] for key in self.config.image_features], dim=-4)
         # NOTE: It's important that this happens after stacking the images into a single key.
         self._queues = populate_queues(self._queues, batch)
+        if self._restart_mask is not None:
+            # Queued frames and features can't be mixed, so encode the new frames first.
+            if OBS_IMAGES in self._queues:
+                self._encode_queued_images()
+            self._queues = restart_queues(self._queues, self._restart_mask, exclude_keys=[ACTION])
+            self._restart_mask = None
 
         if len(self._queues[ACTION]) == 0:
             actions = self.predict_action_chunk(batch)
@@ -147,15 +194,34 @@ class DiffusionPolicy(PreTrainedPolicy):
         return loss, None
 
 
-def _make_noise_scheduler(name: str, **kwargs: dict) -> DDPMScheduler | DDIMScheduler:
+def _make_noise_scheduler(
+    name: str, **kwargs: dict
+) -> DDPMScheduler | DDIMScheduler | DPMSolverMultistepScheduler | UniPCMultistepScheduler:
     """
     Factory for noise scheduler instances of the requested type. All kwargs are passed
     to the scheduler.
+
+    The multistep solvers ("DPMSolver++" and "UniPC") don't support plain sample clipping. When `clip_sample` is
+    set, dynamic thresholding with `sample_max_value=1` is used instead, which is equivalent to clipping the
+    predicted sample to [-1, 1]. Other values of `clip_sample_range` are not supported with these solvers.
     """
     if name == "DDPM":
         return DDPMScheduler(**kwargs)
     elif name == "DDIM":
         return DDIMScheduler(**kwargs)
+    elif name in ("DPMSolver++", "UniPC"):
+        kwargs = dict(kwargs)
+        clip_sample = kwargs.pop("clip_sample", False)
+        clip_sample_range = kwargs.pop("clip_sample_range", 1.0)
+        if clip_sample and clip_sample_range != 1.0:
+            raise ValueError(
+                f"The {name} noise scheduler only supports clipping the sample to [-1, 1]. Got "
+                f"`clip_sample_range={clip_sample_range}`."
+            )
+        kwargs.update(thresholding=clip_sample, sample_max_value=1.0)
+        if name == "DPMSolver++":
+            return DPMSolverMultistepScheduler(algorithm_type="dpmsolver++", **kwargs)
+        return UniPCMultistepScheduler(**kwargs)
     else:
         raise ValueError(f"Unsupported noise scheduler type {name}")
 
@@ -182,20 +248,45 @@ class DiffusionModel(nn.Module):
         self.unet = DiffusionConditionalUnet1d(config, global_cond_dim=global_cond_dim * config.n_obs_steps)
 
         self.noise_scheduler = _make_noise_scheduler(
-            config.noise_scheduler_type,
-            num_train_timesteps=config.num_train_timesteps,
-            beta_start=config.beta_start,
-            beta_end=config.beta_end,
-            beta_schedule=config.beta_schedule,
-            clip_sample=config.clip_sample,
-            clip_sample_range=config.clip_sample_range,
-            prediction_type=config.prediction_type,
+            config.noise_scheduler_type, **self._noise_scheduler_kwargs()
         )
+        self.set_inference_schedule(config.inference_noise_scheduler_type, config.num_inference_steps)
+
+    def _noise_scheduler_kwargs(self) -> dict:
+        return {
+            "num_train_timesteps": self.config.num_train_timesteps,
+            "beta_start": self.config.beta_start,
+            "beta_end": self.config.beta_end,
+            "beta_schedule": self.config.beta_schedule,
+            "clip_sample": self.config.clip_sample,
+            "clip_sample_range": self.config.clip_sample_range,
+            "prediction_type": self.config.prediction_type,
+        }
+
+    def set_inference_schedule(
+        self, noise_scheduler_type: str | None = None, num_inference_steps: int | None = None
+    ) -> None:
+        """Sets the noise scheduler and number of denoising steps used by `conditional_sample`.
 
-        if config.num_inference_steps is None:
+        Args:
+            noise_scheduler_type: Type of the scheduler to sample with. Defaults to the training scheduler.
+            num_inference_steps: Number of denoising steps. Defaults to `num_train_timesteps`.
+        """
+        if noise_scheduler_type is None or noise_scheduler_type == self.config.noise_scheduler_type:
+            self.inference_noise_scheduler = self.noise_scheduler
+        else:
+            self.inference_noise_scheduler = _make_noise_scheduler(
+                noise_scheduler_type, **self._noise_scheduler_kwargs()
+            )
+        # Not all schedulers draw noise when stepping (and thus accept a generator).
+        self._scheduler_step_accepts_generator = (
+            "generator" in inspect.signature(self.inference_noise_scheduler.step).parameters
+        )
+
+        if num_inference_steps is None:
             self.num_inference_steps = self.noise_scheduler.config.num_train_timesteps
         else:
-            self.num_inference_steps = config.num_inference_steps
+            self.num_inference_steps = num_inference_steps
 
     # ========= inference  ============
     def conditional_sample(
@@ -212,9 +303,11 @@ class DiffusionModel(nn.Module):
             generator=generator,
         )
 
-        self.noise_scheduler.set_timesteps(self.num_inference_steps)
+        noise_scheduler = self.inference_noise_scheduler
+        noise_scheduler.set_timesteps(self.num_inference_steps)
+        step_kwargs = {"generator": generator} if self._scheduler_step_accepts_generator else {}
 
-        for t in self.noise_scheduler.timesteps:
+        for t in noise_scheduler.timesteps:
             # Predict model output.
             model_output = self.unet(
                 sample,
@@ -222,40 +315,42 @@ class DiffusionModel(nn.Module):
                 global_cond=global_cond,
             )
             # Compute previous image: x_t -> x_t-1
-            sample = self.noise_scheduler.step(model_output, t, sample, generator=generator).prev_sample
+            sample = noise_scheduler.step(model_output, t, sample, **step_kwargs).prev_sample
 
         return sample
 
+    def encode_images(self, images: Tensor) -> Tensor:
+        """Encode a (B, S, num_cameras, C, H, W) stack of images into (B, S, num_cameras * feature_dim)."""
+        batch_size, n_obs_steps = images.shape[:2]
+        if self.config.use_separate_rgb_encoder_per_camera:
+            # Combine batch and sequence dims while rearranging to make the camera index dimension first.
+            images_per_camera = einops.rearrange(images, "b s n ... -> n (b s) ...")
+            img_features_list = torch.cat(
+                [encoder(images) for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)]
+            )
+            # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
+            # feature dim (effectively concatenating the camera features).
+            return einops.rearrange(
+                img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
+            )
+        # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
+        img_features = self.rgb_encoder(einops.rearrange(images, "b s n ... -> (b s n) ..."))
+        # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
+        # feature dim (effectively concatenating the camera features).
+        return einops.rearrange(img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps)
+
     def _prepare_global_conditioning(self, batch: dict[str, Tensor]) -> Tensor:
-        """Encode image features and concatenate them all together along with the state vector."""
-        batch_size, n_obs_steps = batch[OBS_STATE].shape[:2]
+        """Encode image features and concatenate them all together along with the state vector.
+
+        Image features that were already encoded can be passed under `OBS_IMAGE_FEATURES` instead of the images.
+        """
         global_cond_feats = [batch[OBS_STATE]]
         # Extract image features.
         if self.config.image_features:
-            if self.config.use_separate_rgb_encoder_per_camera:
-                # Combine batch and sequence dims while rearranging to make the camera index dimension first.
-                images_per_camera = einops.rearrange(batch[OBS_IMAGES], "b s n ... -> n (b s) ...")
-                img_features_list = torch.cat(
-                    [
-                        encoder(images)
-                        for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)
-                    ]
-                )
-                # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
+            if OBS_IMAGE_FEATURES in batch:
+                img_features = batch[OBS_IMAGE_FEATURES]
             else:
-                # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
-                img_features = self.rgb_encoder(
-                    einops.rearrange(batch[OBS_IMAGES], "b s n ... -> (b s n) ...")
-                )
-                # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
+                img_features = self.encode_images(batch[OBS_IMAGES])
             global_cond_feats.append(img_features)
 
         if self.config.env_state_feature:
@@ -271,6 +366,7 @@ class DiffusionModel(nn.Module):
             "observation.state": (B, n_obs_steps, state_dim)
 
             "observation.images": (B, n_obs_steps, num_cameras, C, H, W)
+                OR "observation.images.features": (B, n_obs_steps, num_cameras * feature_dim)
                 AND/OR
             "observation.environment_state": (B, n_obs_steps, environment_dim)
         }
@@ -239,6 +239,10 @@ class PI0Policy(PreTrainedPolicy):
         """This should be called whenever the environment is reset."""
         self._action_queue = deque([], maxlen=self.config.n_action_steps)
 
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        # No history of observations is kept, so elements can restart whenever new actions are generated.
+        return len(self._action_queue) == 0
+
     def get_optim_params(self) -> dict:
         return self.parameters()
 
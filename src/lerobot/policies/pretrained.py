@@ -166,6 +166,26 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
         """
         raise NotImplementedError
 
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        """Resets the inference state of some elements of the batch, e.g. when their environments start new
+        episodes while the other environments of a vectorized environment carry on.
+
+        The reset takes effect at the next `select_action` call, which receives the first observations of the
+        new episodes. Policies executing action chunks can only restart an element when they are about to
+        generate actions for the whole batch (their action queue is empty), and return False otherwise: the
+        caller should then try again at the next step.
+
+        Args:
+            mask: (batch,) boolean tensor selecting the elements to reset.
+
+        Returns:
+            bool: Whether the elements will be reset at the next `select_action` call.
+
+        Raises:
+            NotImplementedError: If the policy doesn't support resetting part of the batch.
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't support resetting part of the batch.")
+
     # TODO(aliberts, rcadene): split into 'forward' and 'compute_loss'?
     @abc.abstractmethod
     def forward(self, batch: dict[str, Tensor]) -> tuple[Tensor, dict | None]:
@@ -127,6 +127,13 @@ class SACConfig(PreTrainedConfig):
     vision_encoder_name: str | None = None
     # Whether to freeze the vision encoder during training
     freeze_vision_encoder: bool = True
+    # Whether to encode images with the frozen pretrained vision encoder once, when transitions are added to the
+    # replay buffers, and sample these features instead of re-encoding the images at every optimization step.
+    # NOTE: DrQ image augmentation is not applied to the stored features.
+    store_image_features_in_buffer: bool = False
+    # Whether to keep the raw images in the replay buffers next to their features. Dropping them saves memory,
+    # but the online buffer is then saved without images at checkpoints.
+    store_images_in_buffer: bool = True
     # Hidden dimension size for the image encoder
     image_encoder_hidden_dim: int = 32
     # Whether to use a shared encoder for actor and critic
@@ -198,10 +205,20 @@ class SACConfig(PreTrainedConfig):
 
     # Optimizations
     use_torch_compile: bool = True
+    # Whether to back the critics' parameters with contiguous buffers so that each target network update is a
+    # single kernel. Parameters are moved to these buffers at the first target update.
+    flatten_target_update_params: bool = False
 
     def __post_init__(self):
         super().__post_init__()
         # Any validation specific to SAC configuration
+        if self.store_image_features_in_buffer and (
+            self.vision_encoder_name is None or not self.freeze_vision_encoder
+        ):
+            raise ValueError(
+                "`store_image_features_in_buffer` requires a frozen pretrained vision encoder "
+                "(`vision_encoder_name` set and `freeze_vision_encoder=True`)."
+            )
 
     def get_optimizer_preset(self) -> MultiAdamConfig:
         return MultiAdamConfig(
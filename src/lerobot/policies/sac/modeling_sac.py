@@ -30,7 +30,7 @@ from torch.distributions import MultivariateNormal, TanhTransform, Transform, Tr
 
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.sac.configuration_sac import SACConfig, is_image_feature
-from lerobot.policies.utils import get_device_from_parameters
+from lerobot.policies.utils import EMAUpdater, get_device_from_parameters, stack_ensemble
 from lerobot.utils.constants import OBS_ENV_STATE, OBS_STATE
 
 DISCRETE_DIMENSION_INDEX = -1  # Gripper is always the last dimension
@@ -219,25 +219,8 @@ class SACPolicy(
 
     def update_target_networks(self):
         """Update target networks with exponential moving average"""
-        for target_param, param in zip(
-            self.critic_target.parameters(),
-            self.critic_ensemble.parameters(),
-            strict=True,
-        ):
-            target_param.data.copy_(
-                param.data * self.config.critic_target_update_weight
-                + target_param.data * (1.0 - self.config.critic_target_update_weight)
-            )
-        if self.config.num_discrete_actions is not None:
-            for target_param, param in zip(
-                self.discrete_critic_target.parameters(),
-                self.discrete_critic.parameters(),
-                strict=True,
-            ):
-                target_param.data.copy_(
-                    param.data * self.config.critic_target_update_weight
-                    + target_param.data * (1.0 - self.config.critic_target_update_weight)
-                )
+        for updater in self.target_network_updaters:
+            updater.update(self.config.critic_target_update_weight)
 
     def update_temperature(self):
         self.temperature = self.log_alpha.exp().item()
@@ -420,6 +403,12 @@ class SACPolicy(
             self.critic_ensemble = torch.compile(self.critic_ensemble)
             self.critic_target = torch.compile(self.critic_target)
 
+        self.target_network_updaters = [
+            EMAUpdater(
+                self.critic_target, self.critic_ensemble, flatten=self.config.flatten_target_update_params
+            )
+        ]
+
         if self.config.num_discrete_actions is not None:
             self._init_discrete_critics()
 
@@ -440,6 +429,13 @@ class SACPolicy(
 
         # TODO: (maractingi, azouitine) Compile the discrete critic
         self.discrete_critic_target.load_state_dict(self.discrete_critic.state_dict())
+        self.target_network_updaters.append(
+            EMAUpdater(
+                self.discrete_critic_target,
+                self.discrete_critic,
+                flatten=self.config.flatten_target_update_params,
+            )
+        )
 
     def _init_actor(self, continuous_action_dim):
         """Initialize policy actor network and default target entropy."""
@@ -710,6 +706,10 @@ class CriticEnsemble(nn.Module):
     """
     CriticEnsemble wraps multiple CriticHead modules into an ensemble.
 
+    The heads' parameters are stacked (see `stack_ensemble`) so that all critics are evaluated with batched
+    matmuls instead of a Python loop over the heads. Checkpoints saved with the heads in an `nn.ModuleList`
+    (`critics.{i}.*` keys) are converted when loaded.
+
     Args:
         encoder (SACObservationEncoder): encoder for observations.
         ensemble (List[CriticHead]): list of critic heads.
@@ -727,7 +727,8 @@ class CriticEnsemble(nn.Module):
         super().__init__()
         self.encoder = encoder
         self.init_final = init_final
-        self.critics = nn.ModuleList(ensemble)
+        self.num_critics = len(ensemble)
+        self.critics = stack_ensemble(ensemble)
 
     def forward(
         self,
@@ -743,13 +744,8 @@ class CriticEnsemble(nn.Module):
 
         inputs = torch.cat([obs_enc, actions], dim=-1)
 
-        # Loop through critics and collect outputs
-        q_values = []
-        for critic in self.critics:
-            q_values.append(critic(inputs))
-
-        # Stack outputs to match expected shape [num_critics, batch_size]
-        q_values = torch.stack([q.squeeze(-1) for q in q_values], dim=0)
+        # Evaluate all critics at once, output shape [num_critics, batch_size]
+        q_values = self.critics(inputs.expand(self.num_critics, *inputs.shape)).squeeze(-1)
         return q_values
 
 
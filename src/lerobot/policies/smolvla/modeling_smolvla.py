@@ -242,6 +242,10 @@ class SmolVLAPolicy(PreTrainedPolicy):
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
 
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        # No history of observations is kept, so elements can restart whenever new actions are generated.
+        return len(self._queues[ACTION]) == 0
+
     def get_optim_params(self) -> dict:
         return self.parameters()
 
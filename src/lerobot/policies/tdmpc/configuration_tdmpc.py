@@ -82,6 +82,11 @@ class TDMPCConfig(PreTrainedConfig):
             elites, when updating the gaussian parameters for CEM.
         gaussian_mean_momentum: Momentum (α) used for EMA updates of the mean parameter μ of the gaussian
             parameters optimized in CEM. Updates are calculated as μ⁻ ← αμ⁻ + (1-α)μ.
+        use_static_planner: Whether to plan with static-shape rollouts over buffers allocated in `reset()`
+            (rather than allocated at every step), evaluating the rewards and values of all the steps of the
+            sampled trajectories in batch. The trajectories' latent rollouts remain sequential.
+        compile_planner: Whether to compile the static planner with `torch.compile`. Requires
+            `use_static_planner`.
         max_random_shift_ratio: Maximum random shift (as a proportion of the image size) to apply to the
             image(s) (in units of pixels) for training-time augmentation. If set to 0, no such augmentation
             is applied. Note that the input images are assumed to be square for this augmentation.
@@ -142,6 +147,8 @@ class TDMPCConfig(PreTrainedConfig):
     n_elites: int = 50
     elite_weighting_temperature: float = 0.5
     gaussian_mean_momentum: float = 0.1
+    use_static_planner: bool = False
+    compile_planner: bool = False
 
     # Training and loss computation.
     max_random_shift_ratio: float = 0.0476
@@ -186,6 +193,8 @@ class TDMPCConfig(PreTrainedConfig):
                 raise ValueError("If `n_action_steps > 1`, `use_mpc` must be set to `True`.")
             if self.n_action_steps > self.horizon:
                 raise ValueError("`n_action_steps` must be less than or equal to `horizon`.")
+        if self.compile_planner and not self.use_static_planner:
+            raise ValueError("`compile_planner` requires `use_static_planner=True`.")
 
     def get_optimizer_preset(self) -> AdamConfig:
         return AdamConfig(lr=self.optimizer_lr)
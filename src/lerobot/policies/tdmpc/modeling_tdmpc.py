@@ -37,7 +37,13 @@ from torch import Tensor
 
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.tdmpc.configuration_tdmpc import TDMPCConfig
-from lerobot.policies.utils import get_device_from_parameters, get_output_shape, populate_queues
+from lerobot.policies.utils import (
+    EMAUpdater,
+    get_device_from_parameters,
+    get_output_shape,
+    populate_queues,
+    stack_ensemble,
+)
 from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGE, OBS_PREFIX, OBS_STATE, OBS_STR, REWARD
 
 
@@ -79,6 +85,14 @@ class TDMPCPolicy(PreTrainedPolicy):
         self.model_target = deepcopy(self.model)
         for param in self.model_target.parameters():
             param.requires_grad = False
+        self._ema_updater = EMAUpdater(self.model_target, self.model)
+
+        # Static planner buffers, allocated in `reset()`, for a batch of size 1 until another size is seen.
+        self._plan_batch_size = 1
+        self._plan_buffers: dict[str, Tensor] | None = None
+        self._static_plan = self._plan_with_buffers
+        if config.compile_planner:
+            self._static_plan = torch.compile(self._plan_with_buffers)
 
         self.reset()
 
@@ -101,6 +115,42 @@ class TDMPCPolicy(PreTrainedPolicy):
         # Previous mean obtained from the cross-entropy method (CEM) used during MPC. It is used to warm start
         # CEM for the next step.
         self._prev_mean: torch.Tensor | None = None
+        if self.config.use_mpc and self.config.use_static_planner:
+            self._allocate_plan_buffers(self._plan_batch_size)
+
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        # Only the latest observation is used, but the actions still queued were planned for all the elements.
+        if len(self._queues[ACTION]) > 0:
+            return False
+        # Don't warm start CEM for the restarted elements.
+        if self._prev_mean is not None:
+            self._prev_mean[:, mask.to(self._prev_mean.device)] = 0
+        if self._plan_buffers is not None and self._plan_batch_size == len(mask):
+            prev_mean = self._plan_buffers["prev_mean"]
+            prev_mean[:, mask.to(prev_mean.device)] = 0
+        return True
+
+    def _allocate_plan_buffers(self, batch_size: int):
+        """Allocates the buffers used by the static planner (see `_plan_with_buffers`)."""
+        device = get_device_from_parameters(self)
+        horizon = self.config.horizon
+        n_samples = self.config.n_gaussian_samples + self.config.n_pi_samples
+        action_dim = self.config.action_feature.shape[0]
+        self._plan_batch_size = batch_size
+        self._plan_buffers = {
+            # Sampled action trajectories: the gaussian samples followed by the policy samples.
+            "actions": torch.zeros(horizon, n_samples, batch_size, action_dim, device=device),
+            "noise": torch.empty(
+                horizon, self.config.n_gaussian_samples, batch_size, action_dim, device=device
+            ),
+            # Latent states visited by the sampled trajectories.
+            "zs": torch.empty(horizon + 1, n_samples, batch_size, self.config.latent_dim, device=device),
+            "mean": torch.zeros(horizon, batch_size, action_dim, device=device),
+            "std": torch.empty(horizon, batch_size, action_dim, device=device),
+            # Zeros are equivalent to not warm starting CEM.
+            "prev_mean": torch.zeros(horizon, batch_size, action_dim, device=device),
+            "discounts": self.config.discount ** torch.arange(horizon, device=device, dtype=torch.float32),
+        }
 
     @torch.no_grad()
     def predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
@@ -170,6 +220,12 @@ class TDMPCPolicy(PreTrainedPolicy):
         Returns:
             (horizon, batch, action_dim,) tensor for the planned trajectory of actions.
         """
+        if self.config.use_static_planner:
+            buffers = self._plan_buffers
+            if buffers["mean"].shape[1] != z.shape[0] or buffers["mean"].device != z.device:
+                self._allocate_plan_buffers(z.shape[0])
+            return self._static_plan(z, **self._plan_buffers)
+
         device = get_device_from_parameters(self)
 
         batch_size = z.shape[0]
@@ -255,6 +311,110 @@ class TDMPCPolicy(PreTrainedPolicy):
 
         return actions
 
+    @torch.no_grad()
+    def _plan_with_buffers(
+        self,
+        z: Tensor,
+        actions: Tensor,
+        noise: Tensor,
+        zs: Tensor,
+        mean: Tensor,
+        std: Tensor,
+        prev_mean: Tensor,
+        discounts: Tensor,
+    ) -> Tensor:
+        """Static-shape version of `plan`, operating in place on buffers allocated in `reset()`.
+
+        There are no allocations depending on the step, nor data-dependent control flow, so that this can be
+        compiled with `torch.compile`.
+        """
+        n_gaussian_samples = self.config.n_gaussian_samples
+        batch_size = z.shape[0]
+
+        # Sample Nπ trajectories from the policy. They are the last ones in `actions`.
+        if self.config.n_pi_samples > 0:
+            _z = z.expand(self.config.n_pi_samples, *z.shape)
+            for t in range(self.config.horizon):
+                actions[t, n_gaussian_samples:] = self.model.pi(_z, self.config.min_std)
+                _z = self.model.latent_dynamics(_z, actions[t, n_gaussian_samples:])
+
+        zs[0] = z
+        mean.zero_()
+        mean[:-1] = prev_mean[1:]
+        std.fill_(self.config.max_std)
+
+        for _ in range(self.config.cem_iterations):
+            # Randomly sample action trajectories for the gaussian distribution.
+            noise.normal_()
+            actions[:, :n_gaussian_samples] = torch.clamp(mean.unsqueeze(1) + std.unsqueeze(1) * noise, -1, 1)
+
+            # Compute elite actions.
+            value = self._estimate_value_with_buffers(actions, zs, discounts).nan_to_num_(0)
+            elite_idxs = torch.topk(value, self.config.n_elites, dim=0).indices  # (n_elites, batch)
+            elite_value = value.take_along_dim(elite_idxs, dim=0)  # (n_elites, batch)
+            # (horizon, n_elites, batch, action_dim)
+            elite_actions = actions.take_along_dim(einops.rearrange(elite_idxs, "n b -> 1 n b 1"), dim=1)
+
+            # Update gaussian PDF parameters, see `plan`.
+            max_value = elite_value.max(0, keepdim=True)[0]  # (1, batch)
+            score = torch.exp(self.config.elite_weighting_temperature * (elite_value - max_value))
+            score /= score.sum(axis=0, keepdim=True)
+            # (horizon, batch, action_dim)
+            _mean = torch.sum(einops.rearrange(score, "n b -> n b 1") * elite_actions, dim=1)
+            _std = torch.sqrt(
+                torch.sum(
+                    einops.rearrange(score, "n b -> n b 1")
+                    * (elite_actions - einops.rearrange(_mean, "h b d -> h 1 b d")) ** 2,
+                    dim=1,
+                )
+            )
+            mean.lerp_(_mean, 1 - self.config.gaussian_mean_momentum)
+            std.copy_(_std.clamp_(self.config.min_std, self.config.max_std))
+
+        # Keep track of the mean for warm-starting subsequent steps.
+        prev_mean.copy_(mean)
+
+        # Randomly select one of the elite actions from the last iteration of MPPI/CEM using the softmax
+        # scores from the last iteration.
+        return elite_actions[:, torch.multinomial(score.T, 1).squeeze(), torch.arange(batch_size)]
+
+    def _estimate_value_with_buffers(self, actions: Tensor, zs: Tensor, discounts: Tensor) -> Tensor:
+        """Batched version of `estimate_value` for the static planner.
+
+        Only the latent rollout is done step by step (storing the latent states in `zs`, whose first element
+        is the initial latent state). The rewards and uncertainty regularizers of all the steps are then
+        computed at once.
+
+        Args:
+            actions: (horizon, batch, action_dim) tensor of action trajectories.
+            zs: (horizon + 1, batch, latent_dim) buffer for the latent states, starting with the initial ones.
+            discounts: (horizon,) tensor of discount factors to apply to each step.
+        Returns:
+            (batch,) tensor of values.
+        """
+        horizon = actions.shape[0]
+        for t in range(horizon):
+            zs[t + 1] = self.model.latent_dynamics(zs[t], actions[t])
+
+        rewards = self.model.reward(zs[:-1], actions)  # (horizon, batch)
+        if self.config.uncertainty_regularizer_coeff > 0:
+            rewards -= self.config.uncertainty_regularizer_coeff * self.model.Qs(zs[:-1], actions).std(0)
+        G = torch.einsum("h,hb...->b...", discounts, rewards)
+
+        # Terminal value, see `estimate_value`.
+        running_discount = self.config.discount**horizon
+        z = zs[-1]
+        next_action = self.model.pi(z, self.config.min_std)
+        terminal_values = self.model.Qs(z, next_action)  # (ensemble, batch)
+        if self.config.q_ensemble_size > 2:
+            q_idxs = torch.randint(0, self.config.q_ensemble_size, size=(2,), device=z.device)
+            G += running_discount * torch.min(terminal_values[q_idxs], dim=0)[0]
+        else:
+            G += running_discount * torch.min(terminal_values, dim=0)[0]
+        if self.config.uncertainty_regularizer_coeff > 0:
+            G -= running_discount * self.config.uncertainty_regularizer_coeff * terminal_values.std(0)
+        return G
+
     @torch.no_grad()
     def estimate_value(self, z: Tensor, actions: Tensor):
         """Estimates the value of a trajectory as per eqn 4 of the FOWM paper.
@@ -512,7 +672,7 @@ class TDMPCPolicy(PreTrainedPolicy):
         # Note a minor variation with respect to the original FOWM code. Here they do this based on an EMA
         # update frequency parameter which is set to 2 (every 2 steps an update is done). To simplify the code
         # we update every step and adjust the decay parameter `alpha` accordingly (0.99 -> 0.995)
-        update_ema_parameters(self.model_target, self.model, self.config.target_model_momentum)
+        self._ema_updater.update(1 - self.config.target_model_momentum)
 
 
 class TDMPCTOLD(nn.Module):
@@ -573,6 +733,8 @@ class TDMPCTOLD(nn.Module):
             nn.Linear(config.mlp_dim, 1),
         )
         self._init_weights()
+        # Evaluate the Q ensemble with batched matmuls rather than a Python loop over its members.
+        self._Qs = stack_ensemble(list(self._Qs))
 
     def _init_weights(self):
         """Initialize model weights.
@@ -619,6 +781,18 @@ class TDMPCTOLD(nn.Module):
         x = torch.cat([z, a], dim=-1)
         return self._dynamics(x), self._reward(x).squeeze(-1)
 
+    def reward(self, z: Tensor, a: Tensor) -> Tensor:
+        """Predict the reward given a current latent and action.
+
+        Args:
+            z: (*, latent_dim) tensor for the current state's latent representation.
+            a: (*, action_dim) tensor for the action to be applied.
+        Returns:
+            (*,) tensor for the estimated reward.
+        """
+        x = torch.cat([z, a], dim=-1)
+        return self._reward(x).squeeze(-1)
+
     def latent_dynamics(self, z: Tensor, a: Tensor) -> Tensor:
         """Predict the next state's latent representation given a current latent and action.
 
@@ -672,14 +846,14 @@ class TDMPCTOLD(nn.Module):
             (*,) tensor if return_min=True.
         """
         x = torch.cat([z, a], dim=-1)
+        q_ensemble_size = self.config.q_ensemble_size
+        qs = self._Qs(x.expand(q_ensemble_size, *x.shape)).squeeze(-1)
         if not return_min:
-            return torch.stack([q(x).squeeze(-1) for q in self._Qs], dim=0)
+            return qs
         else:
-            if len(self._Qs) > 2:  # noqa: SIM108
-                Qs = [self._Qs[i] for i in np.random.choice(len(self._Qs), size=2)]
-            else:
-                Qs = self._Qs
-            return torch.stack([q(x).squeeze(-1) for q in Qs], dim=0).min(dim=0)[0]
+            if q_ensemble_size > 2:
+                qs = qs[np.random.choice(q_ensemble_size, size=2)]
+            return qs.min(dim=0)[0]
 
 
 class TDMPCObservationEncoder(nn.Module):
@@ -793,23 +967,6 @@ def random_shifts_aug(x: Tensor, max_random_shift_ratio: float) -> Tensor:
     return F.grid_sample(x, grid, padding_mode="zeros", align_corners=False)
 
 
-def update_ema_parameters(ema_net: nn.Module, net: nn.Module, alpha: float):
-    """Update EMA parameters in place with ema_param <- alpha * ema_param + (1 - alpha) * param."""
-    for ema_module, module in zip(ema_net.modules(), net.modules(), strict=True):
-        for (n_p_ema, p_ema), (n_p, p) in zip(
-            ema_module.named_parameters(recurse=False), module.named_parameters(recurse=False), strict=True
-        ):
-            assert n_p_ema == n_p, "Parameter names don't match for EMA model update"
-            if isinstance(p, dict):
-                raise RuntimeError("Dict parameter not supported")
-            if isinstance(module, nn.modules.batchnorm._BatchNorm) or not p.requires_grad:
-                # Copy BatchNorm parameters, and non-trainable parameters directly.
-                p_ema.copy_(p.to(dtype=p_ema.dtype).data)
-            with torch.no_grad():
-                p_ema.mul_(alpha)
-                p_ema.add_(p.to(dtype=p_ema.dtype).data, alpha=1 - alpha)
-
-
 def flatten_forward_unflatten(fn: Callable[[Tensor], Tensor], image_tensor: Tensor) -> Tensor:
     """Helper to temporarily flatten extra dims at the start of the image tensor.
 
@@ -14,10 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import logging
+import re
 from collections import deque
 
 import torch
+import torch.nn.functional as F  # noqa: N812
 from torch import nn
 
 
@@ -41,6 +44,30 @@ def populate_queues(
     return queues
 
 
+def restart_queues(
+    queues: dict[str, deque], mask: torch.Tensor | None, exclude_keys: list[str] | None = None
+):
+    """Restarts the observation history of the batch elements selected by `mask` from their latest observation.
+
+    To be called after `populate_queues` added the first observations of new episodes: older entries of the
+    selected elements are replaced by their latest one, which is what `populate_queues` does for the first
+    observation after a policy reset. Entries are replaced rather than modified in place, as the same tensor
+    can appear several times in a queue (or be the caller's).
+    """
+    if mask is None:
+        return queues
+    if exclude_keys is None:
+        exclude_keys = []
+    for key, queue in queues.items():
+        if key in exclude_keys or len(queue) < 2:
+            continue
+        latest = queue[-1]
+        element_mask = mask.to(latest.device).view(-1, *[1] * (latest.ndim - 1))
+        for i in range(len(queue) - 1):
+            queue[i] = torch.where(element_mask, latest, queue[i])
+    return queues
+
+
 def get_device_from_parameters(module: nn.Module) -> torch.device:
     """Get a module's device by checking one of its parameters.
 
@@ -85,3 +112,255 @@ def log_model_loading_keys(missing_keys: list[str], unexpected_keys: list[str])
         logging.warning(f"Missing key(s) when loading model: {missing_keys}")
     if unexpected_keys:
         logging.warning(f"Unexpected key(s) when loading model: {unexpected_keys}")
+
+
+class EnsembleLinear(nn.Module):
+    """A stack of independent `nn.Linear` layers evaluated with a single batched matmul.
+
+    Parameters follow the `nn.Linear` layout with a leading ensemble dimension, i.e. `weight` is
+    (num_members, out_features, in_features) and `bias` is (num_members, out_features).
+
+    Input: (num_members, *, in_features). Output: (num_members, *, out_features).
+    """
+
+    def __init__(self, num_members: int, in_features: int, out_features: int, bias: bool = True):
+        super().__init__()
+        self.num_members = num_members
+        self.in_features = in_features
+        self.out_features = out_features
+        self.weight = nn.Parameter(torch.empty(num_members, out_features, in_features))
+        self.bias = nn.Parameter(torch.empty(num_members, out_features)) if bias else None
+
+    @classmethod
+    def from_modules(cls, modules: list[nn.Linear]) -> "EnsembleLinear":
+        first = modules[0]
+        stacked = cls(len(modules), first.in_features, first.out_features, bias=first.bias is not None)
+        stacked.to(device=first.weight.device, dtype=first.weight.dtype)
+        with torch.no_grad():
+            stacked.weight.copy_(torch.stack([m.weight for m in modules]))
+            if stacked.bias is not None:
+                stacked.bias.copy_(torch.stack([m.bias for m in modules]))
+        return stacked
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        shape = x.shape
+        x = x.reshape(self.num_members, -1, self.in_features)
+        if self.bias is None:
+            out = torch.bmm(x, self.weight.transpose(1, 2))
+        else:
+            out = torch.baddbmm(self.bias.unsqueeze(1), x, self.weight.transpose(1, 2))
+        return out.reshape(*shape[:-1], self.out_features)
+
+    def extra_repr(self) -> str:
+        return (
+            f"num_members={self.num_members}, in_features={self.in_features}, "
+            f"out_features={self.out_features}, bias={self.bias is not None}"
+        )
+
+
+class EnsembleLayerNorm(nn.Module):
+    """A stack of independent `nn.LayerNorm` layers, each with its own affine parameters.
+
+    Input and output: (num_members, *, normalized_shape).
+    """
+
+    def __init__(self, num_members: int, normalized_shape: int, eps: float = 1e-5):
+        super().__init__()
+        self.num_members = num_members
+        self.normalized_shape = (normalized_shape,)
+        self.eps = eps
+        self.weight = nn.Parameter(torch.ones(num_members, normalized_shape))
+        self.bias = nn.Parameter(torch.zeros(num_members, normalized_shape))
+
+    @classmethod
+    def from_modules(cls, modules: list[nn.LayerNorm]) -> "EnsembleLayerNorm":
+        first = modules[0]
+        if len(first.normalized_shape) != 1 or not first.elementwise_affine or first.bias is None:
+            raise ValueError("Only 1D LayerNorms with affine weight and bias can be stacked.")
+        stacked = cls(len(modules), first.normalized_shape[0], eps=first.eps)
+        stacked.to(device=first.weight.device, dtype=first.weight.dtype)
+        with torch.no_grad():
+            stacked.weight.copy_(torch.stack([m.weight for m in modules]))
+            stacked.bias.copy_(torch.stack([m.bias for m in modules]))
+        return stacked
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        x = F.layer_norm(x, self.normalized_shape, eps=self.eps)
+        broadcast_shape = (self.num_members,) + (1,) * (x.ndim - 2) + self.normalized_shape
+        return x * self.weight.view(broadcast_shape) + self.bias.view(broadcast_shape)
+
+    def extra_repr(self) -> str:
+        return f"num_members={self.num_members}, normalized_shape={self.normalized_shape}, eps={self.eps}"
+
+
+def _stack_modules(modules: list[nn.Module]) -> nn.Module:
+    first = modules[0]
+    if any(type(m) is not type(first) for m in modules):
+        raise TypeError("All ensemble members must have the same architecture.")
+    if isinstance(first, nn.Linear):
+        return EnsembleLinear.from_modules(modules)
+    if isinstance(first, nn.LayerNorm):
+        return EnsembleLayerNorm.from_modules(modules)
+    if (
+        next(first.parameters(recurse=False), None) is not None
+        or next(first.buffers(recurse=False), None) is not None
+    ):
+        raise TypeError(f"Cannot stack modules of type {type(first).__name__}.")
+
+    # Parameter-free modules (activations, dropout, containers) are copied from the first member, and their
+    # children are stacked.
+    # NOTE: `named_children` is not used as it skips children appearing several times (e.g. a shared activation).
+    children = {name: child for name, child in first._modules.items() if child is not None}
+    stacked = copy.deepcopy(first, memo={id(child): None for child in children.values()})
+    for name in children:
+        setattr(stacked, name, _stack_modules([m._modules[name] for m in modules]))
+    return stacked
+
+
+def stack_ensemble(members: list[nn.Module]) -> nn.Module:
+    """Merges an ensemble of identical modules into a single module with stacked parameters.
+
+    The returned module has the same structure (and state dict keys) as one member, but each `nn.Linear` and
+    `nn.LayerNorm` is replaced by its `EnsembleLinear` / `EnsembleLayerNorm` counterpart, so a forward pass
+    evaluates all members at once on inputs of shape (num_members, *, in_features). This only holds for
+    members whose forward passes are made of these layers and of element-wise operations (e.g. MLPs).
+
+    State dicts saved with the members in an `nn.ModuleList` are converted on load (see
+    `stack_ensemble_state_dict`).
+    """
+    stacked = _stack_modules(members)
+
+    def _convert_module_list_state_dict(module, state_dict, prefix, *args, **kwargs):
+        expected = module.state_dict().keys()
+        if any(prefix + key in state_dict for key in expected):
+            return
+        converted = stack_ensemble_state_dict(
+            {k: v for k, v in state_dict.items() if k.startswith(prefix)}, prefix=prefix
+        )
+        for key in list(state_dict):
+            if key.startswith(prefix):
+                del state_dict[key]
+        state_dict.update(converted)
+
+    stacked.register_load_state_dict_pre_hook(_convert_module_list_state_dict)
+    return stacked
+
+
+def stack_ensemble_state_dict(
+    state_dict: dict[str, torch.Tensor], prefix: str = ""
+) -> dict[str, torch.Tensor]:
+    """Converts the state dict of an `nn.ModuleList` ensemble (stored under `prefix`) to the stacked layout.
+
+    `{prefix}{i}.{name}` entries are stacked along a new leading dimension into `{prefix}{name}`. Other entries
+    are left untouched.
+    """
+    pattern = re.compile(rf"^{re.escape(prefix)}(\d+)\.(.+)$")
+    members: dict[str, dict[int, torch.Tensor]] = {}
+    converted = {}
+    for key, value in state_dict.items():
+        match = pattern.match(key)
+        if match is None:
+            converted[key] = value
+        else:
+            members.setdefault(match.group(2), {})[int(match.group(1))] = value
+    for name, tensors in members.items():
+        converted[prefix + name] = torch.stack([tensors[i] for i in sorted(tensors)])
+    return converted
+
+
+def unstack_ensemble_state_dict(
+    state_dict: dict[str, torch.Tensor], prefix: str = ""
+) -> dict[str, torch.Tensor]:
+    """Converts the state dict of a stacked ensemble (stored under `prefix`) to the `nn.ModuleList` layout.
+
+    This is the inverse of `stack_ensemble_state_dict`.
+    """
+    converted = {}
+    for key, value in state_dict.items():
+        if not key.startswith(prefix):
+            converted[key] = value
+            continue
+        name = key[len(prefix) :]
+        for i, member_value in enumerate(value.unbind(0)):
+            converted[f"{prefix}{i}.{name}"] = member_value.clone()
+    return converted
+
+
+def _flatten_parameters_(params: list[torch.Tensor]) -> torch.Tensor:
+    """Moves `params` into a single contiguous buffer (that their data become views of) and returns it."""
+    flat = torch.cat([p.detach().reshape(-1) for p in params])
+    offset = 0
+    for p in params:
+        p.data = flat[offset : offset + p.numel()].view_as(p)
+        offset += p.numel()
+    return flat
+
+
+class EMAUpdater:
+    """Updates the parameters of a target network as an exponential moving average of a source network.
+
+    The update `target <- (1 - weight) * target + weight * source` is done with fused multi-tensor kernels
+    (`torch._foreach_lerp_`) instead of one set of element-wise operations per parameter. Parameters that are
+    not trained (`requires_grad=False` in the source, or batch norm parameters) are copied. Parameters shared
+    between the two networks (e.g. a shared encoder) are skipped.
+
+    With `flatten=True`, the parameters of each network are additionally moved to one contiguous buffer on the
+    first update, so that an update is a single kernel. The buffers are rebuilt if the parameters were moved
+    since (e.g. with `.to(device)`). This requires all the parameters to share the same device and dtype.
+
+    Args:
+        target: The target network, with the same architecture as `source`.
+        source: The online network.
+        flatten: Whether to back the parameters with contiguous buffers.
+    """
+
+    def __init__(self, target: nn.Module, source: nn.Module, flatten: bool = False):
+        self.flatten = flatten
+        self._ema_targets: list[torch.Tensor] = []
+        self._ema_sources: list[torch.Tensor] = []
+        self._copy_targets: list[torch.Tensor] = []
+        self._copy_sources: list[torch.Tensor] = []
+        for target_module, source_module in zip(target.modules(), source.modules(), strict=True):
+            for (target_name, target_param), (source_name, source_param) in zip(
+                target_module.named_parameters(recurse=False),
+                source_module.named_parameters(recurse=False),
+                strict=True,
+            ):
+                if target_name != source_name:
+                    raise ValueError(
+                        f"Parameter names don't match for EMA update: {target_name}, {source_name}"
+                    )
+                if target_param is source_param:
+                    continue
+                if (
+                    isinstance(source_module, nn.modules.batchnorm._BatchNorm)
+                    or not source_param.requires_grad
+                ):
+                    self._copy_targets.append(target_param)
+                    self._copy_sources.append(source_param)
+                else:
+                    self._ema_targets.append(target_param)
+                    self._ema_sources.append(source_param)
+        self._flat_target: torch.Tensor | None = None
+        self._flat_source: torch.Tensor | None = None
+
+    def _flat_buffers_are_valid(self) -> bool:
+        return (
+            self._flat_target is not None
+            and self._ema_targets[0].data_ptr() == self._flat_target.data_ptr()
+            and self._ema_sources[0].data_ptr() == self._flat_source.data_ptr()
+        )
+
+    @torch.no_grad()
+    def update(self, weight: float) -> None:
+        """Moves the target parameters towards the source ones by `weight` (1.0 copies the source)."""
+        if self._ema_targets:
+            if self.flatten:
+                if not self._flat_buffers_are_valid():
+                    self._flat_target = _flatten_parameters_(self._ema_targets)
+                    self._flat_source = _flatten_parameters_(self._ema_sources)
+                self._flat_target.lerp_(self._flat_source, weight)
+            else:
+                torch._foreach_lerp_(self._ema_targets, self._ema_sources, weight)
+        for target_param, source_param in zip(self._copy_targets, self._copy_sources, strict=True):
+            target_param.copy_(source_param)
@@ -28,7 +28,12 @@ import torchvision
 from torch import Tensor, nn
 
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.policies.utils import get_device_from_parameters, get_output_shape, populate_queues
+from lerobot.policies.utils import (
+    get_device_from_parameters,
+    get_output_shape,
+    populate_queues,
+    restart_queues,
+)
 from lerobot.policies.vqbet.configuration_vqbet import VQBeTConfig
 from lerobot.policies.vqbet.vqbet_utils import GPT, ResidualVQ
 from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
@@ -113,6 +118,14 @@ class VQBeTPolicy(PreTrainedPolicy):
             OBS_STATE: deque(maxlen=self.config.n_obs_steps),
             ACTION: deque(maxlen=self.config.action_chunk_size),
         }
+        # Batch elements whose observation history restarts at the next step (see `reset_batch_elements`).
+        self._restart_mask: Tensor | None = None
+
+    def reset_batch_elements(self, mask: Tensor) -> bool:
+        if len(self._queues[ACTION]) > 0:
+            return False
+        self._restart_mask = mask if self._restart_mask is None else self._restart_mask | mask
+        return True
 
     @torch.no_grad()
     def predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
@@ -139,6 +152,8 @@ class VQBeTPolicy(PreTrainedPolicy):
             batch.pop(ACTION)
 
         self._queues = populate_queues(self._queues, batch)
+        self._queues = restart_queues(self._queues, self._restart_mask, exclude_keys=[ACTION])
+        self._restart_mask = None
 
         if not self.vqbet.action_head.vqvae_model.discretized.item():
             warnings.warn(
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import functools
+import logging
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from typing import TypedDict
@@ -36,6 +37,8 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    observation_feature: dict[str, torch.Tensor] | None = None
+    next_observation_feature: dict[str, torch.Tensor] | None = None
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -87,6 +90,8 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        image_feature_version: str | None = None,
+        store_images: bool = True,
     ):
         """
         Replay buffer for storing transitions.
@@ -104,6 +109,12 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            image_feature_version (str | None): Identifier of the frozen image encoder that computed the image
+                features passed to `add` (or `precompute_image_features`). When set, these features are stored and
+                returned by `sample` as `observation_feature` and `next_observation_feature`, and image
+                augmentation is skipped.
+            store_images (bool): Whether to store the raw images next to their features. Only used when image
+                features are stored.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
@@ -129,15 +140,24 @@ class ReplayBuffer:
             self.image_augmentation_function = torch.compile(base_function)
         self.use_drq = use_drq
 
+        self.image_feature_version = image_feature_version
+        self.store_images = store_images
+        self.has_image_features = False
+
     def _initialize_storage(
         self,
         state: dict[str, torch.Tensor],
         action: torch.Tensor,
         complementary_info: dict[str, torch.Tensor] | None = None,
+        state_features: dict[str, torch.Tensor] | None = None,
     ):
         """Initialize the storage tensors based on the first transition."""
         # Determine shapes from the first transition
         state_shapes = {key: val.squeeze(0).shape for key, val in state.items()}
+        if state_features is not None and self.image_feature_version is not None:
+            self._initialize_feature_storage(state_features)
+            if not self.store_images:
+                state_shapes = {k: v for k, v in state_shapes.items() if k not in state_features}
         action_shape = action.squeeze(0).shape
 
         # Pre-allocate tensors for storage
@@ -184,6 +204,21 @@ class ReplayBuffer:
 
         self.initialized = True
 
+    def _initialize_feature_storage(self, state_features: dict[str, torch.Tensor]):
+        feature_shapes = {key: val.squeeze(0).shape for key, val in state_features.items()}
+        self.state_features = {
+            key: torch.empty((self.capacity, *shape), device=self.storage_device)
+            for key, shape in feature_shapes.items()
+        }
+        if not self.optimize_memory:
+            self.next_state_features = {
+                key: torch.empty((self.capacity, *shape), device=self.storage_device)
+                for key, shape in feature_shapes.items()
+            }
+        else:
+            self.next_state_features = self.state_features
+        self.has_image_features = True
+
     def __len__(self):
         return self.size
 
@@ -196,11 +231,27 @@ class ReplayBuffer:
         done: bool,
         truncated: bool,
         complementary_info: dict[str, torch.Tensor] | None = None,
+        state_features: dict[str, torch.Tensor] | None = None,
+        next_state_features: dict[str, torch.Tensor] | None = None,
     ):
-        """Saves a transition, ensuring tensors are stored on the designated storage device."""
+        """Saves a transition, ensuring tensors are stored on the designated storage device.
+
+        `state_features` and `next_state_features` are the image features of `state` and `next_state`, computed
+        by the image encoder identified by `image_feature_version`. They are required once the buffer stores
+        image features.
+        """
         # Initialize storage if this is the first transition
         if not self.initialized:
-            self._initialize_storage(state=state, action=action, complementary_info=complementary_info)
+            self._initialize_storage(
+                state=state,
+                action=action,
+                complementary_info=complementary_info,
+                state_features=state_features,
+            )
+        if self.has_image_features and (
+            state_features is None or (next_state_features is None and not self.optimize_memory)
+        ):
+            raise ValueError("This replay buffer stores image features, they must be provided.")
 
         # Store the transition in pre-allocated tensors
         for key in self.states:
@@ -210,6 +261,14 @@ class ReplayBuffer:
                 # Only store next_states if not optimizing memory
                 self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
 
+        if self.has_image_features:
+            for key in self.state_features:
+                self.state_features[key][self.position].copy_(state_features[key].squeeze(dim=0))
+                if not self.optimize_memory:
+                    self.next_state_features[key][self.position].copy_(
+                        next_state_features[key].squeeze(dim=0)
+                    )
+
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
         self.dones[self.position] = done
@@ -240,8 +299,9 @@ class ReplayBuffer:
         # Random indices for sampling - create on the same device as storage
         idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
 
-        # Identify image keys that need augmentation
-        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
+        # Identify image keys that need augmentation (images are not used when their features are stored)
+        use_drq = self.use_drq and not self.has_image_features
+        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if use_drq else []
 
         # Create batched state and next_state
         batch_state = {}
@@ -260,7 +320,7 @@ class ReplayBuffer:
                 batch_next_state[key] = self.states[key][next_idx].to(self.device)
 
         # Apply image augmentation in a batched way if needed
-        if self.use_drq and image_keys:
+        if use_drq and image_keys:
             # Concatenate all images from state and next_state
             all_images = []
             for key in image_keys:
@@ -293,7 +353,7 @@ class ReplayBuffer:
             for key in self.complementary_info_keys:
                 batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
 
-        return BatchTransition(
+        batch = BatchTransition(
             state=batch_state,
             action=batch_actions,
             reward=batch_rewards,
@@ -303,6 +363,62 @@ class ReplayBuffer:
             complementary_info=batch_complementary_info,
         )
 
+        if self.has_image_features:
+            batch["observation_feature"] = {
+                key: val[idx].to(self.device) for key, val in self.state_features.items()
+            }
+            next_idx = (idx + 1) % self.capacity if self.optimize_memory else idx
+            batch["next_observation_feature"] = {
+                key: val[next_idx].to(self.device) for key, val in self.next_state_features.items()
+            }
+
+        return batch
+
+    @torch.no_grad()
+    def precompute_image_features(
+        self,
+        encode_fn: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]],
+        image_feature_version: str,
+        store_images: bool = True,
+        batch_size: int = 256,
+    ):
+        """Starts storing image features, and computes those of the transitions already in the buffer.
+
+        This is meant for buffers filled from a dataset, for which `add` was called without features. Subsequent
+        calls to `add` must provide the features.
+
+        Args:
+            encode_fn: Function mapping a batch of states to the features of their images, keyed by image key.
+            image_feature_version: Identifier of the image encoder used by `encode_fn`.
+            store_images: Whether to keep the raw images next to their features.
+            batch_size: Number of states encoded at once.
+        """
+        if self.has_image_features and self.image_feature_version != image_feature_version:
+            raise ValueError(
+                f"The buffer already stores image features computed with '{self.image_feature_version}'."
+            )
+        self.image_feature_version = image_feature_version
+        self.store_images = store_images
+        if not self.initialized:
+            return
+
+        state_storages = [(self.states, "state_features")]
+        if not self.optimize_memory:
+            state_storages.append((self.next_states, "next_state_features"))
+        for states, features_name in state_storages:
+            for start in range(0, self.size, batch_size):
+                end = min(start + batch_size, self.size)
+                features = encode_fn({key: val[start:end].to(self.device) for key, val in states.items()})
+                if not self.has_image_features:
+                    self._initialize_feature_storage({key: val[:1] for key, val in features.items()})
+                for key, val in features.items():
+                    getattr(self, features_name)[key][start:end].copy_(val)
+
+        if not self.store_images:
+            for key in self.state_features:
+                self.states.pop(key, None)
+                self.next_states.pop(key, None)
+
     def get_iterator(
         self,
         batch_size: int,
@@ -518,6 +634,8 @@ class ReplayBuffer:
         """
         if self.size == 0:
             raise ValueError("The replay buffer is empty. Cannot convert to a dataset.")
+        if self.has_image_features and not self.store_images:
+            logging.warning("The replay buffer does not store raw images, the dataset will not contain them.")
 
         # Create features dictionary for the dataset
         features = {
@@ -813,6 +931,17 @@ def concatenate_batch_transitions(
         dim=0,
     )
 
+    # Concatenate precomputed image features, which can only be used if both batches have them
+    for key in ("observation_feature", "next_observation_feature"):
+        left_features = left_batch_transitions.get(key)
+        right_features = right_batch_transition.get(key)
+        if left_features is not None and right_features is not None:
+            left_batch_transitions[key] = {
+                k: torch.cat([left_features[k], right_features[k]], dim=0) for k in left_features
+            }
+        else:
+            left_batch_transitions.pop(key, None)
+
     # Handle complementary_info
     left_info = left_batch_transitions.get("complementary_info")
     right_info = right_batch_transition.get("complementary_info")
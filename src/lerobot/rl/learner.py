@@ -44,6 +44,7 @@ For more details on the complete HILSerl training workflow, see:
 https://github.com/michel-aractingi/lerobot-hilserl-guide
 """
 
+import hashlib
 import logging
 import os
 import shutil
@@ -66,7 +67,7 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import BatchTransition, ReplayBuffer, concatenate_batch_transitions
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
@@ -87,12 +88,13 @@ from lerobot.utils.constants import (
 )
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
+    AsyncCheckpointer,
     get_step_checkpoint_dir,
     load_training_state as utils_load_training_state,
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
+from lerobot.utils.transition import Transition, move_state_dict_to_device, move_transition_to_device
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -339,6 +341,17 @@ def add_actor_information_and_train(
         )
         batch_size: int = batch_size // 2  # We will sample from both replay buffer
 
+    if cfg.policy.store_image_features_in_buffer and policy.actor.encoder.has_images:
+        image_feature_version = get_image_encoder_version(policy)
+        logging.info(f"Storing image features computed by {image_feature_version} in the replay buffers")
+        for buffer in (replay_buffer, offline_replay_buffer):
+            if buffer is not None:
+                buffer.precompute_image_features(
+                    encode_fn=policy.actor.encoder.get_cached_image_features,
+                    image_feature_version=image_feature_version,
+                    store_images=cfg.policy.store_images_in_buffer,
+                )
+
     logging.info("Starting learner thread")
     interaction_message = None
     optimization_step = resume_optimization_step if resume_optimization_step is not None else 0
@@ -352,6 +365,12 @@ def add_actor_information_and_train(
     online_iterator = None
     offline_iterator = None
 
+    checkpointer = None
+    if saving_checkpoint and cfg.async_checkpoint:
+        checkpointer = AsyncCheckpointer(
+            max_in_flight=cfg.max_checkpoints_in_flight, pin_memory=device.type == "cuda"
+        )
+
     # NOTE: THIS IS THE MAIN LOOP OF THE LEARNER
     while True:
         # Exit the training loop if shutdown is requested
@@ -367,6 +386,7 @@ def add_actor_information_and_train(
             device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
+            policy=policy,
         )
 
         # Process all available interaction messages sent by the actor server
@@ -410,7 +430,7 @@ def add_actor_information_and_train(
             check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
             observation_features, next_observation_features = get_observation_features(
-                policy=policy, observations=observations, next_observations=next_observations
+                policy=policy, observations=observations, next_observations=next_observations, batch=batch
             )
 
             # Create a batch dictionary with all required elements for the forward method
@@ -469,7 +489,7 @@ def add_actor_information_and_train(
         check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
         observation_features, next_observation_features = get_observation_features(
-            policy=policy, observations=observations, next_observations=next_observations
+            policy=policy, observations=observations, next_observations=next_observations, batch=batch
         )
 
         # Create a batch dictionary with all required elements for the forward method
@@ -602,8 +622,12 @@ def add_actor_information_and_train(
                 offline_replay_buffer=offline_replay_buffer,
                 dataset_repo_id=dataset_repo_id,
                 fps=fps,
+                checkpointer=checkpointer,
             )
 
+    if checkpointer is not None:
+        checkpointer.close()
+
 
 def start_learner(
     parameters_queue: Queue,
@@ -686,6 +710,7 @@ def save_training_checkpoint(
     offline_replay_buffer: ReplayBuffer | None = None,
     dataset_repo_id: str | None = None,
     fps: int = 30,
+    checkpointer: AsyncCheckpointer | None = None,
 ) -> None:
     """
     Save training checkpoint and associated data.
@@ -709,6 +734,8 @@ def save_training_checkpoint(
         offline_replay_buffer: Optional offline replay buffer to save
         dataset_repo_id: Repository ID for dataset
         fps: Frames per second for dataset
+        checkpointer: Optional asynchronous checkpointer. When provided, steps 2 to 4 happen on its background
+            thread and the "last" symlink only moves once the checkpoint is fully written.
     """
     logging.info(f"Checkpoint policy after step {optimization_step}")
     _num_digits = max(6, len(str(online_steps)))
@@ -717,24 +744,38 @@ def save_training_checkpoint(
     # Create checkpoint directory
     checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, online_steps, optimization_step)
 
-    # Save checkpoint
-    save_checkpoint(
-        checkpoint_dir=checkpoint_dir,
-        step=optimization_step,
-        cfg=cfg,
-        policy=policy,
-        optimizer=optimizers,
-        scheduler=None,
-    )
+    def save_interaction_step(checkpoint_dir: Path) -> None:
+        training_state_dir = os.path.join(checkpoint_dir, TRAINING_STATE_DIR)
+        os.makedirs(training_state_dir, exist_ok=True)
+        training_state = {"step": optimization_step, "interaction_step": interaction_step}
+        torch.save(training_state, os.path.join(training_state_dir, "training_state.pt"))
 
-    # Save interaction step manually
-    training_state_dir = os.path.join(checkpoint_dir, TRAINING_STATE_DIR)
-    os.makedirs(training_state_dir, exist_ok=True)
-    training_state = {"step": optimization_step, "interaction_step": interaction_step}
-    torch.save(training_state, os.path.join(training_state_dir, "training_state.pt"))
+    if checkpointer is not None:
+        checkpointer.save(
+            checkpoint_dir,
+            optimization_step,
+            cfg,
+            policy,
+            optimizers,
+            scheduler=None,
+            extra_writers=[save_interaction_step],
+        )
+    else:
+        # Save checkpoint
+        save_checkpoint(
+            checkpoint_dir=checkpoint_dir,
+            step=optimization_step,
+            cfg=cfg,
+            policy=policy,
+            optimizer=optimizers,
+            scheduler=None,
+        )
 
-    # Update the "last" symlink
-    update_last_checkpoint(checkpoint_dir)
+        # Save interaction step manually
+        save_interaction_step(checkpoint_dir)
+
+        # Update the "last" symlink
+        update_last_checkpoint(checkpoint_dir)
 
     # TODO : temporary save replay buffer here, remove later when on the robot
     # We want to control this with the keyboard inputs
@@ -1019,7 +1060,10 @@ def initialize_offline_replay_buffer(
 
 
 def get_observation_features(
-    policy: SACPolicy, observations: torch.Tensor, next_observations: torch.Tensor
+    policy: SACPolicy,
+    observations: torch.Tensor,
+    next_observations: torch.Tensor,
+    batch: BatchTransition | None = None,
 ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
     """
     Get observation features from the policy encoder. It act as cache for the observation features.
@@ -1030,6 +1074,8 @@ def get_observation_features(
         policy: The policy model
         observations: The current observations
         next_observations: The next observations
+        batch: The sampled batch. If it holds the image features stored in the replay buffer, they are used
+            instead of encoding the images.
 
     Returns:
         tuple: observation_features, next_observation_features
@@ -1038,6 +1084,9 @@ def get_observation_features(
     if policy.config.vision_encoder_name is None or not policy.config.freeze_vision_encoder:
         return None, None
 
+    if batch is not None and batch.get("observation_feature") is not None:
+        return batch["observation_feature"], batch["next_observation_feature"]
+
     with torch.no_grad():
         observation_features = policy.actor.encoder.get_cached_image_features(observations)
         next_observation_features = policy.actor.encoder.get_cached_image_features(next_observations)
@@ -1045,6 +1094,45 @@ def get_observation_features(
     return observation_features, next_observation_features
 
 
+def get_image_encoder_version(policy: SACPolicy) -> str:
+    """Identifies the image encoder of the policy by its name and a hash of its weights.
+
+    Image features stored in the replay buffers are tagged with this version, so that they are never mixed with
+    features computed by another encoder.
+    """
+    hasher = hashlib.sha256()
+    for name, tensor in sorted(policy.actor.encoder.image_encoder.state_dict().items()):
+        hasher.update(name.encode())
+        hasher.update(tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tobytes())
+    return f"{policy.config.vision_encoder_name}@{hasher.hexdigest()[:16]}"
+
+
+def get_transitions_image_features(
+    policy: SACPolicy, transitions: list[Transition], encode_next_state: bool
+) -> list[dict[str, dict[str, torch.Tensor] | None]]:
+    """Encodes the images of transitions with the (frozen) image encoder, to be stored in a replay buffer.
+
+    The images of all the transitions are encoded in one batch, for `state` and for `next_state`, and the
+    features are split back into the `state_features` and `next_state_features` of each transition.
+    """
+    encoder = policy.actor.encoder
+
+    def _encode(observations: list[dict[str, torch.Tensor]]) -> list[dict[str, torch.Tensor]]:
+        batch = {key: torch.cat([obs[key] for obs in observations], dim=0) for key in encoder.image_keys}
+        features = encoder.get_cached_image_features(batch)
+        return [{key: value[i : i + 1] for key, value in features.items()} for i in range(len(observations))]
+
+    with torch.no_grad():
+        state_features = _encode([transition["state"] for transition in transitions])
+        next_state_features = [None] * len(transitions)
+        if encode_next_state:
+            next_state_features = _encode([transition["next_state"] for transition in transitions])
+    return [
+        {"state_features": state, "next_state_features": next_state}
+        for state, next_state in zip(state_features, next_state_features, strict=True)
+    ]
+
+
 def use_threads(cfg: TrainRLServerPipelineConfig) -> bool:
     return cfg.policy.concurrency.learner == "threads"
 
@@ -1134,6 +1222,7 @@ def process_transitions(
     device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
+    policy: SACPolicy | None = None,
 ):
     """Process all available transitions from the queue.
 
@@ -1144,11 +1233,18 @@ def process_transitions(
         device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
+        policy: Policy whose image encoder computes the image features of the transitions, when the replay
+            buffer stores them
     """
+    store_image_features = policy is not None and replay_buffer.image_feature_version is not None
+    encode_next_state = not replay_buffer.optimize_memory or (
+        offline_replay_buffer is not None and not offline_replay_buffer.optimize_memory
+    )
     while not transition_queue.empty() and not shutdown_event.is_set():
         transition_list = transition_queue.get()
         transition_list = bytes_to_transitions(buffer=transition_list)
 
+        transitions = []
         for transition in transition_list:
             transition = move_transition_to_device(transition=transition, device=device)
 
@@ -1160,14 +1256,22 @@ def process_transitions(
             ):
                 logging.warning("[LEARNER] NaN detected in transition, skipping")
                 continue
+            transitions.append(transition)
+
+        all_image_features = [{} for _ in transitions]
+        if store_image_features and transitions:
+            all_image_features = get_transitions_image_features(
+                policy=policy, transitions=transitions, encode_next_state=encode_next_state
+            )
 
-            replay_buffer.add(**transition)
+        for transition, image_features in zip(transitions, all_image_features, strict=True):
+            replay_buffer.add(**transition, **image_features)
 
             # Add to offline buffer if it's an intervention
             if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
                 TeleopEvents.IS_INTERVENTION
             ):
-                offline_replay_buffer.add(**transition)
+                offline_replay_buffer.add(**transition, **image_features)
 
 
 def process_interaction_messages(
@@ -64,6 +64,12 @@ class LeKiwiHostConfig:
     # If robot jitters decrease the frequency and monitor cpu load with `top` in cmd
     max_loop_freq_hz: int = 30
 
+    # Format of the observations sent to the client, "multipart" or "json" for clients of previous versions.
+    observation_format: str = "multipart"
+    # Encoding of the images in the "multipart" format, "jpeg" or "raw" to skip the encoding on fast networks.
+    image_encoding: str = "jpeg"
+    jpeg_quality: int = 90
+
 
 @RobotConfig.register_subclass("lekiwi_client")
 @dataclass
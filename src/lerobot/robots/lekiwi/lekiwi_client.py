@@ -17,7 +17,9 @@
 import base64
 import json
 import logging
+import time
 from functools import cached_property
+from threading import Condition, Event, Thread
 from typing import Any
 
 import cv2
@@ -28,6 +30,7 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 
 from ..robot import Robot
 from .config_lekiwi import LeKiwiClientConfig
+from .observation_protocol import DecodedObservation, ObservationDecoder, is_multipart_observation
 
 
 class LeKiwiClient(Robot):
@@ -56,6 +59,11 @@ class LeKiwiClient(Robot):
         self.zmq_cmd_socket = None
         self.zmq_observation_socket = None
 
+        self.observation_decoder = ObservationDecoder()
+        self._latest_message: list | None = None
+        self._message_condition = Condition()
+        self._receive_thread: Thread | None = None
+        self._stop_event = Event()
         self.last_frames = {}
 
         self.last_remote_state = {}
@@ -128,9 +136,11 @@ class LeKiwiClient(Robot):
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
 
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PULL)
+        # CONFLATE does not support the multipart observations: queue at most one of them, and keep the latest
+        # one in a receiving thread.
+        self.zmq_observation_socket.setsockopt(zmq.RCVHWM, 1)
         zmq_observations_locator = f"tcp://{self.remote_ip}:{self.port_zmq_observations}"
         self.zmq_observation_socket.connect(zmq_observations_locator)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
 
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -138,39 +148,43 @@ class LeKiwiClient(Robot):
         if self.zmq_observation_socket not in socks or socks[self.zmq_observation_socket] != zmq.POLLIN:
             raise DeviceNotConnectedError("Timeout waiting for LeKiwi Host to connect expired.")
 
+        self._stop_event.clear()
+        self._latest_message = None
+        self._receive_thread = Thread(target=self._receive_loop, name="lekiwi_client_receive", daemon=True)
+        self._receive_thread.start()
+
         self._is_connected = True
 
     def calibrate(self) -> None:
         pass
 
-    def _poll_and_get_latest_message(self) -> str | None:
-        """Polls the ZMQ socket for a limited time and returns the latest message string."""
+    def _receive_loop(self) -> None:
+        """Receives the observations as they arrive, keeping only the latest one, until disconnection."""
         zmq = self._zmq
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
-
-        try:
-            socks = dict(poller.poll(self.polling_timeout_ms))
-        except zmq.ZMQError as e:
-            logging.error(f"ZMQ polling error: {e}")
-            return None
-
-        if self.zmq_observation_socket not in socks:
-            logging.info("No new data available within timeout.")
-            return None
-
-        last_msg = None
-        while True:
+        while not self._stop_event.is_set():
             try:
-                msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
-                last_msg = msg
-            except zmq.Again:
-                break
-
-        if last_msg is None:
-            logging.warning("Poller indicated data, but failed to retrieve message.")
-
-        return last_msg
+                if not poller.poll(100):
+                    continue
+                message = self.zmq_observation_socket.recv_multipart(copy=False)
+            except zmq.ZMQError as e:
+                logging.error(f"ZMQ receive error: {e}")
+                continue
+            with self._message_condition:
+                self._latest_message = message
+                self._message_condition.notify_all()
+
+    def _poll_and_get_latest_message(self) -> list | None:
+        """Waits for a limited time for a new message and returns the frames of the latest one."""
+        with self._message_condition:
+            if not self._message_condition.wait_for(
+                lambda: self._latest_message is not None, timeout=self.polling_timeout_ms / 1000
+            ):
+                logging.info("No new data available within timeout.")
+                return None
+            message, self._latest_message = self._latest_message, None
+        return message
 
     def _parse_observation_json(self, obs_string: str) -> dict[str, Any] | None:
         """Parses the JSON observation string."""
@@ -195,16 +209,28 @@ class LeKiwiClient(Robot):
             logging.error(f"Error decoding base64 image data: {e}")
             return None
 
+    def _state_obs_dict(self, state: dict[str, Any]) -> dict[str, Any]:
+        flat_state = {key: state.get(key, 0.0) for key in self._state_order}
+
+        state_vec = np.array([flat_state[key] for key in self._state_order], dtype=np.float32)
+
+        return {**flat_state, OBS_STATE: state_vec}
+
+    def _remote_state_from_decoded(
+        self, observation: DecodedObservation
+    ) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+        """Extracts frames, and state from an observation of the multipart format."""
+        current_frames = {
+            name: frame for name, frame in observation.images.items() if name in self._cameras_ft
+        }
+        return current_frames, self._state_obs_dict(observation.state)
+
     def _remote_state_from_obs(
         self, observation: dict[str, Any]
     ) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
         """Extracts frames, and state from the parsed observation."""
 
-        flat_state = {key: observation.get(key, 0.0) for key in self._state_order}
-
-        state_vec = np.array([flat_state[key] for key in self._state_order], dtype=np.float32)
-
-        obs_dict: dict[str, Any] = {**flat_state, OBS_STATE: state_vec}
+        obs_dict = self._state_obs_dict(observation)
 
         # Decode images
         current_frames: dict[str, np.ndarray] = {}
@@ -226,27 +252,35 @@ class LeKiwiClient(Robot):
         If no new data arrives or decoding fails, returns the last known values.
         """
 
-        # 1. Get the latest message string from the socket
-        latest_message_str = self._poll_and_get_latest_message()
+        # 1. Get the latest message from the socket
+        latest_message = self._poll_and_get_latest_message()
 
         # 2. If no message, return cached data
-        if latest_message_str is None:
-            return self.last_frames, self.last_remote_state
-
-        # 3. Parse the JSON message
-        observation = self._parse_observation_json(latest_message_str)
-
-        # 4. If JSON parsing failed, return cached data
-        if observation is None:
+        if latest_message is None:
             return self.last_frames, self.last_remote_state
 
-        # 5. Process the valid observation data
+        # 3. Decode a multipart message, or parse a JSON message from a host of a previous version
         try:
-            new_frames, new_state = self._remote_state_from_obs(observation)
+            if is_multipart_observation(latest_message):
+                decoded = self.observation_decoder.decode(latest_message)
+                timestamp = decoded.timestamp
+                new_frames, new_state = self._remote_state_from_decoded(decoded)
+            else:
+                observation = self._parse_observation_json(latest_message[-1].bytes.decode("utf-8"))
+                # 4. If JSON parsing failed, return cached data
+                if observation is None:
+                    return self.last_frames, self.last_remote_state
+                timestamp = observation.get("timestamp")
+                new_frames, new_state = self._remote_state_from_obs(observation)
         except Exception as e:
             logging.error(f"Error processing observation data, serving last observation: {e}")
             return self.last_frames, self.last_remote_state
 
+        if timestamp is not None:
+            # Client time minus host time at encoding. The clocks of the host and of the client are not
+            # synchronized, so this is the latency plus their offset, the latency only on a single machine.
+            self.logs["observation_clock_delta_s"] = time.time() - timestamp
+
         self.last_frames = new_frames
         self.last_remote_state = new_state
 
@@ -340,6 +374,9 @@ class LeKiwiClient(Robot):
             raise DeviceNotConnectedError(
                 "LeKiwi is not connected. You need to run `robot.connect()` before disconnecting."
             )
+        self._stop_event.set()
+        self._receive_thread.join()
+        self._receive_thread = None
         self.zmq_observation_socket.close()
         self.zmq_cmd_socket.close()
         self.zmq_context.term()
@@ -14,33 +14,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
 import json
 import logging
 import time
+from typing import Any
 
-import cv2
 import zmq
 
 from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
+from .observation_protocol import (
+    IMAGE_ENCODINGS,
+    OBSERVATION_FORMATS,
+    encode_observation,
+    encode_observation_json,
+)
 
 
 class LeKiwiHost:
     def __init__(self, config: LeKiwiHostConfig):
+        if config.observation_format not in OBSERVATION_FORMATS:
+            raise ValueError(
+                f"`observation_format` must be one of {OBSERVATION_FORMATS}, "
+                f"got '{config.observation_format}'."
+            )
+        if config.image_encoding not in IMAGE_ENCODINGS:
+            raise ValueError(
+                f"`image_encoding` must be one of {IMAGE_ENCODINGS}, got '{config.image_encoding}'."
+            )
+        self.observation_format = config.observation_format
+        self.image_encoding = config.image_encoding
+        self.jpeg_quality = config.jpeg_quality
+        self.observation_sequence = 0
+
         self.zmq_context = zmq.Context()
         self.zmq_cmd_socket = self.zmq_context.socket(zmq.PULL)
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
         self.zmq_cmd_socket.bind(f"tcp://*:{config.port_zmq_cmd}")
 
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PUSH)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
+        if self.observation_format == "multipart":
+            # CONFLATE does not support multipart messages, queue at most one observation instead.
+            self.zmq_observation_socket.setsockopt(zmq.SNDHWM, 1)
+        else:
+            self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
         self.zmq_observation_socket.bind(f"tcp://*:{config.port_zmq_observations}")
 
         self.connection_time_s = config.connection_time_s
         self.watchdog_timeout_ms = config.watchdog_timeout_ms
         self.max_loop_freq_hz = config.max_loop_freq_hz
 
+    def send_observation(self, observation: dict[str, Any], image_keys: list[str]) -> None:
+        """Sends an observation to the client without blocking.
+
+        Raises:
+            zmq.Again: If the observation could not be queued, e.g. when no client is connected.
+        """
+        if self.observation_format == "json":
+            message = encode_observation_json(observation, image_keys, self.jpeg_quality)
+            self.zmq_observation_socket.send_string(message, flags=zmq.NOBLOCK)
+            return
+        self.observation_sequence += 1
+        frames = encode_observation(
+            observation, image_keys, self.observation_sequence, self.image_encoding, self.jpeg_quality
+        )
+        self.zmq_observation_socket.send_multipart(frames, flags=zmq.NOBLOCK, copy=False)
+
     def disconnect(self):
         self.zmq_observation_socket.close()
         self.zmq_cmd_socket.close()
@@ -90,19 +129,9 @@ def main():
 
             last_observation = robot.get_observation()
 
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
-                if ret:
-                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
-                else:
-                    last_observation[cam_key] = ""
-
             # Send the observation to the remote agent
             try:
-                host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
+                host.send_observation(last_observation, list(robot.cameras))
             except zmq.Again:
                 logging.info("Dropping observation, no client connected")
 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encoding of the observations sent by the LeKiwi host to the client.
+
+In the "multipart" format, an observation is a single ZMQ multipart message made of:
+- a header frame: `HEADER` (magic, version, numbers of state values and of images, sequence number and host
+  time), followed by the state values as float64 and one `IMAGE_HEADER` (height, width, channels, encoding)
+  per image,
+- a schema frame: the names of the state values then of the images, separated by newlines. It only changes
+  with the observation features, so the client decodes it once and then only compares its bytes,
+- one frame per image, with its raw pixels or its JPEG bytes, sent without copying the arrays. Raw images are
+  received as read-only arrays over the received frames.
+
+The "json" format is the previous one: a JSON string with the images as base64-encoded JPEGs.
+
+`ZMQ_CONFLATE` does not support multipart messages. For the same latest-only semantics, the sockets queue at
+most one message in the "multipart" format, and the client receives the messages continuously in a background
+thread, which only keeps the latest one. Only the message read by the client is decoded.
+"""
+
+import base64
+import json
+import logging
+import struct
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+import numpy as np
+
+OBSERVATION_FORMATS = ("multipart", "json")
+IMAGE_ENCODINGS = ("raw", "jpeg")
+
+MAGIC = b"LKOB"
+VERSION = 1
+# magic, version, number of state values, number of images, sequence number, host time.
+HEADER = struct.Struct("<4sBHHId")
+# height, width, channels, index of the encoding in `IMAGE_ENCODINGS`.
+IMAGE_HEADER = struct.Struct("<HHBB")
+
+
+@dataclass
+class DecodedObservation:
+    state: dict[str, float]
+    images: dict[str, np.ndarray]
+    sequence: int
+    # `time.time()` of the host when the observation was encoded.
+    timestamp: float
+
+
+def encode_observation(
+    observation: dict[str, Any],
+    image_keys: Sequence[str],
+    sequence: int,
+    image_encoding: str = "jpeg",
+    jpeg_quality: int = 90,
+) -> list[bytes | np.ndarray]:
+    """Returns the frames of the multipart message of an observation, to send with `copy=False`.
+
+    The raw images are sent from the arrays of the observation, which must not be modified until sent.
+    """
+    if image_encoding not in IMAGE_ENCODINGS:
+        raise ValueError(f"`image_encoding` must be one of {IMAGE_ENCODINGS}, got '{image_encoding}'.")
+    state_keys = [key for key in observation if key not in image_keys]
+    state = np.array([observation[key] for key in state_keys], dtype=np.float64)
+
+    image_headers, image_frames = [], []
+    for key in image_keys:
+        image = observation[key]
+        height, width = image.shape[:2]
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        if image_encoding == "jpeg":
+            ret, payload = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality])
+            if not ret:
+                logging.warning(f"Failed to encode image '{key}', sending an empty frame.")
+                payload = b""
+        else:
+            payload = np.ascontiguousarray(image)
+        image_headers.append(
+            IMAGE_HEADER.pack(height, width, channels, IMAGE_ENCODINGS.index(image_encoding))
+        )
+        image_frames.append(payload)
+
+    header = b"".join(
+        [
+            HEADER.pack(MAGIC, VERSION, len(state_keys), len(image_frames), sequence, time.time()),
+            state.tobytes(),
+            *image_headers,
+        ]
+    )
+    schema = "\n".join([*state_keys, *image_keys]).encode("utf-8")
+    return [header, schema, *image_frames]
+
+
+def is_multipart_observation(frames: Sequence[Any]) -> bool:
+    """Whether a received message, as `bytes` or `zmq.Frame` frames, is in the "multipart" format."""
+    return len(frames) >= 2 and bytes(memoryview(_buffer(frames[0]))[: len(MAGIC)]) == MAGIC
+
+
+def _buffer(frame: Any) -> Any:
+    # `zmq.Frame` received with `copy=False` exposes its memory as `buffer`.
+    return getattr(frame, "buffer", frame)
+
+
+class ObservationDecoder:
+    """Decodes the observations of the "multipart" format, caching the names of their schema."""
+
+    def __init__(self):
+        self._schema: bytes | None = None
+        self._names: list[str] = []
+
+    def decode(self, frames: Sequence[Any]) -> DecodedObservation:
+        header = memoryview(_buffer(frames[0]))
+        magic, version, num_state, num_images, sequence, timestamp = HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Unsupported observation message, magic {magic!r} and version {version}.")
+        if len(frames) != 2 + num_images:
+            raise ValueError(
+                f"Expected {2 + num_images} frames in the observation message, got {len(frames)}."
+            )
+
+        schema = bytes(_buffer(frames[1]))
+        if schema != self._schema:
+            self._names = schema.decode("utf-8").split("\n") if schema else []
+            self._schema = schema
+        if len(self._names) != num_state + num_images:
+            raise ValueError(f"The schema has {len(self._names)} names for {num_state + num_images} values.")
+
+        values = np.frombuffer(header, dtype=np.float64, count=num_state, offset=HEADER.size)
+        state = dict(zip(self._names[:num_state], values.tolist(), strict=True))
+
+        images = {}
+        offset = HEADER.size + values.nbytes
+        for i, name in enumerate(self._names[num_state:]):
+            height, width, channels, encoding = IMAGE_HEADER.unpack_from(
+                header, offset + i * IMAGE_HEADER.size
+            )
+            payload = np.frombuffer(_buffer(frames[2 + i]), dtype=np.uint8)
+            if payload.size == 0:
+                continue
+            if IMAGE_ENCODINGS[encoding] == "raw":
+                images[name] = payload.reshape(height, width, channels)
+            else:
+                image = cv2.imdecode(payload, cv2.IMREAD_COLOR)
+                if image is None:
+                    logging.warning(f"cv2.imdecode returned None for image '{name}'.")
+                    continue
+                images[name] = image
+        return DecodedObservation(state, images, sequence, timestamp)
+
+
+def encode_observation_json(
+    observation: dict[str, Any], image_keys: Sequence[str], jpeg_quality: int = 90
+) -> str:
+    """Returns an observation in the "json" format, with the host time as "timestamp"."""
+    message = dict(observation)
+    for key in image_keys:
+        ret, buffer = cv2.imencode(".jpg", observation[key], [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality])
+        message[key] = base64.b64encode(buffer).decode("utf-8") if ret else ""
+    message["timestamp"] = time.time()
+    return json.dumps(message)
@@ -19,6 +19,7 @@ from dataclasses import dataclass, field
 from lerobot.cameras import CameraConfig
 from lerobot.cameras.opencv import OpenCVCameraConfig
 from ..config import RobotConfig
+from .xarm_state import STATE_KEYS
 from lerobot.cameras.configs import ColorMode, Cv2Rotation
 
 
@@ -35,6 +36,38 @@ class PearlyWhiteFollowerConfig(RobotConfig):
     # names to the max_relative_target value for that motor.
     max_relative_target: float | dict[str, float] | None = None
 
+    # How `send_action` commands the arm:
+    # - "position": blocking `set_position(wait=True)` from the latest state of the arm.
+    # - "online_trajectory": non-blocking targets replanned by the arm's online trajectory planner (mode 7).
+    # - "servo_cartesian": non-blocking targets followed directly by the arm's servo loop (mode 1). Only suited
+    #   to small steps sent at a high rate.
+    # In the non-blocking modes, the last commanded target is kept locally and the relative actions are applied
+    # to it, so that the control loop runs at its own rate.
+    control_mode: str = "position"
+    # Non-blocking modes: maximum displacement (mm) of the target per `send_action`, per axis.
+    max_step_mm: float = 20.0
+    # Non-blocking modes: bounds (mm) of the target, [[x_min, y_min, z_min], [x_max, y_max, z_max]].
+    workspace_bounds_mm: list[list[float]] = field(
+        default_factory=lambda: [[-500.0, -500.0, 50.0], [500.0, 500.0, 600.0]]
+    )
+    # Non-blocking modes: speed (mm/s) and acceleration (mm/s^2) of the motions.
+    streaming_speed: float = 200.0
+    streaming_mvacc: float = 2000.0
+
+    # Where the state of the arm comes from: "poll" (blocking SDK calls whenever the state is needed),
+    # "thread" (a background thread polling the arm at `state_poll_hz`) or "report" (the SDK's report
+    # callbacks). "report" is only as fresh as the report stream of the SDK, which is much slower than the
+    # control loop unless the real-time report is enabled on the arm, and its timestamps are the times of the
+    # callbacks.
+    state_source: str = "poll"
+    state_poll_hz: float = 100.0
+    # Keys of the state in the observations, among the TCP pose "x", "y", "z", "roll", "pitch", "yaw", the joint
+    # positions "joint1" ... "joint6", and their velocities "joint1.vel" ... and torques "joint1.torque" ...
+    observation_state: list[str] = field(default_factory=lambda: ["x", "y", "z"])
+    # Whether to add to the observations the `time.perf_counter()` time at which the state was measured, as
+    # "state_timestamp", to align it with the other data.
+    observation_timestamp: bool = False
+
     # cameras
     cameras = {
         "cam_1": OpenCVCameraConfig(
@@ -49,4 +82,17 @@ class PearlyWhiteFollowerConfig(RobotConfig):
 
 
     # Set to `True` for backward compatibility with previous policies/dataset
-    use_degrees: bool = True
\ No newline at end of file
+    use_degrees: bool = True
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.control_mode not in ("position", "online_trajectory", "servo_cartesian"):
+            raise ValueError(
+                "`control_mode` must be 'position', 'online_trajectory' or 'servo_cartesian', "
+                f"got '{self.control_mode}'."
+            )
+        if self.state_source not in ("report", "thread", "poll"):
+            raise ValueError(f"`state_source` must be 'report', 'thread' or 'poll', got '{self.state_source}'.")
+        unknown_keys = set(self.observation_state) - set(STATE_KEYS)
+        if unknown_keys:
+            raise ValueError(f"Unknown `observation_state` keys {sorted(unknown_keys)}, expected {STATE_KEYS}.")
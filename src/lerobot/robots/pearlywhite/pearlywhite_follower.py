@@ -3,6 +3,7 @@ import time
 from functools import cached_property
 from typing import Any
 
+from lerobot.cameras import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
@@ -16,6 +17,7 @@ from lerobot.robots import Robot
 
 # Custom
 from lerobot.robots.pearlywhite.config_pearlywhite_follower import PearlyWhiteFollowerConfig
+from lerobot.robots.pearlywhite.xarm_state import XArmState, XArmStateReader
 from xarm.wrapper import XArmAPI
 
 from PIL import Image
@@ -24,6 +26,11 @@ import cv2
 
 logger = logging.getLogger(__name__)
 
+# xArm modes used by the control modes of the config.
+XARM_MODES = {"position": 0, "servo_cartesian": 1, "online_trajectory": 7}
+# Fixed orientation (roll, pitch, yaw in degrees) of the gripper, pointing down.
+GRIPPER_ORIENTATION = (180, 0, 90)
+
 
 class PearlyWhiteFollower(Robot):
     config_class = PearlyWhiteFollowerConfig
@@ -36,6 +43,13 @@ class PearlyWhiteFollower(Robot):
         self.arm = XArmAPI(self.config.port, baud_checkset=False)
 
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras)
+
+        self.state_reader = XArmStateReader(self.arm, config.state_source, config.state_poll_hz)
+
+        # Last commanded target (x, y, z in mm) of the non-blocking control modes.
+        self._target: np.ndarray | None = None
+        self._workspace_bounds = np.asarray(config.workspace_bounds_mm, dtype=np.float64)
     
     # These keys match the output of get_observation. xyz is the current position of the robotic arm
     @property
@@ -46,6 +60,13 @@ class PearlyWhiteFollower(Robot):
             "z": float
         }
 
+    @property
+    def _state_ft(self) -> dict[str, type]:
+        state_ft = dict.fromkeys(self.config.observation_state, float)
+        if self.config.observation_timestamp:
+            state_ft["state_timestamp"] = float
+        return state_ft
+
     @property
     def _cameras_ft(self) -> dict[str, tuple]:
         return {
@@ -54,7 +75,7 @@ class PearlyWhiteFollower(Robot):
     
     @cached_property
     def observation_features(self) -> dict[str, type | tuple]:
-        return {**self._motors_ft, **self._cameras_ft}
+        return {**self._state_ft, **self._cameras_ft}
 
     @cached_property
     def action_features(self) -> dict[str, type]:
@@ -78,8 +99,17 @@ class PearlyWhiteFollower(Robot):
         # Go to initial position
         self.arm.set_position(x=9.97717, y=207.91037, z=190.492111, roll=180, pitch=0, yaw=90, wait=True, radius=-1, speed=200)
 
+        self.state_reader.start()
+
+        if self.config.control_mode != "position":
+            # The targets are streamed from the initial position, which is only read once.
+            self._target = self.state_reader.latest().pose[:3].copy()
+            self.arm.set_mode(XARM_MODES[self.config.control_mode])
+            self.arm.set_state(0)
+
         for cam in self.cameras.values():
             cam.connect()
+        self.camera_group.start()
 
         self.configure()
         logger.info(f"{self} connected.")
@@ -98,19 +128,19 @@ class PearlyWhiteFollower(Robot):
         if not self.arm.connected:
             raise ConnectionError(f"{self} is not connected.")
         
-        # Read joint angles in degrees
-        current_pos = self.arm.get_position_aa()[1]
-        obs_dict = {
-            "x": current_pos[0],
-            "y": current_pos[1],
-            "z": current_pos[2]
-        }
+        # Read the latest state of the arm
+        state = self._read_state()
+        state_dict = state.as_dict()
+        obs_dict = {key: state_dict[key] for key in self.config.observation_state}
+        if self.config.observation_timestamp:
+            obs_dict["state_timestamp"] = state.timestamp
 
 
-        # Capture images from cameras
-        for cam_name, cam in self.cameras.items():
-            frame = cam.async_read()
-            obs_dict[cam_name] = frame
+        # Capture images from cameras, waiting on all of them together and taking the frames
+        # captured the closest to the state
+        frames = self.camera_group.read_nearest(state.timestamp)
+        for cam_name, timestamped in frames.items():
+            obs_dict[cam_name] = timestamped.frame
 
             # cv2.imwrite("image.png", obs_dict[cam_key])
 
@@ -132,17 +162,57 @@ class PearlyWhiteFollower(Robot):
         """
         if not self.arm.connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
+        if not action == {} and self.config.control_mode != "position":
+            return self._stream_action(action)
         if not action == {}:
             x, y, z = action["x"], action["y"], action["z"]
 
-            current_pos = self.arm.get_position()[1]
+            current_pos = self._read_state().pose
 
             self.arm.set_position(x=current_pos[0]+x, y=current_pos[1]+y, z=current_pos[2]+z, roll=180, pitch=0, yaw=90, wait=True, radius=-1, speed=200)
         return action
-    
+
+    def _read_state(self) -> XArmState:
+        if self.config.state_source == "poll":
+            self.state_reader.write()
+        return self.state_reader.latest()
+
+    def _stream_action(self, action: dict[str, Any]) -> dict[str, Any]:
+        """Moves the local target by the relative action and sends it to the arm without waiting.
+
+        The displacement is clipped to `max_step_mm` per axis and the target to the workspace bounds, so the
+        action actually applied is returned.
+        """
+        step = np.clip(
+            [action["x"], action["y"], action["z"]], -self.config.max_step_mm, self.config.max_step_mm
+        )
+        target = np.clip(self._target + step, self._workspace_bounds[0], self._workspace_bounds[1])
+
+        pose = [*target.tolist(), *GRIPPER_ORIENTATION]
+        if self.config.control_mode == "servo_cartesian":
+            code = self.arm.set_servo_cartesian(
+                pose, speed=self.config.streaming_speed, mvacc=self.config.streaming_mvacc
+            )
+        else:
+            code = self.arm.set_position(
+                *pose, speed=self.config.streaming_speed, mvacc=self.config.streaming_mvacc, wait=False
+            )
+        if code != 0:
+            # The target is kept, to be retried from the same place at the next step.
+            logger.warning(f"{self} failed to send target {pose} (code {code}).")
+            return {"x": 0.0, "y": 0.0, "z": 0.0}
+
+        applied = target - self._target
+        self._target = target
+        return {"x": float(applied[0]), "y": float(applied[1]), "z": float(applied[2])}
 
     def disconnect(self):
+        self.state_reader.stop()
+        if self.config.control_mode != "position":
+            self.arm.set_mode(XARM_MODES["position"])
+            self.arm.set_state(0)
         self.arm.disconnect()
+        self.camera_group.stop()
         for cam in self.cameras.values():
             cam.disconnect()
 
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_JOINTS = 6
+POSE_KEYS = ("x", "y", "z", "roll", "pitch", "yaw")
+JOINT_KEYS = tuple(f"joint{i + 1}" for i in range(NUM_JOINTS))
+# Observation keys available from the state.
+STATE_KEYS = (
+    *POSE_KEYS,
+    *JOINT_KEYS,
+    *(f"{joint}.vel" for joint in JOINT_KEYS),
+    *(f"{joint}.torque" for joint in JOINT_KEYS),
+)
+# Layout of a buffer row.
+_TIMESTAMP = 0
+_POSE = slice(1, 7)
+_JOINTS = slice(7, 13)
+_VELOCITIES = slice(13, 19)
+_TORQUES = slice(19, 25)
+_ROW_SIZE = 25
+
+
+@dataclass(frozen=True)
+class XArmState:
+    """Snapshot of the state of the arm.
+
+    `timestamp` is the `time.perf_counter()` time at which the state was received, `pose` the TCP pose
+    (x, y, z in mm, roll, pitch, yaw in degrees) and `joints` the joint positions in degrees. `joint_velocities`
+    and `joint_torques` are as reported by the SDK, and NaN when unavailable.
+    """
+
+    timestamp: float
+    pose: np.ndarray
+    joints: np.ndarray
+    joint_velocities: np.ndarray
+    joint_torques: np.ndarray
+
+    def as_dict(self) -> dict[str, float]:
+        """Values of the state mapped to `STATE_KEYS`."""
+        values = np.concatenate([self.pose, self.joints, self.joint_velocities, self.joint_torques])
+        return dict(zip(STATE_KEYS, values.tolist(), strict=True))
+
+
+class XArmStateReader:
+    """Keeps the latest state of an xArm, updated in the background, readable in O(1) without blocking.
+
+    The state is updated either by the report callbacks of the SDK (`source="report"`), which reads the values
+    cached by the SDK's report thread, or by a dedicated thread polling the arm at `poll_hz` (`source="thread"`).
+    With `source="poll"`, there are no background updates and the owner calls `write` to poll the arm.
+
+    States are written to a double buffer: the writer fills the back row, then publishes it by flipping the
+    index of the front row. Each row has a sequence number, odd while the row is written, which readers check
+    around their copy to retry torn reads, so neither side ever takes a lock.
+    """
+
+    def __init__(self, arm, source: str = "report", poll_hz: float = 100.0):
+        if source not in ("report", "thread", "poll"):
+            raise ValueError(f"`source` must be 'report', 'thread' or 'poll', got '{source}'.")
+        self.arm = arm
+        self.source = source
+        self.poll_hz = poll_hz
+
+        self._buffer = np.full((2, _ROW_SIZE), np.nan)
+        self._front = 0
+        self._sequences = [0, 0]
+        self._has_state = False
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    def start(self, timeout_s: float = 1.0) -> None:
+        """Starts the updates and waits for the first state."""
+        self.write()
+        if self.source == "report":
+            self.arm.register_report_location_callback(
+                self._on_report, report_cartesian=True, report_joints=True
+            )
+        elif self.source == "thread":
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._poll_loop, name="XArmStateReader", daemon=True)
+            self._thread.start()
+        deadline = time.perf_counter() + timeout_s
+        while not self._has_state and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        if not self._has_state:
+            raise TimeoutError(f"No state received from the arm within {timeout_s} s.")
+
+    def stop(self) -> None:
+        if self.source == "report":
+            self.arm.release_report_location_callback(self._on_report)
+        elif self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def _on_report(self, _report: dict) -> None:
+        self.write()
+
+    def _poll_loop(self) -> None:
+        period = 1.0 / self.poll_hz
+        while not self._stop_event.is_set():
+            start = time.perf_counter()
+            try:
+                self.write()
+            except Exception as e:
+                logger.warning(f"Failed to read the state of the arm: {e}")
+            self._stop_event.wait(max(period - (time.perf_counter() - start), 0.0))
+
+    def _read_arm(self, row: np.ndarray) -> bool:
+        """Reads the state of the arm into a buffer row, returns whether it succeeded."""
+        if self.source == "report":
+            # Values cached by the report thread of the SDK, without any round trip to the arm.
+            pose, joints = self.arm.position, self.arm.angles
+        else:
+            code, pose = self.arm.get_position()
+            if code != 0:
+                return False
+            code, joints = self.arm.get_servo_angle()
+            if code != 0:
+                return False
+        row[_POSE] = pose[:6]
+        row[_JOINTS] = joints[:NUM_JOINTS]
+        # Only available with the real-time reports of recent firmwares.
+        velocities = getattr(self.arm, "realtime_joint_speeds", None)
+        torques = getattr(self.arm, "joints_torque", None)
+        row[_VELOCITIES] = np.nan if velocities is None else velocities[:NUM_JOINTS]
+        row[_TORQUES] = np.nan if torques is None else torques[:NUM_JOINTS]
+        return True
+
+    def write(self) -> None:
+        """Reads the state of the arm and publishes it. Must only be called by one writer at a time."""
+        back = 1 - self._front
+        row = self._buffer[back]
+        timestamp = time.perf_counter()
+        # Odd while the row is written.
+        self._sequences[back] += 1
+        try:
+            success = self._read_arm(row)
+            row[_TIMESTAMP] = timestamp
+        finally:
+            self._sequences[back] += 1
+        if success:
+            self._front = back
+            self._has_state = True
+
+    def latest(self) -> XArmState:
+        """Returns a copy of the latest state."""
+        while True:
+            front = self._front
+            sequence = self._sequences[front]
+            row = self._buffer[front].copy()
+            if sequence % 2 == 0 and self._sequences[front] == sequence:
+                break
+        return XArmState(
+            timestamp=float(row[_TIMESTAMP]),
+            pose=row[_POSE],
+            joints=row[_JOINTS],
+            joint_velocities=row[_VELOCITIES],
+            joint_torques=row[_TORQUES],
+        )
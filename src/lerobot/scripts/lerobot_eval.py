@@ -148,6 +148,8 @@ def rollout(
     step = 0
     # Keep track of which environments are done.
     done = np.array([False] * env.num_envs)
+    # Keep track of which environments have succeeded so far.
+    succeeded = np.array([False] * env.num_envs)
     max_steps = env.call("_max_episode_steps")[0]
     progbar = trange(
         max_steps,
@@ -200,10 +202,8 @@ def rollout(
         all_successes.append(torch.tensor(successes))
 
         step += 1
-        running_success_rate = (
-            einops.reduce(torch.stack(all_successes, dim=1), "b n -> b", "any").numpy().mean()
-        )
-        progbar.set_postfix({"running_success_rate": f"{running_success_rate.item() * 100:.1f}%"})
+        succeeded |= np.array(successes, dtype=bool)
+        progbar.set_postfix({"running_success_rate": f"{succeeded.mean() * 100:.1f}%"})
         progbar.update()
 
     # Track the final observation.
@@ -230,6 +230,142 @@ def rollout(
     return ret
 
 
+def continuous_rollout(
+    env: gym.vector.SyncVectorEnv,
+    policy: PreTrainedPolicy,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    start_seed: int | None = None,
+) -> list[dict]:
+    """Run `n_episodes` episodes through a batch of environments, refilling each environment with a new episode
+    as soon as its current one is done.
+
+    Unlike `rollout`, environments don't wait for the slowest one to be done, so that no environment step is
+    wasted on heterogeneous episode lengths. When an environment starts a new episode, it is reset with its own
+    seed, and the policy restarts the corresponding batch element with `policy.reset_batch_elements`. Policies
+    executing action chunks only restart elements when they generate actions for the whole batch, so a finished
+    environment may be idle for a few steps. Idle environments are not stepped (the sub-environments of the
+    `SyncVectorEnv` are stepped individually).
+
+    Args:
+        env: The batch of environments.
+        policy: The policy. Must support `reset_batch_elements`.
+        n_episodes: The number of episodes to run.
+        start_seed: The seed of the first episode, incremented by 1 for each subsequent episode. If not
+            provided, the environments are not manually seeded.
+    Returns:
+        A list with, for each episode in order, a dictionary with its "episode_ix", "sum_reward", "max_reward",
+        "success", "seed" and "n_steps".
+    """
+    assert isinstance(policy, nn.Module), "Policy must be a PyTorch nn module."
+    check_env_attributes_and_types(env)
+    num_envs = env.num_envs
+    max_steps = env.call("_max_episode_steps")[0]
+
+    policy.reset()
+    observations = [None] * num_envs
+    # Episode run by each environment (-1 when the environment is idle), and its statistics so far.
+    slot_episode = np.full(num_envs, -1)
+    slot_seed: list[int | None] = [None] * num_envs
+    slot_steps = np.zeros(num_envs, dtype=int)
+    slot_sum_reward = np.zeros(num_envs)
+    slot_max_reward = np.full(num_envs, -np.inf)
+    # Environments whose episode is done, waiting for the policy to restart them with a new episode.
+    waiting = np.zeros(num_envs, dtype=bool)
+    next_episode = 0
+
+    def start_episode(slot: int):
+        nonlocal next_episode
+        seed = None if start_seed is None else start_seed + next_episode
+        observations[slot], _ = env.envs[slot].reset(seed=seed)
+        slot_episode[slot] = next_episode
+        slot_seed[slot] = seed
+        slot_steps[slot] = 0
+        slot_sum_reward[slot] = 0.0
+        slot_max_reward[slot] = -np.inf
+        next_episode += 1
+
+    for slot in range(num_envs):
+        if next_episode < n_episodes:
+            start_episode(slot)
+        else:
+            # Unused environments still need an observation to complete the batch.
+            observations[slot], _ = env.envs[slot].reset()
+
+    episodes: list[dict | None] = [None] * n_episodes
+    n_successes = 0
+    progbar = trange(
+        n_episodes,
+        desc=f"Running {n_episodes} episodes on {num_envs} environments",
+        disable=inside_slurm(),  # we dont want progress bar when we use slurm, since it clutters the logs
+        leave=False,
+    )
+    while np.any(slot_episode >= 0) or np.any(waiting):
+        if np.any(waiting) and policy.reset_batch_elements(torch.from_numpy(waiting)):
+            for slot in np.flatnonzero(waiting):
+                start_episode(slot)
+            waiting[:] = False
+
+        # A new batch is made at every step, as the policy may keep references to previous observations.
+        observation = gym.vector.utils.concatenate(
+            env.single_observation_space,
+            observations,
+            gym.vector.utils.create_empty_array(env.single_observation_space, n=num_envs),
+        )
+        observation = preprocess_observation(observation)
+        observation = add_envs_task(env, observation)
+        observation = preprocessor(observation)
+        with torch.inference_mode():
+            action = policy.select_action(observation)
+        action_numpy: np.ndarray = postprocessor(action).to("cpu").numpy()
+        assert action_numpy.ndim == 2, "Action dimensions should be (batch, action_dim)"
+
+        for slot in np.flatnonzero(slot_episode >= 0):
+            observations[slot], reward, terminated, truncated, info = env.envs[slot].step(action_numpy[slot])
+            slot_steps[slot] += 1
+            slot_sum_reward[slot] += reward
+            slot_max_reward[slot] = max(slot_max_reward[slot], reward)
+            if not (terminated or truncated or slot_steps[slot] == max_steps):
+                continue
+
+            success = bool((terminated or truncated) and info.get("is_success", False))
+            episodes[slot_episode[slot]] = {
+                "episode_ix": int(slot_episode[slot]),
+                "sum_reward": float(slot_sum_reward[slot]),
+                "max_reward": float(slot_max_reward[slot]),
+                "success": success,
+                "seed": slot_seed[slot],
+                "n_steps": int(slot_steps[slot]),
+            }
+            slot_episode[slot] = -1
+            waiting[slot] = next_episode + waiting.sum() < n_episodes
+            # Incremental success tally.
+            n_successes += success
+            progbar.update()
+            progbar.set_postfix({"running_success_rate": f"{n_successes / progbar.n * 100:.1f}%"})
+
+    if hasattr(policy, "use_original_modules"):
+        policy.use_original_modules()
+
+    return episodes
+
+
+def _continuous_refill_unsupported_reason(
+    env: gym.vector.VectorEnv, policy: PreTrainedPolicy, max_episodes_rendered: int, return_episode_data: bool
+) -> str | None:
+    """Returns why `continuous_rollout` can't be used for an evaluation, or None if it can."""
+    if not isinstance(env, gym.vector.SyncVectorEnv):
+        return "it requires synchronous environments"
+    if max_episodes_rendered > 0 or return_episode_data:
+        return "it doesn't render videos nor return episode data"
+    try:
+        policy.reset_batch_elements(torch.zeros(env.num_envs, dtype=torch.bool))
+    except NotImplementedError as e:
+        return str(e)
+    return None
+
+
 def eval_policy(
     env: gym.vector.VectorEnv,
     policy: PreTrainedPolicy,
@@ -240,6 +376,7 @@ def eval_policy(
     videos_dir: Path | None = None,
     return_episode_data: bool = False,
     start_seed: int | None = None,
+    continuous_refill: bool = False,
 ) -> dict:
     """
     Args:
@@ -252,6 +389,9 @@ def eval_policy(
             the "episodes" key of the returned dictionary.
         start_seed: The first seed to use for the first individual rollout. For all subsequent rollouts the
             seed is incremented by 1. If not provided, the environments are not manually seeded.
+        continuous_refill: Whether to refill each environment with a new episode as soon as its current one
+            is done (see `continuous_rollout`). Falls back to batches of synchronized rollouts when this isn't
+            supported.
     Returns:
         Dictionary with metrics and data regarding the rollouts.
     """
@@ -266,6 +406,27 @@ def eval_policy(
     start = time.time()
     policy.eval()
 
+    if continuous_refill:
+        reason = _continuous_refill_unsupported_reason(
+            env, policy, max_episodes_rendered, return_episode_data
+        )
+        if reason is None:
+            episodes = continuous_rollout(env, policy, preprocessor, postprocessor, n_episodes, start_seed)
+            return {
+                "per_episode": [
+                    {k: ep[k] for k in ("episode_ix", "sum_reward", "max_reward", "success", "seed")}
+                    for ep in episodes
+                ],
+                "aggregated": {
+                    "avg_sum_reward": float(np.nanmean([ep["sum_reward"] for ep in episodes])),
+                    "avg_max_reward": float(np.nanmean([ep["max_reward"] for ep in episodes])),
+                    "pc_success": float(np.nanmean([ep["success"] for ep in episodes]) * 100),
+                    "eval_s": time.time() - start,
+                    "eval_ep_s": (time.time() - start) / n_episodes,
+                },
+            }
+        logging.warning(f"Continuous refill is disabled because {reason}.")
+
     # Determine how many batched rollouts we need to get n_episodes. Note that if n_episodes is not evenly
     # divisible by env.num_envs we end up discarding some data in the last batch.
     n_batches = n_episodes // env.num_envs + int((n_episodes % env.num_envs) != 0)
@@ -284,11 +445,9 @@ def eval_policy(
         if n_episodes_rendered >= max_episodes_rendered:
             return
         n_to_render_now = min(max_episodes_rendered - n_episodes_rendered, env.num_envs)
-        if isinstance(env, gym.vector.SyncVectorEnv):
-            ep_frames.append(np.stack([env.envs[i].render() for i in range(n_to_render_now)]))  # noqa: B023
-        elif isinstance(env, gym.vector.AsyncVectorEnv):
-            # Here we must render all frames and discard any we don't need.
-            ep_frames.append(np.stack(env.call("render")[:n_to_render_now]))
+        frames = _render_frames(env, n_to_render_now)
+        if frames is not None:
+            ep_frames.append(frames)  # noqa: B023
 
     if max_episodes_rendered > 0:
         video_paths: list[str] = []
@@ -320,21 +479,10 @@ def eval_policy(
             render_callback=render_frame if max_episodes_rendered > 0 else None,
         )
 
-        # Figure out where in each rollout sequence the first done condition was encountered (results after
-        # this won't be included).
-        n_steps = rollout_data["done"].shape[1]
-        # Note: this relies on a property of argmax: that it returns the first occurrence as a tiebreaker.
-        done_indices = torch.argmax(rollout_data["done"].to(int), dim=1)
-
-        # Make a mask with shape (batch, n_steps) to mask out rollout data after the first done
-        # (batch-element-wise). Note the `done_indices + 1` to make sure to keep the data from the done step.
-        mask = (torch.arange(n_steps) <= einops.repeat(done_indices + 1, "b -> b s", s=n_steps)).int()
+        done_indices, batch_sum_rewards, batch_max_rewards, batch_successes = _episode_metrics(rollout_data)
         # Extend metrics.
-        batch_sum_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "sum")
         sum_rewards.extend(batch_sum_rewards.tolist())
-        batch_max_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "max")
         max_rewards.extend(batch_max_rewards.tolist())
-        batch_successes = einops.reduce((rollout_data["success"] * mask), "b n -> b", "any")
         all_successes.extend(batch_successes.tolist())
         if seeds:
             all_seeds.extend(seeds)
@@ -429,6 +577,258 @@ def eval_policy(
     return info
 
 
+def _render_frames(env: gym.vector.VectorEnv, n: int) -> np.ndarray | None:
+    """Renders the first `n` environments of a batch, as a (n, h, w, c) array."""
+    if isinstance(env, gym.vector.SyncVectorEnv):
+        return np.stack([env.envs[i].render() for i in range(n)])
+    if isinstance(env, gym.vector.AsyncVectorEnv):
+        # Here we must render all frames and discard any we don't need.
+        return np.stack(env.call("render")[:n])
+    return None
+
+
+def _episode_metrics(rollout_data: dict) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Computes the done index, sum of rewards, max reward and success of each episode of a batched rollout."""
+    # Figure out where in each rollout sequence the first done condition was encountered (results after
+    # this won't be included).
+    n_steps = rollout_data["done"].shape[1]
+    # Note: this relies on a property of argmax: that it returns the first occurrence as a tiebreaker.
+    done_indices = torch.argmax(rollout_data["done"].to(int), dim=1)
+
+    # Make a mask with shape (batch, n_steps) to mask out rollout data after the first done
+    # (batch-element-wise). Note the `done_indices + 1` to make sure to keep the data from the done step.
+    mask = (torch.arange(n_steps) <= einops.repeat(done_indices + 1, "b -> b s", s=n_steps)).int()
+    sum_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "sum")
+    max_rewards = einops.reduce((rollout_data["reward"] * mask), "b n -> b", "max")
+    successes = einops.reduce((rollout_data["success"] * mask), "b n -> b", "any")
+    return done_indices, sum_rewards, max_rewards, successes
+
+
+def _concatenate_batches(batches: list):
+    """Concatenates batched observations (possibly nested dictionaries of arrays) along the batch dimension."""
+    if isinstance(batches[0], dict):
+        return {key: _concatenate_batches([batch[key] for batch in batches]) for key in batches[0]}
+    return np.concatenate(batches)
+
+
+class MultiTaskVectorEnv(gym.vector.VectorEnv):
+    """Presents the vectorized environments of several tasks as a single batch of environments.
+
+    The tasks must have the same number of environments, observation and action spaces. A policy then runs a
+    single forward pass per step for all the tasks, while the vectorized environments of the tasks are stepped
+    concurrently, by one thread each. This parallelizes simulators which release the GIL (e.g. MuJoCo), and
+    asynchronous vectorized environments, which step in their own worker processes.
+
+    The wrapped environments are not closed with this one.
+    """
+
+    def __init__(self, envs: list[gym.vector.VectorEnv]):
+        super().__init__(
+            sum(env.num_envs for env in envs), envs[0].single_observation_space, envs[0].single_action_space
+        )
+        self.vector_envs = envs
+        self.metadata = envs[0].metadata
+        ends = np.cumsum([env.num_envs for env in envs]).tolist()
+        # Slice of the batch of each task.
+        self.task_slices = [slice(start, end) for start, end in zip([0, *ends[:-1]], ends, strict=True)]
+        self._executor = cf.ThreadPoolExecutor(max_workers=len(envs))
+
+    @property
+    def envs(self) -> list[gym.Env]:
+        return [env for vector_env in self.vector_envs for env in vector_env.envs]
+
+    def _map(self, fn: Callable, *args: list) -> list:
+        return list(self._executor.map(fn, self.vector_envs, *args))
+
+    def reset(self, *, seed: int | list[int] | None = None, options: dict | None = None):
+        if seed is None:
+            seeds = [None] * len(self.vector_envs)
+        else:
+            if isinstance(seed, int):
+                seed = list(range(seed, seed + self.num_envs))
+            seeds = [seed[task_slice] for task_slice in self.task_slices]
+        results = self._map(lambda env, s: env.reset(seed=s, options=options), seeds)
+        return _concatenate_batches([observation for observation, _ in results]), {}
+
+    def step(self, actions: np.ndarray):
+        results = self._map(
+            lambda env, a: env.step(a), [actions[task_slice] for task_slice in self.task_slices]
+        )
+        observations, rewards, terminations, truncations, infos = zip(*results, strict=True)
+        info = {}
+        # Only "final_info" is forwarded, with one entry per environment.
+        if any("final_info" in task_info for task_info in infos):
+            info["final_info"] = np.full(self.num_envs, None, dtype=object)
+            for task_slice, task_info in zip(self.task_slices, infos, strict=True):
+                if "final_info" in task_info:
+                    info["final_info"][task_slice] = task_info["final_info"]
+        return (
+            _concatenate_batches(list(observations)),
+            np.concatenate(rewards),
+            np.concatenate(terminations),
+            np.concatenate(truncations),
+            info,
+        )
+
+    def call(self, name: str, *args, **kwargs) -> tuple:
+        return tuple(result for env in self.vector_envs for result in env.call(name, *args, **kwargs))
+
+    def close_extras(self, **kwargs):
+        self._executor.shutdown()
+
+
+def eval_policy_tasks(
+    env: MultiTaskVectorEnv,
+    policy: PreTrainedPolicy,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    max_episodes_rendered: int = 0,
+    videos_dirs: list[Path | None] | None = None,
+    start_seed: int | None = None,
+) -> list[dict]:
+    """Evaluates a policy on several tasks at once, with batched inference across the tasks.
+
+    This is equivalent to calling `eval_policy` on each of the vectorized environments wrapped by `env`: each
+    task runs the same episodes, with the same seeds, and renders its own videos.
+
+    Args:
+        env: The vectorized environments of the tasks.
+        n_episodes: The number of episodes to evaluate for each task.
+        max_episodes_rendered: Maximum number of episodes to render into videos, for each task.
+        videos_dirs: Where to save the rendered videos of each task.
+        See `eval_policy` for the other arguments.
+    Returns:
+        The info returned by `eval_policy` for each task, without episode data.
+    """
+    if max_episodes_rendered > 0 and (videos_dirs is None or not all(videos_dirs)):
+        raise ValueError("If max_episodes_rendered > 0, videos_dirs must be provided.")
+
+    if not isinstance(policy, PreTrainedPolicy):
+        raise ValueError(
+            f"Policy of type 'PreTrainedPolicy' is expected, but type '{type(policy)}' was provided."
+        )
+
+    start = time.time()
+    policy.eval()
+
+    task_envs = env.vector_envs
+    n_envs = task_envs[0].num_envs
+    n_batches = n_episodes // n_envs + int((n_episodes % n_envs) != 0)
+
+    sum_rewards = [[] for _ in task_envs]
+    max_rewards = [[] for _ in task_envs]
+    all_successes = [[] for _ in task_envs]
+    all_seeds = [[] for _ in task_envs]
+    video_paths = [[] for _ in task_envs]
+    threads = []  # for video saving threads
+    n_episodes_rendered = [0] * len(task_envs)
+
+    def render_frame(env: MultiTaskVectorEnv):
+        for task_ix, task_env in enumerate(env.vector_envs):
+            if n_episodes_rendered[task_ix] < max_episodes_rendered:
+                n_to_render_now = min(max_episodes_rendered - n_episodes_rendered[task_ix], n_envs)
+                frames = _render_frames(task_env, n_to_render_now)
+                if frames is not None:
+                    ep_frames[task_ix].append(frames)  # noqa: B023
+
+    progbar = trange(
+        n_batches,
+        desc=f"Stepping through eval batches of {len(task_envs)} tasks",
+        disable=inside_slurm(),  # we dont want progress bar when we use slurm, since it clutters the logs
+    )
+    for batch_ix in progbar:
+        ep_frames: list[list[np.ndarray]] = [[] for _ in task_envs]
+
+        # Each task uses the seeds that `eval_policy` would use.
+        seeds = None
+        if start_seed is not None:
+            seeds = list(range(start_seed + batch_ix * n_envs, start_seed + (batch_ix + 1) * n_envs))
+        rollout_data = rollout(
+            env=env,
+            policy=policy,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            seeds=seeds * len(task_envs) if seeds else None,
+            render_callback=render_frame if max_episodes_rendered > 0 else None,
+        )
+        done_indices, batch_sum_rewards, batch_max_rewards, batch_successes = _episode_metrics(rollout_data)
+
+        for task_ix, task_slice in enumerate(env.task_slices):
+            sum_rewards[task_ix].extend(batch_sum_rewards[task_slice].tolist())
+            max_rewards[task_ix].extend(batch_max_rewards[task_slice].tolist())
+            all_successes[task_ix].extend(batch_successes[task_slice].tolist())
+            all_seeds[task_ix].extend(seeds if seeds else [None] * n_envs)
+
+            # Maybe render video for visualization.
+            if not ep_frames[task_ix]:
+                continue
+            batch_stacked_frames = np.stack(ep_frames[task_ix], axis=1)  # (b, t, *)
+            for stacked_frames, done_index in zip(
+                batch_stacked_frames, done_indices[task_slice].tolist(), strict=False
+            ):
+                videos_dir = videos_dirs[task_ix]
+                videos_dir.mkdir(parents=True, exist_ok=True)
+                video_path = videos_dir / f"eval_episode_{n_episodes_rendered[task_ix]}.mp4"
+                video_paths[task_ix].append(str(video_path))
+                thread = threading.Thread(
+                    target=write_video,
+                    args=(
+                        str(video_path),
+                        stacked_frames[: done_index + 1],  # + 1 to capture the last observation
+                        env.metadata["render_fps"],
+                    ),
+                )
+                thread.start()
+                threads.append(thread)
+                n_episodes_rendered[task_ix] += 1
+
+        progbar.set_postfix(
+            {"running_success_rate": f"{np.mean([s[:n_episodes] for s in all_successes]).item() * 100:.1f}%"}
+        )
+
+    # Wait till all video rendering threads are done.
+    for thread in threads:
+        thread.join()
+
+    eval_s = time.time() - start
+    infos = []
+    for task_ix in range(len(task_envs)):
+        info = {
+            "per_episode": [
+                {
+                    "episode_ix": i,
+                    "sum_reward": sum_reward,
+                    "max_reward": max_reward,
+                    "success": success,
+                    "seed": seed,
+                }
+                for i, (sum_reward, max_reward, success, seed) in enumerate(
+                    zip(
+                        sum_rewards[task_ix][:n_episodes],
+                        max_rewards[task_ix][:n_episodes],
+                        all_successes[task_ix][:n_episodes],
+                        all_seeds[task_ix][:n_episodes],
+                        strict=True,
+                    )
+                )
+            ],
+            "aggregated": {
+                "avg_sum_reward": float(np.nanmean(sum_rewards[task_ix][:n_episodes])),
+                "avg_max_reward": float(np.nanmean(max_rewards[task_ix][:n_episodes])),
+                "pc_success": float(np.nanmean(all_successes[task_ix][:n_episodes]) * 100),
+                # The tasks share the evaluation time.
+                "eval_s": eval_s,
+                "eval_ep_s": eval_s / (n_episodes * len(task_envs)),
+            },
+        }
+        if max_episodes_rendered > 0:
+            info["video_paths"] = video_paths[task_ix]
+        infos.append(info)
+
+    return infos
+
+
 def _compile_episode_data(
     rollout_data: dict, done_indices: Tensor, start_episode_index: int, start_data_index: int, fps: float
 ) -> dict:
@@ -515,6 +915,7 @@ def eval_main(cfg: EvalPipelineConfig):
             videos_dir=Path(cfg.output_dir) / "videos",
             start_seed=cfg.seed,
             max_parallel_tasks=cfg.env.max_parallel_tasks,
+            continuous_refill=cfg.eval.continuous_refill,
         )
         print("Overall Aggregated Metrics:")
         print(info["overall"])
@@ -555,6 +956,7 @@ def eval_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    continuous_refill: bool = False,
 ) -> TaskMetrics:
     """Evaluates one task_id of one suite using the provided vec env."""
 
@@ -570,6 +972,7 @@ def eval_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        continuous_refill=continuous_refill,
     )
 
     per_episode = task_result["per_episode"]
@@ -594,6 +997,7 @@ def run_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    continuous_refill: bool = False,
 ):
     """
     Run eval_one for a single (task_group, task_id, env).
@@ -616,6 +1020,7 @@ def run_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        continuous_refill=continuous_refill,
     )
     # ensure we always provide video_paths key to simplify accumulation
     if max_episodes_rendered > 0:
@@ -623,6 +1028,27 @@ def run_one(
     return task_group, task_id, metrics
 
 
+def _batch_compatible_tasks(
+    tasks: list[tuple[str, int, gym.vector.VectorEnv]], max_tasks: int
+) -> list[list[tuple[str, int, gym.vector.VectorEnv]]]:
+    """Splits tasks into batches of at most `max_tasks` tasks which can be run by a `MultiTaskVectorEnv`."""
+    compatible_tasks = defaultdict(list)
+    for task in tasks:
+        env = task[2]
+        key = (
+            env.num_envs,
+            str(env.single_observation_space),
+            str(env.single_action_space),
+            env.call("_max_episode_steps")[0],
+        )
+        compatible_tasks[key].append(task)
+    return [
+        group[i : i + max_tasks]
+        for group in compatible_tasks.values()
+        for i in range(0, len(group), max_tasks)
+    ]
+
+
 def eval_policy_all(
     envs: dict[str, dict[int, gym.vector.VectorEnv]],
     policy,
@@ -635,13 +1061,21 @@ def eval_policy_all(
     return_episode_data: bool = False,
     start_seed: int | None = None,
     max_parallel_tasks: int = 1,
+    continuous_refill: bool = False,
+    on_task_done: Callable[[str, int, TaskMetrics], None] | None = None,
 ) -> dict:
     """
     Evaluate a nested `envs` dict: {task_group: {task_id: vec_env}}.
-    This implementation flattens tasks, runs them sequentially or via ThreadPoolExecutor,
+    This implementation flattens tasks, runs them sequentially or `max_parallel_tasks` at a time,
     accumulates per-group and overall statistics, and returns the same aggregate metrics
     schema as the single-env evaluator (avg_sum_reward / avg_max_reward / pc_success / timings)
     plus per-task infos.
+
+    Tasks run in parallel are batched together (see `MultiTaskVectorEnv`) when their environments have the
+    same number of environments, observation and action spaces and maximum episode length, so that the
+    policy runs a single forward pass per step for all of them. With `return_episode_data` or
+    `continuous_refill`, tasks run sequentially. `on_task_done` is called with the metrics of each task as
+    soon as it is done.
     """
     start_t = time.time()
 
@@ -677,7 +1111,7 @@ def eval_policy_all(
             group_acc[group]["video_paths"].extend(paths)
             overall["video_paths"].extend(paths)
 
-    # Choose runner (sequential vs threaded)
+    # Runner of a single task, with its own environments
     task_runner = partial(
         run_one,
         policy=policy,
@@ -688,26 +1122,52 @@ def eval_policy_all(
         videos_dir=videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        continuous_refill=continuous_refill,
     )
 
-    if max_parallel_tasks <= 1:
+    def _task_done(tg: str, tid: int, metrics: TaskMetrics):
+        _accumulate_to(tg, metrics)
+        per_task_infos.append({"task_group": tg, "task_id": tid, "metrics": metrics})
+        logging.info(f"Task {tg}/{tid} done: pc_success={np.mean(metrics['successes']) * 100:.1f}%")
+        if on_task_done is not None:
+            on_task_done(tg, tid, metrics)
+
+    if max_parallel_tasks <= 1 or return_episode_data or continuous_refill:
         # sequential path (single accumulator path on the main thread)
-        # NOTE: keeping a single-threaded accumulator avoids concurrent list appends or locks
+        # NOTE: keeping a single-threaded accumulator avoids concurrent list appends or locks. The policy is
+        # stateful (action queues, batch elements restarted by `continuous_rollout`), so tasks that can't be
+        # batched together run one after the other rather than in threads sharing it.
         for task_group, task_id, env in tasks:
-            tg, tid, metrics = task_runner(task_group, task_id, env)
-            _accumulate_to(tg, metrics)
-            per_task_infos.append({"task_group": tg, "task_id": tid, "metrics": metrics})
+            _task_done(*task_runner(task_group, task_id, env))
     else:
-        # threaded path: submit all tasks, consume completions on main thread and accumulate there
-        with cf.ThreadPoolExecutor(max_workers=max_parallel_tasks) as executor:
-            fut2meta = {}
-            for task_group, task_id, env in tasks:
-                fut = executor.submit(task_runner, task_group, task_id, env)
-                fut2meta[fut] = (task_group, task_id)
-            for fut in cf.as_completed(fut2meta):
-                tg, tid, metrics = fut.result()
-                _accumulate_to(tg, metrics)
-                per_task_infos.append({"task_group": tg, "task_id": tid, "metrics": metrics})
+        # batched path: tasks with compatible environments run together, with batched policy inference
+        for wave in _batch_compatible_tasks(tasks, max_parallel_tasks):
+            if len(wave) == 1:
+                _task_done(*task_runner(*wave[0]))
+                continue
+            multi_task_env = MultiTaskVectorEnv([env for _, _, env in wave])
+            task_infos = eval_policy_tasks(
+                multi_task_env,
+                policy,
+                preprocessor,
+                postprocessor,
+                n_episodes,
+                max_episodes_rendered=max_episodes_rendered,
+                videos_dirs=[
+                    None if videos_dir is None else videos_dir / f"{tg}_{tid}" for tg, tid, _ in wave
+                ],
+                start_seed=start_seed,
+            )
+            multi_task_env.close()
+            for (tg, tid, _), task_info in zip(wave, task_infos, strict=True):
+                per_episode = task_info["per_episode"]
+                metrics = TaskMetrics(
+                    sum_rewards=[ep["sum_reward"] for ep in per_episode],
+                    max_rewards=[ep["max_reward"] for ep in per_episode],
+                    successes=[ep["success"] for ep in per_episode],
+                    video_paths=task_info.get("video_paths", []),
+                )
+                _task_done(tg, tid, metrics)
 
     # compute aggregated metrics helper (robust to lists/scalars)
     def _agg_from_list(xs):
@@ -59,7 +59,6 @@ lerobot-record \
 """
 
 import logging
-import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from pprint import pformat
@@ -117,13 +116,13 @@ from lerobot.utils.control_utils import (
     sanity_check_dataset_name,
     sanity_check_dataset_robot_compatibility,
 )
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.loop_scheduler import LoopScheduler, LoopStats
 from lerobot.utils.utils import (
     get_safe_torch_device,
     init_logging,
     log_say,
 )
-from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
+from lerobot.utils.visualization_utils import RerunSink, init_rerun, log_rerun_data
 
 
 @dataclass
@@ -180,10 +179,16 @@ class RecordConfig:
     policy: PreTrainedConfig | None = None
     # Display all cameras on screen
     display_data: bool = False
+    # Maximum rate at which camera images are displayed, and scale they are downscaled by.
+    display_image_fps: float = 10.0
+    display_image_scale: float = 0.5
     # Use vocal synthesis to read events.
     play_sounds: bool = True
     # Resume recording on an existing dataset.
     resume: bool = False
+    # What the control loop does when it falls behind by more than one tick: "skip" drops the missed ticks,
+    # "catch_up" runs them back-to-back.
+    missed_ticks: str = "skip"
 
     def __post_init__(self):
         # HACK: We parse again the cli args here to get the pretrained path if there was one.
@@ -253,44 +258,53 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
-):
+    missed_ticks: str = "skip",
+    rerun_sink: RerunSink | None = None,
+) -> LoopStats:
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
 
-    timestamp = 0
-    start_episode_t = time.perf_counter()
-    while timestamp < control_time_s:
-        start_loop_t = time.perf_counter()
-
+    scheduler = LoopScheduler(fps, missed_ticks=missed_ticks)
+    while scheduler.elapsed_s < control_time_s:
         if events["exit_early"]:
             events["exit_early"] = False
             break
 
         # Get robot observation
-        obs = robot.get_observation()
+        with scheduler.phase("observation"):
+            obs = robot.get_observation()
 
         # Applies a pipeline to the raw robot observation, default is IdentityProcessor
-        obs_processed = robot_observation_processor(obs)
-        act = teleop.get_action()
-        _sent_action = robot.send_action(act)
+        with scheduler.phase("processors"):
+            obs_processed = robot_observation_processor(obs)
+        with scheduler.phase("teleop"):
+            act = teleop.get_action()
+        with scheduler.phase("action"):
+            _sent_action = robot.send_action(act)
 
         # if policy is not None or dataset is not None:
-        observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix="observation")
-        act_processed_teleop = teleop_action_processor((act, obs))
+        with scheduler.phase("processors"):
+            observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix="observation")
+            act_processed_teleop = teleop_action_processor((act, obs))
         action_values = act_processed_teleop
 
         # Write to dataset
-        action_frame = build_dataset_frame(dataset.features, action_values, prefix="action")
-        frame = {**observation_frame, **action_frame, "task": single_task}
-        dataset.add_frame(frame)
-
-        log_rerun_data(observation=obs_processed, action=action_values)
+        with scheduler.phase("dataset"):
+            action_frame = build_dataset_frame(dataset.features, action_values, prefix="action")
+            frame = {**observation_frame, **action_frame, "task": single_task}
+            dataset.add_frame(frame)
 
-        dt_s = time.perf_counter() - start_loop_t
-        busy_wait(1 / fps - dt_s)
+        with scheduler.phase("display"):
+            if rerun_sink is not None:
+                rerun_sink.log(observation=obs_processed, action=action_values)
+            elif display_data:
+                log_rerun_data(observation=obs_processed, action=action_values)
 
-        timestamp = time.perf_counter() - start_episode_t
+        scheduler.wait()
 
+    stats = scheduler.stats()
+    logging.info(f"Control loop timing: {stats}")
+    return stats
 
 # @safe_stop_image_writer
 # def record_loop(
@@ -438,8 +452,11 @@ def record_loop(
 def record(cfg: RecordConfig) -> LeRobotDataset:
     init_logging()
     logging.info(pformat(asdict(cfg)))
+    rerun_sink = None
     if cfg.display_data:
         init_rerun(session_name="recording")
+        rerun_sink = RerunSink(image_fps=cfg.display_image_fps, image_scale=cfg.display_image_scale)
+        rerun_sink.start()
 
     robot = make_robot_from_config(cfg.robot)
     teleop = make_teleoperator_from_config(cfg.teleop) if cfg.teleop is not None else None
@@ -529,6 +546,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 control_time_s=cfg.dataset.episode_time_s,
                 single_task=cfg.dataset.single_task,
                 display_data=cfg.display_data,
+                missed_ticks=cfg.missed_ticks,
+                rerun_sink=rerun_sink,
             )
 
             # Execute a few seconds without recording to give time to manually reset the environment
@@ -548,6 +567,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                     control_time_s=cfg.dataset.reset_time_s,
                     single_task=cfg.dataset.single_task,
                     display_data=cfg.display_data,
+                    missed_ticks=cfg.missed_ticks,
+                    rerun_sink=rerun_sink,
                 )
 
             if events["rerecord_episode"]:
@@ -562,6 +583,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
 
     log_say("Stop recording", cfg.play_sounds, blocking=True)
 
+    if rerun_sink is not None:
+        rerun_sink.stop()
     robot.disconnect()
     if teleop is not None:
         teleop.disconnect()
@@ -40,7 +40,6 @@ lerobot-replay \
 """
 
 import logging
-import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from pprint import pformat
@@ -60,7 +59,7 @@ from lerobot.robots import (  # noqa: F401
     so100_follower,
     so101_follower,
 )
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.loop_scheduler import LoopScheduler
 from lerobot.utils.utils import (
     init_logging,
     log_say,
@@ -85,6 +84,9 @@ class ReplayConfig:
     dataset: DatasetReplayConfig
     # Use vocal synthesis to read events.
     play_sounds: bool = True
+    # What the replay loop does when it falls behind by more than one frame: "skip" drops the missed frames,
+    # "catch_up" replays them back-to-back.
+    missed_ticks: str = "skip"
 
 
 @parser.wrap()
@@ -104,22 +106,28 @@ def replay(cfg: ReplayConfig):
     robot.connect()
 
     log_say("Replaying episode", cfg.play_sounds, blocking=True)
-    for idx in range(len(episode_frames)):
-        start_episode_t = time.perf_counter()
-
+    scheduler = LoopScheduler(dataset.fps, missed_ticks=cfg.missed_ticks)
+    idx = 0
+    while idx < len(episode_frames):
         action_array = actions[idx]["action"]
         action = {}
         for i, name in enumerate(dataset.features["action"]["names"]):
             action[name] = action_array[i]
 
-        robot_obs = robot.get_observation()
+        with scheduler.phase("observation"):
+            robot_obs = robot.get_observation()
+
+        with scheduler.phase("processors"):
+            processed_action = robot_action_processor((action, robot_obs))
 
-        processed_action = robot_action_processor((action, robot_obs))
+        with scheduler.phase("action"):
+            _ = robot.send_action(processed_action)
 
-        _ = robot.send_action(processed_action)
+        scheduler.wait()
+        # Frames are replayed at the time they were recorded, so the frames of skipped ticks are dropped.
+        idx = scheduler.tick_index + scheduler.skipped_ticks
 
-        dt_s = time.perf_counter() - start_episode_t
-        busy_wait(1 / dataset.fps - dt_s)
+    logging.info(f"Replay loop timing: {scheduler.stats()}")
 
     robot.disconnect()
 
@@ -52,7 +52,6 @@ lerobot-teleoperate \
 """
 
 import logging
-import time
 from dataclasses import asdict, dataclass
 from pprint import pformat
 
@@ -88,9 +87,9 @@ from lerobot.teleoperators import (  # noqa: F401
     so100_leader,
     so101_leader,
 )
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.loop_scheduler import LoopScheduler
 from lerobot.utils.utils import init_logging, move_cursor_up
-from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
+from lerobot.utils.visualization_utils import RerunSink, init_rerun, log_rerun_data
 
 
 @dataclass
@@ -103,6 +102,12 @@ class TeleoperateConfig:
     teleop_time_s: float | None = None
     # Display all cameras on screen
     display_data: bool = False
+    # Maximum rate at which camera images are displayed, and scale they are downscaled by.
+    display_image_fps: float = 10.0
+    display_image_scale: float = 0.5
+    # What the control loop does when it falls behind by more than one tick: "skip" drops the missed ticks,
+    # "catch_up" runs them back-to-back.
+    missed_ticks: str = "skip"
 
 
 def teleop_loop(
@@ -114,6 +119,8 @@ def teleop_loop(
     robot_observation_processor: RobotProcessorPipeline[RobotObservation, RobotObservation],
     display_data: bool = False,
     duration: float | None = None,
+    missed_ticks: str = "skip",
+    rerun_sink: RerunSink | None = None,
 ):
     """
     This function continuously reads actions from a teleoperation device, processes them through optional
@@ -129,40 +136,47 @@ def teleop_loop(
         teleop_action_processor: An optional pipeline to process raw actions from the teleoperator.
         robot_action_processor: An optional pipeline to process actions before they are sent to the robot.
         robot_observation_processor: An optional pipeline to process raw observations from the robot.
+        missed_ticks: What the loop does when it falls behind by more than one tick, "skip" or "catch_up".
+        rerun_sink: An optional sink logging to Rerun from a background thread, used instead of logging inline.
     """
 
     display_len = max(len(key) for key in robot.action_features)
-    start = time.perf_counter()
-
+    scheduler = LoopScheduler(fps, missed_ticks=missed_ticks)
+    tick_start = scheduler.start_t
     while True:
-        loop_start = time.perf_counter()
-
         # Get robot observation
         # Not really needed for now other than for visualization
         # teleop_action_processor can take None as an observation
         # given that it is the identity processor as default
-        obs = robot.get_observation()
+        with scheduler.phase("observation"):
+            obs = robot.get_observation()
 
         # Get teleop action
-        raw_action = teleop.get_action()
+        with scheduler.phase("teleop"):
+            raw_action = teleop.get_action()
 
-        # Process teleop action through pipeline
-        teleop_action = teleop_action_processor((raw_action, obs))
+        with scheduler.phase("processors"):
+            # Process teleop action through pipeline
+            teleop_action = teleop_action_processor((raw_action, obs))
 
-        # Process action for robot through pipeline
-        robot_action_to_send = robot_action_processor((teleop_action, obs))
+            # Process action for robot through pipeline
+            robot_action_to_send = robot_action_processor((teleop_action, obs))
 
         # Send processed action to robot (robot_action_processor.to_output should return dict[str, Any])
-        _ = robot.send_action(robot_action_to_send)
+        with scheduler.phase("action"):
+            _ = robot.send_action(robot_action_to_send)
 
         if display_data:
             # Process robot observation through pipeline
             obs_transition = robot_observation_processor(obs)
 
-            log_rerun_data(
-                observation=obs_transition,
-                action=teleop_action,
-            )
+            if rerun_sink is not None:
+                rerun_sink.log(observation=obs_transition, action=teleop_action)
+            else:
+                log_rerun_data(
+                    observation=obs_transition,
+                    action=teleop_action,
+                )
 
             print("\n" + "-" * (display_len + 10))
             print(f"{'NAME':<{display_len}} | {'NORM':>7}")
@@ -171,12 +185,13 @@ def teleop_loop(
                 print(f"{motor:<{display_len}} | {value:>7.2f}")
             move_cursor_up(len(robot_action_to_send) + 5)
 
-        dt_s = time.perf_counter() - loop_start
-        busy_wait(1 / fps - dt_s)
-        loop_s = time.perf_counter() - loop_start
+        loop_start = tick_start
+        tick_start = scheduler.wait()
+        loop_s = tick_start - loop_start
         print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
 
-        if duration is not None and time.perf_counter() - start >= duration:
+        if duration is not None and scheduler.elapsed_s >= duration:
+            logging.info(f"Control loop timing: {scheduler.stats()}")
             return
 
 
@@ -184,8 +199,11 @@ def teleop_loop(
 def teleoperate(cfg: TeleoperateConfig):
     init_logging()
     logging.info(pformat(asdict(cfg)))
+    rerun_sink = None
     if cfg.display_data:
         init_rerun(session_name="teleoperation")
+        rerun_sink = RerunSink(image_fps=cfg.display_image_fps, image_scale=cfg.display_image_scale)
+        rerun_sink.start()
 
     teleop = make_teleoperator_from_config(cfg.teleop)
     robot = make_robot_from_config(cfg.robot)
@@ -201,6 +219,8 @@ def teleoperate(cfg: TeleoperateConfig):
             fps=cfg.fps,
             display_data=cfg.display_data,
             duration=cfg.teleop_time_s,
+            missed_ticks=cfg.missed_ticks,
+            rerun_sink=rerun_sink,
             teleop_action_processor=teleop_action_processor,
             robot_action_processor=robot_action_processor,
             robot_observation_processor=robot_observation_processor,
@@ -209,6 +229,7 @@ def teleoperate(cfg: TeleoperateConfig):
         pass
     finally:
         if cfg.display_data:
+            rerun_sink.stop()
             rr.rerun_shutdown()
         teleop.disconnect()
         robot.disconnect()
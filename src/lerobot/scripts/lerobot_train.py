@@ -22,6 +22,7 @@ from typing import Any
 import torch
 from termcolor import colored
 from torch.amp import GradScaler
+from torch.nn.parallel import DistributedDataParallel
 from torch.optim import Optimizer
 
 from lerobot.configs import parser
@@ -37,9 +38,20 @@ from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.utils import get_device_from_parameters
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.scripts.lerobot_eval import eval_policy_all
+from lerobot.utils.distributed_utils import (
+    broadcast_object,
+    cleanup_distributed,
+    get_rank,
+    get_world_size,
+    init_distributed,
+    is_distributed,
+    is_main_process,
+    main_process_first,
+)
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
+    AsyncCheckpointer,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
@@ -51,12 +63,13 @@ from lerobot.utils.utils import (
     get_safe_torch_device,
     has_method,
     init_logging,
+    synchronize_device,
 )
 
 
 def update_policy(
     train_metrics: MetricsTracker,
-    policy: PreTrainedPolicy,
+    policy: PreTrainedPolicy | DistributedDataParallel,
     batch: Any,
     optimizer: Optimizer,
     grad_clip_norm: float,
@@ -64,6 +77,7 @@ def update_policy(
     lr_scheduler=None,
     use_amp: bool = False,
     lock=None,
+    log_timing: bool = False,
 ) -> tuple[MetricsTracker, dict]:
     """
     Performs a single training step to update the policy's weights.
@@ -73,7 +87,8 @@ def update_policy(
 
     Args:
         train_metrics: A MetricsTracker instance to record training statistics.
-        policy: The policy model to be trained.
+        policy: The policy model to be trained, possibly wrapped in `DistributedDataParallel` in which case
+            gradients are all-reduced across processes during the backward pass.
         batch: A batch of training data.
         optimizer: The optimizer used to update the policy's parameters.
         grad_clip_norm: The maximum norm for gradient clipping.
@@ -81,6 +96,8 @@ def update_policy(
         lr_scheduler: An optional learning rate scheduler.
         use_amp: A boolean indicating whether to use automatic mixed precision.
         lock: An optional lock for thread-safe optimizer updates.
+        log_timing: Whether to record the time spent in the forward pass, backward pass and optimizer step
+            (`forward_s`, `backward_s` and `optim_s` metrics). This synchronizes the device after each phase.
 
     Returns:
         A tuple containing:
@@ -93,7 +110,16 @@ def update_policy(
     with torch.autocast(device_type=device.type) if use_amp else nullcontext():
         loss, output_dict = policy.forward(batch)
         # TODO(rcadene): policy.unnormalize_outputs(out_dict)
+    if log_timing:
+        synchronize_device(device)
+        forward_end_time = time.perf_counter()
+        train_metrics.forward_s = forward_end_time - start_time
+
     grad_scaler.scale(loss).backward()
+    if log_timing:
+        synchronize_device(device)
+        backward_end_time = time.perf_counter()
+        train_metrics.backward_s = backward_end_time - forward_end_time
 
     # Unscale the gradient of the optimizer's assigned params in-place **prior to gradient clipping**.
     grad_scaler.unscale_(optimizer)
@@ -117,12 +143,19 @@ def update_policy(
     if lr_scheduler is not None:
         lr_scheduler.step()
 
-    if has_method(policy, "update"):
+    unwrapped_policy = policy.module if isinstance(policy, DistributedDataParallel) else policy
+    if has_method(unwrapped_policy, "update"):
         # To possibly update an internal buffer (for instance an Exponential Moving Average like in TDMPC).
-        policy.update()
+        unwrapped_policy.update()
+
+    if log_timing:
+        synchronize_device(device)
+        train_metrics.optim_s = time.perf_counter() - backward_end_time
 
-    train_metrics.loss = loss.item()
-    train_metrics.grad_norm = grad_norm.item()
+    # Loss and grad norm are kept on device, they are only synchronized with the host when logged. Note that
+    # without `log_timing`, `update_s` thus only measures the time spent queueing work on the device.
+    train_metrics.loss = loss.detach()
+    train_metrics.grad_norm = grad_norm.detach()
     train_metrics.lr = optimizer.param_groups[0]["lr"]
     train_metrics.update_s = time.perf_counter() - start_time
     return train_metrics, output_dict
@@ -141,34 +174,50 @@ def train(cfg: TrainPipelineConfig):
     - Periodically logging metrics, saving model checkpoints, and evaluating the policy.
     - Pushing the final trained model to the Hugging Face Hub if configured.
 
+    When launched with `torchrun`, each process trains on its own shard of the dataset and gradients are
+    all-reduced across processes. Logging, checkpointing, evaluation and pushing to the hub are only done by
+    the main process.
+
     Args:
         cfg: A `TrainPipelineConfig` object containing all training configurations.
     """
     cfg.validate()
+
+    # Check device is available
+    device = get_safe_torch_device(cfg.policy.device, log=True)
+    device = init_distributed(device, backend=cfg.distributed_backend)
+    if is_distributed():
+        if cfg.dataset.streaming:
+            raise ValueError("Distributed training is not supported with streaming datasets.")
+        # All processes must agree on the output directory, which defaults to a timestamp.
+        cfg.output_dir = broadcast_object(cfg.output_dir)
+        if not is_main_process():
+            logging.getLogger().setLevel(logging.WARNING)
+
     logging.info(pformat(cfg.to_dict()))
 
-    if cfg.wandb.enable and cfg.wandb.project:
+    if cfg.wandb.enable and cfg.wandb.project and is_main_process():
         wandb_logger = WandBLogger(cfg)
     else:
         wandb_logger = None
         logging.info(colored("Logs will be saved locally.", "yellow", attrs=["bold"]))
 
     if cfg.seed is not None:
-        set_seed(cfg.seed)
+        # Model weights are synchronized by DDP, offsetting the seed decorrelates data augmentation across ranks.
+        set_seed(cfg.seed + get_rank())
 
-    # Check device is available
-    device = get_safe_torch_device(cfg.policy.device, log=True)
     torch.backends.cudnn.benchmark = True
     torch.backends.cuda.matmul.allow_tf32 = True
 
     logging.info("Creating dataset")
-    dataset = make_dataset(cfg)
+    with main_process_first():
+        dataset = make_dataset(cfg)
 
     # Create environment used for evaluating checkpoints during training on simulation data.
     # On real-world data, no need to create an environment as evaluations are done outside train.py,
     # using the eval.py instead, with gym_dora environment and dora-rs.
     eval_env = None
-    if cfg.eval_freq > 0 and cfg.env is not None:
+    if cfg.eval_freq > 0 and cfg.env is not None and is_main_process():
         logging.info("Creating env")
         eval_env = make_env(cfg.env, n_envs=cfg.eval.batch_size, use_async_envs=cfg.eval.use_async_envs)
 
@@ -200,6 +249,15 @@ def train(cfg: TrainPipelineConfig):
     if cfg.resume:
         step, optimizer, lr_scheduler = load_training_state(cfg.checkpoint_path, optimizer, lr_scheduler)
 
+    # The optimizer and the checkpoints refer to the unwrapped `policy`, only the training step goes through DDP.
+    train_policy = policy
+    if is_distributed():
+        train_policy = DistributedDataParallel(
+            policy,
+            device_ids=[device.index] if device.type == "cuda" else None,
+            find_unused_parameters=cfg.ddp_find_unused_parameters,
+        )
+
     num_learnable_params = sum(p.numel() for p in policy.parameters() if p.requires_grad)
     num_total_params = sum(p.numel() for p in policy.parameters())
 
@@ -211,6 +269,10 @@ def train(cfg: TrainPipelineConfig):
     logging.info(f"{dataset.num_episodes=}")
     logging.info(f"{num_learnable_params=} ({format_big_number(num_learnable_params)})")
     logging.info(f"{num_total_params=} ({format_big_number(num_total_params)})")
+    if is_distributed():
+        logging.info(
+            f"world_size={get_world_size()} (global batch size: {cfg.batch_size * get_world_size()})"
+        )
 
     # create dataloader for offline training
     if hasattr(cfg.policy, "drop_n_last_frames"):
@@ -220,6 +282,14 @@ def train(cfg: TrainPipelineConfig):
             dataset.meta.episodes["dataset_to_index"],
             drop_n_last_frames=cfg.policy.drop_n_last_frames,
             shuffle=True,
+            num_replicas=get_world_size(),
+            rank=get_rank(),
+            seed=cfg.seed or 0,
+        )
+    elif is_distributed():
+        shuffle = False
+        sampler = torch.utils.data.DistributedSampler(
+            dataset, num_replicas=get_world_size(), rank=get_rank(), shuffle=True, seed=cfg.seed or 0
         )
     else:
         shuffle = True
@@ -246,11 +316,26 @@ def train(cfg: TrainPipelineConfig):
         "update_s": AverageMeter("updt_s", ":.3f"),
         "dataloading_s": AverageMeter("data_s", ":.3f"),
     }
+    if cfg.log_timing:
+        train_metrics["forward_s"] = AverageMeter("fwd_s", ":.3f")
+        train_metrics["backward_s"] = AverageMeter("bwd_s", ":.3f")
+        train_metrics["optim_s"] = AverageMeter("optim_s", ":.3f")
 
+    # Metrics are those of the main process, but samples are counted across all processes.
     train_tracker = MetricsTracker(
-        cfg.batch_size, dataset.num_frames, dataset.num_episodes, train_metrics, initial_step=step
+        cfg.batch_size * get_world_size(),
+        dataset.num_frames,
+        dataset.num_episodes,
+        train_metrics,
+        initial_step=step,
     )
 
+    checkpointer = None
+    if cfg.save_checkpoint and cfg.async_checkpoint and is_main_process():
+        checkpointer = AsyncCheckpointer(
+            max_in_flight=cfg.max_checkpoints_in_flight, pin_memory=device.type == "cuda"
+        )
+
     logging.info("Start offline training on a fixed dataset")
     for _ in range(step, cfg.steps):
         start_time = time.perf_counter()
@@ -260,13 +345,14 @@ def train(cfg: TrainPipelineConfig):
 
         train_tracker, output_dict = update_policy(
             train_tracker,
-            policy,
+            train_policy,
             batch,
             optimizer,
             cfg.optimizer.grad_clip_norm,
             grad_scaler=grad_scaler,
             lr_scheduler=lr_scheduler,
             use_amp=cfg.policy.use_amp,
+            log_timing=cfg.log_timing,
         )
 
         # Note: eval and checkpoint happens *after* the `step`th training update has completed, so we
@@ -286,17 +372,30 @@ def train(cfg: TrainPipelineConfig):
                 wandb_logger.log_dict(wandb_log_dict, step)
             train_tracker.reset_averages()
 
-        if cfg.save_checkpoint and is_saving_step:
+        if cfg.save_checkpoint and is_saving_step and is_main_process():
             logging.info(f"Checkpoint policy after step {step}")
             checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, cfg.steps, step)
-            save_checkpoint(
-                checkpoint_dir, step, cfg, policy, optimizer, lr_scheduler, preprocessor, postprocessor
-            )
-            update_last_checkpoint(checkpoint_dir)
-            if wandb_logger:
-                wandb_logger.log_policy(checkpoint_dir)
+            if checkpointer is not None:
+                checkpointer.save(
+                    checkpoint_dir,
+                    step,
+                    cfg,
+                    policy,
+                    optimizer,
+                    lr_scheduler,
+                    preprocessor,
+                    postprocessor,
+                    on_complete=wandb_logger.log_policy if wandb_logger else None,
+                )
+            else:
+                save_checkpoint(
+                    checkpoint_dir, step, cfg, policy, optimizer, lr_scheduler, preprocessor, postprocessor
+                )
+                update_last_checkpoint(checkpoint_dir)
+                if wandb_logger:
+                    wandb_logger.log_policy(checkpoint_dir)
 
-        if cfg.env and is_eval_step:
+        if cfg.env and is_eval_step and is_main_process():
             step_id = get_step_identifier(step, cfg.steps)
             logging.info(f"Eval policy at step {step}")
             with (
@@ -338,15 +437,19 @@ def train(cfg: TrainPipelineConfig):
                 wandb_logger.log_dict(wandb_log_dict, step, mode="eval")
                 wandb_logger.log_video(eval_info["overall"]["video_paths"][0], step, mode="eval")
 
+    if checkpointer is not None:
+        checkpointer.close()
     if eval_env:
         close_envs(eval_env)
     logging.info("End of training")
 
-    if cfg.policy.push_to_hub:
+    if cfg.policy.push_to_hub and is_main_process():
         policy.push_model_to_hub(cfg)
         preprocessor.push_to_hub(cfg.policy.repo_id)
         postprocessor.push_to_hub(cfg.policy.repo_id)
 
+    cleanup_distributed()
+
 
 def main():
     init_logging()
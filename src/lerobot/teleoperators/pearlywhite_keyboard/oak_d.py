@@ -1,26 +1,61 @@
+import time
+
 import depthai
 import cv2
 import numpy as np
 
-from transformers import (
-    AutoImageProcessor,
-    AutoModelForObjectDetection
-)
-
-import torch
 from typing import List
 
+from lerobot.cameras.detection_pipeline import FramePipeline, FrameSource
+from lerobot.teleoperators.pearlywhite_keyboard.rtdetr import RTDetrDetector
+
+
+class OakDFrameSource(FrameSource):
+    """Frames of the color, depth and disparity output queues of an OAK-D device.
+
+    The disparity is scaled by `max_disparity` and returned color-mapped, as it is displayed.
+    """
+
+    def __init__(self, queues, max_disparity, poll_interval_s=0.001):
+        self.queues = queues
+        self.max_disparity = max_disparity
+        self.poll_interval_s = poll_interval_s
+
+    @property
+    def streams(self):
+        return list(self.queues)
+
+    def read(self, stream, timeout_s):
+        # Polls the non-blocking queue, as a blocking `get` could not be interrupted when stopping.
+        deadline = time.perf_counter() + timeout_s
+        while (message := self.queues[stream].tryGet()) is None:
+            if time.perf_counter() >= deadline:
+                return None
+            time.sleep(self.poll_interval_s)
+
+        if stream == "rgb":
+            return message.getCvFrame()
+        frame = message.getFrame()
+        if stream == "disparity":
+            frame = (frame * (255 / self.max_disparity)).astype(np.uint8)
+            frame = cv2.applyColorMap(frame, cv2.COLORMAP_JET)
+        return frame
+
+
 class OakDProDevice():
-    def __init__(self, mxid=None):
+    """OAK-D Pro camera whose frames are captured, and run through the RT-DETR detector, in background threads.
 
-        model_file_path_ = f"/home/mailroom/lerobot/src/lerobot/teleoperators/keyboard/model_5_rtdetr"
-        self.processor = AutoImageProcessor.from_pretrained(
-            model_file_path_,
-        )
-        self.model = AutoModelForObjectDetection.from_pretrained(
-            model_file_path_,
-        ).to("cpu")
-        self.custom_threshold = 0.35
+    `run` and `latest_detections` return the latest frames and detections without waiting, so neither the
+    detection nor the device queues throttle the caller. Pass `detector=None` to only capture frames. By default,
+    the detector runs the fp32 model with the Hugging Face processing, see `RTDetrDetector` for the faster CPU
+    paths, to measure with `benchmarks/teleoperators/run_rtdetr_benchmark.py` before using them.
+    """
+
+    def __init__(self, mxid=None, detector="rtdetr", detector_backend="fp32", detector_processing="hf"):
+
+        if detector == "rtdetr":
+            detector = RTDetrDetector(backend=detector_backend, processing=detector_processing)
+        self.detector = detector
 
         self.frame = None
         self.disparity = None
@@ -87,6 +122,18 @@ class OakDProDevice():
         self.depthQueue = self.device.getOutputQueue(name="depth", maxSize=4, blocking=False)
         self.dispQ = self.device.getOutputQueue(name="disp", maxSize=4, blocking=False)
 
+        self.frame_source = OakDFrameSource(
+            {"rgb": self.q_rgb, "depth": self.depthQueue, "disparity": self.dispQ},
+            max_disparity=self.stereo.initialConfig.getMaxDisparity(),
+        )
+        self.frame_pipeline = FramePipeline(self.frame_source, self.detector, detection_stream="rgb", crop=self.od_calibration)
+
+    def start(self):
+        self.frame_pipeline.start()
+
+    def stop(self):
+        self.frame_pipeline.stop()
+
     def oak_device(self):
         return self.device
     
@@ -94,51 +141,40 @@ class OakDProDevice():
         return self.depth_width, self.depth_height, self.rgb_width, self.rgb_height
 
     def run(self):
-        in_rgb = self.q_rgb.tryGet()
-
-        if in_rgb is not None:
-            self.frame = in_rgb.getCvFrame()
-            self.od_rgb = self.frame[self.od_calibration[0][1]:self.od_calibration[1][1], 
-                                  self.od_calibration[0][0]:self.od_calibration[1][0]]
-            cv2.imshow('frame', self.od_rgb)
-            results = self.rtdetr_detections([self.od_rgb])
-            print(results)
-        cv2.waitKey(1)
-
-        in_depthData = self.depthQueue.get()
-        in_disparityData = self.dispQ.get() #.getFrame()
+        """Returns the latest color frame, color-mapped disparity and depth, or None for those not received yet."""
+        if not self.frame_pipeline.is_running:
+            self.start()
 
-        if in_depthData is not None:
-            self.depth = in_depthData
+        frames = [self.frame_pipeline.latest(stream) for stream in ("rgb", "disparity", "depth")]
+        self.frame, self.disparity, self.depth = [None if frame is None else frame.frame for frame in frames]
+        return self.frame, self.disparity, self.depth
 
-        if in_disparityData is not None:
-            self.disparity = in_disparityData.getFrame()
+    def latest_detections(self):
+        """Returns the latest `Detections` of the calibrated crop of the color frame, without waiting."""
+        return self.frame_pipeline.latest_detections()
 
-        if self.disparity is not None:
-            self.disparity = (self.disparity * (255 / self.stereo.initialConfig.getMaxDisparity())).astype(np.uint8)
-            self.disparity = cv2.applyColorMap(self.disparity, cv2.COLORMAP_JET)
-        
-        return self.frame, self.disparity, in_depthData
-    
-     # Detect with Real Time Model
+    # Detect with Real Time Model
     def rtdetr_detections(self, frames: List):
-        inputs = self.processor(images=frames, return_tensors="pt").to("cpu")
-
-        with torch.no_grad():
-            outputs = self.model(**inputs)
+        return self.detector(frames)
 
-        target_sizes = [(frame.shape[0], frame.shape[1]) for frame in frames]
 
-        results = self.processor.post_process_object_detection(
-            outputs, target_sizes=target_sizes, threshold=self.custom_threshold)
-
-        return results
-        
-        
 def main(args=None):
     oak = OakDProDevice('18443010D1AEAC0F00')
-    while True:
-         oak.run()
+    oak.start()
+    last_sequence = 0
+    try:
+        while True:
+            frame, _, _ = oak.run()
+            if frame is not None:
+                (x_min, y_min), (x_max, y_max) = oak.od_calibration
+                cv2.imshow('frame', frame[y_min:y_max, x_min:x_max])
+            detections = oak.latest_detections()
+            if detections is not None and detections.sequence != last_sequence:
+                last_sequence = detections.sequence
+                print(detections.results)
+            cv2.waitKey(1)
+    finally:
+        oak.stop()
 
     
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""RT-DETR object detector with CPU inference backends.
+
+The reference path pre- and post-processes the frames with the Hugging Face image processor. The "numpy"
+processing does it with OpenCV and NumPy, see `lerobot.utils.rtdetr_processing`. The model runs with one of
+the backends:
+- "fp32": the PyTorch model,
+- "int8": the PyTorch model with the weights of its linear layers dynamically quantized to int8,
+- "onnx": the model exported to ONNX and run by ONNX Runtime,
+- "onnx_int8": the exported model dynamically quantized to int8 by ONNX Runtime.
+"""
+
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+from transformers import AutoImageProcessor, AutoModelForObjectDetection
+
+from lerobot.utils.rtdetr_processing import RTDetrPreprocessor, post_process_detections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = "/home/mailroom/lerobot/src/lerobot/teleoperators/keyboard/model_5_rtdetr"
+BACKENDS = ("fp32", "int8", "onnx", "onnx_int8")
+PROCESSINGS = ("hf", "numpy")
+
+
+class _LogitsAndBoxes(torch.nn.Module):
+    """Returns the outputs used by the post-processing as a tuple, to export the model to ONNX."""
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, pixel_values: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        outputs = self.model(pixel_values=pixel_values)
+        return outputs.logits, outputs.pred_boxes
+
+
+class RTDetrDetector:
+    """RT-DETR object detector, called with a batch of frames and returning the detections of each frame.
+
+    Each detection is a dict of "scores", "labels" and "boxes" arrays, the boxes being (x_min, y_min, x_max,
+    y_max) in the pixels of the frame.
+
+    Args:
+        model_path: Directory of the pretrained model and of its image processor.
+        threshold: Minimum score of the detections.
+        backend: One of `BACKENDS`.
+        processing: "hf" for the image processor of the model, "numpy" for `RTDetrPreprocessor` and
+            `post_process_detections`.
+        max_batch_size: Batch size the preprocessing is preallocated for, e.g. the number of cameras.
+        onnx_path: Where the exported ONNX model is stored, next to the model by default. The model is
+            exported if the file does not exist.
+        num_threads: Number of threads of ONNX Runtime, all the cores by default.
+    """
+
+    def __init__(
+        self,
+        model_path: str | Path = DEFAULT_MODEL_PATH,
+        threshold: float = 0.35,
+        backend: str = "fp32",
+        processing: str = "hf",
+        max_batch_size: int = 1,
+        onnx_path: str | Path | None = None,
+        num_threads: int | None = None,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"`backend` must be one of {BACKENDS}, got '{backend}'.")
+        if processing not in PROCESSINGS:
+            raise ValueError(f"`processing` must be one of {PROCESSINGS}, got '{processing}'.")
+        self.threshold = threshold
+        self.backend = backend
+        self.processing = processing
+
+        self.processor = AutoImageProcessor.from_pretrained(model_path)
+        self.preprocessor = RTDetrPreprocessor.from_image_processor(self.processor, max_batch_size)
+        self.model = AutoModelForObjectDetection.from_pretrained(model_path).to("cpu").eval()
+        if backend == "int8":
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+        self.session = None
+        if backend.startswith("onnx"):
+            onnx_path = Path(model_path) / "model.onnx" if onnx_path is None else Path(onnx_path)
+            self.session = self._make_onnx_session(
+                onnx_path, quantize=backend == "onnx_int8", num_threads=num_threads
+            )
+
+    def _make_onnx_session(self, onnx_path: Path, quantize: bool, num_threads: int | None):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError(
+                "The ONNX backends require onnxruntime, install it with `pip install onnxruntime`."
+            ) from e
+
+        if not onnx_path.exists():
+            logger.info(f"Exporting the model to {onnx_path}")
+            dummy = torch.from_numpy(self.preprocessor.pixel_values[:1].copy())
+            torch.onnx.export(
+                _LogitsAndBoxes(self.model),
+                (dummy,),
+                str(onnx_path),
+                input_names=["pixel_values"],
+                output_names=["logits", "pred_boxes"],
+                dynamic_axes={
+                    "pixel_values": {0: "batch"},
+                    "logits": {0: "batch"},
+                    "pred_boxes": {0: "batch"},
+                },
+                opset_version=17,
+            )
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantized_path = onnx_path.with_name(f"{onnx_path.stem}_int8.onnx")
+            if not quantized_path.exists():
+                logger.info(f"Quantizing the ONNX model to {quantized_path}")
+                quantize_dynamic(onnx_path, quantized_path, weight_type=QuantType.QInt8)
+            onnx_path = quantized_path
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads is not None:
+            options.intra_op_num_threads = num_threads
+        return onnxruntime.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+
+    def _infer(self, pixel_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self.session is not None:
+            return tuple(self.session.run(["logits", "pred_boxes"], {"pixel_values": pixel_values}))
+        with torch.inference_mode():
+            outputs = self.model(pixel_values=torch.from_numpy(pixel_values))
+        return outputs.logits.numpy(), outputs.pred_boxes.numpy()
+
+    def __call__(self, frames: Sequence[np.ndarray]) -> list[dict[str, np.ndarray]]:
+        target_sizes = [(frame.shape[0], frame.shape[1]) for frame in frames]
+        if self.processing == "numpy":
+            logits, pred_boxes = self._infer(self.preprocessor(frames))
+            return post_process_detections(logits, pred_boxes, target_sizes, self.threshold)
+
+        pixel_values = self.processor(images=list(frames), return_tensors="np")["pixel_values"]
+        logits, pred_boxes = self._infer(pixel_values)
+        outputs = SimpleNamespace(logits=torch.from_numpy(logits), pred_boxes=torch.from_numpy(pred_boxes))
+        results = self.processor.post_process_object_detection(
+            outputs, target_sizes=target_sizes, threshold=self.threshold
+        )
+        return [{key: value.numpy() for key, value in result.items()} for result in results]
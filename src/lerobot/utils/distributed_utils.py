@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Helpers for multi-process data-parallel training.
+
+Processes are expected to be launched with `torchrun`, which sets the `RANK`, `LOCAL_RANK` and `WORLD_SIZE`
+environment variables, e.g.:
+
+```bash
+torchrun --nproc_per_node=2 -m lerobot.scripts.lerobot_train --policy.type=act ...
+```
+
+When these variables are not set, every helper falls back to single-process behavior.
+"""
+
+import logging
+import os
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+import torch
+import torch.distributed as dist
+
+
+def get_world_size() -> int:
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_world_size()
+    return int(os.environ.get("WORLD_SIZE", 1))
+
+
+def get_rank() -> int:
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_rank()
+    return int(os.environ.get("RANK", 0))
+
+
+def get_local_rank() -> int:
+    return int(os.environ.get("LOCAL_RANK", 0))
+
+
+def is_distributed() -> bool:
+    return get_world_size() > 1
+
+
+def is_main_process() -> bool:
+    return get_rank() == 0
+
+
+def init_distributed(device: torch.device, backend: str | None = None) -> torch.device:
+    """Initializes the default process group when launched with multiple processes.
+
+    Args:
+        device: The device requested for training. On cuda, each process is pinned to the gpu matching its
+            local rank.
+        backend: The `torch.distributed` backend to use. Defaults to "nccl" on cuda and "gloo" otherwise.
+
+    Returns:
+        torch.device: The device this process should train on.
+    """
+    if not is_distributed():
+        return device
+
+    if device.type == "cuda":
+        torch.cuda.set_device(get_local_rank())
+        device = torch.device("cuda", get_local_rank())
+    elif device.type == "mps":
+        raise ValueError("Distributed training is not supported on mps.")
+
+    if backend is None:
+        backend = "nccl" if device.type == "cuda" else "gloo"
+
+    if not dist.is_initialized():
+        dist.init_process_group(backend=backend)
+    logging.info(f"Initialized process group: {backend=} rank={get_rank()} world_size={get_world_size()}")
+    return device
+
+
+def cleanup_distributed() -> None:
+    if dist.is_available() and dist.is_initialized():
+        dist.destroy_process_group()
+
+
+def barrier() -> None:
+    if dist.is_available() and dist.is_initialized():
+        dist.barrier()
+
+
+def broadcast_object(obj: Any, src: int = 0) -> Any:
+    """Returns the (picklable) `obj` of process `src` on every process."""
+    if not (dist.is_available() and dist.is_initialized()):
+        return obj
+    objects = [obj]
+    dist.broadcast_object_list(objects, src=src)
+    return objects[0]
+
+
+@contextmanager
+def main_process_first() -> Generator[None, None, None]:
+    """Lets the main process run the enclosed block (e.g. downloading a dataset) before the other processes."""
+    if not is_main_process():
+        barrier()
+    try:
+        yield
+    finally:
+        if is_main_process():
+            barrier()
@@ -15,6 +15,8 @@
 # limitations under the License.
 from typing import Any
 
+import torch
+
 from lerobot.utils.utils import format_big_number
 
 
@@ -22,6 +24,10 @@ class AverageMeter:
     """
     Computes and stores the average and current value
     Adapted from https://github.com/pytorch/examples/blob/main/imagenet/main.py
+
+    Values can be passed either as python numbers or as (possibly on-device) scalar tensors. Tensors are
+    accumulated on their device and only synchronized with the host when `val`, `sum` or `avg` are read (e.g.
+    when logging), which avoids a device synchronization (`tensor.item()`) on every update.
     """
 
     def __init__(self, name: str, fmt: str = ":f"):
@@ -30,20 +36,50 @@ class AverageMeter:
         self.reset()
 
     def reset(self) -> None:
-        self.val = 0.0
-        self.avg = 0.0
-        self.sum = 0.0
+        self._val = 0.0
+        self._sum = 0.0
         self.count = 0.0
-
-    def update(self, val: float, n: int = 1) -> None:
-        self.val = val
-        self.sum += val * n
+        self._pending_val: torch.Tensor | None = None
+        self._pending_sum: torch.Tensor | None = None
+
+    def update(self, val: float | torch.Tensor, n: int = 1) -> None:
+        if isinstance(val, torch.Tensor):
+            val = val.detach()
+            self._pending_val = val
+            self._pending_sum = val * n if self._pending_sum is None else self._pending_sum + val * n
+        else:
+            self.sync()
+            self._val = val
+            self._sum += val * n
         self.count += n
-        self.avg = self.sum / self.count
+
+    def sync(self) -> None:
+        """Folds the pending on-device values into the host-side statistics."""
+        if self._pending_sum is None:
+            return
+        pending_sum, pending_val = torch.stack([self._pending_sum, self._pending_val]).float().tolist()
+        self._sum += pending_sum
+        self._val = pending_val
+        self._pending_val = None
+        self._pending_sum = None
+
+    @property
+    def val(self) -> float:
+        self.sync()
+        return self._val
+
+    @property
+    def sum(self) -> float:
+        self.sync()
+        return self._sum
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count if self.count else 0.0
 
     def __str__(self):
         fmtstr = "{name}:{avg" + self.fmt + "}"
-        return fmtstr.format(**self.__dict__)
+        return fmtstr.format(name=self.name, avg=self.avg)
 
 
 class MetricsTracker:
@@ -0,0 +1,246 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import numpy as np
+
+MISSED_TICK_POLICIES = ("skip", "catch_up")
+
+
+class TimingHistogram:
+    """Fixed-size histogram of durations, with logarithmic bins.
+
+    Durations are counted in `bins_per_decade` bins per decade between `min_s` and `max_s`, plus one underflow
+    and one overflow bin, so recording is O(1) and the memory does not grow with the length of the loop. The
+    exact count, sum and maximum are kept alongside, and percentiles are estimated by the upper edge of the bin
+    they fall in.
+    """
+
+    def __init__(self, min_s: float = 1e-5, max_s: float = 10.0, bins_per_decade: int = 10):
+        self.min_s = min_s
+        self.bins_per_decade = bins_per_decade
+        self._log_min = math.log10(min_s)
+        num_bins = math.ceil((math.log10(max_s) - self._log_min) * bins_per_decade)
+        # Upper edges of the bins, the last one is the overflow bin.
+        self.edges = np.append(
+            min_s * 10 ** (np.arange(num_bins + 1) / bins_per_decade),
+            np.inf,
+        )
+        self.counts = np.zeros(len(self.edges), dtype=np.int64)
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, duration_s: float) -> None:
+        if duration_s < self.min_s:
+            index = 0
+        else:
+            index = min(
+                math.ceil((math.log10(duration_s) - self._log_min) * self.bins_per_decade),
+                len(self.counts) - 1,
+            )
+        self.counts[index] += 1
+        self.count += 1
+        self.total_s += duration_s
+        self.max_s = max(self.max_s, duration_s)
+
+    def reset(self) -> None:
+        self.counts[:] = 0
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the `q`-th percentile (0 < q <= 100), capped by the maximum."""
+        if self.count == 0:
+            return 0.0
+        index = int(np.searchsorted(np.cumsum(self.counts), q / 100 * self.count))
+        return min(float(self.edges[index]), self.max_s)
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_s": self.mean_s,
+            "p50_s": self.percentile(50),
+            "p99_s": self.percentile(99),
+            "max_s": self.max_s,
+        }
+
+
+@dataclass
+class LoopStats:
+    """Timing statistics of a control loop, as returned by `LoopScheduler.stats`.
+
+    `jitter` is the distribution of how late the loop woke up after a deadline it waited for, and
+    `overruns` counts the ticks whose work ended after their deadline. `skipped_ticks` counts the ticks
+    dropped by the "skip" policy. `max_timestamp_error_s` is the largest difference between the start of a
+    tick and `tick_index / fps`, the timestamp a dataset records for it.
+    """
+
+    fps: float
+    num_ticks: int
+    elapsed_s: float
+    jitter: dict[str, float]
+    overruns: int
+    max_overrun_s: float
+    skipped_ticks: int
+    max_timestamp_error_s: float
+    phases: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        items = [
+            f"ticks:{self.num_ticks}",
+            f"fps:{self.num_ticks / self.elapsed_s if self.elapsed_s > 0 else 0.0:.1f}/{self.fps:g}",
+            f"jitter p50:{self.jitter['p50_s'] * 1e3:.3f}ms p99:{self.jitter['p99_s'] * 1e3:.3f}ms "
+            f"max:{self.jitter['max_s'] * 1e3:.3f}ms",
+            f"overruns:{self.overruns} (max {self.max_overrun_s * 1e3:.2f}ms)",
+            f"skipped:{self.skipped_ticks}",
+            f"timestamp error:{self.max_timestamp_error_s * 1e3:.2f}ms",
+        ]
+        for name, phase in self.phases.items():
+            items.append(f"{name} mean:{phase['mean_s'] * 1e3:.2f}ms p99:{phase['p99_s'] * 1e3:.2f}ms")
+        return ", ".join(items)
+
+
+class LoopScheduler:
+    """Paces a control loop on absolute deadlines and records its timings.
+
+    Tick `k` is due at `start + k / fps`. `wait` sleeps until the next deadline, then spins for the last
+    `spin_s` seconds since `time.sleep` may overshoot, so an overrun delays one tick instead of shifting all
+    the following ones. A tick whose deadline has passed starts right away. When several deadlines have
+    passed, the "skip" policy drops the missed ticks so that the next one is due on the following deadline,
+    while the "catch_up" policy runs the missed ticks back-to-back until the loop is on time again.
+
+    Example:
+        ```python
+        scheduler = LoopScheduler(fps=30)
+        scheduler.start()
+        while scheduler.elapsed_s < duration_s:
+            with scheduler.phase("observation"):
+                obs = robot.get_observation()
+            ...
+            scheduler.wait()
+        logging.info(scheduler.stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        missed_ticks: str = "skip",
+        spin_s: float = 0.002,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if fps <= 0:
+            raise ValueError(f"`fps` must be positive, got {fps}.")
+        if missed_ticks not in MISSED_TICK_POLICIES:
+            raise ValueError(f"`missed_ticks` must be one of {MISSED_TICK_POLICIES}, got '{missed_ticks}'.")
+        self.fps = fps
+        self.period_s = 1.0 / fps
+        self.missed_ticks = missed_ticks
+        self.spin_s = spin_s
+        self._clock = clock
+        self._sleep = sleep
+
+        self.jitter = TimingHistogram()
+        self.phases: dict[str, TimingHistogram] = {}
+        self.start()
+
+    def start(self) -> None:
+        """Starts a new episode: the first tick is due now and the statistics are reset."""
+        self.start_t = self._clock()
+        self.tick_index = 0
+        self._deadline_index = 1
+        self.jitter.reset()
+        for histogram in self.phases.values():
+            histogram.reset()
+        self.overruns = 0
+        self.max_overrun_s = 0.0
+        self.skipped_ticks = 0
+        self.max_timestamp_error_s = 0.0
+
+    @property
+    def elapsed_s(self) -> float:
+        return self._clock() - self.start_t
+
+    @property
+    def next_deadline(self) -> float:
+        return self.start_t + self._deadline_index * self.period_s
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Records the duration of the enclosed block in the histogram of the phase `name`."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            if name not in self.phases:
+                self.phases[name] = TimingHistogram()
+            self.phases[name].record(self._clock() - start)
+
+    def wait(self) -> float:
+        """Waits until the start of the next tick and returns its time, as given by the clock."""
+        deadline = self.next_deadline
+        now = self._clock()
+        if now > deadline:
+            # The tick starts late, right away.
+            self.overruns += 1
+            self.max_overrun_s = max(self.max_overrun_s, now - deadline)
+            if self.missed_ticks == "skip":
+                # Drops the ticks whose deadline has passed as well, to stay on the grid.
+                missed = int((now - deadline) / self.period_s)
+                self.skipped_ticks += missed
+                self._deadline_index += missed
+        else:
+            now = self._sleep_until(deadline)
+        self._deadline_index += 1
+
+        self.tick_index += 1
+        # A dataset records `tick_index / fps` as the timestamp of the tick that starts now.
+        self.max_timestamp_error_s = max(
+            self.max_timestamp_error_s, abs(now - self.start_t - self.tick_index * self.period_s)
+        )
+        return now
+
+    def _sleep_until(self, deadline: float) -> float:
+        remaining = deadline - self._clock() - self.spin_s
+        if remaining > 0:
+            self._sleep(remaining)
+        while (now := self._clock()) < deadline:
+            pass
+        self.jitter.record(now - deadline)
+        return now
+
+    def stats(self) -> LoopStats:
+        return LoopStats(
+            fps=self.fps,
+            num_ticks=self.tick_index,
+            elapsed_s=self.elapsed_s,
+            jitter=self.jitter.summary(),
+            overruns=self.overruns,
+            max_overrun_s=self.max_overrun_s,
+            skipped_ticks=self.skipped_ticks,
+            max_timestamp_error_s=self.max_timestamp_error_s,
+            phases={name: histogram.summary() for name, histogram in self.phases.items()},
+        )
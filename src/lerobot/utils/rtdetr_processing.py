@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""NumPy pre- and post-processing of the RT-DETR object detector, without the image processor of transformers.
+
+The frames are resized and rescaled with OpenCV and NumPy into a preallocated input batch at the fixed input
+resolution of the model, and the outputs of the model are post-processed in NumPy.
+"""
+
+from collections.abc import Sequence
+
+import cv2
+import numpy as np
+
+
+class RTDetrPreprocessor:
+    """Resizes and rescales frames into a preallocated batch, as the RT-DETR image processor does.
+
+    The frames are resized to the fixed input resolution of the model with bilinear interpolation, and their
+    channels are kept in order, so the batch matches the one of the image processor up to interpolation.
+    """
+
+    def __init__(
+        self,
+        height: int = 640,
+        width: int = 640,
+        max_batch_size: int = 1,
+        rescale_factor: float = 1 / 255,
+        image_mean: Sequence[float] | None = None,
+        image_std: Sequence[float] | None = None,
+    ):
+        self.height = height
+        self.width = width
+        mean = np.zeros(3) if image_mean is None else np.asarray(image_mean, dtype=np.float64)
+        std = np.ones(3) if image_std is None else np.asarray(image_std, dtype=np.float64)
+        # (x * rescale_factor - mean) / std, as a single multiply-add per pixel.
+        self._scale = (rescale_factor / std).astype(np.float32)[:, None, None]
+        self._offset = (-mean / std).astype(np.float32)[:, None, None]
+        self._resized = np.empty((height, width, 3), dtype=np.uint8)
+        self.pixel_values = np.empty((max_batch_size, 3, height, width), dtype=np.float32)
+
+    @classmethod
+    def from_image_processor(cls, processor, max_batch_size: int = 1) -> "RTDetrPreprocessor":
+        return cls(
+            height=processor.size["height"],
+            width=processor.size["width"],
+            max_batch_size=max_batch_size,
+            rescale_factor=processor.rescale_factor if processor.do_rescale else 1.0,
+            image_mean=processor.image_mean if processor.do_normalize else None,
+            image_std=processor.image_std if processor.do_normalize else None,
+        )
+
+    def __call__(self, frames: Sequence[np.ndarray]) -> np.ndarray:
+        """Returns the batch of the frames, a view of `pixel_values` overwritten by the next call."""
+        if len(frames) > len(self.pixel_values):
+            self.pixel_values = np.empty((len(frames), *self.pixel_values.shape[1:]), dtype=np.float32)
+        for frame, pixel_values in zip(frames, self.pixel_values, strict=False):
+            cv2.resize(frame, (self.width, self.height), dst=self._resized, interpolation=cv2.INTER_LINEAR)
+            np.multiply(self._resized.transpose(2, 0, 1), self._scale, out=pixel_values)
+            pixel_values += self._offset
+        return self.pixel_values[: len(frames)]
+
+
+def post_process_detections(
+    logits: np.ndarray, pred_boxes: np.ndarray, target_sizes: Sequence[tuple[int, int]], threshold: float
+) -> list[dict[str, np.ndarray]]:
+    """NumPy version of `RTDetrImageProcessor.post_process_object_detection`, with the focal loss scores.
+
+    Keeps the `num_queries` best (query, class) pairs of each frame whose score is above `threshold`, sorted
+    by decreasing score, with their boxes as (x_min, y_min, x_max, y_max) in the pixels of the frame.
+    """
+    batch_size, num_queries, num_classes = logits.shape
+    scores = 1 / (1 + np.exp(-logits.reshape(batch_size, -1)))
+    results = []
+    for frame_scores, boxes, (height, width) in zip(scores, pred_boxes, target_sizes, strict=True):
+        top = np.argpartition(-frame_scores, num_queries - 1)[:num_queries]
+        top = top[frame_scores[top] > threshold]
+        top = top[np.argsort(-frame_scores[top], kind="stable")]
+        center_x, center_y, box_w, box_h = boxes[top // num_classes].T
+        corners = np.stack(
+            [center_x - box_w / 2, center_y - box_h / 2, center_x + box_w / 2, center_y + box_h / 2], axis=-1
+        )
+        results.append(
+            {
+                "scores": frame_scores[top],
+                "labels": top % num_classes,
+                "boxes": corners * np.array([width, height, width, height], dtype=corners.dtype),
+            }
+        )
+    return results
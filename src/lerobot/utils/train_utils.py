@@ -13,14 +13,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import logging
+import os
+import shutil
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import torch
+from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from safetensors.torch import _remove_duplicate_names, save_file
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import LRScheduler
 
 from lerobot.configs.train import TrainPipelineConfig
-from lerobot.datasets.utils import load_json, write_json
-from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state
+from lerobot.datasets.utils import flatten_dict, load_json, write_json
+from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state, save_optimizer_state_dict
 from lerobot.optim.schedulers import load_scheduler_state, save_scheduler_state
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.processor import PolicyProcessorPipeline
@@ -28,10 +39,12 @@ from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
     PRETRAINED_MODEL_DIR,
+    RNG_STATE,
+    SCHEDULER_STATE,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
 )
-from lerobot.utils.random_utils import load_rng_state, save_rng_state
+from lerobot.utils.random_utils import load_rng_state, save_rng_state, serialize_rng_state
 
 
 def get_step_identifier(step: int, total_steps: int) -> str:
@@ -163,3 +176,205 @@ def load_training_state(
         scheduler = load_scheduler_state(scheduler, training_state_dir)
 
     return step, optimizer, scheduler
+
+
+def _snapshot_to_cpu(obj: Any, pin_memory: bool) -> Any:
+    """Recursively copies every tensor found in `obj` to (optionally pinned) CPU memory.
+
+    Copies from CUDA tensors are issued as non-blocking; callers must synchronize before reading them.
+    """
+    if isinstance(obj, torch.Tensor):
+        if obj.device.type == "cpu":
+            return obj.detach().clone()
+        host = torch.empty(obj.shape, dtype=obj.dtype, device="cpu", pin_memory=pin_memory and obj.is_cuda)
+        host.copy_(obj.detach(), non_blocking=pin_memory)
+        return host
+    if isinstance(obj, dict):
+        return {k: _snapshot_to_cpu(v, pin_memory) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_snapshot_to_cpu(v, pin_memory) for v in obj)
+    return copy.deepcopy(obj)
+
+
+def _snapshot_model_state(model: torch.nn.Module, pin_memory: bool) -> dict[str, torch.Tensor]:
+    """Snapshots a model's state dict the same way `safetensors.torch.save_model` would serialize it.
+
+    Tied/shared tensors are deduplicated on the live state dict, since sharing is lost once copied.
+    """
+    state_dict = model.state_dict()
+    to_removes = _remove_duplicate_names(state_dict)
+    for to_remove_group in to_removes.values():
+        for to_remove in to_remove_group:
+            del state_dict[to_remove]
+    return _snapshot_to_cpu(state_dict, pin_memory)
+
+
+class AsyncCheckpointer:
+    """Writes training checkpoints from a background thread.
+
+    `save()` only snapshots the state to be saved (policy weights, optimizer and scheduler state, rng state)
+    to host memory and writes the small config files, then returns to the training loop. The heavy
+    serialization happens on a single writer thread, into a temporary directory that is atomically renamed
+    to `checkpoint_dir` once complete, so that a partially written checkpoint is never visible. The "last"
+    checkpoint symlink is only updated after that rename.
+
+    At most `max_in_flight` checkpoints are pending at any time: further calls to `save()` block until the
+    oldest one has been written, which bounds the amount of host memory used by snapshots.
+
+    Call `wait()` (or `close()`) before exiting to make sure every pending checkpoint has been written.
+    """
+
+    def __init__(self, max_in_flight: int = 1, pin_memory: bool = True):
+        if max_in_flight < 1:
+            raise ValueError(f"`max_in_flight` must be at least 1, got {max_in_flight}.")
+        self.max_in_flight = max_in_flight
+        self.pin_memory = pin_memory and torch.cuda.is_available()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint_writer")
+        self._pending: deque[Future] = deque()
+
+    def save(
+        self,
+        checkpoint_dir: Path,
+        step: int,
+        cfg: TrainPipelineConfig,
+        policy: PreTrainedPolicy,
+        optimizer: Optimizer | dict[str, Optimizer] | None,
+        scheduler: LRScheduler | None = None,
+        preprocessor: PolicyProcessorPipeline | None = None,
+        postprocessor: PolicyProcessorPipeline | None = None,
+        extra_writers: list[Callable[[Path], None]] | None = None,
+        on_complete: Callable[[Path], None] | None = None,
+    ) -> Future:
+        """Snapshots the training state and schedules it to be written to `checkpoint_dir`.
+
+        The resulting directory structure is identical to the one produced by `save_checkpoint`.
+
+        Args:
+            checkpoint_dir (Path): The final checkpoint directory.
+            step (int): The training step at that checkpoint.
+            cfg (TrainPipelineConfig): The training config used for this run.
+            policy (PreTrainedPolicy): The policy to save.
+            optimizer: The optimizer (or dict of optimizers) to save the state from.
+            scheduler (LRScheduler | None, optional): The scheduler to save the state from. Defaults to None.
+            preprocessor: The preprocessor/pipeline to save. Defaults to None.
+            postprocessor: The postprocessor/pipeline to save. Defaults to None.
+            extra_writers: Optional callables run on the writer thread with the temporary checkpoint directory,
+                before it is renamed, to add extra files to the checkpoint.
+            on_complete: Optional callable run on the writer thread with `checkpoint_dir` once the checkpoint
+                is complete and the "last" symlink has been updated (e.g. to upload it).
+
+        Returns:
+            Future: A future resolved once the checkpoint has been fully written.
+        """
+        self._wait_for_slot()
+
+        tmp_dir = checkpoint_dir.parent / f".{checkpoint_dir.name}.tmp"
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        pretrained_dir = tmp_dir / PRETRAINED_MODEL_DIR
+        pretrained_dir.mkdir(parents=True)
+
+        # Cheap, json-only artifacts are written right away.
+        policy.config._save_pretrained(pretrained_dir)
+        cfg.save_pretrained(pretrained_dir)
+        if preprocessor is not None:
+            preprocessor.save_pretrained(pretrained_dir)
+        if postprocessor is not None:
+            postprocessor.save_pretrained(pretrained_dir)
+
+        model = policy.module if hasattr(policy, "module") else policy
+        model_state = _snapshot_model_state(model, self.pin_memory)
+        if isinstance(optimizer, dict):
+            optimizer_state = {
+                name: _snapshot_to_cpu(opt.state_dict(), self.pin_memory) for name, opt in optimizer.items()
+            }
+        elif optimizer is not None:
+            optimizer_state = _snapshot_to_cpu(optimizer.state_dict(), self.pin_memory)
+        else:
+            optimizer_state = None
+        scheduler_state = copy.deepcopy(scheduler.state_dict()) if scheduler is not None else None
+        rng_state = flatten_dict(serialize_rng_state())
+
+        copy_done = None
+        if self.pin_memory:
+            copy_done = torch.cuda.Event()
+            copy_done.record()
+
+        future = self._executor.submit(
+            self._write,
+            tmp_dir,
+            checkpoint_dir,
+            step,
+            model_state,
+            optimizer_state,
+            scheduler_state,
+            rng_state,
+            copy_done,
+            extra_writers or [],
+            on_complete,
+        )
+        self._pending.append(future)
+        return future
+
+    def _wait_for_slot(self) -> None:
+        while self._pending and self._pending[0].done():
+            self._pending.popleft().result()
+        while len(self._pending) >= self.max_in_flight:
+            self._pending.popleft().result()
+
+    @staticmethod
+    def _write(
+        tmp_dir: Path,
+        checkpoint_dir: Path,
+        step: int,
+        model_state: dict[str, torch.Tensor],
+        optimizer_state: dict | None,
+        scheduler_state: dict | None,
+        rng_state: dict[str, torch.Tensor],
+        copy_done: "torch.cuda.Event | None",
+        extra_writers: list[Callable[[Path], None]],
+        on_complete: Callable[[Path], None] | None,
+    ) -> Path:
+        if copy_done is not None:
+            copy_done.synchronize()
+
+        save_file(model_state, tmp_dir / PRETRAINED_MODEL_DIR / SAFETENSORS_SINGLE_FILE, {"format": "pt"})
+
+        save_dir = tmp_dir / TRAINING_STATE_DIR
+        save_dir.mkdir(parents=True, exist_ok=True)
+        save_training_step(step, save_dir)
+        save_file(rng_state, save_dir / RNG_STATE)
+        if optimizer_state is not None and "param_groups" not in optimizer_state:
+            # Dictionary of optimizers, mirrors `save_optimizer_state`
+            for name, state in optimizer_state.items():
+                optimizer_dir = save_dir / name
+                optimizer_dir.mkdir(exist_ok=True, parents=True)
+                save_optimizer_state_dict(state, optimizer_dir)
+        elif optimizer_state is not None:
+            save_optimizer_state_dict(optimizer_state, save_dir)
+        if scheduler_state is not None:
+            write_json(scheduler_state, save_dir / SCHEDULER_STATE)
+
+        for writer in extra_writers:
+            writer(tmp_dir)
+
+        if checkpoint_dir.exists():
+            shutil.rmtree(checkpoint_dir)
+        os.replace(tmp_dir, checkpoint_dir)
+        update_last_checkpoint(checkpoint_dir)
+        logging.info(f"Checkpoint written to {checkpoint_dir}")
+
+        if on_complete is not None:
+            on_complete(checkpoint_dir)
+        return checkpoint_dir
+
+    def wait(self) -> None:
+        """Blocks until every pending checkpoint has been written, re-raising any error from the writer."""
+        while self._pending:
+            self._pending.popleft().result()
+
+    def close(self) -> None:
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
@@ -104,6 +104,14 @@ def is_amp_available(device: str):
         raise ValueError(f"Unknown device '{device}.")
 
 
+def synchronize_device(device: torch.device) -> None:
+    """Waits for all queued work on `device` to complete. No-op on cpu."""
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elif device.type == "mps":
+        torch.mps.synchronize()
+
+
 def init_logging(
     log_file: Path | None = None,
     display_pid: bool = False,
@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import numbers
 import os
+import time
+from collections import deque
+from threading import Condition, Thread
 from typing import Any
 
+import cv2
 import numpy as np
 import rerun as rr
 
@@ -40,27 +45,13 @@ def _is_scalar(x):
     )
 
 
-def log_rerun_data(
+def _split_rerun_data(
     observation: dict[str, Any] | None = None,
     action: dict[str, Any] | None = None,
-) -> None:
-    """
-    Logs observation and action data to Rerun for real-time visualization.
-
-    This function iterates through the provided observation and action dictionaries and sends their contents
-    to the Rerun viewer. It handles different data types appropriately:
-    - Scalar values (floats, ints) are logged as `rr.Scalar`.
-    - 3D NumPy arrays that resemble images (e.g., with 1, 3, or 4 channels first) are transposed
-      from CHW to HWC format and logged as `rr.Image`.
-    - 1D NumPy arrays are logged as a series of individual scalars, with each element indexed.
-    - Other multi-dimensional arrays are flattened and logged as individual scalars.
-
-    Keys are automatically namespaced with "observation." or "action." if not already present.
-
-    Args:
-        observation: An optional dictionary containing observation data to log.
-        action: An optional dictionary containing action data to log.
-    """
+) -> tuple[dict[str, float], dict[str, np.ndarray]]:
+    """Splits observation and action data into namespaced scalars and HWC images, see `log_rerun_data`."""
+    scalars = {}
+    images = {}
     if observation:
         for k, v in observation.items():
             if v is None:
@@ -68,7 +59,7 @@ def log_rerun_data(
             key = k if str(k).startswith(OBS_PREFIX) else f"{OBS_STR}.{k}"
 
             if _is_scalar(v):
-                rr.log(key, rr.Scalar(float(v)))
+                scalars[key] = float(v)
             elif isinstance(v, np.ndarray):
                 arr = v
                 # Convert CHW -> HWC when needed
@@ -76,9 +67,9 @@ def log_rerun_data(
                     arr = np.transpose(arr, (1, 2, 0))
                 if arr.ndim == 1:
                     for i, vi in enumerate(arr):
-                        rr.log(f"{key}_{i}", rr.Scalar(float(vi)))
+                        scalars[f"{key}_{i}"] = float(vi)
                 else:
-                    rr.log(key, rr.Image(arr), static=True)
+                    images[key] = arr
 
     if action:
         for k, v in action.items():
@@ -87,13 +78,185 @@ def log_rerun_data(
             key = k if str(k).startswith("action.") else f"action.{k}"
 
             if _is_scalar(v):
-                rr.log(key, rr.Scalar(float(v)))
+                scalars[key] = float(v)
             elif isinstance(v, np.ndarray):
-                if v.ndim == 1:
-                    for i, vi in enumerate(v):
-                        rr.log(f"{key}_{i}", rr.Scalar(float(vi)))
-                else:
-                    # Fall back to flattening higher-dimensional arrays
-                    flat = v.flatten()
-                    for i, vi in enumerate(flat):
-                        rr.log(f"{key}_{i}", rr.Scalar(float(vi)))
+                # Fall back to flattening higher-dimensional arrays
+                for i, vi in enumerate(v.flatten()):
+                    scalars[f"{key}_{i}"] = float(vi)
+
+    return scalars, images
+
+
+def log_rerun_data(
+    observation: dict[str, Any] | None = None,
+    action: dict[str, Any] | None = None,
+) -> None:
+    """
+    Logs observation and action data to Rerun for real-time visualization.
+
+    This function iterates through the provided observation and action dictionaries and sends their contents
+    to the Rerun viewer. It handles different data types appropriately:
+    - Scalar values (floats, ints) are logged as `rr.Scalar`.
+    - 3D NumPy arrays that resemble images (e.g., with 1, 3, or 4 channels first) are transposed
+      from CHW to HWC format and logged as `rr.Image`.
+    - 1D NumPy arrays are logged as a series of individual scalars, with each element indexed.
+    - Other multi-dimensional arrays are flattened and logged as individual scalars.
+
+    Keys are automatically namespaced with "observation." or "action." if not already present.
+
+    Args:
+        observation: An optional dictionary containing observation data to log.
+        action: An optional dictionary containing action data to log.
+    """
+    scalars, images = _split_rerun_data(observation, action)
+    for key, value in scalars.items():
+        rr.log(key, rr.Scalar(value))
+    for key, image in images.items():
+        rr.log(key, rr.Image(image), static=True)
+
+
+class RerunSink:
+    """Logs control loop data to Rerun from a background thread, without ever blocking the control loop.
+
+    `log` only appends the data to a bounded queue, which drops the oldest entries when the background thread
+    can't keep up. The thread buffers the scalars and sends them every `flush_interval_s`, with one columnar
+    `rr.send_columns` per series on the "control_time" timeline instead of one `rr.log` per value. Images are
+    logged at most `image_fps` times per second, downscaled by `image_scale` and JPEG compressed with
+    `jpeg_quality` (`None` to keep them raw).
+
+    The numbers of entries dropped by the queue and of images skipped by the rate limit are counted in `dropped`
+    and `skipped_images`, and logged to the "rerun_sink" series.
+
+    Example:
+        ```python
+        init_rerun(session_name="recording")
+        sink = RerunSink(image_fps=10)
+        sink.start()
+        while recording:
+            ...
+            sink.log(observation=obs, action=action)
+        sink.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        image_fps: float = 10.0,
+        image_scale: float = 0.5,
+        jpeg_quality: int | None = 75,
+        flush_interval_s: float = 0.1,
+        max_queue_size: int = 8,
+    ):
+        self.image_period_s = 1.0 / image_fps if image_fps > 0 else float("inf")
+        self.image_scale = image_scale
+        self.jpeg_quality = jpeg_quality
+        self.flush_interval_s = flush_interval_s
+
+        self._queue: deque[tuple[float, dict[str, Any] | None, dict[str, Any] | None]] = deque(
+            maxlen=max_queue_size
+        )
+        self._condition = Condition()
+        self._thread: Thread | None = None
+        self._running = False
+        self.dropped = 0
+        self.skipped_images = 0
+
+        self._start_t = time.perf_counter()
+        self._last_image_t: dict[str, float] = {}
+        self._times: dict[str, list[float]] = {}
+        self._values: dict[str, list[float]] = {}
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = Thread(target=self._run, name="RerunSink", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Logs the queued data and stops the background thread."""
+        if self._thread is None:
+            return
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+        if self.dropped:
+            logging.warning(f"Rerun sink dropped {self.dropped} entries, the viewer could not keep up.")
+
+    def log(self, observation: dict[str, Any] | None = None, action: dict[str, Any] | None = None) -> None:
+        """Queues observation and action data to be logged, dropping the oldest queued data if the queue is full."""
+        with self._condition:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append((time.perf_counter(), observation, action))
+            self._condition.notify()
+
+    def _run(self) -> None:
+        next_flush_t = time.perf_counter() + self.flush_interval_s
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._queue or not self._running,
+                    timeout=max(next_flush_t - time.perf_counter(), 0),
+                )
+                entries = list(self._queue)
+                self._queue.clear()
+                running = self._running
+
+            for timestamp, observation, action in entries:
+                try:
+                    self._process(timestamp, observation, action)
+                except Exception as e:
+                    logging.warning(f"Rerun sink failed to log data: {e}")
+
+            if not running or time.perf_counter() >= next_flush_t:
+                self._flush()
+                next_flush_t = time.perf_counter() + self.flush_interval_s
+            if not running:
+                return
+
+    def _process(
+        self, timestamp: float, observation: dict[str, Any] | None, action: dict[str, Any] | None
+    ) -> None:
+        scalars, images = _split_rerun_data(observation, action)
+        control_t = timestamp - self._start_t
+        for key, value in scalars.items():
+            self._times.setdefault(key, []).append(control_t)
+            self._values.setdefault(key, []).append(value)
+
+        for key, image in images.items():
+            if timestamp - self._last_image_t.get(key, -float("inf")) < self.image_period_s:
+                self.skipped_images += 1
+                continue
+            self._last_image_t[key] = timestamp
+            rr.log(key, self._prepare_image(image), static=True)
+
+    def _prepare_image(self, image: np.ndarray) -> "rr.Image | rr.EncodedImage":
+        if self.image_scale != 1.0:
+            image = cv2.resize(
+                image, None, fx=self.image_scale, fy=self.image_scale, interpolation=cv2.INTER_AREA
+            )
+        rerun_image = rr.Image(image)
+        if self.jpeg_quality is not None and image.dtype == np.uint8 and image.shape[-1] in (1, 3):
+            return rerun_image.compress(jpeg_quality=self.jpeg_quality)
+        return rerun_image
+
+    def _flush(self) -> None:
+        control_t = time.perf_counter() - self._start_t
+        self._times.setdefault("rerun_sink.dropped", []).append(control_t)
+        self._values.setdefault("rerun_sink.dropped", []).append(float(self.dropped))
+        self._times.setdefault("rerun_sink.skipped_images", []).append(control_t)
+        self._values.setdefault("rerun_sink.skipped_images", []).append(float(self.skipped_images))
+
+        for key, times in self._times.items():
+            if not times:
+                continue
+            rr.send_columns(
+                key,
+                indexes=[rr.TimeSecondsColumn("control_time", times)],
+                columns=rr.Scalar.columns(scalar=self._values[key]),
+            )
+            self._times[key] = []
+            self._values[key] = []
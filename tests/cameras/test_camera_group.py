@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from threading import Condition, Timer
+
+import numpy as np
+import pytest
+
+from lerobot.cameras import Camera, CameraGroup
+
+
+class FakeCamera(Camera):
+    """Camera whose frames are pushed by the test, filled with their index."""
+
+    def __init__(self):
+        self.fps, self.width, self.height = 30, 4, 3
+        self._condition = Condition()
+        self._frames: list[tuple[np.ndarray, float]] = []
+        self._next = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    @staticmethod
+    def find_cameras():
+        return []
+
+    def connect(self, warmup: bool = True) -> None:
+        pass
+
+    def push(self, timestamp: float | None = None) -> None:
+        with self._condition:
+            frame = np.full((self.height, self.width, 3), len(self._frames), dtype=np.uint8)
+            self._frames.append((frame, time.perf_counter() if timestamp is None else timestamp))
+            self._condition.notify_all()
+
+    def read(self, color_mode=None) -> np.ndarray:
+        return self.async_read()
+
+    def async_read_with_timestamp(self, timeout_ms: float = 200) -> tuple[np.ndarray, float]:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._next < len(self._frames), timeout_ms / 1000):
+                raise TimeoutError
+            self._next += 1
+            return self._frames[self._next - 1]
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        return self.async_read_with_timestamp(timeout_ms)[0]
+
+    def disconnect(self) -> None:
+        pass
+
+
+def wait_collected(group: CameraGroup, num_frames: int) -> None:
+    deadline = time.perf_counter() + 1.0
+    while time.perf_counter() < deadline:
+        if all(len(frames) >= num_frames for frames in group._frames.values()):
+            return
+        time.sleep(0.001)
+    raise TimeoutError
+
+
+@pytest.fixture
+def cameras():
+    return {"front": FakeCamera(), "wrist": FakeCamera()}
+
+
+def test_read(cameras):
+    group = CameraGroup(cameras, timeout_ms=50)
+    group.start()
+    try:
+        cameras["front"].push()
+        cameras["wrist"].push()
+        wait_collected(group, 1)
+        # Frames captured before the read are not returned.
+        with pytest.raises(TimeoutError):
+            group.read()
+
+        cameras["front"].push()
+        cameras["wrist"].push()
+        wait_collected(group, 2)
+        start = time.perf_counter()
+        # Frames captured while waiting are returned.
+        for cam in cameras.values():
+            Timer(0.02, cam.push).start()
+        frames = group.read(timeout_ms=1000)
+    finally:
+        group.stop()
+
+    assert set(frames) == {"front", "wrist"}
+    for timestamped in frames.values():
+        assert timestamped.timestamp >= start
+        assert timestamped.frame[0, 0, 0] == 2
+
+
+def test_read_nearest(cameras):
+    group = CameraGroup(cameras, history=4)
+    group.start()
+    try:
+        for timestamp in (1.0, 2.0, 3.0):
+            cameras["front"].push(timestamp)
+        for timestamp in (1.4, 2.6, 3.5):
+            cameras["wrist"].push(timestamp)
+        wait_collected(group, 3)
+        frames = group.read_nearest(2.2)
+        # The trigger is after the frames of both cameras, so the latest frames are the closest available.
+        late_frames = group.read_nearest(10.0, timeout_ms=10)
+    finally:
+        group.stop()
+
+    assert frames["front"].timestamp == 2.0
+    assert frames["wrist"].timestamp == 2.6
+    assert late_frames["front"].timestamp == 3.0
+    assert late_frames["wrist"].timestamp == 3.5
+
+
+def test_read_nearest_without_frames(cameras):
+    group = CameraGroup(cameras)
+    try:
+        with pytest.raises(TimeoutError):
+            group.read_nearest(time.perf_counter(), timeout_ms=10)
+    finally:
+        group.stop()
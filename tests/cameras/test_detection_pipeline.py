@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import cv2
+import numpy as np
+
+from lerobot.cameras.detection_pipeline import (
+    DetectionWorker,
+    FramePipeline,
+    LatestFrame,
+    RecordedFrameSource,
+)
+
+
+class SlowDetector:
+    """Detector taking `delay_s` per batch, returning the first pixel and the shape of each frame."""
+
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.batch_sizes = []
+
+    def __call__(self, frames):
+        self.batch_sizes.append(len(frames))
+        time.sleep(self.delay_s)
+        return [(int(frame[0, 0, 0]), frame.shape) for frame in frames]
+
+
+def make_frames(num_frames: int, height: int = 6, width: int = 8) -> list[np.ndarray]:
+    return [np.full((height, width, 3), i, dtype=np.uint8) for i in range(num_frames)]
+
+
+def test_pipeline_is_not_throttled_by_detection():
+    source = RecordedFrameSource({"rgb": make_frames(100), "depth": make_frames(100)}, fps=200)
+    detector = SlowDetector(delay_s=0.05)
+    pipeline = FramePipeline(source, detector, crop=((2, 1), (6, 4)))
+    pipeline.start()
+    try:
+        deadline = time.perf_counter() + 2.0
+        while pipeline.latest_detections() is None and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        time.sleep(0.2)
+        rgb = pipeline.latest("rgb")
+        detections = pipeline.latest_detections()
+    finally:
+        pipeline.stop()
+
+    assert rgb is not None and pipeline.latest("depth") is not None
+    assert detections is not None
+    # Frames keep being captured while the detector runs, and the detector skips to the latest one.
+    assert pipeline.frames["rgb"].sequence > 2 * len(detector.batch_sizes)
+    assert pipeline.detection_worker.skipped_frames > 0
+    value, shape = detections.results
+    assert value == (detections.sequence - 1) % 100
+    assert shape == (3, 4, 3)
+    assert detections.latency_s >= 0.05
+
+
+def test_detection_worker_batches_latest_frames():
+    inputs = {"left": LatestFrame(), "right": LatestFrame()}
+    detector = SlowDetector()
+    worker = DetectionWorker(detector, inputs)
+
+    assert worker.detect_batch() == 0
+    for i in range(3):
+        inputs["left"].put(np.full((2, 2, 3), i, dtype=np.uint8), timestamp=float(i))
+    inputs["right"].put(np.full((2, 2, 3), 7, dtype=np.uint8), timestamp=10.0)
+    assert worker.detect_batch() == 2
+    # Only the inputs with a new frame are batched.
+    inputs["right"].put(np.full((2, 2, 3), 8, dtype=np.uint8), timestamp=11.0)
+    assert worker.detect_batch() == 1
+
+    assert detector.batch_sizes == [2, 1]
+    assert worker.skipped_frames == 2
+    assert worker.latest("left").results[0] == 2
+    assert worker.latest("left").timestamp == 2.0
+    assert worker.latest("right").results[0] == 8
+    assert worker.latest("right").sequence == 2
+
+
+def test_recorded_frame_source_from_directory(tmp_path):
+    for stream in ("rgb", "depth"):
+        (tmp_path / stream).mkdir()
+        for i, frame in enumerate(make_frames(2)):
+            cv2.imwrite(str(tmp_path / stream / f"frame_{i:06d}.png"), frame)
+
+    source = RecordedFrameSource.from_directory(tmp_path, fps=1000, loop=False)
+
+    assert sorted(source.streams) == ["depth", "rgb"]
+    frames = [source.read("rgb", timeout_s=0.1) for _ in range(3)]
+    assert [frame[0, 0, 0] for frame in frames[:2]] == [0, 1]
+    assert frames[2] is None
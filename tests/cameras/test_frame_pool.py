@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.frame_pool import FramePool
+
+
+def write_frame(pool: FramePool, value: int, timestamp: float) -> int:
+    slot = pool.next_slot()
+    pool.buffers[slot][:] = value
+    return pool.publish(slot, timestamp)
+
+
+def test_frame_pool_reuses_buffers():
+    pool = FramePool((2, 3, 3), size=3)
+    with pytest.raises(RuntimeError):
+        pool.latest()
+
+    views = []
+    for i in range(1, 7):
+        assert write_frame(pool, i, timestamp=float(i)) == i
+        view, timestamp, sequence = pool.latest()
+        views.append(view)
+        assert sequence == i
+        assert timestamp == float(i)
+        assert (view == i).all()
+        assert not view.flags.writeable
+
+    # Frame `k` is written to buffer `(k - 1) % size`.
+    assert all(np.shares_memory(views[i], pool.buffers[i % 3]) for i in range(6))
+
+
+def test_frame_pool_is_valid():
+    pool = FramePool((2, 2), size=3)
+    write_frame(pool, 1, timestamp=0.0)
+    _, _, sequence = pool.latest()
+    assert pool.is_valid(sequence)
+
+    write_frame(pool, 2, timestamp=0.0)
+    # The writer may now be writing to the next buffer, which is still a different one.
+    assert pool.is_valid(sequence)
+
+    write_frame(pool, 3, timestamp=0.0)
+    # The writer may now be writing to the buffer of the first frame.
+    assert not pool.is_valid(sequence)
+
+
+def test_frame_pool_invalid_size():
+    with pytest.raises(ValueError):
+        FramePool((2, 2), size=1)
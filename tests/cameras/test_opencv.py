@@ -155,6 +155,47 @@ def test_async_read_before_connect():
         _ = camera.async_read()
 
 
+def test_async_read_view():
+    config = OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH)
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+
+    try:
+        view, _, sequence = camera.async_read_view()
+
+        assert not view.flags.writeable
+        assert sequence >= 1
+        assert any(np.shares_memory(view, buffer) for buffer in camera.frame_pool.buffers)
+    finally:
+        if camera.is_connected:
+            camera.disconnect()
+
+
+@pytest.mark.parametrize("postprocess_in_reader", [False, True], ids=["capture", "reader"])
+@pytest.mark.parametrize(
+    "rotation", [Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90], ids=["no_rot", "rot90"]
+)
+def test_async_read_matches_read(rotation, postprocess_in_reader):
+    config = OpenCVCameraConfig(
+        index_or_path=DEFAULT_PNG_FILE_PATH, rotation=rotation, postprocess_in_reader=postprocess_in_reader
+    )
+    async_camera = OpenCVCamera(config)
+    async_camera.connect(warmup=False)
+    try:
+        async_img = async_camera.async_read()
+    finally:
+        async_camera.disconnect()
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+    try:
+        img = camera.read()
+    finally:
+        camera.disconnect()
+
+    assert async_img.flags.writeable
+    np.testing.assert_array_equal(async_img, img)
+
+
 @pytest.mark.parametrize("index_or_path", TEST_IMAGE_PATHS, ids=TEST_IMAGE_SIZES)
 @pytest.mark.parametrize(
     "rotation",
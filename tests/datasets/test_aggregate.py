@@ -16,9 +16,11 @@
 
 from unittest.mock import patch
 
+import numpy as np
+import pyarrow as pa
 import torch
 
-from lerobot.datasets.aggregate import aggregate_datasets
+from lerobot.datasets.aggregate import aggregate_datasets, assign_files, update_data_table
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from tests.fixtures.constants import DUMMY_REPO_ID
 
@@ -290,3 +292,29 @@ def test_aggregate_with_low_threshold(tmp_path, lerobot_dataset_factory):
     if video_dir.exists():
         video_files = list(video_dir.rglob("*.mp4"))
         assert len(video_files) > 1, "Small file size limits should create multiple video files"
+
+
+def test_update_data_table():
+    table = pa.table(
+        {
+            "index": pa.array([0, 1, 2], pa.int64()),
+            "episode_index": pa.array([0, 0, 1], pa.int64()),
+            "task_index": pa.array([1, 0, 1], pa.int64()),
+            "timestamp": pa.array([0.0, 0.1, 0.0], pa.float32()),
+        }
+    )
+
+    updated = update_data_table(table, episode_offset=5, index_offset=100, task_lookup=np.array([3, 7]))
+
+    assert updated.schema == table.schema
+    assert updated["index"].to_pylist() == [100, 101, 102]
+    assert updated["episode_index"].to_pylist() == [5, 5, 6]
+    assert updated["task_index"].to_pylist() == [7, 3, 7]
+    assert updated["timestamp"].equals(table["timestamp"])
+
+
+def test_assign_files():
+    # A source file larger than the maximum size still gets its own destination file.
+    assignments = assign_files([4.0, 5.0, 2.0, 20.0, 1.0], max_mb=10.0, chunk_size=2)
+
+    assert assignments == [(0, 0), (0, 0), (0, 1), (1, 0), (1, 1)]
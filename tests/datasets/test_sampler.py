@@ -13,6 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pytest
 from datasets import Dataset
 
 from lerobot.datasets.push_dataset_to_hub.utils import calculate_episode_data_index
@@ -90,3 +91,29 @@ def test_shuffle():
     assert sampler.indices == [0, 1, 2, 3, 4, 5]
     assert len(sampler) == 6
     assert set(sampler) == {0, 1, 2, 3, 4, 5}
+
+
+def test_distributed_shards():
+    from_indices, to_indices = [0, 2, 3], [2, 3, 7]
+    shards = [
+        EpisodeAwareSampler(from_indices, to_indices, shuffle=True, num_replicas=3, rank=rank, seed=42)
+        for rank in range(3)
+    ]
+    for shard in shards:
+        assert len(shard) == 3
+
+    indices = [list(shard) for shard in shards]
+    # 7 indices split across 3 replicas: all of them are covered, 2 are repeated as padding
+    assert sorted(set().union(*indices)) == list(range(7))
+    assert sum(len(i) for i in indices) == 9
+
+    # All replicas agree on the permutation, which changes with the epoch
+    assert indices == [list(shard) for shard in shards]
+    for shard in shards:
+        shard.set_epoch(1)
+    assert sorted(set().union(*[list(shard) for shard in shards])) == list(range(7))
+
+
+def test_distributed_invalid_rank():
+    with pytest.raises(ValueError):
+        EpisodeAwareSampler([0], [4], num_replicas=2, rank=2)
@@ -16,6 +16,7 @@
 import importlib
 
 import gymnasium as gym
+import numpy as np
 import pytest
 import torch
 from gymnasium.utils.env_checker import check_env
@@ -23,6 +24,7 @@ from gymnasium.utils.env_checker import check_env
 import lerobot
 from lerobot.envs.factory import make_env, make_env_config
 from lerobot.envs.utils import preprocess_observation
+from lerobot.scripts.lerobot_eval import MultiTaskVectorEnv
 from tests.utils import require_env
 
 OBS_TYPES = ["state", "pixels", "pixels_agent_pos"]
@@ -64,3 +66,122 @@ def test_factory(env_name):
         assert img.min() >= 0.0
 
     env.close()
+
+
+def test_multi_task_vector_env():
+    """Check that a MultiTaskVectorEnv behaves as its vectorized environments, concatenated."""
+
+    def make_vec_env():
+        return gym.vector.SyncVectorEnv([lambda: gym.make("CartPole-v1")] * 2)
+
+    envs = [make_vec_env() for _ in range(3)]
+    reference_envs = [make_vec_env() for _ in range(3)]
+    env = MultiTaskVectorEnv(envs)
+    assert env.num_envs == 6
+
+    seeds = list(range(6))
+    obs, _ = env.reset(seed=seeds)
+    reference_obs = [ref.reset(seed=seeds[2 * i : 2 * i + 2])[0] for i, ref in enumerate(reference_envs)]
+    np.testing.assert_array_equal(obs, np.concatenate(reference_obs))
+
+    for _ in range(30):
+        actions = np.random.randint(0, 2, size=6)
+        obs, reward, terminated, truncated, info = env.step(actions)
+        reference = [ref.step(actions[2 * i : 2 * i + 2]) for i, ref in enumerate(reference_envs)]
+        np.testing.assert_array_equal(obs, np.concatenate([r[0] for r in reference]))
+        np.testing.assert_array_equal(terminated, np.concatenate([r[2] for r in reference]))
+        for i, r in enumerate(reference):
+            if "final_info" in r[4]:
+                assert list(info["final_info"][2 * i : 2 * i + 2]) == list(r[4]["final_info"])
+            elif "final_info" in info:
+                assert all(x is None for x in info["final_info"][2 * i : 2 * i + 2])
+
+    assert env.call("spec")[3] is envs[1].call("spec")[1]
+    env.close()
+
+
+class SeededLengthEnv(gym.Env):
+    """Environment whose episode length depends on its seed, and whose rewards depend on the actions."""
+
+    observation_space = gym.spaces.Dict(
+        {
+            "agent_pos": gym.spaces.Box(-10, 10, shape=(2,), dtype=np.float32),
+            "environment_state": gym.spaces.Box(-10, 10, shape=(2,), dtype=np.float32),
+        }
+    )
+    action_space = gym.spaces.Box(-1, 1, shape=(2,), dtype=np.float32)
+    _max_episode_steps = 8
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.length = 2 + int(self.np_random.integers(0, 6))
+        self.steps = 0
+        self.state = self.np_random.uniform(-1, 1, size=2).astype(np.float32)
+        return self._obs(), {}
+
+    def _obs(self):
+        return {"agent_pos": self.state.copy(), "environment_state": -self.state}
+
+    def step(self, action):
+        self.state = np.clip(self.state + action, -10, 10).astype(np.float32)
+        self.steps += 1
+        reward = float(-np.abs(self.state).sum())
+        terminated = self.steps >= self.length
+        return self._obs(), reward, terminated, False, {"is_success": terminated and reward > -2.0}
+
+
+def test_eval_policy_all_continuous_refill_parallel_tasks():
+    """Check that tasks evaluated with continuous refill get the same metrics with max_parallel_tasks > 1."""
+    from lerobot.configs.types import FeatureType, PolicyFeature
+    from lerobot.policies.act.configuration_act import ACTConfig
+    from lerobot.policies.act.modeling_act import ACTPolicy
+    from lerobot.scripts.lerobot_eval import eval_policy_all
+    from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_STATE
+
+    torch.manual_seed(0)
+    config = ACTConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+            OBS_ENV_STATE: PolicyFeature(type=FeatureType.ENV, shape=(2,)),
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        chunk_size=3,
+        n_action_steps=3,
+        dim_model=16,
+        dim_feedforward=32,
+        n_heads=2,
+        n_encoder_layers=1,
+        n_decoder_layers=1,
+        use_vae=False,
+        device="cpu",
+    )
+    policy = ACTPolicy(config)
+
+    def make_envs():
+        return {
+            "group": {
+                task_id: gym.vector.SyncVectorEnv([SeededLengthEnv, SeededLengthEnv]) for task_id in range(2)
+            }
+        }
+
+    def evaluate(max_parallel_tasks):
+        info = eval_policy_all(
+            make_envs(),
+            policy,
+            lambda observation: observation,
+            lambda action: action,
+            n_episodes=5,
+            start_seed=0,
+            max_parallel_tasks=max_parallel_tasks,
+            continuous_refill=True,
+        )
+        return {(task["task_group"], task["task_id"]): task["metrics"] for task in info["per_task"]}
+
+    sequential = evaluate(max_parallel_tasks=1)
+    parallel = evaluate(max_parallel_tasks=2)
+
+    assert parallel.keys() == sequential.keys()
+    for task, metrics in sequential.items():
+        assert len(metrics["sum_rewards"]) == 5
+        for key in ("sum_rewards", "max_rewards", "successes"):
+            np.testing.assert_allclose(parallel[task][key], metrics[key])
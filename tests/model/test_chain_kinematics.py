@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from lerobot.model.chain_kinematics import (
+    XARM6_JOINT_LIMITS_DEG,
+    XARM6_T2_OFFSET,
+    ChainKinematics,
+    rotation_log,
+    xarm6_kinematics,
+)
+
+# Joint origins of the xArm6 URDF (xarm_description), equivalent to its DH parameters.
+XARM6_URDF_JOINTS = [
+    ("joint1", "0 0 0.267", "0 0 0"),
+    ("joint2", "0 0 0", "-1.5707963267948966 0 0"),
+    ("joint3", "0.0535 -0.2845 0", "0 0 0"),
+    ("joint4", "0.0775 0.3425 0", "-1.5707963267948966 0 0"),
+    ("joint5", "0 0 0", "1.5707963267948966 0 0"),
+    ("joint6", "0.076 0.097 0", "-1.5707963267948966 0 0"),
+]
+
+
+@pytest.fixture
+def xarm6_urdf(tmp_path):
+    links = ["link_base"] + [f"link{i + 1}" for i in range(6)] + ["link_eef"]
+    joints = [
+        f'<joint name="{name}" type="revolute"><parent link="{links[i]}"/><child link="{links[i + 1]}"/>'
+        f'<origin xyz="{xyz}" rpy="{rpy}"/><axis xyz="0 0 1"/>'
+        f'<limit lower="-6.28" upper="6.28" effort="50" velocity="3.14"/></joint>'
+        for i, (name, xyz, rpy) in enumerate(XARM6_URDF_JOINTS)
+    ]
+    joints.append(
+        '<joint name="joint_eef" type="fixed"><parent link="link6"/><child link="link_eef"/>'
+        '<origin xyz="0 0 0.05" rpy="0 0 0"/></joint>'
+    )
+    urdf = "".join([f'<link name="{link}"/>' for link in links] + joints)
+    path = tmp_path / "xarm6.urdf"
+    path.write_text(f'<robot name="xarm6">{urdf}</robot>')
+    return str(path)
+
+
+def random_joint_positions(n: int, seed: int = 0) -> np.ndarray:
+    lower = np.maximum(XARM6_JOINT_LIMITS_DEG[:, 0], -170) + 10
+    upper = np.minimum(XARM6_JOINT_LIMITS_DEG[:, 1], 170) - 10
+    return np.random.default_rng(seed).uniform(lower, upper, (n, 6))
+
+
+def test_xarm6_forward_kinematics():
+    kinematics = xarm6_kinematics()
+    # At zero, the flange of the xArm6 is at (207, 0, 112) mm, pointing down.
+    np.testing.assert_allclose(
+        kinematics.forward_kinematics(np.zeros(6)),
+        [[1, 0, 0, 0.207], [0, -1, 0, 0], [0, 0, -1, 0.112], [0, 0, 0, 1]],
+        atol=1e-9,
+    )
+
+    joint_pos = random_joint_positions(32)
+    poses = kinematics.forward_kinematics(joint_pos)
+    assert poses.shape == (32, 4, 4)
+    for pose, q in zip(poses, joint_pos, strict=True):
+        np.testing.assert_allclose(pose, kinematics.forward_kinematics(q))
+    # Extra trailing joints (gripper) are ignored.
+    np.testing.assert_allclose(kinematics.forward_kinematics(np.pad(joint_pos, ((0, 0), (0, 1)))), poses)
+
+
+def test_dh_conventions_and_urdf_match(xarm6_urdf):
+    standard_dh = np.array(
+        [
+            [0.0, -np.pi / 2, 0.267, 0.0],
+            [np.hypot(0.0535, 0.2845), 0.0, 0.0, -XARM6_T2_OFFSET],
+            [0.0775, -np.pi / 2, 0.0, XARM6_T2_OFFSET],
+            [0.0, np.pi / 2, 0.3425, 0.0],
+            [0.076, -np.pi / 2, 0.0, 0.0],
+            [0.0, 0.0, 0.097, 0.0],
+        ]
+    )
+    tool = np.eye(4)
+    tool[2, 3] = 0.05
+    modified = xarm6_kinematics(tool_transform=tool)
+    standard = ChainKinematics.from_dh(standard_dh, modified=False, tool_transform=tool)
+    urdf = ChainKinematics.from_urdf(xarm6_urdf, target_frame_name="link_eef")
+    assert urdf.joint_names == [f"joint{i + 1}" for i in range(6)]
+
+    joint_pos = random_joint_positions(100)
+    expected = modified.forward_kinematics(joint_pos)
+    np.testing.assert_allclose(standard.forward_kinematics(joint_pos), expected, atol=1e-7)
+    np.testing.assert_allclose(urdf.forward_kinematics(joint_pos), expected, atol=1e-6)
+
+
+def test_jacobian_matches_finite_differences():
+    kinematics = xarm6_kinematics()
+    joint_pos = random_joint_positions(8)
+    jacobian = kinematics.jacobian(joint_pos)
+    eps = 1e-4
+    for j in range(6):
+        delta = np.zeros(6)
+        delta[j] = np.rad2deg(eps)
+        plus = kinematics.forward_kinematics(joint_pos + delta)
+        minus = kinematics.forward_kinematics(joint_pos - delta)
+        np.testing.assert_allclose(
+            jacobian[:, :3, j], (plus[:, :3, 3] - minus[:, :3, 3]) / (2 * eps), atol=1e-6
+        )
+        angular = rotation_log(plus[:, :3, :3] @ minus[:, :3, :3].swapaxes(-1, -2)) / (2 * eps)
+        np.testing.assert_allclose(jacobian[:, 3:, j], angular, atol=1e-6)
+
+
+def test_rotation_log():
+    rng = np.random.default_rng(0)
+    axes = rng.standard_normal((50, 3))
+    axes /= np.linalg.norm(axes, axis=-1, keepdims=True)
+    angles = np.concatenate([rng.uniform(0, np.pi, 46), [0.0, 1e-8, np.pi - 1e-4, np.pi]])
+    skew = np.cross(np.eye(3), axes[:, None, :])
+    rotations = (
+        np.eye(3) + np.sin(angles)[:, None, None] * skew + (1 - np.cos(angles))[:, None, None] * (skew @ skew)
+    )
+    logs = rotation_log(rotations)
+    # Rotations of pi around an axis and its opposite are the same.
+    expected = axes * angles[:, None]
+    flipped = np.isclose(angles, np.pi) & (np.sum(logs * expected, axis=-1) < 0)
+    expected[flipped] *= -1
+    np.testing.assert_allclose(logs, expected, atol=1e-6)
+
+
+def test_inverse_kinematics():
+    kinematics = xarm6_kinematics()
+    joint_pos = random_joint_positions(200)
+    targets = kinematics.forward_kinematics(joint_pos)
+    initial = joint_pos + np.random.default_rng(1).uniform(-5, 5, joint_pos.shape)
+    gripper = np.full((200, 1), 42.0)
+
+    solution = kinematics.inverse_kinematics(np.hstack([initial, gripper]), targets, orientation_weight=1.0)
+    assert solution.shape == (200, 7)
+    np.testing.assert_array_equal(solution[:, 6], 42.0)
+    np.testing.assert_allclose(kinematics.forward_kinematics(solution), targets, atol=1e-4)
+    assert np.all(solution[:, :6] >= XARM6_JOINT_LIMITS_DEG[:, 0])
+    assert np.all(solution[:, :6] <= XARM6_JOINT_LIMITS_DEG[:, 1])
+
+    # A single pose, warm started at its solution, is solved without moving.
+    np.testing.assert_allclose(kinematics.inverse_kinematics(joint_pos[0], targets[0]), joint_pos[0])
+
+
+def test_matches_placo(xarm6_urdf):
+    pytest.importorskip("placo")
+    from lerobot.model.kinematics import RobotKinematics
+
+    reference = RobotKinematics(xarm6_urdf, target_frame_name="link_eef")
+    kinematics = ChainKinematics.from_urdf(xarm6_urdf, target_frame_name="link_eef")
+    joint_pos = random_joint_positions(20)
+    for q, pose in zip(joint_pos, kinematics.forward_kinematics(joint_pos), strict=True):
+        np.testing.assert_allclose(pose, reference.forward_kinematics(q), atol=1e-9)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import inspect
+import math
 from copy import deepcopy
 from pathlib import Path
 
@@ -34,6 +35,8 @@ from lerobot.envs.utils import preprocess_observation
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.act.configuration_act import ACTConfig
 from lerobot.policies.act.modeling_act import ACTTemporalEnsembler
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import DiffusionPolicy
 from lerobot.policies.factory import (
     get_policy_class,
     make_policy,
@@ -41,7 +44,11 @@ from lerobot.policies.factory import (
     make_pre_post_processors,
 )
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+from lerobot.policies.tdmpc.configuration_tdmpc import TDMPCConfig
+from lerobot.policies.tdmpc.modeling_tdmpc import TDMPCPolicy
+from lerobot.policies.vqbet.configuration_vqbet import VQBeTConfig
+from lerobot.policies.vqbet.vqbet_utils import GPT
+from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGES, OBS_STATE
 from lerobot.utils.random_utils import seeded_context
 from tests.artifacts.policies.save_policy_to_safetensors import get_policy_stats
 from tests.utils import DEVICE, require_cpu, require_env, require_x86_64_kernel
@@ -455,3 +462,233 @@ def test_act_temporal_ensembler():
         assert torch.all(offline_avg <= einops.reduce(seq_slice, "b s 1 -> b 1", "max"))
         # Selected atol=1e-4 keeping in mind actions in [-1, 1] and excepting 0.01% error.
         torch.testing.assert_close(online_avg, offline_avg, rtol=1e-4, atol=1e-4)
+
+
+def test_act_temporal_ensembler_matches_concatenation():
+    """Check that the circular buffer gives exactly the outputs of the online update with concatenations."""
+    temporal_ensemble_coeff = 0.01
+    chunk_size = 7
+    ensembler = ACTTemporalEnsembler(temporal_ensemble_coeff, chunk_size)
+    weights = torch.exp(-temporal_ensemble_coeff * torch.arange(chunk_size))
+    weights_cumsum = torch.cumsum(weights, dim=0)
+
+    # Two episodes, each longer than twice the chunk size so that the buffer wraps around.
+    for episode_length in [17, 23]:
+        ensembler.reset()
+        ensembled_actions = None
+        for _ in range(episode_length):
+            actions = torch.randn(2, chunk_size, 3)
+            # Reference: previous implementation of `ACTTemporalEnsembler.update`.
+            if ensembled_actions is None:
+                ensembled_actions = actions.clone()
+                count = torch.ones((chunk_size, 1), dtype=torch.long)
+            else:
+                ensembled_actions *= weights_cumsum[count - 1]
+                ensembled_actions += actions[:, :-1] * weights[count]
+                ensembled_actions /= weights_cumsum[count]
+                count = torch.clamp(count + 1, max=chunk_size)
+                ensembled_actions = torch.cat([ensembled_actions, actions[:, -1:]], dim=1)
+                count = torch.cat([count, torch.ones_like(count[-1:])])
+            expected, ensembled_actions, count = ensembled_actions[:, 0], ensembled_actions[:, 1:], count[1:]
+
+            assert torch.equal(ensembler.update(actions), expected)
+
+
+@pytest.mark.parametrize("n_action_steps", [1, 3])
+def test_diffusion_image_feature_cache(n_action_steps):
+    """Check that caching encoded frames across steps gives the same conditioning as re-encoding all frames."""
+    config = DiffusionConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+            f"{OBS_IMAGES}.top": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32)),
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        n_obs_steps=3,
+        horizon=8,
+        n_action_steps=n_action_steps,
+        crop_shape=None,
+        down_dims=(16, 32),
+        num_inference_steps=2,
+        device="cpu",
+    )
+    policy = DiffusionPolicy(config).eval()
+
+    global_conds = []
+
+    def fake_conditional_sample(batch_size, global_cond=None, generator=None):
+        global_conds.append(global_cond)
+        return torch.zeros(batch_size, config.horizon, 2)
+
+    policy.diffusion.conditional_sample = fake_conditional_sample
+    encode_images = policy.diffusion.encode_images
+    num_encoded_frames = []
+
+    def counting_encode_images(images):
+        num_encoded_frames.append(images.shape[1])
+        return encode_images(images)
+
+    policy.diffusion.encode_images = counting_encode_images
+
+    frames = []
+    with seeded_context(0):
+        observations = [
+            {OBS_STATE: torch.rand(1, 2), f"{OBS_IMAGES}.top": torch.rand(1, 3, 32, 32)} for _ in range(7)
+        ]
+    for observation in observations:
+        frames.append(observation)
+        num_conds = len(global_conds)
+        policy.select_action(dict(observation))
+        if len(global_conds) == num_conds:
+            continue
+        # Reference: re-encode the raw last `n_obs_steps` frames (the first one is repeated at the start).
+        window = ([frames[0]] * config.n_obs_steps + frames)[-config.n_obs_steps :]
+        states = torch.stack([o[OBS_STATE] for o in window], dim=1)
+        images = torch.stack([o[f"{OBS_IMAGES}.top"] for o in window], dim=1).unsqueeze(2)
+        with torch.no_grad():
+            expected = torch.cat([states, encode_images(images)], dim=-1).flatten(start_dim=1)
+        torch.testing.assert_close(global_conds[-1], expected)
+
+    # Each distinct frame is encoded at most once.
+    assert sum(num_encoded_frames) <= len(observations)
+
+
+@pytest.mark.parametrize("inference_noise_scheduler_type", ["DDIM", "DPMSolver++", "UniPC"])
+def test_diffusion_inference_noise_scheduler(inference_noise_scheduler_type):
+    """Check that the diffusion policy can sample with a scheduler other than the training one."""
+    config = DiffusionConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+            OBS_ENV_STATE: PolicyFeature(type=FeatureType.ENV, shape=(3,)),
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        n_obs_steps=2,
+        horizon=8,
+        n_action_steps=4,
+        down_dims=(16, 32),
+        num_inference_steps=3,
+        inference_noise_scheduler_type=inference_noise_scheduler_type,
+        device="cpu",
+    )
+    policy = DiffusionPolicy(config).eval()
+    assert type(policy.diffusion.inference_noise_scheduler) is not type(policy.diffusion.noise_scheduler)
+
+    batch = {
+        OBS_STATE: torch.rand(2, config.n_obs_steps, 2),
+        OBS_ENV_STATE: torch.rand(2, config.n_obs_steps, 3),
+    }
+    with torch.no_grad(), seeded_context(0):
+        actions = policy.diffusion.generate_actions(batch)
+    assert actions.shape == (2, config.n_action_steps, 2)
+    assert torch.isfinite(actions).all()
+
+    policy.diffusion.set_inference_schedule()
+    assert policy.diffusion.inference_noise_scheduler is policy.diffusion.noise_scheduler
+    assert policy.diffusion.num_inference_steps == config.num_train_timesteps
+
+    with pytest.raises(ValueError):
+        policy.diffusion.set_inference_schedule("Euler")
+
+    # The multistep solvers can't clip the sample to another range than [-1, 1].
+    policy.diffusion.config.clip_sample_range = 2.0
+    if inference_noise_scheduler_type == "DDIM":
+        policy.diffusion.set_inference_schedule(inference_noise_scheduler_type)
+    else:
+        with pytest.raises(ValueError, match="clip_sample_range"):
+            policy.diffusion.set_inference_schedule(inference_noise_scheduler_type)
+
+
+def test_tdmpc_static_planner():
+    """Check the static planner against the reference planner's value estimates and its buffer management."""
+    config = TDMPCConfig(
+        input_features={OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(4,))},
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        horizon=3,
+        n_action_steps=1,
+        latent_dim=16,
+        mlp_dim=32,
+        q_ensemble_size=2,
+        n_gaussian_samples=16,
+        n_pi_samples=4,
+        n_elites=4,
+        use_static_planner=True,
+        device="cpu",
+    )
+    policy = TDMPCPolicy(config).eval()
+    n_samples = config.n_gaussian_samples + config.n_pi_samples
+
+    # The batched value estimates match the step by step ones.
+    z = torch.randn(n_samples, config.latent_dim)
+    actions = torch.rand(config.horizon, n_samples, 2) * 2 - 1
+    zs = torch.empty(config.horizon + 1, n_samples, config.latent_dim)
+    zs[0] = z
+    discounts = config.discount ** torch.arange(config.horizon, dtype=torch.float32)
+    torch.testing.assert_close(
+        policy._estimate_value_with_buffers(actions, zs, discounts), policy.estimate_value(z, actions)
+    )
+
+    buffers = policy._plan_buffers
+    for _ in range(2):
+        plan = policy.plan(torch.randn(1, config.latent_dim))
+        assert plan.shape == (config.horizon, 1, 2)
+        assert (plan.abs() <= 1).all()
+        # Buffers are reused across steps, and the CEM mean is kept for warm starting.
+        assert policy._plan_buffers is buffers
+        assert buffers["prev_mean"].abs().sum() > 0
+
+    # Buffers are reallocated for a new batch size, and reset at the start of an episode.
+    assert policy.plan(torch.randn(3, config.latent_dim)).shape == (config.horizon, 3, 2)
+    assert policy._plan_buffers["mean"].shape == (config.horizon, 3, 2)
+    policy.reset()
+    assert policy._plan_buffers["prev_mean"].abs().sum() == 0
+
+    with pytest.raises(ValueError):
+        TDMPCConfig(compile_planner=True)
+
+
+def test_vqbet_gpt_sdpa_attention():
+    """Check that the GPT's causal self-attention matches the explicit masked softmax formulation."""
+    config = VQBeTConfig(gpt_input_dim=8, gpt_output_dim=16, gpt_hidden_dim=32, dropout=0.0)
+    attn = GPT(config).eval().transformer.h[0].attn
+    x = torch.randn(2, 5, config.gpt_hidden_dim)
+
+    with torch.no_grad():
+        q, k, v = attn.c_attn(x).split(config.gpt_hidden_dim, dim=2)
+        q, k, v = (einops.rearrange(t, "b t (h d) -> b h t d", h=config.gpt_n_head) for t in (q, k, v))
+        att = (q @ k.transpose(-2, -1)) / math.sqrt(k.size(-1))
+        att = att.masked_fill(attn.bias[:, :, :5, :5] == 0, float("-inf")).softmax(dim=-1)
+        expected = attn.c_proj(einops.rearrange(att @ v, "b h t d -> b t (h d)"))
+        torch.testing.assert_close(attn(x), expected, atol=1e-6, rtol=1e-5)
+
+
+def test_diffusion_reset_batch_elements():
+    """Check that restarted batch elements get the observation history of a fresh episode, at chunk boundaries."""
+    config = DiffusionConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(4,)),
+            OBS_ENV_STATE: PolicyFeature(type=FeatureType.ENV, shape=(4,)),
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        n_obs_steps=2,
+        horizon=8,
+        n_action_steps=2,
+        down_dims=(16, 32),
+        num_inference_steps=2,
+        device="cpu",
+    )
+    policy = DiffusionPolicy(config).eval()
+    policy.reset()
+    observations = [torch.randn(2, 4) for _ in range(3)]
+
+    with torch.no_grad():
+        policy.select_action({OBS_STATE: observations[0], OBS_ENV_STATE: observations[0]})
+        # The batch can't be restarted in the middle of an action chunk.
+        assert not policy.reset_batch_elements(torch.tensor([False, True]))
+        policy.select_action({OBS_STATE: observations[1], OBS_ENV_STATE: observations[1]})
+        assert policy.reset_batch_elements(torch.tensor([False, True]))
+        policy.select_action({OBS_STATE: observations[2], OBS_ENV_STATE: observations[2]})
+
+    queue = policy._queues[OBS_STATE]
+    torch.testing.assert_close(queue[0][0], observations[1][0])
+    torch.testing.assert_close(queue[0][1], observations[2][1])
+    torch.testing.assert_close(queue[1], observations[2])
+    assert policy._restart_mask is None
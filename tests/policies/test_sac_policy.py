@@ -22,7 +22,14 @@ from torch import Tensor, nn
 
 from lerobot.configs.types import FeatureType, PolicyFeature
 from lerobot.policies.sac.configuration_sac import SACConfig
-from lerobot.policies.sac.modeling_sac import MLP, SACPolicy
+from lerobot.policies.sac.modeling_sac import (
+    MLP,
+    CriticEnsemble,
+    CriticHead,
+    SACObservationEncoder,
+    SACPolicy,
+)
+from lerobot.policies.utils import unstack_ensemble_state_dict
 from lerobot.utils.constants import OBS_IMAGE, OBS_STATE
 from lerobot.utils.random_utils import seeded_context, set_seed
 
@@ -467,6 +474,33 @@ def test_sac_policy_update_target_network():
         )
 
 
+@pytest.mark.parametrize("flatten", [False, True])
+def test_sac_policy_update_target_network_ema(flatten: bool):
+    config = create_default_config(state_dim=10, continuous_action_dim=6)
+    config.flatten_target_update_params = flatten
+    weight = config.critic_target_update_weight
+
+    policy = SACPolicy(config=config)
+    optimizers = make_optimizers(policy)
+    batch = create_default_train_batch(batch_size=4, state_dim=10, action_dim=6)
+
+    for _ in range(3):
+        target_before = [p.detach().clone() for p in policy.critic_target.parameters()]
+        loss = policy.forward(batch, model="critic")["loss_critic"]
+        optimizers["critic"].zero_grad()
+        loss.backward()
+        optimizers["critic"].step()
+        policy.update_target_networks()
+
+        for before, target_param, param in zip(
+            target_before, policy.critic_target.parameters(), policy.critic_ensemble.parameters(), strict=True
+        ):
+            if target_param is param:
+                # Shared encoder
+                continue
+            torch.testing.assert_close(target_param, (1 - weight) * before + weight * param)
+
+
 @pytest.mark.parametrize("num_critics", [1, 3])
 def test_sac_policy_with_critics_number_of_heads(num_critics: int):
     batch_size = 2
@@ -478,7 +512,8 @@ def test_sac_policy_with_critics_number_of_heads(num_critics: int):
     policy = SACPolicy(config=config)
     policy.train()
 
-    assert len(policy.critic_ensemble.critics) == num_critics
+    assert policy.critic_ensemble.num_critics == num_critics
+    assert policy.critic_ensemble.critics.output_layer.weight.shape[0] == num_critics
 
     batch = create_train_batch_with_visual_input(
         batch_size=batch_size, state_dim=state_dim, action_dim=action_dim
@@ -540,3 +575,40 @@ def test_sac_policy_save_and_load(tmp_path):
         assert torch.allclose(actor_loss, loaded_actor_loss)
         assert torch.allclose(temperature_loss, loaded_temperature_loss)
         assert torch.allclose(actions, loaded_actions)
+
+
+def test_critic_ensemble_matches_individual_heads():
+    config = create_default_config(state_dim=10, continuous_action_dim=6)
+    encoder = SACObservationEncoder(config)
+    heads = [CriticHead(input_dim=encoder.output_dim + 6, hidden_dims=[32, 32]) for _ in range(4)]
+    ensemble = CriticEnsemble(encoder=encoder, ensemble=heads)
+
+    observations = create_dummy_state(batch_size=5, state_dim=10)
+    actions = create_dummy_action(batch_size=5, action_dim=6)
+    with torch.no_grad():
+        inputs = torch.cat([encoder(observations), actions], dim=-1)
+        expected = torch.stack([head(inputs).squeeze(-1) for head in heads])
+        q_values = ensemble(observations, actions)
+
+    assert q_values.shape == (4, 5)
+    torch.testing.assert_close(q_values, expected)
+
+
+def test_critic_ensemble_loads_module_list_state_dict():
+    config = create_default_config(state_dim=10, continuous_action_dim=6)
+    encoder = SACObservationEncoder(config)
+
+    def make_ensemble():
+        heads = [CriticHead(input_dim=encoder.output_dim + 6, hidden_dims=[32, 32]) for _ in range(3)]
+        return CriticEnsemble(encoder=encoder, ensemble=heads)
+
+    ensemble = make_ensemble()
+    # State dict in the layout of the heads stored in an `nn.ModuleList` (`critics.{i}.*` keys).
+    module_list_state_dict = unstack_ensemble_state_dict(ensemble.state_dict(), prefix="critics.")
+    assert "critics.2.output_layer.weight" in module_list_state_dict
+
+    loaded = make_ensemble()
+    loaded.load_state_dict(module_list_state_dict)
+
+    for key, value in ensemble.state_dict().items():
+        torch.testing.assert_close(loaded.state_dict()[key], value)
@@ -296,3 +296,49 @@ def test_end_to_end_parameters_flow(cfg, data_size):
     assert received_params.keys() == input_params.keys()
     for key in input_params:
         assert torch.allclose(received_params[key], input_params[key])
+
+
+@require_package("grpc")
+def test_transitions_image_features_are_encoded_in_one_batch():
+    from lerobot.configs.types import FeatureType, PolicyFeature
+    from lerobot.policies.sac.modeling_sac import SACPolicy
+    from lerobot.rl.learner import get_transitions_image_features
+
+    image_keys = ("observation.images.front", "observation.images.side")
+    config = SACConfig(
+        input_features={
+            **{key: PolicyFeature(type=FeatureType.VISUAL, shape=(3, 64, 64)) for key in image_keys},
+            "observation.state": PolicyFeature(type=FeatureType.STATE, shape=(4,)),
+        },
+        output_features={"action": PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        dataset_stats=None,
+    )
+    policy = SACPolicy(config).eval()
+    encoder = policy.actor.encoder
+
+    def make_observation():
+        return {key: torch.rand(1, 3, 64, 64) for key in image_keys} | {"observation.state": torch.rand(1, 4)}
+
+    transitions = [{"state": make_observation(), "next_state": make_observation()} for _ in range(5)]
+    batch_sizes = []
+    encode = encoder.get_cached_image_features
+
+    def counted_encode(obs):
+        batch_sizes.append(len(obs[image_keys[0]]))
+        return encode(obs)
+
+    encoder.get_cached_image_features = counted_encode
+    all_features = get_transitions_image_features(policy, transitions, encode_next_state=True)
+
+    # One call for the states and one for the next states, instead of one per transition and state.
+    assert batch_sizes == [5, 5]
+    with torch.no_grad():
+        for transition, features in zip(transitions, all_features, strict=True):
+            for name in ("state", "next_state"):
+                expected = encode(transition[name])
+                assert features[f"{name}_features"].keys() == expected.keys()
+                for key in expected:
+                    torch.testing.assert_close(features[f"{name}_features"][key], expected[key])
+
+    all_features = get_transitions_image_features(policy, transitions, encode_next_state=False)
+    assert all(features["next_state_features"] is None for features in all_features)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import time
+from threading import Thread
+
+import numpy as np
+import pytest
+
+from lerobot.robots.lekiwi import LeKiwiClient, LeKiwiClientConfig
+from lerobot.robots.lekiwi.config_lekiwi import LeKiwiHostConfig
+from lerobot.robots.lekiwi.lekiwi_host import LeKiwiHost
+from lerobot.robots.lekiwi.observation_protocol import (
+    ObservationDecoder,
+    encode_observation,
+    is_multipart_observation,
+)
+
+CAMERAS = ("front", "wrist")
+
+
+def make_observation(value: float) -> dict:
+    observation = {"arm_shoulder_pan.pos": value, "x.vel": -value, "theta.vel": 0.5}
+    # Smooth images, so that their JPEG encoding is close to them.
+    gradient = np.linspace(0, 255, 480, dtype=np.uint8)
+    observation["front"] = np.broadcast_to(gradient[:, None, None], (480, 640, 3)).copy()
+    observation["wrist"] = np.broadcast_to(gradient[None, :, None], (640, 480, 3)).copy()
+    return observation
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.parametrize("image_encoding", ["raw", "jpeg"])
+def test_encode_decode_observation(image_encoding):
+    observation = make_observation(1.5)
+    decoder = ObservationDecoder()
+
+    frames = encode_observation(observation, CAMERAS, sequence=7, image_encoding=image_encoding)
+    frames = [bytes(memoryview(frame)) for frame in frames]
+    decoded = decoder.decode(frames)
+    names = decoder._names
+    decoder.decode(frames)
+
+    assert is_multipart_observation(frames)
+    assert len(frames) == 2 + len(CAMERAS)
+    assert decoded.sequence == 7
+    assert decoded.timestamp == pytest.approx(time.time(), abs=1.0)
+    assert decoded.state == {"arm_shoulder_pan.pos": 1.5, "x.vel": -1.5, "theta.vel": 0.5}
+    for cam in CAMERAS:
+        assert decoded.images[cam].shape == observation[cam].shape
+        if image_encoding == "raw":
+            np.testing.assert_array_equal(decoded.images[cam], observation[cam])
+        else:
+            assert np.abs(decoded.images[cam].astype(int) - observation[cam]).mean() < 2
+    # The schema is only decoded when it changes.
+    assert decoder._names is names
+
+
+@pytest.mark.parametrize("observation_format", ["multipart", "json"])
+def test_client_receives_latest_observation(observation_format):
+    host_config = LeKiwiHostConfig(
+        port_zmq_cmd=free_port(), port_zmq_observations=free_port(), observation_format=observation_format
+    )
+    host = LeKiwiHost(host_config)
+    client = LeKiwiClient(
+        LeKiwiClientConfig(
+            remote_ip="127.0.0.1",
+            port_zmq_cmd=host_config.port_zmq_cmd,
+            port_zmq_observations=host_config.port_zmq_observations,
+            polling_timeout_ms=200,
+        )
+    )
+    connect_thread = Thread(target=client.connect)
+    connect_thread.start()
+    try:
+        while connect_thread.is_alive():
+            try:
+                host.send_observation(make_observation(0.0), list(CAMERAS))
+            except Exception:
+                pass
+            time.sleep(0.01)
+        assert client.is_connected
+
+        for value in (1.0, 2.0, 3.0):
+            host.send_observation(make_observation(value), list(CAMERAS))
+            time.sleep(0.05)
+        observation = client.get_observation()
+    finally:
+        if client.is_connected:
+            client.disconnect()
+        host.disconnect()
+
+    # The observations received while the client was not reading are dropped.
+    assert observation["arm_shoulder_pan.pos"] == 3.0
+    assert observation["x.vel"] == -3.0
+    assert observation["front"].shape == (480, 640, 3)
+    assert observation["wrist"].shape == (640, 480, 3)
+    # The host and the client share the clock of this machine.
+    assert 0 <= client.logs["observation_clock_delta_s"] < 1.0
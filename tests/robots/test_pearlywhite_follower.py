@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import sys
+import threading
+import time
+import types
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from lerobot.robots.pearlywhite.config_pearlywhite_follower import PearlyWhiteFollowerConfig
+from lerobot.robots.pearlywhite.xarm_state import STATE_KEYS, XArmStateReader
+
+
+class FakeXArmAPI:
+    """Stand-in for `xarm.wrapper.XArmAPI` recording the commands, where blocking motions complete instantly.
+
+    As in the SDK, `position`, `angles`, `realtime_joint_speeds` and `joints_torque` are the values cached from the
+    last report, and `report` calls the report callbacks.
+    """
+
+    def __init__(self, port, **kwargs):
+        self.connected = False
+        self.mode = 0
+        self.position = [0.0, 0.0, 0.0, 180.0, 0.0, 90.0]
+        self.angles = [0.0, -10.0, -20.0, 0.0, 30.0, 0.0, 0.0]
+        self.realtime_joint_speeds = [0.0] * 6
+        self.joints_torque = [1.0] * 7
+        self.report_callbacks = []
+        self.calls = []
+
+    def report(self):
+        for callback in self.report_callbacks:
+            callback({"cartesian": self.position, "joints": self.angles})
+
+    def register_report_location_callback(self, callback, report_cartesian=True, report_joints=True):
+        self.report_callbacks.append(callback)
+
+    def release_report_location_callback(self, callback):
+        self.report_callbacks.remove(callback)
+
+    def get_servo_angle(self, is_radian=False):
+        self.calls.append(("get_servo_angle",))
+        return 0, list(self.angles)
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def motion_enable(self, enable=True):
+        return 0
+
+    def set_mode(self, mode):
+        self.mode = mode
+        return 0
+
+    def set_state(self, state):
+        return 0
+
+    def get_position(self, is_radian=False):
+        self.calls.append(("get_position",))
+        return 0, list(self.position)
+
+    def get_position_aa(self, is_radian=False):
+        return 0, list(self.position)
+
+    def set_position(self, x=None, y=None, z=None, roll=None, pitch=None, yaw=None, wait=False, **kwargs):
+        self.calls.append(("set_position", (x, y, z), wait, self.mode))
+        if wait:
+            self.position[:3] = [x, y, z]
+        return 0
+
+    def set_servo_cartesian(self, mvpose, **kwargs):
+        self.calls.append(("set_servo_cartesian", tuple(mvpose[:3]), False, self.mode))
+        return 0
+
+
+@pytest.fixture
+def make_follower():
+    xarm = types.ModuleType("xarm")
+    xarm.wrapper = types.ModuleType("xarm.wrapper")
+    xarm.wrapper.XArmAPI = FakeXArmAPI
+    with patch.dict(sys.modules, {"xarm": xarm, "xarm.wrapper": xarm.wrapper}):
+        sys.modules.pop("lerobot.robots.pearlywhite.pearlywhite_follower", None)
+        module = importlib.import_module("lerobot.robots.pearlywhite.pearlywhite_follower")
+
+        def _make(**kwargs):
+            config = PearlyWhiteFollowerConfig(**kwargs)
+            config.cameras = {}
+            follower = module.PearlyWhiteFollower(config)
+            follower.connect()
+            follower.arm.calls.clear()
+            return follower
+
+        yield _make
+    sys.modules.pop("lerobot.robots.pearlywhite.pearlywhite_follower", None)
+
+
+def test_position_mode_blocks(make_follower):
+    follower = make_follower(state_source="poll")
+    follower.send_action({"x": 5.0, "y": 0.0, "z": -5.0})
+    assert [call[0] for call in follower.arm.calls] == ["get_position", "get_servo_angle", "set_position"]
+    assert follower.arm.calls[-1][2]  # wait=True
+    np.testing.assert_allclose(follower.arm.position[:3], [9.97717 + 5.0, 207.91037, 190.492111 - 5.0])
+
+    # With the state from the reports, the position isn't read back.
+    follower = make_follower(state_source="report")
+    follower.send_action({"x": 5.0, "y": 0.0, "z": -5.0})
+    assert [call[0] for call in follower.arm.calls] == ["set_position"]
+    np.testing.assert_allclose(follower.arm.position[:3], [9.97717 + 5.0, 207.91037, 190.492111 - 5.0])
+
+
+@pytest.mark.parametrize(
+    "control_mode, command, xarm_mode",
+    [("online_trajectory", "set_position", 7), ("servo_cartesian", "set_servo_cartesian", 1)],
+)
+def test_streaming_mode(make_follower, control_mode, command, xarm_mode):
+    follower = make_follower(
+        control_mode=control_mode,
+        max_step_mm=10.0,
+        workspace_bounds_mm=[[-100.0, 0.0, 150.0], [100.0, 300.0, 205.0]],
+    )
+    start = np.array([9.97717, 207.91037, 190.492111])
+
+    sent = follower.send_action({"x": 5.0, "y": -30.0, "z": 0.0})
+    np.testing.assert_allclose([sent["x"], sent["y"], sent["z"]], [5.0, -10.0, 0.0])
+    applied_z = [follower.send_action({"x": 0.0, "y": 0.0, "z": 10.0})["z"] for _ in range(3)]
+    # The target is clamped to the workspace.
+    np.testing.assert_allclose(applied_z, [10.0, 205.0 - start[2] - 10.0, 0.0])
+
+    calls = follower.arm.calls
+    # The position is never read back, and no command waits for the motion.
+    assert [call[0] for call in calls] == [command] * 4
+    assert not any(call[2] for call in calls)
+    assert all(call[3] == xarm_mode for call in calls)
+    np.testing.assert_allclose(calls[0][1], start + [5.0, -10.0, 0.0])
+    np.testing.assert_allclose(calls[-1][1], [start[0] + 5.0, start[1] - 10.0, 205.0])
+
+    follower.disconnect()
+    assert follower.arm.mode == 0
+
+
+def test_invalid_control_mode():
+    with pytest.raises(ValueError):
+        PearlyWhiteFollowerConfig(control_mode="velocity")
+
+
+def test_observation_from_reports(make_follower):
+    keys = ["x", "y", "z", "roll", "pitch", "yaw", "joint1", "joint6", "joint2.vel", "joint3.torque"]
+    follower = make_follower(state_source="report", observation_state=keys, observation_timestamp=True)
+    assert list(follower.observation_features) == [*keys, "state_timestamp"]
+
+    first = follower.get_observation()
+    follower.arm.position = [1.0, 2.0, 3.0, 170.0, 5.0, 80.0]
+    follower.arm.angles = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 0.0]
+    follower.arm.realtime_joint_speeds = [0.5] * 6
+    # The cached values are only taken into account at the next report.
+    assert follower.get_observation() == first
+    follower.arm.report()
+    observation = follower.get_observation()
+
+    assert [observation[key] for key in keys] == [1.0, 2.0, 3.0, 170.0, 5.0, 80.0, 10.0, 60.0, 0.5, 1.0]
+    assert observation["state_timestamp"] > first["state_timestamp"]
+    # No round trip to the arm.
+    assert follower.arm.calls == []
+
+    follower.disconnect()
+    assert follower.arm.report_callbacks == []
+
+
+def test_observation_from_thread(make_follower):
+    follower = make_follower(state_source="thread", state_poll_hz=1000.0, observation_state=["z", "joint2"])
+    follower.arm.position = [1.0, 2.0, 3.0, 170.0, 5.0, 80.0]
+    deadline = time.perf_counter() + 1.0
+    while follower.get_observation()["z"] != 3.0 and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    assert follower.get_observation() == {"z": 3.0, "joint2": -10.0}
+    follower.disconnect()
+    assert follower.state_reader._thread is None
+
+
+def test_state_reader_reads_are_not_torn():
+    class CountingArm:
+        """Arm whose state values are all equal to the number of reads."""
+
+        def __init__(self):
+            self.count = 0
+
+        @property
+        def position(self):
+            self.count += 1
+            return [float(self.count)] * 6
+
+        @property
+        def angles(self):
+            return [float(self.count)] * 6
+
+        @property
+        def realtime_joint_speeds(self):
+            return [float(self.count)] * 6
+
+        @property
+        def joints_torque(self):
+            return [float(self.count)] * 6
+
+        def register_report_location_callback(self, callback, **kwargs):
+            self.callback = callback
+
+        def release_report_location_callback(self, callback):
+            pass
+
+    arm = CountingArm()
+    reader = XArmStateReader(arm)
+    reader.start()
+    stop = threading.Event()
+
+    def report_loop():
+        while not stop.is_set():
+            arm.callback({})
+
+    writer = threading.Thread(target=report_loop)
+    writer.start()
+    try:
+        for _ in range(2000):
+            values = np.array(list(reader.latest().as_dict().values()))
+            assert len(values) == len(STATE_KEYS)
+            assert np.all(values == values[0])
+    finally:
+        stop.set()
+        writer.join()
+
+
+def test_invalid_state_keys():
+    with pytest.raises(ValueError):
+        PearlyWhiteFollowerConfig(observation_state=["x", "joint7"])
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import socket
+
+import torch
+import torch.multiprocessing as mp
+from torch.amp import GradScaler
+from torch.nn.parallel import DistributedDataParallel
+
+from lerobot.scripts.lerobot_train import update_policy
+from lerobot.utils.distributed_utils import (
+    broadcast_object,
+    cleanup_distributed,
+    get_rank,
+    get_world_size,
+    init_distributed,
+    is_distributed,
+    is_main_process,
+)
+from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
+
+WORLD_SIZE = 2
+
+
+class _LinearPolicy(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(3, 1)
+
+    def forward(self, batch):
+        return (self.linear(batch["x"]) - batch["y"]).pow(2).mean(), {}
+
+
+def _make_tracker():
+    metrics = {name: AverageMeter(name) for name in ["loss", "grad_norm", "lr", "update_s"]}
+    return MetricsTracker(8, 100, 10, metrics)
+
+
+def _make_policy_and_data():
+    torch.manual_seed(0)
+    policy = _LinearPolicy()
+    x = torch.randn(8, 3)
+    y = torch.randn(8, 1)
+    return policy, x, y
+
+
+def _worker(rank, port, results):
+    os.environ.update(
+        {
+            "MASTER_ADDR": "127.0.0.1",
+            "MASTER_PORT": str(port),
+            "RANK": str(rank),
+            "WORLD_SIZE": str(WORLD_SIZE),
+        }
+    )
+    try:
+        device = init_distributed(torch.device("cpu"), backend="gloo")
+        assert device.type == "cpu"
+        assert get_rank() == rank and get_world_size() == WORLD_SIZE
+        assert is_main_process() == (rank == 0)
+        assert broadcast_object(f"rank{rank}") == "rank0"
+
+        policy, x, y = _make_policy_and_data()
+        optimizer = torch.optim.SGD(policy.parameters(), lr=0.1)
+        shard = slice(rank * 4, (rank + 1) * 4)
+        update_policy(
+            _make_tracker(),
+            DistributedDataParallel(policy),
+            {"x": x[shard], "y": y[shard]},
+            optimizer,
+            grad_clip_norm=1e6,
+            grad_scaler=GradScaler("cpu", enabled=False),
+        )
+        results[rank] = [p.detach().clone() for p in policy.parameters()]
+    finally:
+        cleanup_distributed()
+
+
+def test_single_process_defaults():
+    assert not is_distributed()
+    assert get_rank() == 0
+    assert get_world_size() == 1
+    assert is_main_process()
+    assert init_distributed(torch.device("cpu")) == torch.device("cpu")
+    assert broadcast_object("obj") == "obj"
+
+
+def test_data_parallel_update_matches_full_batch():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    results = mp.Manager().dict()
+    mp.spawn(_worker, args=(port, results), nprocs=WORLD_SIZE, join=True)
+
+    policy, x, y = _make_policy_and_data()
+    optimizer = torch.optim.SGD(policy.parameters(), lr=0.1)
+    update_policy(
+        _make_tracker(),
+        policy,
+        {"x": x, "y": y},
+        optimizer,
+        grad_clip_norm=1e6,
+        grad_scaler=GradScaler("cpu", enabled=False),
+    )
+
+    # Averaging gradients over two equal shards is equivalent to a step on the full batch
+    for rank in range(WORLD_SIZE):
+        for param, expected in zip(results[rank], policy.parameters(), strict=True):
+            torch.testing.assert_close(param, expected.detach())
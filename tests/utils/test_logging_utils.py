@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import pytest
+import torch
 
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
 
@@ -50,6 +51,25 @@ def test_average_meter_reset():
     assert meter.count == 0.0
 
 
+def test_average_meter_update_with_tensors():
+    meter = AverageMeter("loss")
+    meter.update(torch.tensor(1.0))
+    meter.update(torch.tensor(3.0), n=3)
+    assert meter.val == 3.0
+    assert meter.sum == 10.0
+    assert meter.count == 4
+    assert meter.avg == 2.5
+    # Reading and syncing again doesn't fold the tensor values in twice
+    meter.sync()
+    assert meter.sum == 10.0
+    assert meter.avg == 2.5
+
+    meter.update(torch.tensor(2.0))
+    meter.update(5.0)
+    assert meter.sum == 17.0
+    assert meter.val == 5.0
+
+
 def test_average_meter_str():
     meter = AverageMeter("metric", ":.1f")
     meter.update(4.567, 3)
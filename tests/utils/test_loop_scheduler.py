@@ -0,0 +1,127 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from lerobot.utils.loop_scheduler import LoopScheduler, TimingHistogram
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_scheduler(clock: FakeClock, **kwargs) -> LoopScheduler:
+    return LoopScheduler(fps=10, spin_s=0.0, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_timing_histogram():
+    histogram = TimingHistogram(min_s=1e-3, max_s=1.0, bins_per_decade=10)
+    for _ in range(99):
+        histogram.record(0.010)
+    histogram.record(0.500)
+
+    assert histogram.count == 100
+    assert histogram.max_s == 0.5
+    assert histogram.mean_s == pytest.approx((99 * 0.010 + 0.500) / 100)
+    assert histogram.percentile(50) == pytest.approx(0.010)
+    assert histogram.percentile(100) == 0.5
+    # Out of range durations fall in the underflow and overflow bins.
+    histogram.record(1e-6)
+    histogram.record(100.0)
+    assert histogram.counts[0] == 1
+    assert histogram.counts[-1] == 1
+
+
+def test_loop_scheduler_absolute_deadlines():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    for work_s in (0.03, 0.07, 0.01):
+        with scheduler.phase("work"):
+            clock.advance(work_s)
+        tick_start = scheduler.wait()
+    # The ticks stay on the grid whatever the duration of the work.
+    assert tick_start == pytest.approx(scheduler.start_t + 0.3)
+
+    stats = scheduler.stats()
+    assert stats.num_ticks == 3
+    assert stats.overruns == 0
+    assert stats.max_timestamp_error_s == pytest.approx(0.0)
+    assert stats.phases["work"]["count"] == 3
+    assert stats.phases["work"]["max_s"] == pytest.approx(0.07)
+
+
+def test_loop_scheduler_overrun_does_not_shift_later_ticks():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    clock.advance(0.15)
+    assert scheduler.wait() == pytest.approx(scheduler.start_t + 0.15)
+    clock.advance(0.01)
+    # The next tick is still due on the grid.
+    assert scheduler.wait() == pytest.approx(scheduler.start_t + 0.2)
+
+    stats = scheduler.stats()
+    assert stats.overruns == 1
+    assert stats.max_overrun_s == pytest.approx(0.05)
+    assert stats.skipped_ticks == 0
+
+
+@pytest.mark.parametrize("missed_ticks", ["skip", "catch_up"])
+def test_loop_scheduler_missed_ticks(missed_ticks):
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, missed_ticks=missed_ticks)
+    # Misses the deadlines at 0.1 and 0.2.
+    clock.advance(0.25)
+    scheduler.wait()
+    scheduler.wait()
+    stats = scheduler.stats()
+
+    if missed_ticks == "skip":
+        assert stats.skipped_ticks == 1
+        assert clock.now == pytest.approx(scheduler.start_t + 0.3)
+        assert stats.overruns == 1
+    else:
+        assert stats.skipped_ticks == 0
+        # The missed tick runs right away.
+        assert clock.now == pytest.approx(scheduler.start_t + 0.25)
+        assert stats.overruns == 2
+    assert stats.max_timestamp_error_s == pytest.approx(0.15)
+
+
+def test_loop_scheduler_start_resets_stats():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    with scheduler.phase("work"):
+        clock.advance(0.5)
+    scheduler.wait()
+    scheduler.start()
+
+    stats = scheduler.stats()
+    assert stats.num_ticks == 0
+    assert stats.overruns == 0
+    assert stats.phases["work"]["count"] == 0
+    assert scheduler.next_deadline == pytest.approx(clock.now + 0.1)
+
+
+def test_loop_scheduler_invalid_policy():
+    with pytest.raises(ValueError):
+        LoopScheduler(fps=10, missed_ticks="wait")
@@ -679,3 +679,75 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+def _encode_images(state: dict) -> dict:
+    # Stand-in for a frozen image encoder: a fixed function of the image.
+    return {OBS_IMAGE: state[OBS_IMAGE].mean(dim=(-1, -2))}
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_image_features_are_stored_and_sampled(optimize_memory):
+    buffer = ReplayBuffer(
+        10, "cpu", state_dims(), optimize_memory=optimize_memory, use_drq=True, image_feature_version="v1"
+    )
+    states = [create_dummy_state() for _ in range(6)]
+    for state, next_state in zip(states[:-1], states[1:], strict=True):
+        buffer.add(
+            {k: v.unsqueeze(0) for k, v in state.items()},
+            create_dummy_action(),
+            1.0,
+            {k: v.unsqueeze(0) for k, v in next_state.items()},
+            False,
+            False,
+            state_features=_encode_images({OBS_IMAGE: state[OBS_IMAGE].unsqueeze(0)}),
+            next_state_features=_encode_images({OBS_IMAGE: next_state[OBS_IMAGE].unsqueeze(0)}),
+        )
+
+    batch = buffer.sample(4)
+    assert batch["observation_feature"][OBS_IMAGE].shape == (4, 3)
+    torch.testing.assert_close(batch["observation_feature"], _encode_images(batch["state"]))
+    # Images are not augmented as they are not used anymore.
+    torch.testing.assert_close(batch["next_observation_feature"], _encode_images(batch["next_state"]))
+
+
+def test_image_features_are_required_once_stored():
+    buffer = ReplayBuffer(10, "cpu", state_dims(), image_feature_version="v1")
+    state = {k: v.unsqueeze(0) for k, v in create_dummy_state().items()}
+    features = _encode_images(state)
+    buffer.add(
+        state,
+        create_dummy_action(),
+        1.0,
+        state,
+        False,
+        False,
+        state_features=features,
+        next_state_features=features,
+    )
+    with pytest.raises(ValueError):
+        buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+
+
+def test_precompute_image_features_without_images():
+    buffer = create_empty_replay_buffer(optimize_memory=True)
+    for _ in range(5):
+        state = {k: v.unsqueeze(0) for k, v in create_dummy_state().items()}
+        buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+    expected = _encode_images({OBS_IMAGE: buffer.states[OBS_IMAGE][:5]})[OBS_IMAGE]
+
+    buffer.precompute_image_features(
+        _encode_images, image_feature_version="v1", store_images=False, batch_size=2
+    )
+
+    assert OBS_IMAGE not in buffer.states
+    torch.testing.assert_close(buffer.state_features[OBS_IMAGE][:5], expected)
+    with pytest.raises(ValueError):
+        buffer.precompute_image_features(_encode_images, image_feature_version="v2")
+
+    # New transitions come with their features.
+    state = {k: v.unsqueeze(0) for k, v in create_dummy_state().items()}
+    buffer.add(state, create_dummy_action(), 1.0, state, False, False, state_features=_encode_images(state))
+    batch = buffer.sample(4)
+    assert OBS_IMAGE not in batch["state"]
+    assert batch["observation_feature"][OBS_IMAGE].shape == (4, 3)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from lerobot.utils.rtdetr_processing import RTDetrPreprocessor, post_process_detections  # noqa: E402
+
+
+def test_post_process_detections():
+    # 2 queries and 3 classes, the scores being the sigmoid of the logits.
+    logits = np.full((1, 2, 3), -10.0, dtype=np.float32)
+    logits[0, 0, 2] = 2.0
+    logits[0, 1, 0] = 0.0
+    logits[0, 1, 1] = 3.0
+    # (center_x, center_y, width, height), relative to the frame.
+    pred_boxes = np.array([[[0.5, 0.5, 0.2, 0.4], [0.25, 0.75, 0.5, 0.5]]], dtype=np.float32)
+
+    (result,) = post_process_detections(logits, pred_boxes, target_sizes=[(100, 200)], threshold=0.4)
+
+    # The top 2 (query, class) pairs, sorted by decreasing score, as the score of (1, 0) is 0.5.
+    np.testing.assert_allclose(result["scores"], 1 / (1 + np.exp([-3.0, -2.0])), rtol=1e-6)
+    np.testing.assert_array_equal(result["labels"], [1, 2])
+    np.testing.assert_allclose(result["boxes"], [[0, 50, 100, 100], [80, 30, 120, 70]], atol=1e-4)
+
+
+def test_preprocessor_reuses_its_batch():
+    preprocessor = RTDetrPreprocessor(
+        height=32, width=48, max_batch_size=2, image_mean=[0.5] * 3, image_std=[0.25] * 3
+    )
+    frames = np.random.default_rng(0).integers(0, 256, size=(2, 60, 80, 3), dtype=np.uint8)
+    # Crops are views of the frames, as in the detection pipeline.
+    crops = [frame[5:55, 10:70] for frame in frames]
+
+    pixel_values = preprocessor(crops)
+
+    assert pixel_values.shape == (2, 3, 32, 48)
+    assert np.shares_memory(pixel_values, preprocessor.pixel_values)
+    expected = [(cv2.resize(np.ascontiguousarray(crop), (48, 32)) / 255 - 0.5) / 0.25 for crop in crops]
+    np.testing.assert_allclose(pixel_values, np.stack(expected).transpose(0, 3, 1, 2), atol=1e-5)
@@ -14,17 +14,23 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import torch
+from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from safetensors.torch import load_file
+
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
     OPTIMIZER_PARAM_GROUPS,
     OPTIMIZER_STATE,
+    PRETRAINED_MODEL_DIR,
     RNG_STATE,
     SCHEDULER_STATE,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
 )
 from lerobot.utils.train_utils import (
+    AsyncCheckpointer,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
@@ -95,3 +101,55 @@ def test_save_load_training_state(tmp_path, optimizer, scheduler):
     assert loaded_step == 10
     assert loaded_optimizer is optimizer
     assert loaded_scheduler is scheduler
+
+
+class _TinyPolicy(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.config = Mock()
+        self.linear = torch.nn.Linear(4, 4)
+
+
+def test_async_checkpointer(tmp_path, optimizer, scheduler):
+    policy = _TinyPolicy()
+    expected_weight = policy.linear.weight.detach().clone()
+    checkpoint_dir = tmp_path / CHECKPOINTS_DIR / "000010"
+
+    checkpointer = AsyncCheckpointer(max_in_flight=2)
+    checkpointer.save(checkpoint_dir, 10, Mock(), policy, optimizer, scheduler)
+    # Mutating the live state right after `save` must not affect what gets written.
+    with torch.no_grad():
+        policy.linear.weight.add_(1.0)
+    checkpointer.close()
+
+    assert not (tmp_path / CHECKPOINTS_DIR / ".000010.tmp").exists()
+    assert (tmp_path / CHECKPOINTS_DIR / LAST_CHECKPOINT_LINK).resolve() == checkpoint_dir.resolve()
+    state_dict = load_file(checkpoint_dir / PRETRAINED_MODEL_DIR / SAFETENSORS_SINGLE_FILE)
+    torch.testing.assert_close(state_dict["linear.weight"], expected_weight)
+    for file in (TRAINING_STEP, RNG_STATE, OPTIMIZER_STATE, OPTIMIZER_PARAM_GROUPS, SCHEDULER_STATE):
+        assert (checkpoint_dir / TRAINING_STATE_DIR / file).is_file()
+
+    loaded_step, _, _ = load_training_state(checkpoint_dir, optimizer, scheduler)
+    assert loaded_step == 10
+
+
+def test_async_checkpointer_dict_of_optimizers_and_extra_writers(tmp_path, optimizer):
+    checkpoint_dir = tmp_path / "000005"
+    on_complete = Mock()
+
+    checkpointer = AsyncCheckpointer()
+    future = checkpointer.save(
+        checkpoint_dir,
+        5,
+        Mock(),
+        _TinyPolicy(),
+        {"actor": optimizer},
+        extra_writers=[lambda tmp_dir: (tmp_dir / "extra.txt").write_text("extra")],
+        on_complete=on_complete,
+    )
+    assert future.result() == checkpoint_dir
+    checkpointer.close()
+
+    assert (checkpoint_dir / "extra.txt").read_text() == "extra"
+    assert (checkpoint_dir / TRAINING_STATE_DIR / "actor" / OPTIMIZER_STATE).is_file()
+    on_complete.assert_called_once_with(checkpoint_dir)
@@ -21,17 +21,35 @@ def mock_rerun(monkeypatch):
         def __init__(self, value):
             self.value = float(value)
 
+        @staticmethod
+        def columns(scalar):
+            return list(scalar)
+
+    class DummyEncodedImage:
+        def __init__(self, arr, jpeg_quality):
+            self.arr = arr
+            self.jpeg_quality = jpeg_quality
+
     class DummyImage:
         def __init__(self, arr):
             self.arr = arr
 
+        def compress(self, jpeg_quality):
+            return DummyEncodedImage(self.arr, jpeg_quality)
+
     def dummy_log(key, obj, **kwargs):
         calls.append((key, obj, kwargs))
 
+    def dummy_send_columns(key, indexes, columns):
+        calls.append((key, (indexes, columns), {"columns": True}))
+
     dummy_rr = SimpleNamespace(
         Scalar=DummyScalar,
         Image=DummyImage,
+        EncodedImage=DummyEncodedImage,
+        TimeSecondsColumn=lambda timeline, times: (timeline, list(times)),
         log=dummy_log,
+        send_columns=dummy_send_columns,
         init=lambda *a, **k: None,
         spawn=lambda *a, **k: None,
     )
@@ -208,3 +226,51 @@ def test_log_rerun_data_kwargs_only(mock_rerun):
     a = _obj_for(calls, "action.a")
     assert type(a).__name__ == "DummyScalar"
     assert a.value == pytest.approx(1.0)
+
+
+def test_rerun_sink_batches_scalars_and_decimates_images(mock_rerun):
+    vu, calls = mock_rerun
+
+    sink = vu.RerunSink(image_fps=1e-3, image_scale=0.5, jpeg_quality=80, flush_interval_s=10.0)
+    sink.start()
+    for i in range(3):
+        sink.log(
+            observation={"temp": float(i), "cam": np.zeros((8, 10, 3), dtype=np.uint8)},
+            action={"vec": np.array([i, 2 * i], dtype=np.float32)},
+        )
+    sink.stop()
+
+    # Scalars are sent in a single columnar call per series, with one row per logged step.
+    column_calls = {key: obj for key, obj, kw in calls if kw.get("columns")}
+    assert set(column_calls) == {
+        "observation.temp",
+        "action.vec_0",
+        "action.vec_1",
+        "rerun_sink.dropped",
+        "rerun_sink.skipped_images",
+    }
+    (timeline, times), values = column_calls["observation.temp"][0][0], column_calls["observation.temp"][1]
+    assert timeline == "control_time"
+    assert len(times) == 3
+    assert values == [0.0, 1.0, 2.0]
+    assert column_calls["action.vec_1"][1] == [0.0, 2.0, 4.0]
+
+    # Only the first image is logged at this rate, downscaled and compressed.
+    image_calls = [obj for key, obj, kw in calls if key == "observation.cam"]
+    assert len(image_calls) == 1
+    assert type(image_calls[0]).__name__ == "DummyEncodedImage"
+    assert image_calls[0].arr.shape == (4, 5, 3)
+    assert image_calls[0].jpeg_quality == 80
+    assert sink.skipped_images == 2
+
+
+def test_rerun_sink_drops_oldest(mock_rerun):
+    vu, calls = mock_rerun
+
+    # Not started, so nothing is consumed from the queue.
+    sink = vu.RerunSink(max_queue_size=2)
+    for i in range(5):
+        sink.log(observation={"temp": float(i)})
+
+    assert sink.dropped == 3
+    assert [observation["temp"] for _, observation, _ in sink._queue] == [3.0, 4.0]